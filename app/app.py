@@ -1,4 +1,4 @@
-from flask import Flask, redirect, url_for
+from flask import Flask, redirect, url_for, jsonify
 from src.controller.dynamodb_controller import dynamodb_bp
 from src.controller.ecs_controller import ecs_bp
 from src.controller.rds_controller import rds_bp
@@ -10,12 +10,22 @@ from src.controller.parameter_store_controller import parameters_bp
 from src.controller.api_catalog_controller import api_catalog_bp
 from src.controller.messaging_controller import messaging_bp
 from src.controller.kafka_controller import kafka_bp
+from src.controller.inventory_controller import inventory_bp
+from src.service.aws_client_factory import get_aws_rate_limiter
+from src.service.aws_single_flight import get_aws_single_flight
+import logging
 import os
 from dotenv import load_dotenv
 
 # Carrega variáveis de ambiente
 load_dotenv()
 
+# Nível de log da aplicação (LOG_LEVEL=DEBUG exibe o detalhamento das requests do catálogo)
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    format='[%(levelname)s] %(name)s: %(message)s'
+)
+
 # Cria a aplicação Flask
 app = Flask(__name__)
 
@@ -35,6 +45,7 @@ app.register_blueprint(parameters_bp)
 app.register_blueprint(api_catalog_bp)
 app.register_blueprint(messaging_bp)
 app.register_blueprint(kafka_bp)
+app.register_blueprint(inventory_bp)
 
 
 @app.route('/')
@@ -46,6 +57,27 @@ def index():
     return render_template('home.html')
 
 
+@app.route('/aws/metrics', methods=['GET'])
+def aws_metrics():
+    """
+    Contadores do limitador de taxa das chamadas AWS (tentativas, retries, throttling, espera)
+    e da coalescência de chamadas idênticas simultâneas
+    """
+    result = get_aws_rate_limiter().get_stats()
+    result['single_flight'] = get_aws_single_flight().get_stats()
+    return jsonify(result), 200
+
+
+@app.route('/aws/metrics/reset', methods=['POST'])
+def reset_aws_metrics():
+    """
+    Zera os contadores do limitador de taxa e da coalescência
+    """
+    get_aws_rate_limiter().reset_stats()
+    get_aws_single_flight().reset_stats()
+    return jsonify({'success': True, 'message': 'Contadores zerados'}), 200
+
+
 @app.errorhandler(404)
 def not_found(error):
     """
@@ -0,0 +1,110 @@
+"""
+Benchmark do Scan paralelo do DynamoDB (TotalSegments)
+Roda contra o DynamoDB Local (ou qualquer endpoint compatível): cria uma tabela
+temporária, carrega N itens com batch_write_item e mede a vazão do scan com
+1, 2, 4 e 8 segmentos. A tabela é removida ao final
+
+Uso: python benchmark_dynamodb_scan.py [quantidade] [endpoint]
+     (endpoint padrão: AWS_ENDPOINT_URL_DYNAMODB ou http://localhost:8000)
+"""
+
+import os
+import sys
+import time
+import uuid
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+DEFAULT_ENDPOINT = 'http://localhost:8000'
+
+
+def _load_items(client, table_name, total):
+    """
+    Carrega os itens em lotes de 25 (reenviando os UnprocessedItems)
+    """
+    payload = 'x' * 200
+    for start in range(0, total, 25):
+        requests = [
+            {'PutRequest': {'Item': {
+                'pk': {'S': f'item-{index}'},
+                'seq': {'N': str(index)},
+                'payload': {'S': payload}
+            }}}
+            for index in range(start, min(start + 25, total))
+        ]
+        while requests:
+            response = client.batch_write_item(RequestItems={table_name: requests})
+            requests = response.get('UnprocessedItems', {}).get(table_name, [])
+
+
+def run_benchmark(total=20000, endpoint=None):
+    print("=" * 60)
+    print("⏱️  Benchmark - Scan paralelo do DynamoDB")
+    print("=" * 60)
+    print()
+
+    endpoint = endpoint or os.getenv('AWS_ENDPOINT_URL_DYNAMODB') or DEFAULT_ENDPOINT
+    os.environ['AWS_ENDPOINT_URL_DYNAMODB'] = endpoint
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    # Importa depois de configurar o endpoint: o cliente é criado no construtor
+    from src.service.dynamodb_service import DynamoDBService
+    from src.service.dynamodb_item_service import DynamoDBItemService
+
+    service = DynamoDBService()
+    items = DynamoDBItemService(service)
+    client = service.dynamodb_client
+    table_name = f'dev-manager-benchmark-{uuid.uuid4().hex[:8]}'
+
+    try:
+        client.create_table(
+            TableName=table_name,
+            KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'pk', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+    except EndpointConnectionError:
+        print(f"   ❌ DynamoDB não encontrado em {endpoint}")
+        print("   Inicie o DynamoDB Local: docker run -p 8000:8000 amazon/dynamodb-local")
+        return
+    except ClientError as e:
+        print(f"   ❌ Erro ao criar a tabela: {e.response['Error']['Message']}")
+        return
+
+    try:
+        client.get_waiter('table_exists').wait(TableName=table_name, WaiterConfig={'Delay': 1})
+
+        started = time.perf_counter()
+        _load_items(client, table_name, total)
+        print(f"   Endpoint: {endpoint}")
+        print(f"   Itens: {total} (carga em {time.perf_counter() - started:.1f}s) | Página: {items.page_size}")
+        print()
+        print(f"   {'Segmentos':<12}{'itens':>10}{'páginas':>10}{'tempo (s)':>12}{'itens/s':>10}")
+
+        baseline = None
+        for segments in (1, 2, 4, 8):
+            for event in items.iter_scan(table_name, segments=segments, max_items=total):
+                if event['type'] == 'finished':
+                    stats = event['stats']
+            if not event['success']:
+                print(f"   ❌ {event['message']}")
+                return
+
+            baseline = baseline or stats['elapsed_seconds']
+            print(f"   {segments:<12}{stats['items']:>10}{stats['pages']:>10}"
+                  f"{stats['elapsed_seconds']:>12.2f}{stats['items_per_second']:>10.0f}"
+                  f"   {baseline / stats['elapsed_seconds']:.1f}x")
+        print()
+
+    finally:
+        client.delete_table(TableName=table_name)
+        print(f"   Tabela temporária {table_name} removida")
+        print()
+
+
+if __name__ == '__main__':
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        sys.argv[2] if len(sys.argv) > 2 else None
+    )
@@ -0,0 +1,103 @@
+"""
+Benchmark da importação em massa do DynamoDB (BatchWriteItem)
+Roda contra o DynamoDB Local (ou qualquer endpoint compatível): gera um NDJSON
+com N itens, importa com 1, 4 e 8 escritores numa tabela temporária e exporta
+a tabela de volta para NDJSON. A tabela é removida ao final
+
+Uso: python benchmark_dynamodb_transfer.py [quantidade] [endpoint]
+     (endpoint padrão: AWS_ENDPOINT_URL_DYNAMODB ou http://localhost:8000)
+"""
+
+import io
+import json
+import os
+import sys
+import uuid
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+DEFAULT_ENDPOINT = 'http://localhost:8000'
+
+
+def _wait(transfer, result):
+    if not result['success']:
+        raise RuntimeError(result['message'])
+    for event in transfer.iter_progress(result['job_id'], interval=0.1):
+        pass
+    return event['job']
+
+
+def run_benchmark(total=10000, endpoint=None):
+    print("=" * 60)
+    print("⏱️  Benchmark - Importação/exportação em massa do DynamoDB")
+    print("=" * 60)
+    print()
+
+    endpoint = endpoint or os.getenv('AWS_ENDPOINT_URL_DYNAMODB') or DEFAULT_ENDPOINT
+    os.environ['AWS_ENDPOINT_URL_DYNAMODB'] = endpoint
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'benchmark')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'benchmark')
+
+    # Importa depois de configurar o endpoint: o cliente é criado no construtor
+    from src.service.dynamodb_service import DynamoDBService
+    from src.service.dynamodb_transfer_service import DynamoDBTransferService
+
+    service = DynamoDBService()
+    transfer = DynamoDBTransferService(service)
+    client = service.dynamodb_client
+    table_name = f'dev-manager-benchmark-{uuid.uuid4().hex[:8]}'
+
+    try:
+        client.create_table(
+            TableName=table_name,
+            KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'pk', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+    except EndpointConnectionError:
+        print(f"   ❌ DynamoDB não encontrado em {endpoint}")
+        print("   Inicie o DynamoDB Local: docker run -p 8000:8000 amazon/dynamodb-local")
+        return
+    except ClientError as e:
+        print(f"   ❌ Erro ao criar a tabela: {e.response['Error']['Message']}")
+        return
+
+    try:
+        client.get_waiter('table_exists').wait(TableName=table_name, WaiterConfig={'Delay': 1})
+
+        payload = 'x' * 200
+        ndjson = ''.join(
+            json.dumps({'pk': f'item-{index}', 'seq': index, 'payload': payload}) + '\n'
+            for index in range(total)
+        ).encode()
+
+        print(f"   Endpoint: {endpoint}")
+        print(f"   Itens: {total} | Arquivo: {len(ndjson) / 1024:.0f} KB")
+        print()
+        print(f"   {'Modo':<28}{'itens':>10}{'chamadas':>10}{'tempo (s)':>12}{'itens/s':>10}")
+
+        baseline = None
+        for writers in (1, 4, 8):
+            job = _wait(transfer, transfer.start_import(table_name, io.BytesIO(ndjson), 'ndjson', writers))
+            baseline = baseline or job['elapsed_seconds']
+            print(f"   {f'importação ({writers} escritores)':<28}{job['written']:>10}{job['batches']:>10}"
+                  f"{job['elapsed_seconds']:>12.2f}{job['items_per_second']:>10.0f}"
+                  f"   {baseline / job['elapsed_seconds']:.1f}x")
+
+        job = _wait(transfer, transfer.start_export(table_name, 'ndjson', segments=8))
+        print(f"   {'exportação (8 segmentos)':<28}{job['written']:>10}{job['batches']:>10}"
+              f"{job['elapsed_seconds']:>12.2f}{job['items_per_second']:>10.0f}")
+        os.remove(transfer.get_export_file(job['id'])[0])
+        print()
+
+    finally:
+        client.delete_table(TableName=table_name)
+        print(f"   Tabela temporária {table_name} removida")
+        print()
+
+
+if __name__ == '__main__':
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        sys.argv[2] if len(sys.argv) > 2 else None
+    )
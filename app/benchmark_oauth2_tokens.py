@@ -0,0 +1,171 @@
+"""
+Verificação do cache de tokens OAuth2 contra um provedor OAuth2 local (stub)
+O stub expõe POST /token (latência simulada, conta as emissões) e GET /api
+(latência aleatória, responde 401 para tokens revogados)
+
+Cenários:
+  1. Single-flight: N chamadas simultâneas com o cache vazio geram um único POST /token
+  2. Renovação antes de expirar: perto do fim da validade o token é renovado em
+     background sem bloquear quem está usando o token atual
+  3. 401: o token recusado é descartado e a request repetida uma vez; requests
+     simultâneas que recebem 401 geram um único POST /token, inclusive as que
+     recebem o 401 depois que o token novo já foi armazenado
+
+Uso: python benchmark_oauth2_tokens.py [requests_simultâneas] [latência_token_ms]
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.service.api_catalog_service import APICatalogService
+from src.service.oauth2_token_cache import OAuth2TokenCache
+
+AUTH_ID = 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    POST /token: emite tok-1, tok-2, ...
+    GET /api: 200 com tokens válidos, 401 com tokens revogados
+    """
+
+    latency = 0.2
+    expires_in = 3600
+    issued = 0
+    revoked = set()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        time.sleep(self.latency)
+
+        with self.lock:
+            _StubHandler.issued += 1
+            token = f'tok-{_StubHandler.issued}'
+
+        self._reply(200, {'access_token': token, 'token_type': 'Bearer', 'expires_in': self.expires_in})
+
+    def do_GET(self):
+        # Espalha as respostas: parte dos 401 chega depois da busca do token novo
+        time.sleep(random.uniform(0, self.latency * 2))
+        token = self.headers.get('Authorization', '').replace('Bearer ', '')
+
+        with self.lock:
+            valid = token.startswith('tok-') and token not in self.revoked
+
+        self._reply(200 if valid else 401, {'token': token})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _check(description, ok, detail):
+    print(f"   {'✅' if ok else '❌'} {description}: {detail}")
+    return ok
+
+
+def run_checks(concurrency=50, token_latency_ms=200):
+    print("=" * 60)
+    print("🔐 Verificação - Cache de tokens OAuth2 (provedor local)")
+    print("=" * 60)
+    print()
+
+    _StubHandler.latency = token_latency_ms / 1000.0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    service = APICatalogService()
+    auth_config = json.dumps({'url': f'{base_url}/token', 'selected_fields': ['access_token']})
+    prepared = {
+        'method': 'GET',
+        'url': f'{base_url}/api',
+        'headers': {'Authorization': 'Bearer ${access_token}'},
+        'auth_header_keys': ['Authorization'],
+        'params': None,
+        'json': None,
+        'data': None,
+        'auth_id': AUTH_ID,
+        'auth_config': auth_config
+    }
+    results = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # 1. Single-flight com o cache vazio
+            service.token_cache = OAuth2TokenCache()
+            started = time.perf_counter()
+            tokens = list(executor.map(lambda _: service._get_oauth2_tokens(AUTH_ID, auth_config), range(concurrency)))
+            elapsed = time.perf_counter() - started
+            results.append(_check(
+                'Single-flight',
+                _StubHandler.issued == 1 and len({t.get('access_token') for t in tokens}) == 1,
+                f'{concurrency} chamadas simultâneas -> {_StubHandler.issued} POST /token em {elapsed * 1000:.0f} ms'
+            ))
+
+            # 2. Renovação em background antes de expirar (validade de 3 s: renova aos 2.4 s, 80% da validade)
+            _StubHandler.expires_in = 3
+            service.token_cache = OAuth2TokenCache(refresh_margin=1)
+            issued_before = _StubHandler.issued
+            first = service._get_oauth2_tokens(AUTH_ID, auth_config)['access_token']
+            time.sleep(2.5)
+
+            started = time.perf_counter()
+            during = service._get_oauth2_tokens(AUTH_ID, auth_config)['access_token']
+            blocked_ms = (time.perf_counter() - started) * 1000
+            time.sleep(_StubHandler.latency + 0.3)
+            after = service._get_oauth2_tokens(AUTH_ID, auth_config)['access_token']
+            results.append(_check(
+                'Renovação antes de expirar',
+                during == first and after != first and blocked_ms < token_latency_ms / 2
+                and _StubHandler.issued - issued_before == 2,
+                f'{first} servido em {blocked_ms:.1f} ms durante a renovação, depois {after}'
+            ))
+
+            # 3. 401 em requests simultâneas: descarta o token recusado uma vez e repete
+            _StubHandler.expires_in = 3600
+            service.token_cache = OAuth2TokenCache()
+            revoked = service._get_oauth2_tokens(AUTH_ID, auth_config)['access_token']
+            with _StubHandler.lock:
+                _StubHandler.revoked.add(revoked)
+            issued_before = _StubHandler.issued
+
+            responses = list(executor.map(lambda _: service._send_prepared_request(prepared)[0], range(concurrency)))
+            statuses = [response.status_code for response in responses]
+            new_tokens = {response.json()['token'] for response in responses}
+            stats = service.token_cache.get_stats()
+            results.append(_check(
+                'Descarte e nova tentativa no 401',
+                statuses.count(200) == concurrency and _StubHandler.issued - issued_before == 1
+                and stats['evictions'] == 1 and revoked not in new_tokens,
+                f'{statuses.count(200)}/{concurrency} com 200 após 401 em {revoked}, '
+                f'{_StubHandler.issued - issued_before} POST /token, {stats["evictions"]} descarte(s)'
+            ))
+    finally:
+        server.shutdown()
+
+    print()
+    print(f"   {sum(results)}/{len(results)} cenários OK")
+    print()
+    return all(results)
+
+
+if __name__ == '__main__':
+    ok = run_checks(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    )
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,159 @@
+"""
+Benchmark da hidratação em lote do Parameter Store (nomes/segundo)
+Usa um stub local da API do SSM com latência simulada por chamada
+
+Antes do benchmark, verifica que uma mesma chamada com o nome base, nomes
+com seletor de versão (/app/db:3) e ARNs devolve o valor de cada um
+
+Uso: python benchmark_parameter_hydration.py [quantidade] [latência_ms]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from boto3 import Session
+
+from src.service.parameter_store_service import ParameterStoreService
+
+
+class _SSMStubHandler(BaseHTTPRequestHandler):
+    """
+    Responde GetParameter e GetParameters (protocolo JSON do SSM)
+    """
+
+    latency = 0.02
+    calls = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        operation = self.headers.get('X-Amz-Target', '').split('.')[-1]
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+
+        _SSMStubHandler.calls[operation] = _SSMStubHandler.calls.get(operation, 0) + 1
+        time.sleep(self.latency)
+
+        if operation == 'GetParameter':
+            payload = {'Parameter': self._parameter(body['Name'])}
+        elif operation == 'GetParameters':
+            payload = {'Parameters': [self._parameter(name) for name in body['Names']], 'InvalidParameters': []}
+        else:
+            payload = {}
+
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-amz-json-1.1')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _parameter(self, name):
+        """
+        Como a AWS: o seletor (:versão) volta separado do nome, no campo Selector
+        """
+        arn = name.startswith('arn:')
+        resource = name.split(':', 5)[5] if arn else name
+        base, _, version = resource.partition(':')
+
+        if arn:
+            base = name[:len(name) - len(resource)] + base
+        path = base.split(':parameter', 1)[-1] if arn else base
+
+        parameter = {
+            'Name': base,
+            'ARN': base if arn else f'arn:aws:ssm:us-east-1:123456789012:parameter{path}',
+            'Type': 'String',
+            'Value': f'valor-{path}' + (f'-v{version}' if version else ''),
+            'Version': int(version) if version else 1,
+            'DataType': 'text'
+        }
+        if version:
+            parameter['Selector'] = f':{version}'
+        return parameter
+
+
+def check_selectors(service):
+    """
+    Nome base, versões e ARN do mesmo parâmetro numa única chamada GetParameters
+    """
+    arn = 'arn:aws:ssm:us-east-1:123456789012:parameter/check/db'
+    expected = {
+        '/check/db': 'valor-/check/db',
+        '/check/db:3': 'valor-/check/db-v3',
+        '/check/db:4': 'valor-/check/db-v4',
+        f'{arn}:2': 'valor-/check/db-v2'
+    }
+
+    calls = _SSMStubHandler.calls.get('GetParameters', 0)
+    result = service.get_parameters(list(expected))
+    values = [parameter['Value'] for parameter in result.get('parameters', [])]
+    ok = (
+        _SSMStubHandler.calls.get('GetParameters', 0) - calls == 1
+        and values == list(expected.values())
+        and not result.get('invalid_parameters')
+    )
+
+    print(f"   {'✅' if ok else '❌'} Seletores e ARN na mesma chamada: {values}")
+    print()
+    return ok
+
+
+def run_benchmark(total=300, latency_ms=20):
+    print("=" * 60)
+    print("⏱️  Benchmark - Hidratação de parâmetros do Parameter Store")
+    print("=" * 60)
+    print()
+
+    _SSMStubHandler.latency = latency_ms / 1000.0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SSMStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    service = ParameterStoreService()
+    service.ssm_client = Session().client(
+        'ssm',
+        region_name='us-east-1',
+        endpoint_url=f'http://127.0.0.1:{server.server_port}',
+        aws_access_key_id='benchmark',
+        aws_secret_access_key='benchmark'
+    )
+
+    names = [f'/benchmark/app/param-{i}' for i in range(total)]
+
+    try:
+        if not check_selectors(service):
+            return False
+
+        started = time.perf_counter()
+        for name in names:
+            service.get_parameter(name)
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = service.get_parameters(names)
+        bulk = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    print(f"   Parâmetros: {total} | Latência simulada: {latency_ms} ms | Workers: {service.max_workers}")
+    print()
+    print(f"   {'Modo':<30}{'chamadas':>10}{'tempo (s)':>12}{'nomes/s':>12}")
+    print(f"   {'get_parameter (1 por vez)':<30}{_SSMStubHandler.calls.get('GetParameter', 0):>10}"
+          f"{sequential:>12.2f}{total / sequential:>12.0f}")
+    print(f"   {'get_parameters (lotes de 10)':<30}{_SSMStubHandler.calls.get('GetParameters', 0):>10}"
+          f"{bulk:>12.2f}{result['count'] / bulk:>12.0f}")
+    print()
+    print(f"   🚀 Ganho: {sequential / bulk:.1f}x")
+    print()
+    return True
+
+
+if __name__ == '__main__':
+    ok = run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    )
+    sys.exit(0 if ok else 1)
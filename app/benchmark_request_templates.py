@@ -0,0 +1,118 @@
+"""
+Benchmark do overhead por request do Catálogo de APIs (sem tempo de rede)
+Compara a montagem da request com e sem o cache de requests compiladas
+
+Uso: python benchmark_request_templates.py [iterações]
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from src.service.api_catalog_service import APICatalogService
+
+
+class _FakeResponse:
+    status_code = 200
+
+
+class _FakeHTTP:
+    """
+    Substitui o pool HTTP para medir só o processamento local
+    """
+
+    def request(self, method, url, timeout=30, **kwargs):
+        return _FakeResponse(), {'total': 0.0}
+
+
+def _create_fixture(service):
+    """
+    Cria owner, autenticação OAuth2, API, endpoint e request em um banco temporário
+    """
+    conn = service.db._get_connection()
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO api_owners (name) VALUES ('benchmark')")
+    owner_id = cursor.lastrowid
+    conn.commit()
+    conn.close()
+
+    auth_config = {'url': 'http://auth.local/token', 'selected_fields': ['access_token']}
+    auth_id = service.create_authentication(owner_id, 'benchmark-auth', 'oauth2', auth_config)['auth_id']
+
+    api_id = service.create_api(
+        'benchmark-api', owner_id, base_url='http://api.local', auth_id=auth_id,
+        default_headers={'Authorization': 'Bearer ${access_token}', 'X-Client': 'dev-manager'}
+    )['api_id']
+
+    endpoint_id = service.create_endpoint(api_id, '/pessoas/{id}/enderecos/{endereco_id}')['endpoint_id']
+
+    request_id = service.create_request(
+        endpoint_id, 'PUT', name='benchmark-request',
+        headers={'X-Trace': '${access_token}', 'Accept': 'application/json'},
+        body_template={'nome': 'Fulano', 'enderecos': [{'cep': '01000-000'}]},
+        query_params={'expand': 'true'}
+    )['request_id']
+
+    # Token já em cache: o benchmark não mede o provedor OAuth2
+    service.token_cache.get_tokens(auth_id, json.dumps(auth_config), lambda: ({'access_token': 'x' * 800}, 3600))
+
+    return request_id
+
+
+def _measure(service, request_id, iterations, cold):
+    samples = []
+    http = _FakeHTTP()
+
+    for i in range(iterations):
+        if cold:
+            service.templates.clear()
+
+        started = time.perf_counter()
+        template = service._get_template(request_id)
+        prepared = template.prepare(path_variables={'id': i, 'endereco_id': 1})
+        service._send_prepared_request(prepared, http=http)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+
+    samples.sort()
+    return {
+        'mean': statistics.mean(samples),
+        'p50': samples[len(samples) // 2],
+        'p99': samples[int(len(samples) * 0.99) - 1]
+    }
+
+
+def run_benchmark(iterations=5000):
+    print("=" * 60)
+    print("⏱️  Benchmark - Overhead por request do Catálogo de APIs")
+    print("=" * 60)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = APICatalogService()
+        service.db.db_path = os.path.join(tmp_dir, 'benchmark.db')
+        service.db._create_tables()
+
+        request_id = _create_fixture(service)
+
+        # Aquecimento
+        _measure(service, request_id, 200, cold=True)
+        _measure(service, request_id, 200, cold=False)
+
+        cold = _measure(service, request_id, iterations, cold=True)
+        warm = _measure(service, request_id, iterations, cold=False)
+
+        print(f"   Iterações: {iterations}")
+        print()
+        print(f"   {'Cenário':<32}{'média':>9}{'p50':>9}{'p99':>9}  (µs)")
+        print(f"   {'Sem cache (JOIN + compilação)':<32}{cold['mean']:>9.1f}{cold['p50']:>9.1f}{cold['p99']:>9.1f}")
+        print(f"   {'Com cache (template compilado)':<32}{warm['mean']:>9.1f}{warm['p50']:>9.1f}{warm['p99']:>9.1f}")
+        print()
+        print(f"   🚀 Redução do overhead: {cold['mean'] / warm['mean']:.1f}x")
+        print()
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
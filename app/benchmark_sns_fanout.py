@@ -0,0 +1,228 @@
+"""
+Benchmark da publicação em lote no SNS e do teste de fan-out SNS -> SQS
+Usa um stub local das APIs do SNS (protocolo query/XML) e do SQS (protocolo JSON):
+cada chamada tem latência simulada e o fan-out entrega na fila inscrita com
+atraso aleatório e uma taxa de perda configurável
+
+Uso: python benchmark_sns_fanout.py [quantidade] [latência_ms] [entrega_ms] [taxa_de_perda]
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from xml.sax.saxutils import escape
+
+from boto3 import Session
+from botocore.config import Config
+
+from src.business.messaging_business import MessagingBusiness
+from src.service.sns_fanout_service import SNSFanoutTester
+
+TOPIC_ARN = 'arn:aws:sns:us-east-1:000000000000:benchmark'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    SNS: Publish, PublishBatch, Subscribe, Unsubscribe
+    SQS: CreateQueue, GetQueueAttributes, SetQueueAttributes, ReceiveMessage, DeleteMessageBatch, DeleteQueue
+    """
+
+    latency = 0.02
+    delivery = 0.05
+    loss_rate = 0.0
+    calls = {}
+    queues = {}
+    subscriptions = {}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        target = self.headers.get('X-Amz-Target')
+
+        if target:
+            operation = target.split('.')[-1]
+            self._count(operation)
+            self._reply(json.dumps(getattr(self, f'_sqs_{operation}')(json.loads(body or b'{}'))),
+                        'application/x-amz-json-1.0')
+        else:
+            params = {key: values[0] for key, values in parse_qs(body.decode()).items()}
+            operation = params['Action']
+            self._count(operation)
+            result = getattr(self, f'_sns_{operation}')(params)
+            self._reply(
+                f'<{operation}Response xmlns="http://sns.amazonaws.com/doc/2010-03-31/">'
+                f'<{operation}Result>{result}</{operation}Result>'
+                f'<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId></ResponseMetadata>'
+                f'</{operation}Response>',
+                'text/xml'
+            )
+
+    def _count(self, operation):
+        with self.lock:
+            _StubHandler.calls[operation] = _StubHandler.calls.get(operation, 0) + 1
+        time.sleep(self.latency)
+
+    def _reply(self, payload, content_type):
+        data = payload.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # ==================== SNS ====================
+
+    def _fan_out(self, message):
+        with self.lock:
+            for queue_url in self.subscriptions.values():
+                if random.random() < self.loss_rate:
+                    continue
+                visible_at = time.monotonic() + random.expovariate(1 / self.delivery)
+                self.queues[queue_url].append((visible_at, message))
+
+    def _sns_Publish(self, params):
+        self._fan_out(params['Message'])
+        return f'<MessageId>{uuid.uuid4()}</MessageId>'
+
+    def _sns_PublishBatch(self, params):
+        members = []
+        index = 1
+        while f'PublishBatchRequestEntries.member.{index}.Id' in params:
+            self._fan_out(params[f'PublishBatchRequestEntries.member.{index}.Message'])
+            members.append(
+                f'<member><Id>{params[f"PublishBatchRequestEntries.member.{index}.Id"]}</Id>'
+                f'<MessageId>{uuid.uuid4()}</MessageId></member>'
+            )
+            index += 1
+        return f'<Successful>{"".join(members)}</Successful><Failed/>'
+
+    def _sns_Subscribe(self, params):
+        arn = f'{params["TopicArn"]}:{uuid.uuid4()}'
+        queue_url = 'http://' + self.headers['Host'] + '/000000000000/' + params['Endpoint'].rsplit(':', 1)[-1]
+        with self.lock:
+            self.subscriptions[arn] = queue_url
+        return f'<SubscriptionArn>{escape(arn)}</SubscriptionArn>'
+
+    def _sns_Unsubscribe(self, params):
+        with self.lock:
+            self.subscriptions.pop(params['SubscriptionArn'], None)
+        return ''
+
+    # ==================== SQS ====================
+
+    def _sqs_CreateQueue(self, body):
+        queue_url = 'http://' + self.headers['Host'] + '/000000000000/' + body['QueueName']
+        with self.lock:
+            self.queues.setdefault(queue_url, [])
+        return {'QueueUrl': queue_url}
+
+    def _sqs_GetQueueAttributes(self, body):
+        return {'Attributes': {'QueueArn': 'arn:aws:sqs:us-east-1:000000000000:' + body['QueueUrl'].rsplit('/', 1)[-1]}}
+
+    def _sqs_SetQueueAttributes(self, body):
+        return {}
+
+    def _sqs_ReceiveMessage(self, body):
+        deadline = time.monotonic() + body.get('WaitTimeSeconds', 0)
+
+        while True:
+            with self.lock:
+                queue = self.queues.get(body['QueueUrl'], [])
+                now = time.monotonic()
+                ready = [item for item in queue if item[0] <= now][:body.get('MaxNumberOfMessages', 1)]
+                for item in ready:
+                    queue.remove(item)
+            if ready or time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+
+        return {'Messages': [
+            {'MessageId': str(uuid.uuid4()), 'ReceiptHandle': str(uuid.uuid4()), 'Body': message, 'MD5OfBody': ''}
+            for _, message in ready
+        ]}
+
+    def _sqs_DeleteMessageBatch(self, body):
+        return {'Successful': [{'Id': entry['Id']} for entry in body['Entries']], 'Failed': []}
+
+    def _sqs_DeleteQueue(self, body):
+        with self.lock:
+            self.queues.pop(body['QueueUrl'], None)
+        return {}
+
+
+def run_benchmark(total=1000, latency_ms=20, delivery_ms=50, loss_rate=0.01):
+    print("=" * 60)
+    print("⏱️  Benchmark - Publicação em lote e fan-out SNS -> SQS")
+    print("=" * 60)
+    print()
+
+    _StubHandler.latency = latency_ms / 1000.0
+    _StubHandler.delivery = delivery_ms / 1000.0
+    _StubHandler.loss_rate = loss_rate
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    business = MessagingBusiness()
+    for service in ('sqs', 'sns'):
+        setattr(business.service, f'{service}_client', Session().client(
+            service,
+            region_name='us-east-1',
+            endpoint_url=f'http://127.0.0.1:{server.server_port}',
+            aws_access_key_id='benchmark',
+            aws_secret_access_key='benchmark',
+            config=Config(max_pool_connections=business.service.max_workers)
+        ))
+    tester = SNSFanoutTester(business.service)
+    template = '{"pedido": {{index}}, "id": "{{uuid}}"}'
+
+    try:
+        started = time.perf_counter()
+        for index in range(total):
+            business.publish_message(TOPIC_ARN, template.replace('{{index}}', str(index)))
+        sequential = time.perf_counter() - started
+
+        batch = business.publish_batch(TOPIC_ARN, template=template, count=total)
+
+        job_id = tester.start(TOPIC_ARN, total, settle_timeout=2)['job_id']
+        for event in tester.iter_progress(job_id, interval=0.2):
+            fanout = event['job']
+    finally:
+        server.shutdown()
+
+    print(f"   Mensagens: {total} | Latência por chamada: {latency_ms} ms"
+          f" | Workers: {business.service.max_workers}")
+    print()
+    print(f"   {'Modo':<32}{'chamadas':>10}{'tempo (s)':>12}{'msgs/s':>10}")
+    print(f"   {'publish (1 por vez)':<32}{_StubHandler.calls.get('Publish', 0):>10}"
+          f"{sequential:>12.2f}{total / sequential:>10.0f}")
+    print(f"   {'publish_batch (lotes de 10)':<32}{batch['api_calls']:>10}"
+          f"{batch['elapsed_seconds']:>12.2f}{batch['messages_per_second']:>10.0f}")
+    print(f"   🚀 Ganho: {sequential / batch['elapsed_seconds']:.1f}x")
+    print()
+
+    latency = fanout['latency']
+    print(f"   Fan-out (entrega média simulada: {delivery_ms} ms, perda simulada: {loss_rate:.1%})")
+    print(f"   Status: {fanout['status']} | Publicadas: {fanout['published']} | Recebidas: {fanout['received']}"
+          f" | Duplicadas: {fanout['duplicates']} | Perdidas: {fanout['lost']} ({fanout['loss_rate']:.2%})")
+    if latency:
+        print(f"   Latência (ms): p50 {latency['p50_ms']} | p90 {latency['p90_ms']} | p99 {latency['p99_ms']}"
+              f" | máx {latency['max_ms']}")
+    print(f"   Fila temporária removida: {not _StubHandler.queues} | Inscrição removida: {not _StubHandler.subscriptions}")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 50,
+        float(sys.argv[4]) if len(sys.argv) > 4 else 0.01
+    )
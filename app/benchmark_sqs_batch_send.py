@@ -0,0 +1,123 @@
+"""
+Benchmark do envio em lote para o SQS (mensagens/segundo)
+Usa um stub local da API do SQS (no estilo ElasticMQ) com latência simulada por
+chamada e falhas transitórias aleatórias por entrada no SendMessageBatch
+
+Uso: python benchmark_sqs_batch_send.py [quantidade] [latência_ms] [taxa_de_falha]
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from boto3 import Session
+from botocore.config import Config
+
+from src.business.messaging_business import MessagingBusiness
+
+
+class _SQSStubHandler(BaseHTTPRequestHandler):
+    """
+    Responde SendMessage e SendMessageBatch (protocolo JSON do SQS) guardando as mensagens em memória
+    """
+
+    latency = 0.02
+    failure_rate = 0.0
+    calls = {}
+    messages = []
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        operation = self.headers.get('X-Amz-Target', '').split('.')[-1]
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+
+        with self.lock:
+            _SQSStubHandler.calls[operation] = _SQSStubHandler.calls.get(operation, 0) + 1
+        time.sleep(self.latency)
+
+        if operation == 'SendMessage':
+            with self.lock:
+                self.messages.append(body['MessageBody'])
+            payload = {'MessageId': str(uuid.uuid4()), 'MD5OfMessageBody': ''}
+        elif operation == 'SendMessageBatch':
+            successful, failed = [], []
+            for entry in body['Entries']:
+                if random.random() < self.failure_rate:
+                    failed.append({'Id': entry['Id'], 'SenderFault': False, 'Code': 'InternalError', 'Message': 'falha simulada'})
+                    continue
+                with self.lock:
+                    self.messages.append(entry['MessageBody'])
+                successful.append({'Id': entry['Id'], 'MessageId': str(uuid.uuid4()), 'MD5OfMessageBody': ''})
+            payload = {'Successful': successful, 'Failed': failed}
+        else:
+            payload = {}
+
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-amz-json-1.0')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def run_benchmark(total=1000, latency_ms=20, failure_rate=0.02):
+    print("=" * 60)
+    print("⏱️  Benchmark - Envio em lote para o SQS")
+    print("=" * 60)
+    print()
+
+    _SQSStubHandler.latency = latency_ms / 1000.0
+    _SQSStubHandler.failure_rate = failure_rate
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SQSStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    business = MessagingBusiness()
+    business.service.sqs_client = Session().client(
+        'sqs',
+        region_name='us-east-1',
+        endpoint_url=f'http://127.0.0.1:{server.server_port}',
+        aws_access_key_id='benchmark',
+        aws_secret_access_key='benchmark',
+        config=Config(max_pool_connections=business.service.max_workers)
+    )
+    queue_url = f'http://127.0.0.1:{server.server_port}/000000000000/benchmark'
+    template = '{"pedido": {{index}}, "id": "{{uuid}}"}'
+
+    try:
+        started = time.perf_counter()
+        for index in range(total):
+            business.send_message(queue_url, template.replace('{{index}}', str(index)))
+        sequential = time.perf_counter() - started
+
+        _SQSStubHandler.messages.clear()
+        result = business.send_message_batch(queue_url, template=template, count=total)
+    finally:
+        server.shutdown()
+
+    print(f"   Mensagens: {total} | Latência simulada: {latency_ms} ms | Falha por entrada: {failure_rate:.0%}"
+          f" | Workers: {business.service.max_workers}")
+    print()
+    print(f"   {'Modo':<32}{'chamadas':>10}{'tempo (s)':>12}{'msgs/s':>10}")
+    print(f"   {'send_message (1 por vez)':<32}{_SQSStubHandler.calls.get('SendMessage', 0):>10}"
+          f"{sequential:>12.2f}{total / sequential:>10.0f}")
+    print(f"   {'send_message_batch (lotes de 10)':<32}{result['api_calls']:>10}"
+          f"{result['elapsed_seconds']:>12.2f}{result['messages_per_second']:>10.0f}")
+    print()
+    print(f"   Entregues: {len(_SQSStubHandler.messages)} | Reenvios: {result['retried']} | Falhas: {result['failed']}")
+    print(f"   🚀 Ganho: {sequential / result['elapsed_seconds']:.1f}x")
+    print()
+
+
+if __name__ == '__main__':
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    )
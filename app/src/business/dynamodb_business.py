@@ -1,4 +1,8 @@
 from src.service.dynamodb_service import DynamoDBService
+from src.service.dynamodb_item_service import SORT_KEY_OPERATORS, DynamoDBItemService
+from src.service.dynamodb_table_watcher import get_dynamodb_table_watcher
+from src.service.dynamodb_transfer_service import get_dynamodb_transfer_service
+import os
 import re
 
 
@@ -9,6 +13,9 @@ class DynamoDBBusiness:
     
     def __init__(self):
         self.service = DynamoDBService()
+        self.items = DynamoDBItemService(self.service)
+        self.transfer = get_dynamodb_transfer_service()
+        self.watcher = get_dynamodb_table_watcher()
     
     def validate_table_name(self, table_name):
         """
@@ -87,59 +94,200 @@ class DynamoDBBusiness:
             'errors': []
         }
     
-    def create_table(self, table_name, primary_key, primary_key_type='S'):
+    def _validate_capacity(self, read_capacity, write_capacity, label):
         """
-        Cria uma tabela aplicando validações de negócio
+        Valida RCU/WCU do modo provisionado
+        
+        Returns:
+            tuple: (rcu, wcu, lista de erros)
+        """
+        try:
+            read_capacity = int(read_capacity)
+            write_capacity = int(write_capacity)
+        except (TypeError, ValueError):
+            return None, None, [f'{label}: RCU e WCU são obrigatórios no modo provisionado']
+        
+        if read_capacity < 1 or write_capacity < 1:
+            return None, None, [f'{label}: RCU e WCU devem ser maiores que 0']
+        
+        return read_capacity, write_capacity, []
+    
+    def _validate_index(self, index, kind, billing_mode):
+        """
+        Valida e normaliza a definição de um GSI ('gsi') ou LSI ('lsi')
+        
+        Returns:
+            tuple: (índice normalizado, lista de erros)
+        """
+        name = (index.get('name') or '').strip()
+        label = f'{kind.upper()} "{name}"' if name else kind.upper()
+        errors = []
+        
+        if not re.match(r'^[a-zA-Z0-9._-]{3,255}$', name):
+            errors.append(f'{label}: o nome deve ter entre 3 e 255 caracteres (letras, números, _, -, .)')
+        
+        normalized = {
+            'name': name,
+            'sort_key': (index.get('sort_key') or '').strip() or None,
+            'sort_key_type': (index.get('sort_key_type') or 'S').strip().upper(),
+            'projection': (index.get('projection') or 'ALL').strip().upper()
+        }
+        
+        if kind == 'gsi':
+            normalized['partition_key'] = (index.get('partition_key') or '').strip()
+            normalized['partition_key_type'] = (index.get('partition_key_type') or 'S').strip().upper()
+            if not normalized['partition_key']:
+                errors.append(f'{label}: a partition key é obrigatória')
+            errors.extend(self.validate_key_type(normalized['partition_key_type'])['errors'])
+        elif not normalized['sort_key']:
+            errors.append(f'{label}: a sort key é obrigatória')
+        
+        if normalized['sort_key']:
+            errors.extend(self.validate_key_type(normalized['sort_key_type'])['errors'])
+        
+        if normalized['projection'] not in ('ALL', 'KEYS_ONLY', 'INCLUDE'):
+            errors.append(f'{label}: projeção inválida. Use: ALL, KEYS_ONLY ou INCLUDE')
+        elif normalized['projection'] == 'INCLUDE':
+            normalized['non_key_attributes'] = self._parse_projection(index.get('non_key_attributes'))
+            if not normalized['non_key_attributes']:
+                errors.append(f'{label}: informe os atributos incluídos na projeção INCLUDE')
+        
+        if kind == 'gsi' and billing_mode == 'PROVISIONED':
+            normalized['read_capacity'], normalized['write_capacity'], capacity_errors = self._validate_capacity(
+                index.get('read_capacity'), index.get('write_capacity'), label
+            )
+            errors.extend(capacity_errors)
+        
+        return normalized, errors
+    
+    def create_table(self, table_name, primary_key, primary_key_type='S', sort_key=None, sort_key_type='S',
+                     billing_mode='PAY_PER_REQUEST', read_capacity=None, write_capacity=None,
+                     global_indexes=None, local_indexes=None, stream_view_type=None, ttl_attribute=None):
+        """
+        Cria uma tabela aplicando validações de negócio e acompanha até ficar pronta
         
         Args:
             table_name (str): Nome da tabela
-            primary_key (str): Nome da chave primária
-            primary_key_type (str): Tipo da chave primária
+            primary_key (str): Nome da partition key
+            primary_key_type (str): Tipo da partition key
+            sort_key (str): Nome da sort key (opcional)
+            sort_key_type (str): Tipo da sort key
+            billing_mode (str): PAY_PER_REQUEST ou PROVISIONED
+            read_capacity (int): RCUs (modo provisionado)
+            write_capacity (int): WCUs (modo provisionado)
+            global_indexes (list): GSIs
+            local_indexes (list): LSIs
+            stream_view_type (str): Tipo de imagem do stream (vazio = sem stream)
+            ttl_attribute (str): Atributo de TTL (ligado quando a tabela ficar ACTIVE)
         
         Returns:
-            dict: Resultado da operação
+            dict: Resultado da operação (com o estado do acompanhamento)
         """
+        errors = []
+        
         # Valida o nome da tabela
-        table_validation = self.validate_table_name(table_name)
-        if not table_validation['valid']:
-            return {
-                'success': False,
-                'message': 'Validação falhou',
-                'errors': table_validation['errors']
-            }
+        errors.extend(self.validate_table_name(table_name)['errors'])
         
-        # Valida a chave primária
-        key_validation = self.validate_primary_key(primary_key)
-        if not key_validation['valid']:
-            return {
-                'success': False,
-                'message': 'Validação falhou',
-                'errors': key_validation['errors']
-            }
+        # Valida as chaves
+        errors.extend(self.validate_primary_key(primary_key)['errors'])
+        errors.extend(self.validate_key_type(primary_key_type)['errors'])
+        sort_key = (sort_key or '').strip() or None
+        if sort_key:
+            errors.extend(self.validate_key_type(sort_key_type)['errors'])
+        
+        # Modo de cobrança
+        billing_mode = billing_mode or 'PAY_PER_REQUEST'
+        if billing_mode not in ('PAY_PER_REQUEST', 'PROVISIONED'):
+            errors.append('Modo de cobrança inválido. Use: PAY_PER_REQUEST ou PROVISIONED')
+        elif billing_mode == 'PROVISIONED':
+            read_capacity, write_capacity, capacity_errors = self._validate_capacity(read_capacity, write_capacity, 'Tabela')
+            errors.extend(capacity_errors)
         
-        # Valida o tipo da chave
-        type_validation = self.validate_key_type(primary_key_type)
-        if not type_validation['valid']:
+        # Índices
+        global_indexes = global_indexes or []
+        local_indexes = local_indexes or []
+        if len(global_indexes) > 20:
+            errors.append('Máximo de 20 GSIs por tabela')
+        if len(local_indexes) > 5:
+            errors.append('Máximo de 5 LSIs por tabela')
+        if local_indexes and not sort_key:
+            errors.append('LSIs exigem que a tabela tenha sort key')
+        
+        normalized_gsis = []
+        for index in global_indexes:
+            normalized, index_errors = self._validate_index(index, 'gsi', billing_mode)
+            normalized_gsis.append(normalized)
+            errors.extend(index_errors)
+        
+        normalized_lsis = []
+        for index in local_indexes:
+            normalized, index_errors = self._validate_index(index, 'lsi', billing_mode)
+            normalized_lsis.append(normalized)
+            errors.extend(index_errors)
+        
+        index_names = [index['name'] for index in normalized_gsis + normalized_lsis]
+        if len(index_names) != len(set(index_names)):
+            errors.append('Os nomes dos índices devem ser únicos')
+        
+        # Um atributo usado em mais de uma chave precisa ter sempre o mesmo tipo
+        attribute_types = {}
+        keys = [(primary_key, primary_key_type), (sort_key, sort_key_type)]
+        for index in normalized_gsis:
+            keys += [(index['partition_key'], index['partition_key_type']), (index['sort_key'], index['sort_key_type'])]
+        for index in normalized_lsis:
+            keys.append((index['sort_key'], index['sort_key_type']))
+        for name, attribute_type in keys:
+            if name and attribute_types.setdefault(name, attribute_type) != attribute_type:
+                errors.append(f'O atributo "{name}" aparece com tipos diferentes nas chaves')
+        
+        # Stream e TTL
+        stream_view_type = stream_view_type or None
+        if stream_view_type and stream_view_type not in ('NEW_IMAGE', 'OLD_IMAGE', 'NEW_AND_OLD_IMAGES', 'KEYS_ONLY'):
+            errors.append('Tipo de stream inválido. Use: NEW_IMAGE, OLD_IMAGE, NEW_AND_OLD_IMAGES ou KEYS_ONLY')
+        
+        ttl_attribute = (ttl_attribute or '').strip() or None
+        if ttl_attribute and ttl_attribute in attribute_types:
+            errors.append('O atributo de TTL não pode ser uma chave')
+        
+        if errors:
             return {
                 'success': False,
                 'message': 'Validação falhou',
-                'errors': type_validation['errors']
+                'errors': list(dict.fromkeys(errors))
             }
         
-        # Verifica se a tabela já existe
-        existing_tables = self.service.list_tables()
-        if existing_tables['success'] and table_name in existing_tables['tables']:
-            return {
-                'success': False,
-                'message': f'A tabela "{table_name}" já existe',
-                'errors': ['Tabela já existe']
-            }
+        # Cria a tabela (uma tabela existente volta como ResourceInUseException)
+        result = self.service.create_table(
+            table_name,
+            primary_key,
+            primary_key_type,
+            sort_key,
+            sort_key_type,
+            billing_mode,
+            read_capacity,
+            write_capacity,
+            normalized_gsis,
+            normalized_lsis,
+            stream_view_type
+        )
         
-        # Cria a tabela
-        result = self.service.create_table(table_name, primary_key, primary_key_type)
+        if result['success']:
+            result['watch'] = self.watcher.watch(table_name, ttl_attribute)['watch']
         
         return result
     
+    def get_table_status(self, table_name):
+        """
+        Estado do acompanhamento de uma tabela recém-criada
+        """
+        return self.watcher.get_watch(table_name)
+    
+    def stream_table_status(self, table_name):
+        """
+        Gerador das mudanças de status até a tabela ficar pronta
+        """
+        return self.watcher.iter_updates(table_name)
+    
     def list_tables(self):
         """
         Lista todas as tabelas
@@ -149,6 +297,18 @@ class DynamoDBBusiness:
         """
         return self.service.list_tables()
     
+    def get_inventory(self, refresh=False):
+        """
+        Inventário das tabelas com itens, tamanho, billing, GSIs e streams
+        
+        Args:
+            refresh (bool): Ignora o cache e descreve todas as tabelas
+        
+        Returns:
+            dict: Resumo por tabela
+        """
+        return self.service.get_inventory(refresh)
+    
     def get_table_info(self, table_name):
         """
         Obtém informações de uma tabela
@@ -182,3 +342,245 @@ class DynamoDBBusiness:
         
         # Deleta a tabela
         return self.service.delete_table(table_name)
+    
+    def _parse_projection(self, projection):
+        """
+        Converte "a, b, c" (ou lista) em lista de atributos de primeiro nível
+        """
+        if not projection:
+            return None
+        if isinstance(projection, str):
+            projection = projection.split(',')
+        
+        return [attribute.strip() for attribute in projection if attribute and attribute.strip()] or None
+    
+    def _parse_limit(self, value, default, maximum, label):
+        """
+        Converte e valida um limite numérico
+        
+        Returns:
+            tuple: (valor, mensagem de erro)
+        """
+        try:
+            value = int(value) if value not in (None, '') else default
+        except (TypeError, ValueError):
+            return None, f'{label} deve ser um número inteiro'
+        
+        if value is not None and not 1 <= value <= maximum:
+            return None, f'{label} deve ser entre 1 e {maximum}'
+        
+        return value, None
+    
+    def query_items(self, table_name, partition_value, sort_operator=None, sort_value=None,
+                    sort_value2=None, index_name=None, projection=None, limit=None,
+                    next_token=None, scan_forward=True, consistent_read=False):
+        """
+        Query de itens por partition key (e condição opcional na sort key), paginada
+        
+        Args:
+            table_name (str): Nome da tabela
+            partition_value (str): Valor da partition key
+            sort_operator (str): =, <, <=, >, >=, between ou begins_with
+            sort_value (str): Valor da sort key
+            sort_value2 (str): Limite superior (between)
+            index_name (str): GSI/LSI (opcional)
+            projection (str ou list): Atributos retornados
+            limit (int): Itens por página
+            next_token (str): Token da página anterior
+            scan_forward (bool): Ordem crescente da sort key
+            consistent_read (bool): Leitura fortemente consistente
+        
+        Returns:
+            dict: Página de itens
+        """
+        table_validation = self.validate_table_name(table_name)
+        if not table_validation['valid']:
+            return {'success': False, 'message': 'Validação falhou', 'errors': table_validation['errors']}
+        
+        if partition_value in (None, ''):
+            return {'success': False, 'message': 'Valor da partition key é obrigatório'}
+        
+        sort_condition = None
+        if sort_operator:
+            if sort_operator not in SORT_KEY_OPERATORS:
+                return {'success': False, 'message': f'Operador inválido. Use: {", ".join(SORT_KEY_OPERATORS)}'}
+            if sort_value in (None, '') or (sort_operator == 'between' and sort_value2 in (None, '')):
+                return {'success': False, 'message': 'Informe o(s) valor(es) da sort key'}
+            sort_condition = {'operator': sort_operator, 'value': sort_value, 'value2': sort_value2}
+        
+        limit, error = self._parse_limit(limit, None, 1000, 'Itens por página')
+        if error:
+            return {'success': False, 'message': error}
+        
+        return self.items.query(
+            table_name,
+            partition_value,
+            sort_condition,
+            index_name or None,
+            self._parse_projection(projection),
+            limit,
+            next_token or None,
+            scan_forward,
+            consistent_read
+        )
+    
+    def scan_items(self, table_name, projection=None, limit=None, next_token=None, index_name=None):
+        """
+        Uma página de Scan
+        """
+        table_validation = self.validate_table_name(table_name)
+        if not table_validation['valid']:
+            return {'success': False, 'message': 'Validação falhou', 'errors': table_validation['errors']}
+        
+        limit, error = self._parse_limit(limit, None, 1000, 'Itens por página')
+        if error:
+            return {'success': False, 'message': error}
+        
+        return self.items.scan_page(table_name, self._parse_projection(projection), limit,
+                                    next_token or None, index_name or None)
+    
+    def stream_scan(self, table_name, segments=4, projection=None, max_items=None,
+                    max_capacity=None, index_name=None):
+        """
+        Scan paralelo (TotalSegments) com os itens enviados conforme chegam
+        
+        Args:
+            table_name (str): Nome da tabela
+            segments (int): Segmentos/workers em paralelo
+            projection (str ou list): Atributos retornados
+            max_items (int): Itens máximos
+            max_capacity (float): RCUs máximas consumidas
+            index_name (str): Índice (opcional)
+        
+        Returns:
+            dict: 'events' com o gerador do scan ou mensagem de erro
+        """
+        max_allowed = int(os.getenv('DYNAMODB_SCAN_MAX_ITEMS', 100000))
+        
+        table_validation = self.validate_table_name(table_name)
+        if not table_validation['valid']:
+            return {'success': False, 'message': 'Validação falhou', 'errors': table_validation['errors']}
+        
+        segments, error = self._parse_limit(segments, 4, self.items.max_segments, 'Segmentos')
+        if error:
+            return {'success': False, 'message': error}
+        
+        max_items, error = self._parse_limit(max_items, 1000, max_allowed, 'Quantidade máxima de itens')
+        if error:
+            return {'success': False, 'message': error}
+        
+        try:
+            max_capacity = float(max_capacity) if max_capacity not in (None, '') else None
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Orçamento de capacidade deve ser um número'}
+        
+        if max_capacity is not None and max_capacity <= 0:
+            return {'success': False, 'message': 'Orçamento de capacidade deve ser positivo'}
+        
+        return {
+            'success': True,
+            'events': self.items.iter_scan(
+                table_name, segments, self._parse_projection(projection), max_items, max_capacity, index_name or None
+            )
+        }
+    
+    def _parse_rate(self, value, label):
+        """
+        Converte e valida um limite de capacidade por segundo (vazio = sem limite)
+        
+        Returns:
+            tuple: (valor, mensagem de erro)
+        """
+        try:
+            value = float(value) if value not in (None, '') else None
+        except (TypeError, ValueError):
+            return None, f'{label} deve ser um número'
+        
+        if value is not None and value <= 0:
+            return None, f'{label} deve ser positivo'
+        
+        return value, None
+    
+    def start_import(self, table_name, stream, file_format=None, filename=None, writers=None, max_wcu=None):
+        """
+        Importa itens de um arquivo NDJSON ou CSV com BatchWriteItem
+        
+        Args:
+            table_name (str): Tabela de destino
+            stream: Conteúdo do arquivo (lido em blocos)
+            file_format (str): 'ndjson' ou 'csv' (se vazio, usa a extensão do arquivo)
+            filename (str): Nome do arquivo enviado
+            writers (int): Escritores simultâneos
+            max_wcu (float): WCUs/s consumidas no máximo
+        
+        Returns:
+            dict: ID do job ou erro
+        """
+        table_validation = self.validate_table_name(table_name)
+        if not table_validation['valid']:
+            return {'success': False, 'message': 'Validação falhou', 'errors': table_validation['errors']}
+        
+        if not file_format and filename:
+            file_format = os.path.splitext(filename)[1].lstrip('.').lower()
+            file_format = 'ndjson' if file_format in ('jsonl', 'json') else file_format
+        
+        if file_format not in self.transfer.IMPORT_FORMATS:
+            return {'success': False, 'message': f'Formato inválido. Use: {", ".join(self.transfer.IMPORT_FORMATS)}'}
+        
+        writers, error = self._parse_limit(writers, None, self.transfer.max_writers, 'Escritores')
+        if error:
+            return {'success': False, 'message': error}
+        
+        max_wcu, error = self._parse_rate(max_wcu, 'Limite de WCU/s')
+        if error:
+            return {'success': False, 'message': error}
+        
+        return self.transfer.start_import(table_name, stream, file_format, writers, max_wcu)
+    
+    def start_export(self, table_name, file_format='ndjson', segments=4, max_rcu=None, projection=None):
+        """
+        Exporta a tabela (Scan paralelo) para NDJSON (DynamoDB JSON) ou Parquet, preservando os tipos
+        
+        Args:
+            table_name (str): Tabela exportada
+            file_format (str): 'ndjson' ou 'parquet'
+            segments (int): Segmentos do scan paralelo
+            max_rcu (float): RCUs/s consumidas no máximo
+            projection (str ou list): Atributos exportados
+        
+        Returns:
+            dict: ID do job ou erro
+        """
+        table_validation = self.validate_table_name(table_name)
+        if not table_validation['valid']:
+            return {'success': False, 'message': 'Validação falhou', 'errors': table_validation['errors']}
+        
+        file_format = file_format or 'ndjson'
+        if file_format not in self.transfer.EXPORT_FORMATS:
+            return {'success': False, 'message': f'Formato inválido. Use: {", ".join(self.transfer.EXPORT_FORMATS)}'}
+        
+        segments, error = self._parse_limit(segments, 4, self.items.max_segments, 'Segmentos')
+        if error:
+            return {'success': False, 'message': error}
+        
+        max_rcu, error = self._parse_rate(max_rcu, 'Limite de RCU/s')
+        if error:
+            return {'success': False, 'message': error}
+        
+        return self.transfer.start_export(table_name, file_format, segments, max_rcu, self._parse_projection(projection))
+    
+    def get_transfer_job(self, job_id):
+        """Progresso de uma importação/exportação"""
+        return self.transfer.get_job(job_id)
+    
+    def cancel_transfer_job(self, job_id):
+        """Interrompe uma importação/exportação"""
+        return self.transfer.cancel_job(job_id)
+    
+    def stream_transfer_job(self, job_id):
+        """Gerador de progresso para streaming"""
+        return self.transfer.iter_progress(job_id)
+    
+    def get_export_file(self, job_id):
+        """Arquivo gerado por uma exportação terminada"""
+        return self.transfer.get_export_file(job_id)
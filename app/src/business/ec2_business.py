@@ -1,4 +1,5 @@
 from src.service.ec2_service import EC2Service
+from src.service.bastion_provisioning_service import get_bastion_provisioner
 import re
 
 
@@ -12,6 +13,7 @@ class EC2Business:
         Inicializa a camada de negócio com o service layer
         """
         self.service = EC2Service()
+        self.provisioner = get_bastion_provisioner()
     
     def list_all_instances(self):
         """
@@ -62,7 +64,7 @@ class EC2Business:
     def create_bastion_host(self, name, instance_type='t3.micro', key_name=None,
                            subnet_id=None, security_group_ids=None):
         """
-        Cria um Bastion Host com validações
+        Inicia a criação de um Bastion Host com validações (em background)
         
         Args:
             name (str): Nome da instância
@@ -103,13 +105,97 @@ class EC2Business:
                 'errors': ['Tipo inválido']
             }
         
-        return self.service.create_bastion_instance(
+        return self.provisioner.start(
             name=name,
             instance_type=instance_type,
             key_name=key_name,
             subnet_id=subnet_id,
             security_group_ids=security_group_ids
         )
+
+    def get_bastion_status(self, refresh=False, running_only=False):
+        """
+        Lista os Bastion Hosts com o status do SSM Agent (saudáveis primeiro)
+        
+        Args:
+            refresh (bool): Ignora o cache
+            running_only (bool): Retorna apenas instâncias em execução
+        
+        Returns:
+            dict: Bastions, contadores e o bastion recomendado
+        """
+        result = self.service.get_bastion_ssm_status(refresh=refresh)
+        
+        if not result['success']:
+            return result
+        
+        bastions = result['bastions']
+        if running_only:
+            bastions = [bastion for bastion in bastions if bastion['state'] == 'running']
+        
+        healthy = [bastion for bastion in bastions if bastion['healthy']]
+        
+        return dict(
+            result,
+            bastions=bastions,
+            count=len(bastions),
+            recommended=healthy[0]['instance_id'] if healthy else None
+        )
+    
+    def check_bastion_ready(self, instance_id):
+        """
+        Verifica (pelo status em cache) se o SSM Agent do bastion está online
+        
+        Antes de recusar, consulta a AWS de novo: o cache pode ser de antes
+        do agent voltar a ficar online
+        
+        Args:
+            instance_id (str): ID da instância
+        
+        Returns:
+            dict: Resultado da verificação
+        """
+        result = self.service.get_bastion_ssm_status()
+        
+        # Sem permissão para consultar o SSM: não bloqueia o túnel
+        if not result['success']:
+            return {'success': True}
+        
+        bastion = next((b for b in result['bastions'] if b['instance_id'] == instance_id), None)
+        if bastion is None or bastion['healthy']:
+            return {'success': True}
+        
+        if result['cached']:
+            result = self.service.get_bastion_ssm_status(refresh=True)
+            if not result['success']:
+                return {'success': True}
+            
+            bastion = next((b for b in result['bastions'] if b['instance_id'] == instance_id), None)
+            if bastion is None or bastion['healthy']:
+                return {'success': True}
+        
+        healthy = [b for b in result['bastions'] if b['healthy']]
+        message = f'SSM Agent do Bastion {bastion["name"]} não está online ({bastion["ping_status"] or bastion["state"]})'
+        if healthy:
+            message += f'. Use {healthy[0]["name"]} ({healthy[0]["instance_id"]})'
+        
+        return {
+            'success': False,
+            'message': message,
+            'recommended': healthy[0]['instance_id'] if healthy else None
+        }
+    
+    def get_bastion_job(self, job_id):
+        """
+        Retorna o progresso da criação de um Bastion Host
+        """
+        return self.provisioner.get_job(job_id)
+
+    def stream_bastion_job(self, job_id):
+        """
+        Gera o progresso da criação de um Bastion Host até o SSM Agent registrar
+        """
+        return self.provisioner.iter_progress(job_id)
     
     def create_instance(self, name, ami_id, instance_type, key_name=None,
                        subnet_id=None, security_group_ids=None, user_data=None):
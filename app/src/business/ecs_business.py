@@ -1,4 +1,6 @@
 from src.service.ecs_service import ECSService
+from src.service.ecs_deployment_watcher import get_ecs_deployment_watcher
+import time
 
 
 class ECSBusiness:
@@ -8,6 +10,7 @@ class ECSBusiness:
     
     def __init__(self):
         self.service = ECSService()
+        self.watcher = get_ecs_deployment_watcher()
     
     def list_all_clusters(self):
         """
@@ -142,6 +145,135 @@ class ECSBusiness:
             'service': service_name
         }
     
+    def get_tasks_deep_view(self, cluster_name, service_name=None, desired_status='RUNNING'):
+        """
+        Visão detalhada das tasks: cada task com sua task definition e containers
+        (imagem, CPU/memória, status, exit code) em uma única consulta
+        
+        Args:
+            cluster_name (str): Nome do cluster
+            service_name (str, optional): Nome do serviço
+            desired_status (str): RUNNING, PENDING ou STOPPED
+        
+        Returns:
+            dict: Tasks formatadas e tempo de cada fase
+        """
+        if not cluster_name or cluster_name.strip() == '':
+            return {
+                'success': False,
+                'message': 'Nome do cluster é obrigatório',
+                'errors': ['Nome do cluster não pode estar vazio']
+            }
+        
+        desired_status = (desired_status or 'RUNNING').upper()
+        valid_statuses = ['RUNNING', 'PENDING', 'STOPPED']
+        if desired_status not in valid_statuses:
+            return {
+                'success': False,
+                'message': f'Status inválido. Use: {", ".join(valid_statuses)}',
+                'errors': ['Status inválido']
+            }
+        
+        started = time.perf_counter()
+        result = self.service.get_tasks_deep_view(cluster_name, service_name, desired_status)
+        
+        if not result['success']:
+            return result
+        
+        join_started = time.perf_counter()
+        tasks = [
+            self._format_deep_task(task, result['task_definitions'].get(task.get('taskDefinitionArn')))
+            for task in result['tasks']
+        ]
+        
+        timing = result['timing']
+        timing['join_ms'] = round((time.perf_counter() - join_started) * 1000, 2)
+        timing['total_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        
+        return {
+            'success': True,
+            'tasks': tasks,
+            'count': len(tasks),
+            'cluster': cluster_name,
+            'service': service_name,
+            'desired_status': desired_status,
+            'failures': [
+                {'arn': failure.get('arn'), 'reason': failure.get('reason')}
+                for failure in result['failures']
+            ],
+            'timing': timing,
+            'api_calls': result['api_calls'],
+            'task_definitions': result['task_definition_stats'],
+            'cache': result['cache']
+        }
+    
+    def _format_deep_task(self, task, task_definition):
+        """
+        Junta uma task com a sua task definition
+        
+        Args:
+            task (dict): Task do describe_tasks
+            task_definition (dict): Task definition (None se não encontrada)
+        
+        Returns:
+            dict: Task no formato de list_cluster_tasks com containers detalhados
+        """
+        task_definition = task_definition or {}
+        definitions = {
+            container.get('name'): container
+            for container in task_definition.get('containerDefinitions', [])
+        }
+        
+        containers = []
+        for container in task.get('containers', []):
+            definition = definitions.get(container.get('name'), {})
+            containers.append({
+                'name': container.get('name', 'N/A'),
+                'image': container.get('image') or definition.get('image', 'N/A'),
+                'image_digest': container.get('imageDigest'),
+                'status': container.get('lastStatus', 'N/A'),
+                'health_status': container.get('healthStatus', 'UNKNOWN'),
+                'exit_code': container.get('exitCode'),
+                'reason': container.get('reason'),
+                'cpu': definition.get('cpu', container.get('cpu')),
+                'memory': definition.get('memory', container.get('memory')),
+                'memory_reservation': definition.get('memoryReservation', container.get('memoryReservation')),
+                'essential': definition.get('essential', True),
+                'ports': [
+                    f"{mapping.get('containerPort')}/{mapping.get('protocol', 'tcp')}"
+                    for mapping in definition.get('portMappings', [])
+                ]
+            })
+        
+        private_ip = None
+        for attachment in task.get('attachments', []):
+            for detail in attachment.get('details', []):
+                if detail.get('name') == 'privateIPv4Address':
+                    private_ip = detail.get('value')
+        
+        return {
+            'task_arn': task.get('taskArn', 'N/A'),
+            'task_id': self._extract_task_id(task.get('taskArn', '')),
+            'status': task.get('lastStatus', 'N/A'),
+            'desired_status': task.get('desiredStatus', 'N/A'),
+            'launch_type': task.get('launchType', 'N/A'),
+            'capacity_provider': task.get('capacityProviderName'),
+            'task_definition': self._extract_task_definition_name(
+                task.get('taskDefinitionArn', 'N/A')
+            ),
+            'family': task_definition.get('family'),
+            'revision': task_definition.get('revision'),
+            'group': task.get('group'),
+            'started_at': str(task.get('startedAt', 'N/A')),
+            'stopped_reason': task.get('stoppedReason'),
+            'cpu': task.get('cpu') or task_definition.get('cpu', 'N/A'),
+            'memory': task.get('memory') or task_definition.get('memory', 'N/A'),
+            'availability_zone': task.get('availabilityZone'),
+            'private_ip': private_ip,
+            'health_status': task.get('healthStatus', 'UNKNOWN'),
+            'containers': containers
+        }
+    
     def get_cluster_info(self, cluster_name):
         """
         Obtém informações detalhadas de um cluster
@@ -251,7 +383,7 @@ class ECSBusiness:
                 'errors': ['Nome do serviço não pode estar vazio']
             }
         
-        return self.service.stop_service(cluster_name, service_name)
+        return self._with_watch(self.service.stop_service(cluster_name, service_name), cluster_name, service_name)
     
     def start_service(self, cluster_name, service_name, desired_count):
         """
@@ -301,7 +433,7 @@ class ECSBusiness:
                 'errors': ['Valor inválido para desired count']
             }
         
-        return self.service.start_service(cluster_name, service_name, desired_count)
+        return self._with_watch(self.service.start_service(cluster_name, service_name, desired_count), cluster_name, service_name)
     
     def change_capacity_provider(self, cluster_name, service_name, capacity_provider):
         """
@@ -338,4 +470,51 @@ class ECSBusiness:
                 'errors': ['Capacity Provider inválido']
             }
         
-        return self.service.change_capacity_provider(cluster_name, service_name, capacity_provider)
+        return self._with_watch(self.service.change_capacity_provider(cluster_name, service_name, capacity_provider), cluster_name, service_name)
+    
+    def watch_deployment(self, cluster_name, service_name):
+        """
+        Inicia (ou reaproveita) o acompanhamento do deployment de um serviço
+        
+        Args:
+            cluster_name (str): Nome do cluster
+            service_name (str): Nome do serviço
+        
+        Returns:
+            dict: Estado do acompanhamento e URL do stream
+        """
+        if not cluster_name or cluster_name.strip() == '':
+            return {
+                'success': False,
+                'message': 'Nome do cluster é obrigatório',
+                'errors': ['Nome do cluster não pode estar vazio']
+            }
+        
+        if not service_name or service_name.strip() == '':
+            return {
+                'success': False,
+                'message': 'Nome do serviço é obrigatório',
+                'errors': ['Nome do serviço não pode estar vazio']
+            }
+        
+        return self.watcher.watch(cluster_name, service_name)
+    
+    def stream_deployment(self, cluster_name, service_name):
+        """
+        Mudanças do deployment de um serviço até atingir steady state (para streaming)
+        """
+        return self.watcher.iter_updates(cluster_name, service_name)
+    
+    def list_deployment_watches(self):
+        """
+        Acompanhamentos de deployment ativos
+        """
+        return self.watcher.list_watches()
+    
+    def _with_watch(self, result, cluster_name, service_name):
+        """
+        Após alterar um serviço com sucesso, inicia o acompanhamento do deployment
+        """
+        if result['success']:
+            result['watch'] = self.watcher.watch(cluster_name, service_name)['watch']
+        return result
@@ -0,0 +1,125 @@
+from src.service.inventory_service import InventoryService
+import re
+
+
+class InventoryBusiness:
+    """
+    Business layer para o inventário multi-região/multi-conta - validações e regras de negócio
+    """
+    
+    MAX_REGIONS = 20
+    MAX_PROFILES = 10
+    MAX_TIMEOUT = 120
+    
+    def __init__(self):
+        """
+        Inicializa a camada de negócio
+        """
+        self.service = InventoryService()
+    
+    def get_options(self):
+        """
+        Regiões, perfis e recursos disponíveis
+        
+        Returns:
+            dict: Opções para montar a consulta
+        """
+        try:
+            return self.service.get_available_options()
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao listar regiões e perfis: {str(e)}'
+            }
+    
+    def collect(self, resources, regions=None, profiles=None, timeout=None):
+        """
+        Coleta o inventário com validações
+        
+        Args:
+            resources (list): Recursos a coletar
+            regions (list): Regiões (padrão: região configurada)
+            profiles (list): Perfis AWS (padrão: credenciais padrão)
+            timeout (float): Segundos máximos por região
+        
+        Returns:
+            dict: Inventário consolidado
+        """
+        resources = self._as_list(resources)
+        regions = self._as_list(regions) or [self.service.default_region]
+        profiles = self._as_list(profiles)
+        
+        if not resources:
+            return {
+                'success': False,
+                'message': 'Informe ao menos um recurso'
+            }
+        
+        invalid = [resource for resource in resources if resource not in InventoryService.RESOURCES]
+        if invalid:
+            return {
+                'success': False,
+                'message': f'Recursos inválidos: {", ".join(invalid)}. Use: {", ".join(sorted(InventoryService.RESOURCES))}'
+            }
+        
+        if len(regions) > self.MAX_REGIONS:
+            return {
+                'success': False,
+                'message': f'Máximo de {self.MAX_REGIONS} regiões por consulta'
+            }
+        
+        invalid = [region for region in regions if not re.match(r'^[a-z]{2}(-[a-z]+)+-\d$', region)]
+        if invalid:
+            return {
+                'success': False,
+                'message': f'Regiões inválidas: {", ".join(invalid)}'
+            }
+        
+        if len(profiles) > self.MAX_PROFILES:
+            return {
+                'success': False,
+                'message': f'Máximo de {self.MAX_PROFILES} perfis por consulta'
+            }
+        
+        if profiles:
+            available = set(self.service.get_available_options()['profiles'])
+            invalid = [profile for profile in profiles if profile not in available]
+            if invalid:
+                return {
+                    'success': False,
+                    'message': f'Perfis não encontrados: {", ".join(invalid)}'
+                }
+        
+        if timeout is not None and timeout != '':
+            try:
+                timeout = float(timeout)
+            except (TypeError, ValueError):
+                return {
+                    'success': False,
+                    'message': 'Timeout inválido'
+                }
+            
+            if timeout <= 0 or timeout > self.MAX_TIMEOUT:
+                return {
+                    'success': False,
+                    'message': f'Timeout deve ser entre 0 e {self.MAX_TIMEOUT} segundos'
+                }
+        else:
+            timeout = None
+        
+        # Remove duplicados mantendo a ordem
+        resources = list(dict.fromkeys(resources))
+        regions = list(dict.fromkeys(regions))
+        profiles = list(dict.fromkeys(profiles)) or None
+        
+        return self.service.collect(resources, regions, profiles, timeout)
+    
+    def _as_list(self, value):
+        """
+        Aceita lista ou texto separado por vírgula
+        """
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(',')
+        return [str(item).strip() for item in value if str(item).strip()]
@@ -2,10 +2,19 @@
 Business layer para SQS e SNS
 """
 from src.service.messaging_service import MessagingService
+from src.service.sqs_drain_service import get_sqs_drain_service
+from src.service.sqs_redrive_service import get_sqs_redrive_service
+from src.service.sns_fanout_service import get_sns_fanout_tester
+import os
+import time
+import uuid
 
 class MessagingBusiness:
     def __init__(self):
         self.service = MessagingService()
+        self.drain = get_sqs_drain_service()
+        self.redrive = get_sqs_redrive_service()
+        self.fanout = get_sns_fanout_tester()
     
     # ==================== SQS ====================
     
@@ -32,6 +41,107 @@ class MessagingBusiness:
         """Envia mensagem para fila"""
         return self.service.send_message(queue_url, message_body, None, delay_seconds)
     
+    def send_message_batch(self, queue_url, ndjson=None, template=None, count=None,
+                           delay_seconds=0, group_id=None, concurrency=None):
+        """
+        Envio em lote: uma mensagem por linha do NDJSON ou N cópias de um template
+        
+        Placeholders do template (e do group_id): {{index}}, {{uuid}}, {{timestamp}}
+        
+        Args:
+            queue_url (str): URL da fila
+            ndjson (str ou iterável de linhas): Uma mensagem por linha
+            template (str): Corpo da mensagem para o modo carga
+            count (int): Quantidade de mensagens do template
+            delay_seconds (int): Delay de cada mensagem
+            group_id (str): MessageGroupId (filas FIFO)
+            concurrency (int): Chamadas simultâneas
+        """
+        max_messages = int(os.getenv('SQS_LOAD_MAX_MESSAGES', 100000))
+        
+        if not queue_url:
+            return {'success': False, 'message': 'URL da fila é obrigatória'}
+        
+        if (ndjson is None) == (template is None):
+            return {'success': False, 'message': 'Informe o NDJSON ou um template com quantidade'}
+        
+        try:
+            delay_seconds = int(delay_seconds or 0)
+            concurrency = int(concurrency) if concurrency else None
+            count = int(count) if template is not None else None
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Quantidade, delay e concorrência devem ser números inteiros'}
+        
+        if not 0 <= delay_seconds <= 900:
+            return {'success': False, 'message': 'Delay deve ser entre 0 e 900 segundos'}
+        
+        if concurrency is not None and not 1 <= concurrency <= 64:
+            return {'success': False, 'message': 'Concorrência deve ser entre 1 e 64'}
+        
+        if template is not None and not 1 <= count <= max_messages:
+            return {'success': False, 'message': f'Quantidade deve ser entre 1 e {max_messages}'}
+        
+        is_fifo = queue_url.endswith('.fifo')
+        if is_fifo and delay_seconds:
+            return {'success': False, 'message': 'Filas FIFO não aceitam delay por mensagem'}
+        
+        group_id = group_id or ('dev-manager' if is_fifo else None)
+        truncated = []
+        
+        if template is not None:
+            bodies = (self._render(template, index) for index in range(count))
+        else:
+            lines = ndjson.splitlines() if isinstance(ndjson, str) else ndjson
+            bodies = self._ndjson_bodies(lines, max_messages, truncated)
+        
+        def entries():
+            for index, body in enumerate(bodies):
+                yield {
+                    'body': body,
+                    'delay_seconds': delay_seconds,
+                    'group_id': self._render(group_id, index) if group_id else None,
+                    'deduplication_id': uuid.uuid4().hex if is_fifo else None
+                }
+        
+        result = self.service.send_message_batch(queue_url, entries(), concurrency)
+        
+        if truncated:
+            result['truncated'] = True
+            result['message'] += f' (limite de {max_messages} mensagens atingido)'
+        
+        return result
+    
+    def _ndjson_bodies(self, lines, max_messages, truncated):
+        """
+        Uma mensagem por linha não vazia, até max_messages
+        """
+        sent = 0
+        
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if not line:
+                continue
+            
+            if sent == max_messages:
+                truncated.append(True)
+                return
+            
+            sent += 1
+            yield line
+    
+    def _render(self, template, index):
+        """
+        Substitui os placeholders do template de carga
+        """
+        body = template.replace('{{index}}', str(index))
+        if '{{uuid}}' in body:
+            body = body.replace('{{uuid}}', str(uuid.uuid4()))
+        if '{{timestamp}}' in body:
+            body = body.replace('{{timestamp}}', str(time.time()))
+        return body
+    
     def receive_messages(self, queue_url, max_messages=10):
         """Recebe mensagens da fila"""
         return self.service.receive_messages(queue_url, max_messages)
@@ -40,6 +150,145 @@ class MessagingBusiness:
         """Deleta mensagem da fila"""
         return self.service.delete_message(queue_url, receipt_handle)
     
+    def delete_message_batch(self, queue_url, receipt_handles):
+        """Deleta várias mensagens da fila (10 por chamada)"""
+        if not queue_url:
+            return {'success': False, 'message': 'URL da fila é obrigatória'}
+        
+        if not receipt_handles or not isinstance(receipt_handles, list):
+            return {'success': False, 'message': 'Informe a lista de receipt handles'}
+        
+        return self.service.delete_message_batch(queue_url, list(dict.fromkeys(receipt_handles)))
+    
+    def start_drain(self, queue_url, mode='peek', max_messages=1000, max_bytes=None,
+                    receivers=None, wait_time=5, visibility_timeout=120):
+        """
+        Inicia a leitura em massa da fila
+        
+        Args:
+            queue_url (str): URL da fila
+            mode (str): 'peek' (só lê) ou 'drain' (lê e apaga)
+            max_messages (int): Quantidade máxima de mensagens
+            max_bytes (int): Soma máxima do tamanho dos corpos
+            receivers (int): Receptores simultâneos
+            wait_time (int): Segundos de long polling (1 a 20)
+            visibility_timeout (int): Segundos que as mensagens ficam invisíveis durante a leitura
+        """
+        max_allowed = int(os.getenv('SQS_DRAIN_MAX_MESSAGES', 100000))
+        
+        if not queue_url:
+            return {'success': False, 'message': 'URL da fila é obrigatória'}
+        
+        if mode not in self.drain.MODES:
+            return {'success': False, 'message': f'Modo inválido. Use: {", ".join(self.drain.MODES)}'}
+        
+        try:
+            max_messages = int(max_messages or 1000)
+            max_bytes = int(max_bytes) if max_bytes else None
+            receivers = int(receivers) if receivers else None
+            wait_time = int(wait_time or 5)
+            visibility_timeout = int(visibility_timeout or 120)
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Limites, receptores e tempos devem ser números inteiros'}
+        
+        if not 1 <= max_messages <= max_allowed:
+            return {'success': False, 'message': f'Quantidade máxima deve ser entre 1 e {max_allowed}'}
+        
+        if max_bytes is not None and max_bytes < 1:
+            return {'success': False, 'message': 'Limite de bytes deve ser positivo'}
+        
+        if receivers is not None and receivers < 1:
+            return {'success': False, 'message': 'Receptores deve ser maior que 0'}
+        
+        if not 1 <= wait_time <= 20:
+            return {'success': False, 'message': 'Long polling deve ser entre 1 e 20 segundos'}
+        
+        if not 1 <= visibility_timeout <= 43200:
+            return {'success': False, 'message': 'Visibility timeout deve ser entre 1 e 43200 segundos'}
+        
+        return self.drain.start(queue_url, mode, max_messages, max_bytes, receivers, wait_time, visibility_timeout)
+    
+    def get_drain_job(self, job_id):
+        """Progresso da leitura em massa"""
+        return self.drain.get_job(job_id)
+    
+    def cancel_drain_job(self, job_id):
+        """Interrompe a leitura em massa"""
+        return self.drain.cancel_job(job_id)
+    
+    def stream_drain_job(self, job_id):
+        """Mensagens da leitura em massa conforme chegam (para streaming)"""
+        return self.drain.iter_messages(job_id)
+    
+    def get_drain_export_path(self, job_id):
+        """Arquivo NDJSON com as mensagens lidas"""
+        return self.drain.get_export_path(job_id)
+    
+    def start_redrive(self, source_queue_url, destination_queue_url=None, max_per_second=None,
+                      max_messages=None, strategy='auto'):
+        """
+        Inicia o redrive de uma DLQ
+        
+        Args:
+            source_queue_url (str): URL da DLQ
+            destination_queue_url (str): URL do destino (vazio = fila de origem das mensagens)
+            max_per_second (float): Limite de mensagens por segundo
+            max_messages (int): Quantidade máxima de mensagens
+            strategy (str): 'auto', 'native' (StartMessageMoveTask) ou 'pipeline'
+        """
+        max_rate = float(os.getenv('SQS_REDRIVE_MAX_RATE', 3000))
+        
+        if not source_queue_url:
+            return {'success': False, 'message': 'URL da DLQ é obrigatória'}
+        
+        if destination_queue_url and destination_queue_url == source_queue_url:
+            return {'success': False, 'message': 'A fila de destino deve ser diferente da DLQ'}
+        
+        if strategy not in self.redrive.STRATEGIES:
+            return {'success': False, 'message': f'Estratégia inválida. Use: {", ".join(self.redrive.STRATEGIES)}'}
+        
+        try:
+            max_per_second = float(max_per_second) if max_per_second else None
+            max_messages = int(max_messages) if max_messages else None
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Taxa e quantidade máxima devem ser números'}
+        
+        if max_per_second is not None and not 0 < max_per_second <= max_rate:
+            return {'success': False, 'message': f'Taxa deve ser maior que 0 e no máximo {max_rate:g} mensagens/s'}
+        
+        if max_messages is not None and max_messages < 1:
+            return {'success': False, 'message': 'Quantidade máxima deve ser maior que 0'}
+        
+        if strategy == self.redrive.NATIVE:
+            if max_messages:
+                return {'success': False, 'message': 'O redrive nativo não aceita quantidade máxima; use pipeline'}
+            if max_per_second and max_per_second > 500:
+                return {'success': False, 'message': 'O redrive nativo aceita no máximo 500 mensagens/s; use pipeline'}
+            if max_per_second and not max_per_second.is_integer():
+                return {'success': False, 'message': 'O redrive nativo aceita apenas taxas inteiras (mensagens/s); use pipeline'}
+        
+        return self.redrive.start(source_queue_url, destination_queue_url or None, max_per_second, max_messages, strategy)
+    
+    def list_redrive_jobs(self, source_queue_url=None):
+        """Redrives registrados"""
+        return self.redrive.list_jobs(source_queue_url)
+    
+    def get_redrive_job(self, job_id):
+        """Progresso do redrive"""
+        return self.redrive.get_job(job_id)
+    
+    def cancel_redrive_job(self, job_id):
+        """Pausa o redrive"""
+        return self.redrive.cancel(job_id)
+    
+    def resume_redrive_job(self, job_id):
+        """Retoma um redrive pausado ou interrompido"""
+        return self.redrive.resume(job_id)
+    
+    def stream_redrive_job(self, job_id):
+        """Progresso do redrive até terminar (para streaming)"""
+        return self.redrive.iter_progress(job_id)
+    
     def purge_queue(self, queue_url):
         """Limpa fila"""
         return self.service.purge_queue(queue_url)
@@ -66,6 +315,110 @@ class MessagingBusiness:
         """Publica mensagem em tópico"""
         return self.service.publish_message(topic_arn, message, subject)
     
+    def publish_batch(self, topic_arn, ndjson=None, template=None, count=None,
+                      subject=None, group_id=None, concurrency=None):
+        """
+        Publicação em lote: uma mensagem por linha do NDJSON ou N cópias de um template
+        
+        Placeholders do template (e do group_id): {{index}}, {{uuid}}, {{timestamp}}
+        
+        Args:
+            topic_arn (str): ARN do tópico
+            ndjson (str ou iterável de linhas): Uma mensagem por linha
+            template (str): Corpo da mensagem para o modo carga
+            count (int): Quantidade de mensagens do template
+            subject (str): Assunto de cada mensagem
+            group_id (str): MessageGroupId (tópicos FIFO)
+            concurrency (int): Chamadas simultâneas
+        """
+        max_messages = int(os.getenv('SQS_LOAD_MAX_MESSAGES', 100000))
+        
+        if not topic_arn:
+            return {'success': False, 'message': 'ARN do tópico é obrigatório'}
+        
+        if (ndjson is None) == (template is None):
+            return {'success': False, 'message': 'Informe o NDJSON ou um template com quantidade'}
+        
+        try:
+            concurrency = int(concurrency) if concurrency else None
+            count = int(count) if template is not None else None
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Quantidade e concorrência devem ser números inteiros'}
+        
+        if concurrency is not None and not 1 <= concurrency <= 64:
+            return {'success': False, 'message': 'Concorrência deve ser entre 1 e 64'}
+        
+        if template is not None and not 1 <= count <= max_messages:
+            return {'success': False, 'message': f'Quantidade deve ser entre 1 e {max_messages}'}
+        
+        is_fifo = topic_arn.endswith('.fifo')
+        group_id = group_id or ('dev-manager' if is_fifo else None)
+        truncated = []
+        
+        if template is not None:
+            bodies = (self._render(template, index) for index in range(count))
+        else:
+            lines = ndjson.splitlines() if isinstance(ndjson, str) else ndjson
+            bodies = self._ndjson_bodies(lines, max_messages, truncated)
+        
+        def entries():
+            for index, body in enumerate(bodies):
+                yield {
+                    'body': body,
+                    'subject': subject,
+                    'group_id': self._render(group_id, index) if group_id else None,
+                    'deduplication_id': uuid.uuid4().hex if is_fifo else None
+                }
+        
+        result = self.service.publish_batch(topic_arn, entries(), concurrency)
+        
+        if truncated:
+            result['truncated'] = True
+            result['message'] += f' (limite de {max_messages} mensagens atingido)'
+        
+        return result
+    
+    def start_fanout_test(self, topic_arn, count=100, concurrency=None, settle_timeout=10):
+        """
+        Inicia o teste de fan-out (fila SQS temporária inscrita no tópico)
+        
+        Args:
+            topic_arn (str): ARN do tópico
+            count (int): Mensagens publicadas
+            concurrency (int): Chamadas PublishBatch simultâneas
+            settle_timeout (float): Segundos sem entregas até considerar o restante perdido
+        """
+        max_messages = int(os.getenv('SNS_FANOUT_MAX_MESSAGES', 10000))
+        
+        if not topic_arn:
+            return {'success': False, 'message': 'ARN do tópico é obrigatório'}
+        
+        try:
+            count = int(count if count is not None else 100)
+            concurrency = int(concurrency) if concurrency else None
+            settle_timeout = float(settle_timeout or 10)
+        except (TypeError, ValueError):
+            return {'success': False, 'message': 'Quantidade, concorrência e espera devem ser números'}
+        
+        if not 1 <= count <= max_messages:
+            return {'success': False, 'message': f'Quantidade deve ser entre 1 e {max_messages}'}
+        
+        if concurrency is not None and not 1 <= concurrency <= 64:
+            return {'success': False, 'message': 'Concorrência deve ser entre 1 e 64'}
+        
+        if not 1 <= settle_timeout <= 120:
+            return {'success': False, 'message': 'Espera por entregas deve ser entre 1 e 120 segundos'}
+        
+        return self.fanout.start(topic_arn, count, concurrency, settle_timeout)
+    
+    def get_fanout_test(self, job_id):
+        """Progresso/resultado do teste de fan-out"""
+        return self.fanout.get_job(job_id)
+    
+    def stream_fanout_test(self, job_id):
+        """Progresso do teste de fan-out até terminar (para streaming)"""
+        return self.fanout.iter_progress(job_id)
+    
     def list_subscriptions(self, topic_arn=None):
         """Lista inscrições"""
         return self.service.list_subscriptions(topic_arn)
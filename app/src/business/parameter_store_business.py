@@ -1,4 +1,6 @@
 from src.service.parameter_store_service import ParameterStoreService
+from src.service.catalog_index_service import CatalogIndexService, get_catalog_index_service
+from src.service.config_promotion_service import ConfigPromotionService, get_config_promotion_service
 import re
 
 
@@ -7,19 +9,38 @@ class ParameterStoreBusiness:
     Business layer para Parameter Store - validações e regras de negócio
     """
     
+    MAX_BULK_PARAMETERS = 500
+    MAX_SEARCH_RESULTS = 1000
+    
     def __init__(self):
         """
         Inicializa a camada de negócio
         """
         self.service = ParameterStoreService()
+        self.catalog = get_catalog_index_service()
+        self.promotion = get_config_promotion_service()
     
     def list_all_parameters(self):
         """
         Lista todos os parâmetros com formatação
+        Usa o índice local quando já sincronizado; senão lista direto na AWS
         
         Returns:
             dict: Lista formatada de parâmetros
         """
+        self.catalog.ensure_background_sync()
+        
+        if self.catalog.is_ready(CatalogIndexService.PARAMETER):
+            indexed = self.catalog.search(CatalogIndexService.PARAMETER)
+            if indexed['success']:
+                return {
+                    'success': True,
+                    'parameters': indexed['items'],
+                    'count': indexed['count'],
+                    'source': 'index',
+                    'synced_at': indexed['synced_at']
+                }
+        
         result = self.service.list_parameters()
         
         if result['success']:
@@ -39,11 +60,82 @@ class ParameterStoreBusiness:
             return {
                 'success': True,
                 'parameters': formatted_params,
-                'count': len(formatted_params)
+                'count': len(formatted_params),
+                'source': 'aws'
+            }
+        
+        return result
+    
+    def search_parameters(self, query=None, prefix=None, tag=None, limit=None):
+        """
+        Busca parâmetros no índice local por trecho, prefixo ou tag
+        
+        Args:
+            query (str): Trecho do nome, descrição ou tags
+            prefix (str): Prefixo do nome
+            tag (str): "chave" ou "chave=valor"
+            limit (int): Quantidade máxima de resultados
+        
+        Returns:
+            dict: Parâmetros encontrados
+        """
+        return self._search_index(CatalogIndexService.PARAMETER, 'parameters', query, prefix, tag, limit)
+    
+    def get_parameter_tree(self, path='/', limit=None):
+        """
+        Retorna um nível da hierarquia de parâmetros (carregamento sob demanda)
+        
+        Args:
+            path (str): Pasta a expandir ('/' para a raiz)
+            limit (int): Quantidade máxima de parâmetros diretos
+        
+        Returns:
+            dict: Subpastas com contagem e parâmetros diretos da pasta
+        """
+        path = '/' + (path or '').strip().strip('/')
+        
+        if path != '/' and not re.match(r'^[a-zA-Z0-9/_.-]+$', path):
+            return {
+                'success': False,
+                'message': 'Caminho contém caracteres inválidos. Use apenas: a-z A-Z 0-9 / _ . -'
+            }
+        
+        self.catalog.ensure_background_sync()
+        
+        if not self.catalog.is_ready(CatalogIndexService.PARAMETER):
+            return {
+                'success': False,
+                'indexing': True,
+                'message': 'Índice em sincronização, tente novamente em instantes'
+            }
+        
+        try:
+            limit = min(int(limit), self.MAX_SEARCH_RESULTS) if limit else self.MAX_SEARCH_RESULTS
+        except (TypeError, ValueError):
+            return {
+                'success': False,
+                'message': 'Limite inválido'
             }
         
+        result = self.catalog.get_tree_level(CatalogIndexService.PARAMETER, path, limit)
+        
+        if result['success']:
+            result['parameters'] = result.pop('items')
+        
         return result
     
+    def sync_catalog(self, full=False):
+        """
+        Dispara a sincronização do índice de parâmetros
+        """
+        return self.catalog.trigger_sync(CatalogIndexService.PARAMETER, full)
+    
+    def get_catalog_status(self):
+        """
+        Retorna o estado da sincronização do índice de parâmetros
+        """
+        return self.catalog.get_status(CatalogIndexService.PARAMETER)
+    
     def get_parameter_value(self, name):
         """
         Obtém valor de um parâmetro com validações
@@ -63,6 +155,51 @@ class ParameterStoreBusiness:
         
         return self.service.get_parameter(name)
     
+    def get_parameter_values(self, names):
+        """
+        Obtém o valor de vários parâmetros em lote
+        
+        Args:
+            names (list): Nomes dos parâmetros
+        
+        Returns:
+            dict: Parâmetros encontrados e nomes inválidos/inexistentes
+        """
+        if not isinstance(names, list) or not names:
+            return {
+                'success': False,
+                'message': 'Informe a lista de parâmetros'
+            }
+        
+        if len(names) > self.MAX_BULK_PARAMETERS:
+            return {
+                'success': False,
+                'message': f'Máximo de {self.MAX_BULK_PARAMETERS} parâmetros por requisição'
+            }
+        
+        valid_names = []
+        invalid = []
+        for name in names:
+            if isinstance(name, str) and self._validate_parameter_name(name)['valid']:
+                valid_names.append(name)
+            else:
+                invalid.append(name)
+        
+        if not valid_names:
+            return {
+                'success': True,
+                'parameters': [],
+                'invalid_parameters': invalid,
+                'count': 0
+            }
+        
+        result = self.service.get_parameters(valid_names)
+        
+        if result['success']:
+            result['invalid_parameters'] = invalid + result['invalid_parameters']
+        
+        return result
+    
     def get_parameter_details(self, name):
         """
         Obtém detalhes completos de um parâmetro
@@ -156,7 +293,12 @@ class ParameterStoreBusiness:
                 'message': f'Tipo inválido. Use: {", ".join(valid_types)}'
             }
         
-        return self.service.create_parameter(name, value, parameter_type, description)
+        result = self.service.create_parameter(name, value, parameter_type, description)
+        
+        if result['success']:
+            self.catalog.refresh_item(CatalogIndexService.PARAMETER, name)
+        
+        return result
     
     def update_existing_parameter(self, name, value, description=None):
         """
@@ -183,7 +325,12 @@ class ParameterStoreBusiness:
                 'message': 'Valor do parâmetro é obrigatório'
             }
         
-        return self.service.update_parameter(name, value, description)
+        result = self.service.update_parameter(name, value, description)
+        
+        if result['success']:
+            self.catalog.refresh_item(CatalogIndexService.PARAMETER, name)
+        
+        return result
     
     def delete_parameter(self, name):
         """
@@ -202,7 +349,12 @@ class ParameterStoreBusiness:
                 'message': validation['message']
             }
         
-        return self.service.delete_parameter(name)
+        result = self.service.delete_parameter(name)
+        
+        if result['success']:
+            self.catalog.remove_item(CatalogIndexService.PARAMETER, name)
+        
+        return result
     
     def get_by_path(self, path):
         """
@@ -226,6 +378,87 @@ class ParameterStoreBusiness:
         
         return self.service.get_parameters_by_path(path)
     
+    def diff_paths(self, source_path, target_path):
+        """
+        Compara parâmetros de dois caminhos (ex: promover staging para prod)
+        
+        Args:
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+        
+        Returns:
+            dict: Inclusões, alterações e remoções necessárias no destino (sem valores)
+        """
+        return self.promotion.diff_paths(ConfigPromotionService.PARAMETER, source_path, target_path, self._validate_parameter_name)
+    
+    def start_copy(self, source_path, target_path, delete_missing=False, max_concurrency=None):
+        """
+        Inicia a cópia em massa de parâmetros de um caminho para outro
+        
+        Args:
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+            delete_missing (bool): Remove do destino o que não existe na origem
+            max_concurrency (int): Escritas simultâneas
+        
+        Returns:
+            dict: ID do job
+        """
+        return self.promotion.start_path_copy(
+            ConfigPromotionService.PARAMETER,
+            source_path,
+            target_path,
+            self._validate_parameter_name,
+            delete_missing,
+            max_concurrency
+        )
+    
+    def get_copy_job(self, job_id):
+        """
+        Obtém o progresso de uma cópia
+        """
+        return self.promotion.get_job(job_id, ConfigPromotionService.PARAMETER)
+    
+    def cancel_copy_job(self, job_id):
+        """
+        Cancela uma cópia em andamento
+        """
+        return self.promotion.cancel_job(job_id, ConfigPromotionService.PARAMETER)
+    
+    def stream_copy_job(self, job_id):
+        """
+        Gera o progresso de uma cópia até o fim (para Server-Sent Events)
+        """
+        return self.promotion.iter_progress(job_id, source=ConfigPromotionService.PARAMETER)
+    
+    def _search_index(self, source, key, query, prefix, tag, limit):
+        """
+        Executa a busca no índice, avisando enquanto a primeira sincronização não terminou
+        """
+        self.catalog.ensure_background_sync()
+        
+        if not self.catalog.is_ready(source):
+            return {
+                'success': False,
+                'indexing': True,
+                'message': 'Índice em sincronização, tente novamente em instantes'
+            }
+        
+        try:
+            limit = min(int(limit), self.MAX_SEARCH_RESULTS) if limit else self.MAX_SEARCH_RESULTS
+        except (TypeError, ValueError):
+            return {
+                'success': False,
+                'message': 'Limite inválido'
+            }
+        
+        result = self.catalog.search(source, (query or '').strip() or None, prefix or None, tag or None, limit)
+        
+        if result['success']:
+            result[key] = result.pop('items')
+        
+        return result
+    
     def _validate_parameter_name(self, name):
         """
         Valida nome do parâmetro
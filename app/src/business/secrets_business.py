@@ -1,4 +1,6 @@
 from src.service.secrets_service import SecretsManagerService
+from src.service.catalog_index_service import CatalogIndexService, get_catalog_index_service
+from src.service.config_promotion_service import ConfigPromotionService, get_config_promotion_service
 import re
 import json
 
@@ -8,19 +10,38 @@ class SecretsManagerBusiness:
     Business layer para Secrets Manager - validações e regras de negócio
     """
     
+    MAX_BATCH_SECRETS = 200
+    MAX_SEARCH_RESULTS = 1000
+    
     def __init__(self):
         """
         Inicializa a camada de negócio
         """
         self.service = SecretsManagerService()
+        self.catalog = get_catalog_index_service()
+        self.promotion = get_config_promotion_service()
     
     def list_all_secrets(self):
         """
         Lista todos os segredos com formatação
+        Usa o índice local quando já sincronizado; senão lista direto na AWS
         
         Returns:
             dict: Lista formatada de segredos
         """
+        self.catalog.ensure_background_sync()
+        
+        if self.catalog.is_ready(CatalogIndexService.SECRET):
+            indexed = self.catalog.search(CatalogIndexService.SECRET)
+            if indexed['success']:
+                return {
+                    'success': True,
+                    'secrets': indexed['items'],
+                    'count': indexed['count'],
+                    'source': 'index',
+                    'synced_at': indexed['synced_at']
+                }
+        
         result = self.service.list_secrets()
         
         if result['success']:
@@ -42,11 +63,61 @@ class SecretsManagerBusiness:
             return {
                 'success': True,
                 'secrets': formatted_secrets,
-                'count': len(formatted_secrets)
+                'count': len(formatted_secrets),
+                'source': 'aws'
             }
         
         return result
     
+    def search_secrets(self, query=None, prefix=None, tag=None, limit=None):
+        """
+        Busca segredos no índice local por trecho, prefixo ou tag
+        
+        Args:
+            query (str): Trecho do nome, descrição ou tags
+            prefix (str): Prefixo do nome
+            tag (str): "chave" ou "chave=valor"
+            limit (int): Quantidade máxima de resultados
+        
+        Returns:
+            dict: Segredos encontrados
+        """
+        self.catalog.ensure_background_sync()
+        
+        if not self.catalog.is_ready(CatalogIndexService.SECRET):
+            return {
+                'success': False,
+                'indexing': True,
+                'message': 'Índice em sincronização, tente novamente em instantes'
+            }
+        
+        try:
+            limit = min(int(limit), self.MAX_SEARCH_RESULTS) if limit else self.MAX_SEARCH_RESULTS
+        except (TypeError, ValueError):
+            return {
+                'success': False,
+                'message': 'Limite inválido'
+            }
+        
+        result = self.catalog.search(CatalogIndexService.SECRET, (query or '').strip() or None, prefix or None, tag or None, limit)
+        
+        if result['success']:
+            result['secrets'] = result.pop('items')
+        
+        return result
+    
+    def sync_catalog(self, full=False):
+        """
+        Dispara a sincronização do índice de segredos
+        """
+        return self.catalog.trigger_sync(CatalogIndexService.SECRET, full)
+    
+    def get_catalog_status(self):
+        """
+        Retorna o estado da sincronização do índice de segredos
+        """
+        return self.catalog.get_status(CatalogIndexService.SECRET)
+    
     def get_secret_value(self, secret_name):
         """
         Obtém o valor de um segredo com validações
@@ -67,6 +138,38 @@ class SecretsManagerBusiness:
         
         return self.service.get_secret_value(secret_name)
     
+    def get_secret_values(self, secret_names):
+        """
+        Obtém o valor de vários segredos com validações
+        
+        Args:
+            secret_names (list): Nomes dos segredos
+        
+        Returns:
+            dict: Valores por nome do segredo
+        """
+        if not isinstance(secret_names, list) or not secret_names:
+            return {
+                'success': False,
+                'message': 'Informe a lista de segredos'
+            }
+        
+        if len(secret_names) > self.MAX_BATCH_SECRETS:
+            return {
+                'success': False,
+                'message': f'Máximo de {self.MAX_BATCH_SECRETS} segredos por requisição'
+            }
+        
+        for secret_name in secret_names:
+            validation = self._validate_secret_name(secret_name)
+            if not validation['valid']:
+                return {
+                    'success': False,
+                    'message': f'{secret_name}: {validation["message"]}'
+                }
+        
+        return self.service.get_secret_values(secret_names)
+    
     def describe_secret(self, secret_name):
         """
         Obtém detalhes de um segredo
@@ -138,7 +241,12 @@ class SecretsManagerBusiness:
                 'message': validation['message']
             }
         
-        return self.service.create_secret(name, secret_value, description, tags)
+        result = self.service.create_secret(name, secret_value, description, tags)
+        
+        if result['success']:
+            self.catalog.refresh_item(CatalogIndexService.SECRET, name)
+        
+        return result
     
     def update_secret(self, secret_name, secret_value):
         """
@@ -165,7 +273,12 @@ class SecretsManagerBusiness:
                 'message': validation['message']
             }
         
-        return self.service.update_secret(secret_name, secret_value)
+        result = self.service.update_secret(secret_name, secret_value)
+        
+        if result['success']:
+            self.catalog.refresh_item(CatalogIndexService.SECRET, secret_name)
+        
+        return result
     
     def delete_secret(self, secret_name, recovery_window_days=30, force_delete=False):
         """
@@ -193,7 +306,13 @@ class SecretsManagerBusiness:
                     'message': 'Período de recuperação deve ser entre 7 e 30 dias'
                 }
         
-        return self.service.delete_secret(secret_name, recovery_window_days, force_delete)
+        result = self.service.delete_secret(secret_name, recovery_window_days, force_delete)
+        
+        if result['success']:
+            # ListSecrets não traz segredos agendados para deleção
+            self.catalog.remove_item(CatalogIndexService.SECRET, secret_name)
+        
+        return result
     
     def restore_secret(self, secret_name):
         """
@@ -212,7 +331,65 @@ class SecretsManagerBusiness:
                 'message': validation['message']
             }
         
-        return self.service.restore_secret(secret_name)
+        result = self.service.restore_secret(secret_name)
+        
+        if result['success']:
+            self.catalog.refresh_item(CatalogIndexService.SECRET, secret_name)
+        
+        return result
+    
+    def diff_paths(self, source_path, target_path):
+        """
+        Compara segredos de dois caminhos (ex: promover staging para prod)
+        
+        Args:
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+        
+        Returns:
+            dict: Inclusões, alterações e remoções necessárias no destino (sem valores)
+        """
+        return self.promotion.diff_paths(ConfigPromotionService.SECRET, source_path, target_path, self._validate_secret_name)
+    
+    def start_copy(self, source_path, target_path, delete_missing=False, max_concurrency=None):
+        """
+        Inicia a cópia em massa de segredos de um caminho para outro
+        
+        Args:
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+            delete_missing (bool): Remove do destino o que não existe na origem
+            max_concurrency (int): Escritas simultâneas
+        
+        Returns:
+            dict: ID do job
+        """
+        return self.promotion.start_path_copy(
+            ConfigPromotionService.SECRET,
+            source_path,
+            target_path,
+            self._validate_secret_name,
+            delete_missing,
+            max_concurrency
+        )
+    
+    def get_copy_job(self, job_id):
+        """
+        Obtém o progresso de uma cópia
+        """
+        return self.promotion.get_job(job_id, ConfigPromotionService.SECRET)
+    
+    def cancel_copy_job(self, job_id):
+        """
+        Cancela uma cópia em andamento
+        """
+        return self.promotion.cancel_job(job_id, ConfigPromotionService.SECRET)
+    
+    def stream_copy_job(self, job_id):
+        """
+        Gera o progresso de uma cópia até o fim (para Server-Sent Events)
+        """
+        return self.promotion.iter_progress(job_id, source=ConfigPromotionService.SECRET)
     
     def _validate_secret_name(self, name):
         """
@@ -1,11 +1,15 @@
 from flask import Blueprint, render_template, request, jsonify
 from src.service.api_catalog_service import APICatalogService
+from src.service.api_load_test_service import APILoadTestService
+from src.service.api_collection_service import APICollectionService
 
 # Cria o Blueprint
 api_catalog_bp = Blueprint('api_catalog', __name__, url_prefix='/api-catalog')
 
 # Instancia o service
 service = APICatalogService()
+load_test_service = APILoadTestService(service)
+collection_service = APICollectionService(service)
 
 
 @api_catalog_bp.route('/')
@@ -368,3 +372,202 @@ def get_test_params(request_id):
             'success': False,
             'message': f'Erro: {str(e)}'
         }), 500
+
+
+# ==================== LOAD TEST ====================
+
+@api_catalog_bp.route('/load-test/<int:request_id>', methods=['POST'])
+def start_load_test(request_id):
+    """
+    Inicia um teste de carga de uma request
+    
+    Body JSON:
+        concurrency: Workers simultâneos (padrão 10)
+        target_rps: Requests por segundo alvo (opcional)
+        duration_seconds: Duração do teste (opcional)
+        total_requests: Quantidade de requests (opcional)
+        body_data, query_data, headers_data, path_variables: Mesmo formato do teste
+    """
+    try:
+        data = request.get_json() or {}
+        result = load_test_service.start_load_test(
+            request_id=request_id,
+            concurrency=data.get('concurrency', 10),
+            target_rps=data.get('target_rps'),
+            duration_seconds=data.get('duration_seconds'),
+            total_requests=data.get('total_requests'),
+            body_data=data.get('body_data'),
+            query_data=data.get('query_data'),
+            headers_data=data.get('headers_data'),
+            path_variables=data.get('path_variables')
+        )
+        return jsonify(result), 202 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/load-test/runs', methods=['GET'])
+def list_load_test_runs():
+    """
+    Lista execuções de teste de carga (opcionalmente filtradas por request)
+    """
+    try:
+        request_id = request.args.get('request_id', type=int)
+        result = load_test_service.list_runs(request_id)
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/load-test/runs/<int:run_id>', methods=['GET'])
+def get_load_test_run(run_id):
+    """
+    Obtém uma execução de teste de carga (progresso ao vivo se estiver rodando)
+    """
+    try:
+        result = load_test_service.get_run(run_id)
+        return jsonify(result), 200 if result['success'] else 404
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/load-test/runs/<int:run_id>/cancel', methods=['POST'])
+def cancel_load_test_run(run_id):
+    """
+    Interrompe uma execução de teste de carga
+    """
+    try:
+        result = load_test_service.cancel_run(run_id)
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+# ==================== COLEÇÕES ====================
+
+@api_catalog_bp.route('/collections', methods=['GET'])
+def list_collections():
+    """
+    Lista as coleções de requests
+    """
+    try:
+        result = collection_service.get_collections()
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/collections', methods=['POST'])
+def save_collection():
+    """
+    Cria ou atualiza (pelo nome) uma coleção de requests
+    
+    Body JSON:
+        name: Nome da coleção
+        description: Descrição (opcional)
+        steps: Lista de passos (request_id, depends_on, extract, body_data...)
+        max_parallel: Passos executados em paralelo (padrão 4)
+    """
+    try:
+        data = request.get_json() or {}
+        result = collection_service.save_collection(
+            name=data.get('name'),
+            steps=data.get('steps'),
+            description=data.get('description'),
+            max_parallel=data.get('max_parallel', 4)
+        )
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/collections/<int:collection_id>', methods=['GET'])
+def get_collection(collection_id):
+    """
+    Obtém uma coleção de requests
+    """
+    try:
+        result = collection_service.get_collection(collection_id)
+        return jsonify(result), 200 if result['success'] else 404
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/collections/<int:collection_id>', methods=['DELETE'])
+def delete_collection(collection_id):
+    """
+    Deleta uma coleção de requests
+    """
+    try:
+        result = collection_service.delete_collection(collection_id)
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/collections/<int:collection_id>/run', methods=['POST'])
+def run_collection(collection_id):
+    """
+    Executa uma coleção salva
+    
+    Body JSON:
+        variables: Variáveis iniciais usadas em {{variavel}} (opcional)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        result = collection_service.run_collection(collection_id, data.get('variables'))
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+
+@api_catalog_bp.route('/collections/run', methods=['POST'])
+def run_adhoc_collection():
+    """
+    Executa uma lista de passos sem salvar a coleção
+    
+    Body JSON:
+        steps: Lista de passos
+        variables: Variáveis iniciais (opcional)
+        max_parallel: Passos executados em paralelo (padrão 4)
+    """
+    try:
+        data = request.get_json() or {}
+        result = collection_service.run_steps(
+            steps=data.get('steps'),
+            variables=data.get('variables'),
+            max_parallel=data.get('max_parallel', 4)
+        )
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
@@ -149,6 +149,13 @@ def create_tunnel():
     try:
         data = request.get_json()
         
+        # Falha rápido se o SSM Agent do bastion está offline (evita esperar o timeout do start-session)
+        bastion_id = data.get('bastion_instance_id')
+        if bastion_id:
+            check = ec2_business.check_bastion_ready(bastion_id)
+            if not check['success']:
+                return jsonify(check), 409
+        
         result = business.create_tunnel(
             bastion_instance_id=data.get('bastion_instance_id'),
             rds_endpoint=data.get('rds_endpoint'),
@@ -198,29 +205,17 @@ def close_tunnel():
 @db_query_bp.route('/list-bastions', methods=['GET'])
 def list_bastions():
     """
-    Lista instâncias EC2 do tipo Bastion
+    Lista Bastions em execução com o status do SSM Agent (saudáveis primeiro)
+    
+    Query params:
+        refresh: true para ignorar o cache
     """
     try:
-        result = ec2_business.list_all_instances()
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        result = ec2_business.get_bastion_status(refresh=refresh, running_only=True)
         
         if result['success']:
-            # Filtra apenas Bastions que estão rodando
-            bastions = [
-                {
-                    'instance_id': inst['instance_id'],
-                    'name': inst['name'],
-                    'state': inst['state'],
-                    'private_ip': inst['private_ip']
-                }
-                for inst in result['instances']
-                if inst['type_tag'] == 'Bastion' and inst['state'] == 'running'
-            ]
-            
-            return jsonify({
-                'success': True,
-                'bastions': bastions,
-                'count': len(bastions)
-            }), 200
+            return jsonify(result), 200
         else:
             return jsonify(result), 400
             
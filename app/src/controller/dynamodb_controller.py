@@ -1,4 +1,5 @@
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, render_template, request, jsonify, send_file, stream_with_context
+import json
 from src.business.dynamodb_business import DynamoDBBusiness
 
 # Cria o Blueprint para o controller de DynamoDB
@@ -23,8 +24,13 @@ def create_table():
     
     Espera JSON com:
     - table_name: Nome da tabela
-    - primary_key: Nome da chave primária
+    - primary_key: Nome da partition key
     - primary_key_type: Tipo da chave (S, N, ou B)
+    - sort_key, sort_key_type: Sort key (opcional)
+    - billing_mode: PAY_PER_REQUEST ou PROVISIONED (read_capacity/write_capacity)
+    - global_indexes, local_indexes: Listas de índices (opcional)
+    - stream_view_type: Liga o DynamoDB Streams (opcional)
+    - ttl_attribute: Atributo de TTL (opcional)
     """
     try:
         data = request.get_json()
@@ -34,7 +40,20 @@ def create_table():
         primary_key_type = data.get('primary_key_type', 'S').strip().upper()
         
         # Chama a camada de negócio para criar a tabela
-        result = business.create_table(table_name, primary_key, primary_key_type)
+        result = business.create_table(
+            table_name,
+            primary_key,
+            primary_key_type,
+            sort_key=data.get('sort_key'),
+            sort_key_type=(data.get('sort_key_type') or 'S').strip().upper(),
+            billing_mode=data.get('billing_mode'),
+            read_capacity=data.get('read_capacity'),
+            write_capacity=data.get('write_capacity'),
+            global_indexes=data.get('global_indexes'),
+            local_indexes=data.get('local_indexes'),
+            stream_view_type=data.get('stream_view_type'),
+            ttl_attribute=data.get('ttl_attribute')
+        )
         
         if result['success']:
             return jsonify(result), 201
@@ -48,6 +67,26 @@ def create_table():
         }), 500
 
 
+@dynamodb_bp.route('/tables/<table_name>/status', methods=['GET'])
+def get_table_status(table_name):
+    """Estado de uma tabela recém-criada (status da tabela, GSIs e TTL)"""
+    result = business.get_table_status(table_name)
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@dynamodb_bp.route('/tables/<table_name>/status/stream', methods=['GET'])
+def stream_table_status(table_name):
+    """Mudanças de status da tabela via Server-Sent Events até ela ficar pronta"""
+    def generate():
+        for event in business.stream_table_status(table_name):
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @dynamodb_bp.route('/list', methods=['GET'])
 def list_tables():
     """
@@ -68,6 +107,29 @@ def list_tables():
         }), 500
 
 
+@dynamodb_bp.route('/inventory', methods=['GET'])
+def get_inventory():
+    """
+    Endpoint do inventário de tabelas (itens, tamanho, billing, GSIs e streams)
+    
+    Query string: refresh=true para ignorar o cache
+    """
+    try:
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        result = business.get_inventory(refresh)
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao montar inventário: {str(e)}'
+        }), 500
+
+
 @dynamodb_bp.route('/info/<table_name>', methods=['GET'])
 def get_table_info(table_name):
     """
@@ -112,3 +174,199 @@ def delete_table(table_name):
             'success': False,
             'message': f'Erro ao deletar tabela: {str(e)}'
         }), 500
+
+
+@dynamodb_bp.route('/items/<table_name>/query', methods=['POST'])
+def query_items(table_name):
+    """
+    Endpoint para consultar itens por partition key (paginado)
+    
+    Espera JSON com:
+    - partition_value: Valor da partition key
+    - sort_operator, sort_value, sort_value2: Condição opcional na sort key
+    - index_name: GSI/LSI (opcional)
+    - projection: Atributos retornados ("a, b, c")
+    - limit, next_token: Paginação
+    - scan_forward, consistent_read
+    """
+    try:
+        data = request.get_json()
+        
+        result = business.query_items(
+            table_name,
+            partition_value=data.get('partition_value'),
+            sort_operator=data.get('sort_operator'),
+            sort_value=data.get('sort_value'),
+            sort_value2=data.get('sort_value2'),
+            index_name=data.get('index_name'),
+            projection=data.get('projection'),
+            limit=data.get('limit'),
+            next_token=data.get('next_token'),
+            scan_forward=data.get('scan_forward', True),
+            consistent_read=data.get('consistent_read', False)
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao consultar itens: {str(e)}'
+        }), 500
+
+
+@dynamodb_bp.route('/items/<table_name>/scan', methods=['POST'])
+def scan_items(table_name):
+    """
+    Endpoint para percorrer os itens de uma tabela, uma página por chamada
+    
+    Espera JSON com: projection, limit, next_token e index_name (opcionais)
+    """
+    try:
+        data = request.get_json() or {}
+        
+        result = business.scan_items(
+            table_name,
+            projection=data.get('projection'),
+            limit=data.get('limit'),
+            next_token=data.get('next_token'),
+            index_name=data.get('index_name')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao percorrer itens: {str(e)}'
+        }), 500
+
+
+@dynamodb_bp.route('/items/<table_name>/scan/stream', methods=['GET'])
+def stream_scan(table_name):
+    """
+    Endpoint de Scan paralelo via Server-Sent Events
+    
+    Query string: segments, projection, max_items, max_capacity, index_name
+    """
+    result = business.stream_scan(
+        table_name,
+        segments=request.args.get('segments'),
+        projection=request.args.get('projection'),
+        max_items=request.args.get('max_items'),
+        max_capacity=request.args.get('max_capacity'),
+        index_name=request.args.get('index_name')
+    )
+    
+    if not result['success']:
+        return jsonify(result), 400
+    
+    def generate():
+        for event in result['events']:
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@dynamodb_bp.route('/items/<table_name>/import', methods=['POST'])
+def start_import(table_name):
+    """
+    Endpoint para importar itens em massa (BatchWriteItem)
+    
+    Corpo: o arquivo NDJSON ou CSV (lido em streaming, sem carregar em memória)
+    Query string: format (ndjson/csv), filename, writers, max_wcu
+    """
+    try:
+        result = business.start_import(
+            table_name,
+            request.stream,
+            file_format=request.args.get('format'),
+            filename=request.args.get('filename'),
+            writers=request.args.get('writers'),
+            max_wcu=request.args.get('max_wcu')
+        )
+        
+        return jsonify(result), 202 if result['success'] else 400
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao iniciar importação: {str(e)}'
+        }), 500
+
+
+@dynamodb_bp.route('/items/<table_name>/export', methods=['POST'])
+def start_export(table_name):
+    """
+    Endpoint para exportar a tabela com Scan paralelo
+    
+    Espera JSON com: format (ndjson/parquet), segments, max_rcu e projection (opcionais)
+    """
+    try:
+        data = request.get_json() or {}
+        
+        result = business.start_export(
+            table_name,
+            file_format=data.get('format'),
+            segments=data.get('segments'),
+            max_rcu=data.get('max_rcu'),
+            projection=data.get('projection')
+        )
+        
+        return jsonify(result), 202 if result['success'] else 400
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao iniciar exportação: {str(e)}'
+        }), 500
+
+
+@dynamodb_bp.route('/transfers/<int:job_id>', methods=['GET'])
+def get_transfer_job(job_id):
+    """Progresso de uma importação/exportação"""
+    result = business.get_transfer_job(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@dynamodb_bp.route('/transfers/<int:job_id>/stream', methods=['GET'])
+def stream_transfer_job(job_id):
+    """Progresso de uma importação/exportação via Server-Sent Events"""
+    def generate():
+        for event in business.stream_transfer_job(job_id):
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@dynamodb_bp.route('/transfers/<int:job_id>/cancel', methods=['POST'])
+def cancel_transfer_job(job_id):
+    """Interrompe uma importação/exportação"""
+    result = business.cancel_transfer_job(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+
+@dynamodb_bp.route('/transfers/<int:job_id>/download', methods=['GET'])
+def download_export(job_id):
+    """Download do arquivo de uma exportação terminada"""
+    path, filename = business.get_export_file(job_id)
+    if not path:
+        return jsonify({
+            'success': False,
+            'message': f'Exportação {job_id} não encontrada ou não terminada'
+        }), 404
+    
+    mimetype = 'application/vnd.apache.parquet' if filename.endswith('.parquet') else 'application/x-ndjson'
+    return send_file(path, mimetype=mimetype, as_attachment=True, download_name=filename)
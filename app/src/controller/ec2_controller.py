@@ -1,4 +1,5 @@
-from flask import Blueprint, render_template, request, jsonify
+import json
+from flask import Blueprint, Response, render_template, request, jsonify, stream_with_context
 from src.business.ec2_business import EC2Business
 
 # Cria o Blueprint para o controller de EC2
@@ -62,7 +63,7 @@ def get_instance(instance_id):
 @ec2_bp.route('/instances/bastion', methods=['POST'])
 def create_bastion():
     """
-    Endpoint para criar um Bastion Host com SSM
+    Endpoint para iniciar a criação de um Bastion Host com SSM (acompanhe em /ec2/bastion/jobs/<id>)
     
     Body JSON:
         name: Nome da instância
@@ -83,7 +84,7 @@ def create_bastion():
         )
         
         if result['success']:
-            return jsonify(result), 201
+            return jsonify(result), 202
         else:
             return jsonify(result), 400
             
@@ -94,6 +95,65 @@ def create_bastion():
         }), 500
 
 
+@ec2_bp.route('/bastions/status', methods=['GET'])
+def get_bastion_status():
+    """
+    Endpoint com o status do SSM Agent de todos os Bastion Hosts
+    
+    Query params:
+        refresh: true para ignorar o cache
+    """
+    try:
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        result = business.get_bastion_status(refresh=refresh)
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao consultar status dos Bastions: {str(e)}'
+        }), 500
+
+
+@ec2_bp.route('/bastion/jobs/<int:job_id>', methods=['GET'])
+def get_bastion_job(job_id):
+    """
+    Endpoint para consultar o progresso da criação de um Bastion Host
+    """
+    try:
+        result = business.get_bastion_job(job_id)
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 404
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao consultar criação: {str(e)}'
+        }), 500
+
+
+@ec2_bp.route('/bastion/jobs/<int:job_id>/stream', methods=['GET'])
+def stream_bastion_job(job_id):
+    """
+    Endpoint SSE com o progresso da criação até o SSM Agent registrar
+    """
+    def generate():
+        for message in business.stream_bastion_job(job_id):
+            yield f'data: {json.dumps(message)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @ec2_bp.route('/instances', methods=['POST'])
 def create_instance():
     """
@@ -1,4 +1,5 @@
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, render_template, request, jsonify, stream_with_context
+import json
 from src.business.ecs_business import ECSBusiness
 from src.database.db_manager import DatabaseManager
 
@@ -88,6 +89,37 @@ def list_tasks(cluster_name):
         }), 500
 
 
+@ecs_bp.route('/clusters/<cluster_name>/tasks/deep-view', methods=['GET'])
+def get_tasks_deep_view(cluster_name):
+    """
+    Endpoint para a visão detalhada das tasks (task definition, imagens e containers)
+    
+    Args:
+        cluster_name: Nome do cluster
+    
+    Query params:
+        service_name: (opcional) Nome do serviço para filtrar tasks
+        desired_status: (opcional) RUNNING (padrão), PENDING ou STOPPED
+    """
+    try:
+        result = business.get_tasks_deep_view(
+            cluster_name,
+            request.args.get('service_name', None),
+            request.args.get('desired_status', 'RUNNING')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao listar tasks: {str(e)}'
+        }), 500
+
+
 @ecs_bp.route('/clusters/<cluster_name>/info', methods=['GET'])
 def get_cluster_info(cluster_name):
     """
@@ -221,6 +253,63 @@ def change_capacity_provider(cluster_name, service_name):
 
 # ==================== FAVORITOS ====================
 
+@ecs_bp.route('/clusters/<cluster_name>/services/<service_name>/deployment/watch', methods=['POST'])
+def watch_deployment(cluster_name, service_name):
+    """
+    Inicia o acompanhamento do deployment de um serviço
+    
+    Args:
+        cluster_name: Nome do cluster
+        service_name: Nome do serviço
+    """
+    try:
+        result = business.watch_deployment(cluster_name, service_name)
+        
+        if result['success']:
+            return jsonify(result), 202
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao acompanhar deployment: {str(e)}'
+        }), 500
+
+
+@ecs_bp.route('/clusters/<cluster_name>/services/<service_name>/deployment/stream', methods=['GET'])
+def stream_deployment(cluster_name, service_name):
+    """
+    Mudanças do deployment via Server-Sent Events (estado inicial, depois só diferenças)
+    
+    Args:
+        cluster_name: Nome do cluster
+        service_name: Nome do serviço
+    """
+    def generate():
+        for message in business.stream_deployment(cluster_name, service_name):
+            yield f'data: {json.dumps(message)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@ecs_bp.route('/deployments/watches', methods=['GET'])
+def list_deployment_watches():
+    """
+    Endpoint para listar os acompanhamentos de deployment ativos
+    """
+    try:
+        return jsonify(business.list_deployment_watches()), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao listar acompanhamentos: {str(e)}'
+        }), 500
+
+
 @ecs_bp.route('/favorites', methods=['GET'])
 def get_favorites():
     """
@@ -0,0 +1,98 @@
+from flask import Blueprint, render_template, request, jsonify
+from src.business.inventory_business import InventoryBusiness
+
+# Cria o Blueprint para o controller de inventário
+inventory_bp = Blueprint('inventory', __name__, url_prefix='/inventory')
+
+# Instancia a camada de negócio
+business = InventoryBusiness()
+
+
+@inventory_bp.route('/')
+def index():
+    """
+    Renderiza a página do inventário multi-região
+    """
+    return render_template('inventory/index.html')
+
+
+@inventory_bp.route('/options', methods=['GET'])
+def get_options():
+    """
+    Regiões, perfis e recursos disponíveis
+    """
+    try:
+        result = business.get_options()
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter opções: {str(e)}'
+        }), 500
+
+
+@inventory_bp.route('/collect', methods=['POST'])
+def collect():
+    """
+    Coleta o inventário em várias regiões/contas ao mesmo tempo
+    
+    Body JSON:
+        resources: Lista de recursos (ecs, ec2, rds, sqs, sns, logs, secrets, parameters)
+        regions: Lista de regiões (padrão: AWS_REGION)
+        profiles: Lista de perfis AWS (padrão: credenciais padrão)
+        timeout: Segundos máximos por região (padrão: INVENTORY_REGION_TIMEOUT)
+    """
+    try:
+        data = request.get_json() or {}
+        result = business.collect(
+            data.get('resources'),
+            data.get('regions'),
+            data.get('profiles'),
+            data.get('timeout')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao coletar inventário: {str(e)}'
+        }), 500
+
+
+@inventory_bp.route('/<resource>', methods=['GET'])
+def collect_resource(resource):
+    """
+    Inventário de um único recurso
+    
+    Query params:
+        regions: Regiões separadas por vírgula
+        profiles: Perfis separados por vírgula
+        timeout: Segundos máximos por região
+    """
+    try:
+        result = business.collect(
+            [resource],
+            request.args.get('regions'),
+            request.args.get('profiles'),
+            request.args.get('timeout')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao coletar inventário: {str(e)}'
+        }), 500
@@ -1,7 +1,8 @@
 """
 Controller para SQS e SNS
 """
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, render_template, request, jsonify, send_file, stream_with_context
+import json
 from src.business.messaging_business import MessagingBusiness
 
 messaging_bp = Blueprint('messaging', __name__, url_prefix='/messaging')
@@ -76,6 +77,43 @@ def send_message():
             'message': f'Erro: {str(e)}'
         }), 500
 
+@messaging_bp.route('/sqs/messages/send-batch', methods=['POST'])
+def send_message_batch():
+    """
+    Envio em lote / geração de carga
+    
+    JSON: queue_url + ndjson (uma mensagem por linha) ou template + count,
+    delay_seconds, group_id e concurrency opcionais
+    NDJSON direto no corpo (Content-Type: application/x-ndjson): parâmetros na query string
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            # Lê o corpo linha a linha, sem carregar o arquivo inteiro em memória
+            result = business.send_message_batch(
+                queue_url=request.args.get('queue_url'),
+                ndjson=request.stream,
+                delay_seconds=request.args.get('delay_seconds', 0),
+                group_id=request.args.get('group_id'),
+                concurrency=request.args.get('concurrency')
+            )
+        else:
+            data = request.get_json()
+            result = business.send_message_batch(
+                queue_url=data.get('queue_url'),
+                ndjson=data.get('ndjson'),
+                template=data.get('template'),
+                count=data.get('count'),
+                delay_seconds=data.get('delay_seconds', 0),
+                group_id=data.get('group_id'),
+                concurrency=data.get('concurrency')
+            )
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
 @messaging_bp.route('/sqs/messages/receive', methods=['POST'])
 def receive_messages():
     """Recebe mensagens da fila"""
@@ -108,6 +146,149 @@ def delete_message():
             'message': f'Erro: {str(e)}'
         }), 500
 
+@messaging_bp.route('/sqs/messages/batch', methods=['DELETE'])
+def delete_message_batch():
+    """Deleta várias mensagens da fila (DeleteMessageBatch)"""
+    try:
+        data = request.get_json()
+        result = business.delete_message_batch(
+            queue_url=data.get('queue_url'),
+            receipt_handles=data.get('receipt_handles')
+        )
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sqs/drain', methods=['POST'])
+def start_drain():
+    """
+    Inicia a leitura em massa da fila (peek ou drain)
+    
+    Body JSON: queue_url, mode, max_messages, max_bytes, receivers, wait_time, visibility_timeout
+    """
+    try:
+        data = request.get_json()
+        result = business.start_drain(
+            queue_url=data.get('queue_url'),
+            mode=data.get('mode', 'peek'),
+            max_messages=data.get('max_messages', 1000),
+            max_bytes=data.get('max_bytes'),
+            receivers=data.get('receivers'),
+            wait_time=data.get('wait_time', 5),
+            visibility_timeout=data.get('visibility_timeout', 120)
+        )
+        return jsonify(result), 202 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sqs/drain/<int:job_id>', methods=['GET'])
+def get_drain_job(job_id):
+    """Progresso da leitura em massa"""
+    result = business.get_drain_job(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+@messaging_bp.route('/sqs/drain/<int:job_id>/stream', methods=['GET'])
+def stream_drain_job(job_id):
+    """Mensagens da leitura em massa via Server-Sent Events, conforme chegam"""
+    def generate():
+        for event in business.stream_drain_job(job_id):
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@messaging_bp.route('/sqs/drain/<int:job_id>/export', methods=['GET'])
+def export_drain_job(job_id):
+    """Baixa as mensagens lidas em NDJSON"""
+    path = business.get_drain_export_path(job_id)
+    if not path:
+        return jsonify({
+            'success': False,
+            'message': f'Job {job_id} não encontrado'
+        }), 404
+    
+    return send_file(path, mimetype='application/x-ndjson', as_attachment=True,
+                     download_name=f'sqs-mensagens-{job_id}.ndjson')
+
+@messaging_bp.route('/sqs/drain/<int:job_id>/cancel', methods=['POST'])
+def cancel_drain_job(job_id):
+    """Interrompe a leitura em massa"""
+    result = business.cancel_drain_job(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+@messaging_bp.route('/sqs/redrive', methods=['POST'])
+def start_redrive():
+    """
+    Inicia o redrive de uma DLQ
+    
+    Body JSON: source_queue_url, destination_queue_url, max_per_second, max_messages, strategy
+    """
+    try:
+        data = request.get_json()
+        result = business.start_redrive(
+            source_queue_url=data.get('source_queue_url'),
+            destination_queue_url=data.get('destination_queue_url'),
+            max_per_second=data.get('max_per_second'),
+            max_messages=data.get('max_messages'),
+            strategy=data.get('strategy', 'auto')
+        )
+        return jsonify(result), 202 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sqs/redrive', methods=['GET'])
+def list_redrive_jobs():
+    """Redrives registrados (filtro opcional: source_queue_url)"""
+    try:
+        result = business.list_redrive_jobs(request.args.get('source_queue_url'))
+        return jsonify(result), 200
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sqs/redrive/<int:job_id>', methods=['GET'])
+def get_redrive_job(job_id):
+    """Progresso do redrive"""
+    result = business.get_redrive_job(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+@messaging_bp.route('/sqs/redrive/<int:job_id>/stream', methods=['GET'])
+def stream_redrive_job(job_id):
+    """Progresso do redrive via Server-Sent Events"""
+    def generate():
+        for event in business.stream_redrive_job(job_id):
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@messaging_bp.route('/sqs/redrive/<int:job_id>/cancel', methods=['POST'])
+def cancel_redrive_job(job_id):
+    """Pausa o redrive"""
+    result = business.cancel_redrive_job(job_id)
+    return jsonify(result), 200 if result['success'] else 400
+
+@messaging_bp.route('/sqs/redrive/<int:job_id>/resume', methods=['POST'])
+def resume_redrive_job(job_id):
+    """Retoma um redrive pausado ou interrompido"""
+    result = business.resume_redrive_job(job_id)
+    return jsonify(result), 202 if result['success'] else 400
+
 @messaging_bp.route('/sqs/queues/purge', methods=['POST'])
 def purge_queue():
     """Limpa fila"""
@@ -182,6 +363,82 @@ def publish_message():
             'message': f'Erro: {str(e)}'
         }), 500
 
+@messaging_bp.route('/sns/publish-batch', methods=['POST'])
+def publish_batch():
+    """
+    Publicação em lote / geração de carga
+    
+    JSON: topic_arn + ndjson (uma mensagem por linha) ou template + count,
+    subject, group_id e concurrency opcionais
+    NDJSON direto no corpo (Content-Type: application/x-ndjson): parâmetros na query string
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            result = business.publish_batch(
+                topic_arn=request.args.get('topic_arn'),
+                ndjson=request.stream,
+                subject=request.args.get('subject'),
+                group_id=request.args.get('group_id'),
+                concurrency=request.args.get('concurrency')
+            )
+        else:
+            data = request.get_json()
+            result = business.publish_batch(
+                topic_arn=data.get('topic_arn'),
+                ndjson=data.get('ndjson'),
+                template=data.get('template'),
+                count=data.get('count'),
+                subject=data.get('subject'),
+                group_id=data.get('group_id'),
+                concurrency=data.get('concurrency')
+            )
+        return jsonify(result), 200 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sns/fanout-test', methods=['POST'])
+def start_fanout_test():
+    """
+    Inicia o teste de fan-out SNS -> SQS
+    
+    Body JSON: topic_arn, count, concurrency, settle_timeout
+    """
+    try:
+        data = request.get_json()
+        result = business.start_fanout_test(
+            topic_arn=data.get('topic_arn'),
+            count=data.get('count', 100),
+            concurrency=data.get('concurrency'),
+            settle_timeout=data.get('settle_timeout', 10)
+        )
+        return jsonify(result), 202 if result['success'] else 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro: {str(e)}'
+        }), 500
+
+@messaging_bp.route('/sns/fanout-test/<int:job_id>', methods=['GET'])
+def get_fanout_test(job_id):
+    """Progresso/resultado do teste de fan-out"""
+    result = business.get_fanout_test(job_id)
+    return jsonify(result), 200 if result['success'] else 404
+
+@messaging_bp.route('/sns/fanout-test/<int:job_id>/stream', methods=['GET'])
+def stream_fanout_test(job_id):
+    """Progresso do teste de fan-out via Server-Sent Events"""
+    def generate():
+        for event in business.stream_fanout_test(job_id):
+            yield f'data: {json.dumps(event)}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @messaging_bp.route('/sns/subscriptions', methods=['GET'])
 def list_subscriptions():
     """Lista inscrições"""
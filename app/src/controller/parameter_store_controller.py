@@ -1,6 +1,7 @@
 from flask import Blueprint, render_template, request, jsonify
 from urllib.parse import unquote
 from src.business.parameter_store_business import ParameterStoreBusiness
+from src.controller.promotion_routes import register_promotion_routes
 from src.database.db_manager import DatabaseManager
 
 # Cria o Blueprint para o controller de Parameter Store
@@ -39,6 +40,103 @@ def list_parameters():
         }), 500
 
 
+@parameters_bp.route('/search', methods=['GET'])
+def search_parameters():
+    """
+    Busca parâmetros no índice local
+    
+    Query params:
+        q: Trecho do nome, descrição ou tags
+        prefix: Prefixo do nome
+        tag: "chave" ou "chave=valor"
+        limit: Quantidade máxima de resultados
+    """
+    try:
+        result = business.search_parameters(
+            request.args.get('q'),
+            request.args.get('prefix'),
+            request.args.get('tag'),
+            request.args.get('limit')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao buscar parâmetros: {str(e)}'
+        }), 500
+
+
+@parameters_bp.route('/tree', methods=['GET'])
+def get_parameter_tree():
+    """
+    Retorna um nível da hierarquia de parâmetros
+    
+    Query params:
+        path: Pasta a expandir (padrão: /)
+        limit: Quantidade máxima de parâmetros diretos
+    """
+    try:
+        result = business.get_parameter_tree(request.args.get('path', '/'), request.args.get('limit'))
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao carregar hierarquia: {str(e)}'
+        }), 500
+
+
+@parameters_bp.route('/catalog/sync', methods=['POST'])
+def sync_catalog():
+    """
+    Dispara a sincronização do índice local
+    
+    Body JSON (opcional):
+        full: Rebusca os metadados de todos os itens
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        result = business.sync_catalog(bool(data.get('full', False)))
+        
+        if result['success']:
+            return jsonify(result), 202
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao sincronizar índice: {str(e)}'
+        }), 500
+
+
+@parameters_bp.route('/catalog/status', methods=['GET'])
+def get_catalog_status():
+    """
+    Retorna o estado da última sincronização do índice local
+    """
+    try:
+        return jsonify(business.get_catalog_status()), 200
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter estado do índice: {str(e)}'
+        }), 500
+
+# Promoção/cópia entre caminhos (/promotions)
+register_promotion_routes(parameters_bp, business)
+
+
 @parameters_bp.route('/<path:parameter_name>', methods=['GET'])
 def get_parameter_details(parameter_name):
     """
@@ -218,6 +316,30 @@ def delete_parameter(parameter_name):
         }), 500
 
 
+@parameters_bp.route('/values', methods=['POST'])
+def get_parameter_values():
+    """
+    Obtém o valor de vários parâmetros em uma única requisição
+    
+    Body JSON:
+        names: Lista de nomes dos parâmetros
+    """
+    try:
+        data = request.get_json() or {}
+        result = business.get_parameter_values(data.get('names'))
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter valores: {str(e)}'
+        }), 500
+
+
 @parameters_bp.route('/by-path', methods=['POST'])
 def get_by_path():
     """
@@ -264,6 +386,39 @@ def get_favorites():
         }), 500
 
 
+@parameters_bp.route('/favorites/values', methods=['GET'])
+def get_favorite_values():
+    """
+    Obtém o valor de todos os parameters favoritos de uma vez
+    """
+    try:
+        favorites = db_manager.get_favorite_parameters()
+        
+        if not favorites['success']:
+            return jsonify(favorites), 400
+        
+        if not favorites['favorites']:
+            return jsonify({
+                'success': True,
+                'parameters': [],
+                'invalid_parameters': [],
+                'count': 0
+            }), 200
+        
+        result = business.get_parameter_values([fav['parameter_name'] for fav in favorites['favorites']])
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter valores dos favoritos: {str(e)}'
+        }), 500
+
+
 @parameters_bp.route('/favorites', methods=['POST'])
 def add_favorite():
     """
@@ -0,0 +1,122 @@
+from flask import Response, request, jsonify, stream_with_context
+import json
+
+
+def register_promotion_routes(blueprint, business):
+    """
+    Registra as rotas de promoção/cópia entre caminhos (/promotions) em um blueprint
+
+    Compartilhado pelo Parameter Store e pelo Secrets Manager: a camada de
+    negócio informada implementa diff_paths, start_copy, get_copy_job,
+    stream_copy_job e cancel_copy_job.
+
+    Args:
+        blueprint (Blueprint): Blueprint do serviço
+        business: Camada de negócio do serviço
+    """
+    @blueprint.route('/promotions/diff', methods=['POST'])
+    def diff_paths():
+        """
+        Compara itens entre dois caminhos (sem devolver valores)
+
+        Body JSON:
+            source_path: Caminho de origem
+            target_path: Caminho de destino
+        """
+        try:
+            data = request.get_json() or {}
+            result = business.diff_paths(data.get('source_path'), data.get('target_path'))
+
+            if result['success']:
+                return jsonify(result), 200
+            else:
+                return jsonify(result), 400
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'message': f'Erro ao comparar caminhos: {str(e)}'
+            }), 500
+
+    @blueprint.route('/promotions', methods=['POST'])
+    def start_copy():
+        """
+        Inicia a cópia em massa entre caminhos
+
+        Body JSON:
+            source_path: Caminho de origem
+            target_path: Caminho de destino
+            delete_missing: Remove do destino o que não existe na origem (padrão: false)
+            max_concurrency: Escritas simultâneas (opcional)
+        """
+        try:
+            data = request.get_json() or {}
+            result = business.start_copy(
+                data.get('source_path'),
+                data.get('target_path'),
+                data.get('delete_missing', False),
+                data.get('max_concurrency')
+            )
+
+            if result['success']:
+                return jsonify(result), 202
+            else:
+                return jsonify(result), 400
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'message': f'Erro ao iniciar cópia: {str(e)}'
+            }), 500
+
+    @blueprint.route('/promotions/<int:job_id>', methods=['GET'])
+    def get_copy_job(job_id):
+        """
+        Obtém o progresso de uma cópia
+        """
+        try:
+            result = business.get_copy_job(job_id)
+
+            if result['success']:
+                return jsonify(result), 200
+            else:
+                return jsonify(result), 404
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'message': f'Erro ao obter cópia: {str(e)}'
+            }), 500
+
+    @blueprint.route('/promotions/<int:job_id>/stream', methods=['GET'])
+    def stream_copy_job(job_id):
+        """
+        Progresso da cópia via Server-Sent Events (itens/s, throttling, concorrência atual)
+        """
+        def generate():
+            for result in business.stream_copy_job(job_id):
+                yield f'data: {json.dumps(result)}\n\n'
+
+        return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+
+    @blueprint.route('/promotions/<int:job_id>/cancel', methods=['POST'])
+    def cancel_copy_job(job_id):
+        """
+        Cancela uma cópia em andamento
+        """
+        try:
+            result = business.cancel_copy_job(job_id)
+
+            if result['success']:
+                return jsonify(result), 200
+            else:
+                return jsonify(result), 400
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'message': f'Erro ao cancelar cópia: {str(e)}'
+            }), 500
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, jsonify
 from src.business.secrets_business import SecretsManagerBusiness
+from src.controller.promotion_routes import register_promotion_routes
 from src.database.db_manager import DatabaseManager
 
 # Cria o Blueprint para o controller de Secrets Manager
@@ -38,6 +39,79 @@ def list_secrets():
         }), 500
 
 
+@secrets_bp.route('/search', methods=['GET'])
+def search_secrets():
+    """
+    Busca segredos no índice local
+    
+    Query params:
+        q: Trecho do nome, descrição ou tags
+        prefix: Prefixo do nome
+        tag: "chave" ou "chave=valor"
+        limit: Quantidade máxima de resultados
+    """
+    try:
+        result = business.search_secrets(
+            request.args.get('q'),
+            request.args.get('prefix'),
+            request.args.get('tag'),
+            request.args.get('limit')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao buscar segredos: {str(e)}'
+        }), 500
+
+
+@secrets_bp.route('/catalog/sync', methods=['POST'])
+def sync_catalog():
+    """
+    Dispara a sincronização do índice local
+    
+    Body JSON (opcional):
+        full: Rebusca os metadados de todos os itens
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        result = business.sync_catalog(bool(data.get('full', False)))
+        
+        if result['success']:
+            return jsonify(result), 202
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao sincronizar índice: {str(e)}'
+        }), 500
+
+
+@secrets_bp.route('/catalog/status', methods=['GET'])
+def get_catalog_status():
+    """
+    Retorna o estado da última sincronização do índice local
+    """
+    try:
+        return jsonify(business.get_catalog_status()), 200
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter estado do índice: {str(e)}'
+        }), 500
+
+# Promoção/cópia entre caminhos (/promotions)
+register_promotion_routes(secrets_bp, business)
+
+
 @secrets_bp.route('/<secret_name>', methods=['GET'])
 def describe_secret(secret_name):
     """
@@ -84,6 +158,30 @@ def get_secret_value(secret_name):
         }), 500
 
 
+@secrets_bp.route('/values', methods=['POST'])
+def get_secret_values():
+    """
+    Obtém o valor de vários segredos em uma única requisição
+    
+    Body JSON:
+        secret_names: Lista de nomes ou ARNs
+    """
+    try:
+        data = request.get_json() or {}
+        result = business.get_secret_values(data.get('secret_names'))
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter valores: {str(e)}'
+        }), 500
+
+
 @secrets_bp.route('/create', methods=['POST'])
 def create_secret():
     """
@@ -227,6 +325,38 @@ def get_favorites():
         }), 500
 
 
+@secrets_bp.route('/favorites/values', methods=['GET'])
+def get_favorite_values():
+    """
+    Obtém o valor de todos os secrets favoritos de uma vez
+    """
+    try:
+        favorites = db_manager.get_favorite_secrets()
+        
+        if not favorites['success']:
+            return jsonify(favorites), 400
+        
+        if not favorites['favorites']:
+            return jsonify({
+                'success': True,
+                'values': {},
+                'count': 0
+            }), 200
+        
+        result = business.get_secret_values([fav['secret_name'] for fav in favorites['favorites']])
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Erro ao obter valores dos favoritos: {str(e)}'
+        }), 500
+
+
 @secrets_bp.route('/favorites', methods=['POST'])
 def add_favorite():
     """
@@ -1,5 +1,6 @@
 import sqlite3
 import os
+import json
 from datetime import datetime
 
 
@@ -195,6 +196,48 @@ class DatabaseManager:
             )
         ''')
         
+        # Tabela de execuções de teste de carga das requests
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS api_load_test_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                request_id INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                concurrency INTEGER NOT NULL,
+                target_rps REAL,
+                duration_seconds REAL,
+                total_requests INTEGER,
+                completed_requests INTEGER DEFAULT 0,
+                error_count INTEGER DEFAULT 0,
+                elapsed_seconds REAL,
+                throughput_rps REAL,
+                latency_mean_ms REAL,
+                latency_p50_ms REAL,
+                latency_p90_ms REAL,
+                latency_p99_ms REAL,
+                latency_max_ms REAL,
+                status_codes TEXT,
+                errors TEXT,
+                histogram TEXT,
+                message TEXT,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP,
+                FOREIGN KEY (request_id) REFERENCES api_requests(id) ON DELETE CASCADE
+            )
+        ''')
+        
+        # Tabela de coleções de requests (fluxos encadeados)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS api_collections (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                description TEXT,
+                steps TEXT NOT NULL,
+                max_parallel INTEGER DEFAULT 4,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
         # ==================== KAFKA CATALOG ====================
         
         # Tabela de donos de Kafka
@@ -310,6 +353,136 @@ class DatabaseManager:
             )
         ''')
         
+        # ==================== ÍNDICE DE PARÂMETROS E SEGREDOS ====================
+        
+        # Metadados espelhados do Parameter Store e Secrets Manager (nunca valores)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                name TEXT NOT NULL,
+                item_type TEXT,
+                description TEXT,
+                tags TEXT,
+                tags_synced INTEGER DEFAULT 0,
+                last_modified TEXT,
+                data TEXT NOT NULL,
+                synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(source, name)
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_item_tags (
+                item_id INTEGER NOT NULL,
+                tag_key TEXT NOT NULL,
+                tag_value TEXT,
+                FOREIGN KEY (item_id) REFERENCES catalog_items(id) ON DELETE CASCADE
+            )
+        ''')
+        
+        try:
+            cursor.execute("SELECT parent_path FROM catalog_items LIMIT 1")
+        except:
+            cursor.execute("ALTER TABLE catalog_items ADD COLUMN parent_path TEXT")
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_catalog_items_parent ON catalog_items(source, parent_path, name)')
+        
+        # Índice de prefixos (pastas) para a navegação em árvore: uma linha por pasta
+        # com a quantidade de itens abaixo dela, mantida a cada gravação no índice
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_path_nodes (
+                source TEXT NOT NULL,
+                path TEXT NOT NULL,
+                parent_path TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                item_count INTEGER DEFAULT 0,
+                PRIMARY KEY (source, path)
+            )
+        ''')
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_catalog_path_nodes_parent ON catalog_path_nodes(source, parent_path, segment)')
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_catalog_item_tags_key ON catalog_item_tags(tag_key, tag_value)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_catalog_item_tags_item ON catalog_item_tags(item_id)')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_sync_state (
+                source TEXT PRIMARY KEY,
+                status TEXT,
+                item_count INTEGER DEFAULT 0,
+                changed_count INTEGER DEFAULT 0,
+                deleted_count INTEGER DEFAULT 0,
+                duration_seconds REAL,
+                message TEXT,
+                last_sync_at TIMESTAMP
+            )
+        ''')
+        
+        # Busca por substring (trigram) em nome, descrição e tags
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS catalog_items_fts USING fts5(
+                    name, description, tags,
+                    content='catalog_items', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS catalog_items_ai AFTER INSERT ON catalog_items BEGIN
+                    INSERT INTO catalog_items_fts(rowid, name, description, tags)
+                    VALUES (new.id, new.name, new.description, new.tags);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS catalog_items_ad AFTER DELETE ON catalog_items BEGIN
+                    INSERT INTO catalog_items_fts(catalog_items_fts, rowid, name, description, tags)
+                    VALUES ('delete', old.id, old.name, old.description, old.tags);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS catalog_items_au AFTER UPDATE ON catalog_items BEGIN
+                    INSERT INTO catalog_items_fts(catalog_items_fts, rowid, name, description, tags)
+                    VALUES ('delete', old.id, old.name, old.description, old.tags);
+                    INSERT INTO catalog_items_fts(rowid, name, description, tags)
+                    VALUES (new.id, new.name, new.description, new.tags);
+                END
+            ''')
+        except sqlite3.OperationalError:
+            pass  # SQLite sem FTS5/trigram: a busca usa LIKE
+        
+        # ==================== REDRIVE DE DLQ (SQS) ====================
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sqs_redrive_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_queue_url TEXT NOT NULL,
+                destination_queue_url TEXT,
+                strategy TEXT NOT NULL,
+                status TEXT NOT NULL,
+                max_per_second REAL,
+                max_messages INTEGER,
+                moved_count INTEGER DEFAULT 0,
+                failed_count INTEGER DEFAULT 0,
+                to_move_count INTEGER,
+                task_handle TEXT,
+                base_moved_count INTEGER DEFAULT 0,
+                message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Mensagens já movidas antes do move task atual (o ListMessageMoveTasks só conta as do task)
+        try:
+            cursor.execute("SELECT base_moved_count FROM sqs_redrive_jobs LIMIT 1")
+        except:
+            cursor.execute("ALTER TABLE sqs_redrive_jobs ADD COLUMN base_moved_count INTEGER DEFAULT 0")
+        
+        # Índices criados antes da navegação em árvore: preenche pastas e parent_path
+        cursor.execute('SELECT 1 FROM catalog_items WHERE parent_path IS NULL LIMIT 1')
+        if cursor.fetchone():
+            self._rebuild_catalog_paths(cursor)
+        
         conn.commit()
         conn.close()
     
@@ -1667,3 +1840,874 @@ class DatabaseManager:
                 'success': False,
                 'message': f'Erro ao obter parâmetros: {str(e)}'
             }
+    
+    # ==================== API LOAD TEST RUNS ====================
+    
+    def create_load_test_run(self, request_id, concurrency, target_rps=None, duration_seconds=None, total_requests=None):
+        """
+        Registra o início de um teste de carga
+        
+        Args:
+            request_id: ID do request
+            concurrency (int): Workers simultâneos
+            target_rps (float): Requests por segundo alvo (opcional)
+            duration_seconds (float): Duração do teste (opcional)
+            total_requests (int): Quantidade de requests (opcional)
+        
+        Returns:
+            dict: Resultado da operação com o ID da execução
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO api_load_test_runs (request_id, status, concurrency, target_rps, 
+                                                duration_seconds, total_requests)
+                VALUES (?, 'running', ?, ?, ?, ?)
+            ''', (request_id, concurrency, target_rps, duration_seconds, total_requests))
+            
+            conn.commit()
+            run_id = cursor.lastrowid
+            conn.close()
+            
+            return {
+                'success': True,
+                'id': run_id
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao registrar teste de carga: {str(e)}'
+            }
+    
+    def finish_load_test_run(self, run_id, status, summary, message=None):
+        """
+        Grava o resumo final de um teste de carga
+        
+        Args:
+            run_id: ID da execução
+            status (str): completed, failed ou cancelled
+            summary (dict): Resumo calculado pelo runner
+            message (str): Mensagem de erro (opcional)
+        
+        Returns:
+            dict: Resultado da operação
+        """
+        try:
+            latency = summary.get('latency', {})
+            
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE api_load_test_runs
+                SET status = ?,
+                    completed_requests = ?,
+                    error_count = ?,
+                    elapsed_seconds = ?,
+                    throughput_rps = ?,
+                    latency_mean_ms = ?,
+                    latency_p50_ms = ?,
+                    latency_p90_ms = ?,
+                    latency_p99_ms = ?,
+                    latency_max_ms = ?,
+                    status_codes = ?,
+                    errors = ?,
+                    histogram = ?,
+                    message = ?,
+                    finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (status, summary.get('completed_requests', 0), summary.get('error_count', 0),
+                  summary.get('elapsed_seconds'), summary.get('throughput_rps'),
+                  latency.get('mean_ms'), latency.get('p50_ms'), latency.get('p90_ms'),
+                  latency.get('p99_ms'), latency.get('max_ms'),
+                  json.dumps(summary.get('status_codes', {})), json.dumps(summary.get('errors', {})),
+                  json.dumps(summary.get('histogram', [])), message, run_id))
+            
+            conn.commit()
+            conn.close()
+            
+            return {
+                'success': True,
+                'message': 'Teste de carga finalizado'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao finalizar teste de carga: {str(e)}'
+            }
+    
+    def get_load_test_runs(self, request_id=None, limit=50):
+        """
+        Lista execuções de teste de carga (mais recentes primeiro)
+        
+        Args:
+            request_id: Filtra por request (opcional)
+            limit (int): Máximo de execuções
+        
+        Returns:
+            dict: Lista de execuções
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            if request_id:
+                cursor.execute('''
+                    SELECT * FROM api_load_test_runs
+                    WHERE request_id = ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                ''', (request_id, limit))
+            else:
+                cursor.execute('''
+                    SELECT * FROM api_load_test_runs
+                    ORDER BY id DESC
+                    LIMIT ?
+                ''', (limit,))
+            
+            rows = cursor.fetchall()
+            conn.close()
+            
+            return {
+                'success': True,
+                'runs': [self._format_load_test_run(row, include_histogram=False) for row in rows]
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao listar testes de carga: {str(e)}'
+            }
+    
+    def get_load_test_run(self, run_id):
+        """
+        Obtém uma execução de teste de carga com o histograma completo
+        
+        Args:
+            run_id: ID da execução
+        
+        Returns:
+            dict: Execução
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT * FROM api_load_test_runs WHERE id = ?', (run_id,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if row:
+                return {
+                    'success': True,
+                    'run': self._format_load_test_run(row, include_histogram=True)
+                }
+            else:
+                return {
+                    'success': False,
+                    'message': 'Teste de carga não encontrado'
+                }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao obter teste de carga: {str(e)}'
+            }
+    
+    def _format_load_test_run(self, row, include_histogram=False):
+        """
+        Converte uma linha de api_load_test_runs em dicionário
+        """
+        run = {
+            'id': row['id'],
+            'request_id': row['request_id'],
+            'status': row['status'],
+            'concurrency': row['concurrency'],
+            'target_rps': row['target_rps'],
+            'duration_seconds': row['duration_seconds'],
+            'total_requests': row['total_requests'],
+            'completed_requests': row['completed_requests'],
+            'error_count': row['error_count'],
+            'elapsed_seconds': row['elapsed_seconds'],
+            'throughput_rps': row['throughput_rps'],
+            'latency': {
+                'mean_ms': row['latency_mean_ms'],
+                'p50_ms': row['latency_p50_ms'],
+                'p90_ms': row['latency_p90_ms'],
+                'p99_ms': row['latency_p99_ms'],
+                'max_ms': row['latency_max_ms']
+            },
+            'status_codes': json.loads(row['status_codes']) if row['status_codes'] else {},
+            'errors': json.loads(row['errors']) if row['errors'] else {},
+            'message': row['message'],
+            'started_at': row['started_at'],
+            'finished_at': row['finished_at']
+        }
+        
+        if include_histogram:
+            run['histogram'] = json.loads(row['histogram']) if row['histogram'] else []
+        
+        return run
+    
+    # ==================== API COLLECTIONS ====================
+    
+    def save_collection(self, name, steps, description=None, max_parallel=4):
+        """
+        Salva (ou atualiza) uma coleção de requests
+        
+        Args:
+            name (str): Nome da coleção
+            steps (list): Passos da coleção
+            description (str): Descrição (opcional)
+            max_parallel (int): Passos executados em paralelo
+        
+        Returns:
+            dict: Resultado da operação
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO api_collections (name, description, steps, max_parallel)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) 
+                DO UPDATE SET 
+                    description = excluded.description,
+                    steps = excluded.steps,
+                    max_parallel = excluded.max_parallel,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (name, description, json.dumps(steps), max_parallel))
+            
+            conn.commit()
+            
+            cursor.execute('SELECT id FROM api_collections WHERE name = ?', (name,))
+            collection_id = cursor.fetchone()['id']
+            conn.close()
+            
+            return {
+                'success': True,
+                'message': f'Coleção "{name}" salva com sucesso',
+                'id': collection_id
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao salvar coleção: {str(e)}'
+            }
+    
+    def get_collections(self):
+        """
+        Lista todas as coleções
+        
+        Returns:
+            dict: Lista de coleções
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT * FROM api_collections ORDER BY name')
+            
+            rows = cursor.fetchall()
+            conn.close()
+            
+            return {
+                'success': True,
+                'collections': [self._format_collection(row) for row in rows]
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao listar coleções: {str(e)}'
+            }
+    
+    def get_collection(self, collection_id):
+        """
+        Obtém uma coleção
+        
+        Args:
+            collection_id: ID da coleção
+        
+        Returns:
+            dict: Coleção
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT * FROM api_collections WHERE id = ?', (collection_id,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if row:
+                return {
+                    'success': True,
+                    'collection': self._format_collection(row)
+                }
+            else:
+                return {
+                    'success': False,
+                    'message': 'Coleção não encontrada'
+                }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao obter coleção: {str(e)}'
+            }
+    
+    def delete_collection(self, collection_id):
+        """
+        Deleta uma coleção
+        
+        Args:
+            collection_id: ID da coleção
+        
+        Returns:
+            dict: Resultado da operação
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('DELETE FROM api_collections WHERE id = ?', (collection_id,))
+            
+            if cursor.rowcount > 0:
+                conn.commit()
+                conn.close()
+                return {
+                    'success': True,
+                    'message': 'Coleção deletada com sucesso'
+                }
+            else:
+                conn.close()
+                return {
+                    'success': False,
+                    'message': 'Coleção não encontrada'
+                }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao deletar coleção: {str(e)}'
+            }
+    
+    def _format_collection(self, row):
+        """
+        Converte uma linha de api_collections em dicionário
+        """
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'steps': json.loads(row['steps']) if row['steps'] else [],
+            'max_parallel': row['max_parallel'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+    
+    # ==================== ÍNDICE DE PARÂMETROS E SEGREDOS ====================
+    
+    def get_catalog_index_state(self, source):
+        """
+        Obtém data de modificação e situação das tags de cada item indexado
+        
+        Args:
+            source (str): 'parameter' ou 'secret'
+        
+        Returns:
+            dict: {nome: (last_modified, tags_synced, tags)}
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT name, last_modified, tags_synced, tags
+            FROM catalog_items
+            WHERE source = ?
+        ''', (source,))
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return {row['name']: (row['last_modified'], bool(row['tags_synced']), row['tags']) for row in rows}
+    
+    def save_catalog_items(self, source, items, deleted_names=None):
+        """
+        Grava itens novos/alterados e remove os que não existem mais (uma transação)
+        
+        Args:
+            source (str): 'parameter' ou 'secret'
+            items (list): Dicts com name, item_type, description, tags (lista), tags_synced, last_modified, data
+            deleted_names (list): Nomes removidos na AWS
+        
+        Returns:
+            dict: Resultado da operação
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            for item in items:
+                cursor.execute('SELECT 1 FROM catalog_items WHERE source = ? AND name = ?', (source, item['name']))
+                if not cursor.fetchone():
+                    self._update_catalog_path_counts(cursor, source, item['name'], 1)
+                
+                cursor.execute('''
+                    INSERT INTO catalog_items (source, name, item_type, description, tags, tags_synced, last_modified,
+                                               data, parent_path)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(source, name)
+                    DO UPDATE SET
+                        item_type = excluded.item_type,
+                        description = excluded.description,
+                        tags = excluded.tags,
+                        tags_synced = excluded.tags_synced,
+                        last_modified = excluded.last_modified,
+                        data = excluded.data,
+                        synced_at = CURRENT_TIMESTAMP
+                ''', (
+                    source, item['name'], item.get('item_type'), item.get('description'),
+                    json.dumps(item.get('tags') or []), 1 if item.get('tags_synced') else 0,
+                    item.get('last_modified'), json.dumps(item['data']), self._catalog_parent_path(item['name'])
+                ))
+                
+                cursor.execute('SELECT id FROM catalog_items WHERE source = ? AND name = ?', (source, item['name']))
+                item_id = cursor.fetchone()['id']
+                
+                cursor.execute('DELETE FROM catalog_item_tags WHERE item_id = ?', (item_id,))
+                cursor.executemany(
+                    'INSERT INTO catalog_item_tags (item_id, tag_key, tag_value) VALUES (?, ?, ?)',
+                    [(item_id, tag.get('Key'), tag.get('Value')) for tag in item.get('tags') or []]
+                )
+            
+            for name in deleted_names or []:
+                cursor.execute('SELECT 1 FROM catalog_items WHERE source = ? AND name = ?', (source, name))
+                if cursor.fetchone():
+                    self._update_catalog_path_counts(cursor, source, name, -1)
+                
+                cursor.execute('''
+                    DELETE FROM catalog_item_tags
+                    WHERE item_id IN (SELECT id FROM catalog_items WHERE source = ? AND name = ?)
+                ''', (source, name))
+                cursor.execute('DELETE FROM catalog_items WHERE source = ? AND name = ?', (source, name))
+            
+            conn.commit()
+            conn.close()
+            
+            return {
+                'success': True,
+                'message': 'Índice atualizado com sucesso'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao atualizar índice: {str(e)}'
+            }
+    
+    def search_catalog_items(self, source, query=None, prefix=None, tag_key=None, tag_value=None, limit=None):
+        """
+        Busca itens no índice
+        
+        Args:
+            source (str): 'parameter' ou 'secret'
+            query (str): Trecho do nome, descrição ou tags (substring)
+            prefix (str): Prefixo do nome
+            tag_key (str): Chave da tag
+            tag_value (str): Valor da tag (opcional)
+            limit (int): Quantidade máxima de itens (None = todos)
+        
+        Returns:
+            dict: Itens encontrados (no formato da listagem)
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            conditions = ['i.source = ?']
+            params = [source]
+            
+            if prefix:
+                # Intervalo no índice UNIQUE(source, name) em vez de LIKE
+                conditions.append('i.name >= ? AND i.name < ?')
+                params.extend([prefix, prefix + '\uffff'])
+            
+            if tag_key:
+                tag_condition = 'i.id IN (SELECT item_id FROM catalog_item_tags WHERE tag_key = ?'
+                params.append(tag_key)
+                if tag_value is not None:
+                    tag_condition += ' AND tag_value = ?'
+                    params.append(tag_value)
+                conditions.append(tag_condition + ')')
+            
+            sql = 'SELECT i.data FROM catalog_items i'
+            
+            if query:
+                if len(query) >= 3 and self._has_catalog_fts(cursor):
+                    sql += ' JOIN catalog_items_fts f ON f.rowid = i.id'
+                    conditions.append('catalog_items_fts MATCH ?')
+                    params.append('"' + query.replace('"', '""') + '"')
+                else:
+                    like = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                    conditions.append("(i.name LIKE ? ESCAPE '\\' OR i.description LIKE ? ESCAPE '\\' OR i.tags LIKE ? ESCAPE '\\')")
+                    params.extend([like, like, like])
+            
+            sql += ' WHERE ' + ' AND '.join(conditions) + ' ORDER BY i.name'
+            
+            if limit:
+                sql += ' LIMIT ?'
+                params.append(int(limit))
+            
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            conn.close()
+            
+            items = [json.loads(row['data']) for row in rows]
+            
+            return {
+                'success': True,
+                'items': items,
+                'count': len(items)
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao buscar no índice: {str(e)}'
+            }
+    
+    def get_catalog_tree_level(self, source, path='/', limit=None):
+        """
+        Retorna um nível da árvore do índice: subpastas com contagem e itens diretos
+        
+        Args:
+            source (str): 'parameter' ou 'secret'
+            path (str): Pasta ('/' para a raiz)
+            limit (int): Quantidade máxima de itens diretos (None = todos)
+        
+        Returns:
+            dict: Pastas, itens e total de itens abaixo da pasta
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT path, segment, item_count FROM catalog_path_nodes
+                WHERE source = ? AND parent_path = ?
+                ORDER BY segment
+            ''', (source, path))
+            folders = [
+                {'name': row['segment'], 'path': row['path'], 'count': row['item_count']}
+                for row in cursor.fetchall()
+            ]
+            
+            cursor.execute('SELECT COUNT(*) FROM catalog_items WHERE source = ? AND parent_path = ?', (source, path))
+            item_count = cursor.fetchone()[0]
+            
+            sql = 'SELECT data FROM catalog_items WHERE source = ? AND parent_path = ? ORDER BY name'
+            params = [source, path]
+            if limit:
+                sql += ' LIMIT ?'
+                params.append(int(limit))
+            
+            cursor.execute(sql, params)
+            items = [json.loads(row['data']) for row in cursor.fetchall()]
+            
+            if path == '/':
+                cursor.execute('SELECT COUNT(*) FROM catalog_items WHERE source = ?', (source,))
+                total = cursor.fetchone()[0]
+            else:
+                cursor.execute('SELECT item_count FROM catalog_path_nodes WHERE source = ? AND path = ?', (source, path))
+                row = cursor.fetchone()
+                total = row['item_count'] if row else item_count
+            
+            conn.close()
+            
+            return {
+                'success': True,
+                'path': path,
+                'folders': folders,
+                'items': items,
+                'item_count': item_count,
+                'total_count': total,
+                'truncated': len(items) < item_count
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao consultar árvore do índice: {str(e)}'
+            }
+    
+    def _catalog_parent_path(self, name):
+        """
+        Pasta que contém o item ('/app/dev/db' -> '/app/dev', 'db' -> '/')
+        """
+        parent = name.rstrip('/').rpartition('/')[0]
+        return parent if parent.startswith('/') else '/' + parent
+    
+    def _catalog_ancestor_paths(self, name):
+        """
+        Pastas acima do item, da raiz para baixo ('/app/dev/db' -> ['/app', '/app/dev'])
+        """
+        segments = [segment for segment in name.split('/') if segment][:-1]
+        return ['/' + '/'.join(segments[:index + 1]) for index in range(len(segments))]
+    
+    def _update_catalog_path_counts(self, cursor, source, name, delta):
+        """
+        Soma delta na contagem das pastas acima do item e remove pastas vazias
+        """
+        for path in self._catalog_ancestor_paths(name):
+            parent, _, segment = path.rpartition('/')
+            cursor.execute('''
+                INSERT INTO catalog_path_nodes (source, path, parent_path, segment, item_count)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(source, path)
+                DO UPDATE SET item_count = catalog_path_nodes.item_count + excluded.item_count
+            ''', (source, path, parent or '/', segment, delta))
+        
+        if delta < 0:
+            cursor.execute('DELETE FROM catalog_path_nodes WHERE source = ? AND item_count <= 0', (source,))
+    
+    def _rebuild_catalog_paths(self, cursor):
+        """
+        Recalcula parent_path e as pastas de todos os itens do índice
+        """
+        cursor.execute('SELECT id, source, name FROM catalog_items')
+        rows = cursor.fetchall()
+        
+        counts = {}
+        for row in rows:
+            for path in self._catalog_ancestor_paths(row['name']):
+                counts[(row['source'], path)] = counts.get((row['source'], path), 0) + 1
+        
+        cursor.executemany(
+            'UPDATE catalog_items SET parent_path = ? WHERE id = ?',
+            [(self._catalog_parent_path(row['name']), row['id']) for row in rows]
+        )
+        
+        cursor.execute('DELETE FROM catalog_path_nodes')
+        cursor.executemany(
+            'INSERT INTO catalog_path_nodes (source, path, parent_path, segment, item_count) VALUES (?, ?, ?, ?, ?)',
+            [
+                (source, path, path.rpartition('/')[0] or '/', path.rpartition('/')[2], count)
+                for (source, path), count in counts.items()
+            ]
+        )
+    
+    def _has_catalog_fts(self, cursor):
+        """
+        Verifica se a tabela FTS5 do índice existe
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'catalog_items_fts'")
+        return cursor.fetchone() is not None
+    
+    def save_catalog_sync_state(self, source, status, item_count=None, changed_count=0, deleted_count=0,
+                                duration_seconds=None, message=None):
+        """
+        Registra o resultado de uma sincronização do índice
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO catalog_sync_state (source, status, item_count, changed_count, deleted_count,
+                                                duration_seconds, message, last_sync_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CASE WHEN ? = 'completed' THEN CURRENT_TIMESTAMP END)
+                ON CONFLICT(source)
+                DO UPDATE SET
+                    status = excluded.status,
+                    item_count = COALESCE(excluded.item_count, catalog_sync_state.item_count),
+                    changed_count = excluded.changed_count,
+                    deleted_count = excluded.deleted_count,
+                    duration_seconds = excluded.duration_seconds,
+                    message = excluded.message,
+                    last_sync_at = CASE WHEN excluded.status = 'completed'
+                                        THEN CURRENT_TIMESTAMP
+                                        ELSE catalog_sync_state.last_sync_at END
+            ''', (source, status, item_count, changed_count, deleted_count, duration_seconds, message, status))
+            
+            conn.commit()
+            conn.close()
+            
+            return {
+                'success': True
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao salvar estado da sincronização: {str(e)}'
+            }
+    
+    def get_catalog_sync_state(self, source):
+        """
+        Obtém o estado da última sincronização de um índice
+        
+        Returns:
+            dict: Estado ou None se nunca sincronizou
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM catalog_sync_state WHERE source = ?', (source,))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        return dict(row) if row else None
+    
+    # ==================== REDRIVE DE DLQ (SQS) ====================
+    
+    def create_redrive_job(self, source_queue_url, destination_queue_url, strategy, max_per_second=None, max_messages=None):
+        """
+        Registra um redrive de DLQ
+        
+        Args:
+            source_queue_url (str): URL da DLQ
+            destination_queue_url (str): URL da fila de destino (None = fila de origem das mensagens)
+            strategy (str): 'native' (StartMessageMoveTask) ou 'pipeline'
+            max_per_second (float): Limite de mensagens por segundo
+            max_messages (int): Quantidade máxima de mensagens
+        
+        Returns:
+            dict: Resultado da operação com o ID do redrive
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO sqs_redrive_jobs (source_queue_url, destination_queue_url, strategy, status,
+                                              max_per_second, max_messages)
+                VALUES (?, ?, ?, 'running', ?, ?)
+            ''', (source_queue_url, destination_queue_url, strategy, max_per_second, max_messages))
+            
+            conn.commit()
+            job_id = cursor.lastrowid
+            conn.close()
+            
+            return {
+                'success': True,
+                'id': job_id
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao registrar redrive: {str(e)}'
+            }
+    
+    def update_redrive_job(self, job_id, **fields):
+        """
+        Atualiza o progresso/estado de um redrive
+        
+        Args:
+            job_id: ID do redrive
+            **fields: Colunas a atualizar (status, moved_count, failed_count, to_move_count,
+                      task_handle, base_moved_count, strategy, message)
+        
+        Returns:
+            dict: Resultado da operação
+        """
+        allowed = {'status', 'strategy', 'moved_count', 'failed_count', 'to_move_count', 'task_handle',
+                   'base_moved_count', 'message', 'max_per_second', 'max_messages'}
+        fields = {column: value for column, value in fields.items() if column in allowed}
+        
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            assignments = ', '.join(f'{column} = ?' for column in fields)
+            cursor.execute(
+                f'UPDATE sqs_redrive_jobs SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                (*fields.values(), job_id)
+            )
+            
+            conn.commit()
+            conn.close()
+            
+            return {
+                'success': True
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao atualizar redrive: {str(e)}'
+            }
+    
+    def get_redrive_job(self, job_id):
+        """
+        Obtém um redrive
+        
+        Returns:
+            dict: Redrive ou None se não existir
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM sqs_redrive_jobs WHERE id = ?', (job_id,))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        return dict(row) if row else None
+    
+    def get_redrive_jobs(self, source_queue_url=None, limit=50):
+        """
+        Lista redrives (mais recentes primeiro)
+        
+        Args:
+            source_queue_url (str): Filtra por DLQ (opcional)
+            limit (int): Máximo de redrives
+        
+        Returns:
+            list: Redrives
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        if source_queue_url:
+            cursor.execute('''
+                SELECT * FROM sqs_redrive_jobs
+                WHERE source_queue_url = ?
+                ORDER BY id DESC
+                LIMIT ?
+            ''', (source_queue_url, limit))
+        else:
+            cursor.execute('SELECT * FROM sqs_redrive_jobs ORDER BY id DESC LIMIT ?', (limit,))
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return [dict(row) for row in rows]
+    
+    def interrupt_running_redrive_jobs(self):
+        """
+        Marca como interrompidos os redrives do pipeline que estavam rodando quando a aplicação parou
+        (redrives nativos continuam rodando na AWS)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            UPDATE sqs_redrive_jobs
+            SET status = 'interrupted', updated_at = CURRENT_TIMESTAMP
+            WHERE status = 'running' AND strategy = 'pipeline'
+        ''')
+        
+        conn.commit()
+        conn.close()
@@ -1,7 +1,16 @@
 import requests
 import json
+import logging
+import re
 import uuid
 from src.database.db_manager import DatabaseManager
+from src.service.http_client_pool import get_http_client_pool
+from src.service.oauth2_token_cache import get_oauth2_token_cache
+from src.service.request_template import AUTH_VARIABLE_PATTERN, get_request_template_cache
+
+logger = logging.getLogger(__name__)
+
+_CAMEL_CASE_PATTERN = re.compile(r'(?<!^)(?=[A-Z])')
 
 
 class APICatalogService:
@@ -14,6 +23,9 @@ class APICatalogService:
         Inicializa o serviço
         """
         self.db = DatabaseManager()
+        self.http = get_http_client_pool()
+        self.token_cache = get_oauth2_token_cache()
+        self.templates = get_request_template_cache()
     
     # ==================== OWNERS ====================
     
@@ -252,6 +264,10 @@ class APICatalogService:
             if cursor.rowcount > 0:
                 conn.commit()
                 conn.close()
+                
+                # Requests da API usam a base URL e headers removidos
+                self.templates.clear()
+                
                 return {
                     'success': True,
                     'message': 'API deletada com sucesso'
@@ -364,11 +380,11 @@ class APICatalogService:
             if 'Content-Type' not in request_headers:
                 request_headers['Content-Type'] = 'application/json'
             
-            # Fazer a requisição
+            # Fazer a requisição (reutilizando conexões do pool)
             if method.upper() == 'POST':
-                response = requests.post(url, json=body, headers=request_headers, timeout=30)
+                response, timing = self.http.request('POST', url, json=body, headers=request_headers, timeout=30)
             elif method.upper() == 'GET':
-                response = requests.get(url, params=body, headers=request_headers, timeout=30)
+                response, timing = self.http.request('GET', url, params=body, headers=request_headers, timeout=30)
             else:
                 return {
                     'success': False,
@@ -387,7 +403,8 @@ class APICatalogService:
                     'status_code': response.status_code,
                     'headers': dict(response.headers),
                     'json': response_json,
-                    'body': response.text
+                    'body': response.text,
+                    'timing': timing
                 }
             }
         except requests.exceptions.Timeout:
@@ -430,6 +447,10 @@ class APICatalogService:
             conn.commit()
             conn.close()
             
+            # Descarta o token e as requests compiladas com a autenticação removida
+            self.token_cache.invalidate(auth_id)
+            self.templates.clear()
+            
             return {
                 'success': True,
                 'message': f'Autenticação "{row["name"]}" deletada com sucesso'
@@ -487,6 +508,8 @@ class APICatalogService:
             conn.commit()
             conn.close()
             
+            self.templates.clear()
+            
             return {
                 'success': True,
                 'message': 'Endpoint e suas requests deletados com sucesso'
@@ -582,6 +605,8 @@ class APICatalogService:
             conn.commit()
             conn.close()
             
+            self.templates.invalidate(request_id)
+            
             return {
                 'success': True,
                 'message': 'Request deletada com sucesso'
@@ -644,8 +669,7 @@ class APICatalogService:
         Converte camelCase para snake_case
         accessToken -> access_token
         """
-        import re
-        return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+        return _CAMEL_CASE_PATTERN.sub('_', name).lower()
     
     def _snake_to_camel(self, name):
         """
@@ -659,6 +683,7 @@ class APICatalogService:
         """
         Obtém valor aninhado de um dicionário usando dot notation
         Exemplo: 'user.name' retorna data['user']['name']
+        Índices de listas também são aceitos: 'items.0.id'
         """
         keys = path.split('.')
         value = data
@@ -666,44 +691,113 @@ class APICatalogService:
         for key in keys:
             if isinstance(value, dict) and key in value:
                 value = value[key]
+            elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
             else:
                 return None
         
         return value
     
-    def _replace_auth_variables(self, headers, auth_tokens):
+    def _replace_auth_variables(self, headers, auth_tokens, keys=None):
         """
         Substitui variáveis ${campo} nos headers pelos valores reais
+        
+        Args:
+            headers (dict): Headers da request
+            auth_tokens (dict): Tokens da autenticação
+            keys (iterable): Headers que contêm ${campo} (padrão: verifica todos)
         """
-        import re
+        if keys is None:
+            keys = [key for key, value in headers.items() if isinstance(value, str) and '${' in value]
         
-        replaced_headers = {}
-        pattern = r'\$\{([^}]+)\}'
+        if not keys:
+            return headers
         
-        print(f"[DEBUG] _replace_auth_variables - Iniciando substituição")
-        print(f"[DEBUG] Pattern regex: {pattern}")
+        def replace_match(match):
+            return str(auth_tokens.get(match.group(1), match.group(0)))
         
-        for key, value in headers.items():
-            print(f"[DEBUG] Processando header: {key} = {value}")
+        replaced_headers = dict(headers)
+        for key in keys:
+            replaced_headers[key] = AUTH_VARIABLE_PATTERN.sub(replace_match, headers[key])
             
-            if isinstance(value, str):
-                # Procurar por ${campo} no valor
-                matches = re.findall(pattern, value)
-                print(f"[DEBUG] Variáveis encontradas em '{key}': {matches}")
+            if logger.isEnabledFor(logging.DEBUG):
+                missing = [name for name in AUTH_VARIABLE_PATTERN.findall(headers[key]) if name not in auth_tokens]
+                logger.debug("Header '%s': variáveis sem token: %s", key, missing or 'nenhuma')
+        
+        return replaced_headers
+    
+    def _get_oauth2_tokens(self, auth_id, auth_config):
+        """
+        Obtém os tokens OAuth2 de uma autenticação usando o cache compartilhado
+        Retorna {} se a autenticação falhar (a request segue sem tokens)
+        """
+        try:
+            return self.token_cache.get_tokens(
+                auth_id,
+                auth_config,
+                lambda: self._fetch_oauth2_tokens(json.loads(auth_config))
+            )
+        except Exception:
+            logger.exception('Erro ao executar OAuth2 da autenticação %s', auth_id)
+            return {}
+    
+    def _fetch_oauth2_tokens(self, auth_config_dict):
+        """
+        Executa a autenticação OAuth2 e extrai os campos selecionados da resposta
+        
+        Returns:
+            tuple: (tokens, expires_in)
+        """
+        logger.debug('Executando OAuth2 em %s', auth_config_dict.get('url'))
+        
+        oauth_result = self.test_oauth2_authentication(
+            url=auth_config_dict.get('url'),
+            method=auth_config_dict.get('method', 'POST'),
+            body=auth_config_dict.get('body'),
+            headers=auth_config_dict.get('headers')
+        )
+        
+        if not oauth_result.get('success') or not oauth_result.get('response'):
+            raise Exception(oauth_result.get('message', 'Falha na autenticação OAuth2'))
+        
+        if oauth_result['response']['status_code'] >= 400:
+            raise Exception(f"Provedor OAuth2 retornou status {oauth_result['response']['status_code']}")
+        
+        auth_tokens = {}
+        
+        # Extrair campos selecionados
+        selected_fields = auth_config_dict.get('selected_fields', [])
+        
+        # A resposta vem em oauth_result['response']['json']
+        response_data = oauth_result['response'].get('json') or oauth_result['response'].get('body')
+        
+        for field in selected_fields:
+            # Navegar pelo JSON usando dot notation
+            value = self._get_nested_value(response_data, field)
+            if value is not None:
+                auth_tokens[field] = value
                 
-                def replace_match(match):
-                    field_name = match.group(1)
-                    replacement = auth_tokens.get(field_name, match.group(0))
-                    print(f"[DEBUG] Substituindo ${{{field_name}}} por: {replacement[:20] if isinstance(replacement, str) and len(replacement) > 20 else replacement}")
-                    return str(replacement)
+                # Também adicionar variações do nome (camelCase <-> snake_case)
+                # accessToken -> access_token
+                snake_case = self._camel_to_snake(field)
+                if snake_case != field:
+                    auth_tokens[snake_case] = value
                 
-                replaced_value = re.sub(pattern, replace_match, value)
-                replaced_headers[key] = replaced_value
-                print(f"[DEBUG] Valor final de '{key}': {replaced_value[:50] if len(replaced_value) > 50 else replaced_value}...")
+                # access_token -> accessToken
+                camel_case = self._snake_to_camel(field)
+                if camel_case != field:
+                    auth_tokens[camel_case] = value
             else:
-                replaced_headers[key] = value
+                logger.debug("Campo '%s' não encontrado na resposta OAuth2", field)
         
-        return replaced_headers
+        logger.debug('Tokens OAuth2 coletados: %s', list(auth_tokens.keys()))
+        
+        # Validade do token (expires_in em segundos, padrão OAuth2)
+        expires_in = None
+        if isinstance(response_data, dict):
+            expires_in = response_data.get('expires_in') or response_data.get('expiresIn')
+        
+        return auth_tokens, expires_in
     
     # ==================== TEST REQUEST ====================
     
@@ -712,27 +806,9 @@ class APICatalogService:
         Executa um teste de request
         """
         try:
-            # Busca dados da request
-            conn = self.db._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT r.*, e.path, a.base_url, a.default_headers, a.auth_id as api_auth_id,
-                       auth.auth_type, auth.auth_config, auth.token_field,
-                       req_auth.auth_type as req_auth_type, req_auth.auth_config as req_auth_config, 
-                       req_auth.token_field as req_token_field
-                FROM api_requests r
-                JOIN api_endpoints e ON r.endpoint_id = e.id
-                JOIN apis a ON e.api_id = a.id
-                LEFT JOIN api_authentications auth ON a.auth_id = auth.id
-                LEFT JOIN api_authentications req_auth ON r.auth_id = req_auth.id
-                WHERE r.id = ?
-            ''', (request_id,))
-            
-            row = cursor.fetchone()
-            conn.close()
+            template = self._get_template(request_id)
             
-            if not row:
+            if not template:
                 return {
                     'success': False,
                     'message': 'Request não encontrada'
@@ -746,146 +822,10 @@ class APICatalogService:
                 headers=json.dumps(headers_data) if headers_data else None
             )
             
-            # Monta a URL e substitui path variables
-            base_url = row['base_url'] or ''
-            path = row['path']
-            
-            # Substituir path variables (ex: /pessoas/{id} -> /pessoas/123)
-            if path_variables:
-                for var_name, var_value in path_variables.items():
-                    path = path.replace(f'{{{var_name}}}', str(var_value))
-            
-            url = f"{base_url}{path}"
-            print(f"[DEBUG] URL final após substituição de path variables: {url}")
-            
-            # Determinar qual autenticação usar (request sobrescreve API)
-            auth_type = row['req_auth_type'] if row['req_auth_type'] else row['auth_type']
-            auth_config = row['req_auth_config'] if row['req_auth_config'] else row['auth_config']
-            token_field = row['req_token_field'] if row['req_token_field'] else row['token_field']
-            
-            print(f"[DEBUG] Auth type detectado: {auth_type}")
-            print(f"[DEBUG] Auth config existe: {bool(auth_config)}")
-            
-            # Executar autenticação OAuth2 se necessário
-            auth_tokens = {}
-            if auth_type == 'oauth2' and auth_config:
-                print(f"[DEBUG] Executando OAuth2...")
-                try:
-                    auth_config_dict = json.loads(auth_config)
-                    print(f"[DEBUG] Auth config: {auth_config_dict}")
-                    
-                    oauth_result = self.test_oauth2_authentication(
-                        url=auth_config_dict.get('url'),
-                        method=auth_config_dict.get('method', 'POST'),
-                        body=auth_config_dict.get('body'),
-                        headers=auth_config_dict.get('headers')
-                    )
-                    
-                    print(f"[DEBUG] OAuth2 result success: {oauth_result.get('success')}")
-                    print(f"[DEBUG] OAuth2 result completo: {oauth_result}")
-                    
-                    if oauth_result.get('success') and oauth_result.get('response'):
-                        # Extrair campos selecionados
-                        selected_fields = auth_config_dict.get('selected_fields', [])
-                        
-                        # A resposta vem em oauth_result['response']['json']
-                        response_data = oauth_result['response'].get('json') or oauth_result['response'].get('body')
-                        
-                        print(f"[DEBUG] Selected fields: {selected_fields}")
-                        print(f"[DEBUG] Response data keys: {list(response_data.keys()) if isinstance(response_data, dict) else 'not a dict'}")
-                        print(f"[DEBUG] Response data completo: {response_data}")
-                        
-                        for field in selected_fields:
-                            # Navegar pelo JSON usando dot notation
-                            value = self._get_nested_value(response_data, field)
-                            if value is not None:
-                                auth_tokens[field] = value
-                                print(f"[DEBUG] Token extraído - {field}: {value[:20] if isinstance(value, str) and len(str(value)) > 20 else value}")
-                                
-                                # Também adicionar variações do nome (camelCase <-> snake_case)
-                                # accessToken -> access_token
-                                snake_case = self._camel_to_snake(field)
-                                if snake_case != field:
-                                    auth_tokens[snake_case] = value
-                                    print(f"[DEBUG] Também adicionado como: {snake_case}")
-                                
-                                # access_token -> accessToken
-                                camel_case = self._snake_to_camel(field)
-                                if camel_case != field:
-                                    auth_tokens[camel_case] = value
-                                    print(f"[DEBUG] Também adicionado como: {camel_case}")
-                            else:
-                                print(f"[DEBUG] Campo '{field}' não encontrado na resposta")
-                        
-                        print(f"[DEBUG] Auth tokens coletados: {list(auth_tokens.keys())}")
-                except Exception as e:
-                    print(f"[ERROR] Erro ao executar OAuth2: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            # Prepara headers começando com os padrão da API
-            headers = {}
-            
-            # 1. Headers padrão da API
-            if row['default_headers']:
-                try:
-                    api_headers = json.loads(row['default_headers'])
-                    headers.update(api_headers)
-                except:
-                    pass
-            
-            # 2. Headers da request
-            if row['headers']:
-                try:
-                    request_headers = json.loads(row['headers'])
-                    headers.update(request_headers)
-                except:
-                    pass
-            
-            # 3. Content-Type
-            headers['Content-Type'] = row['content_type']
-            
-            # 4. Headers customizados do teste
-            if headers_data:
-                headers.update(headers_data)
-            
-            # 5. Substituir variáveis ${campo} pelos valores da autenticação
-            print(f"[DEBUG] ========== SUBSTITUIÇÃO DE VARIÁVEIS ==========")
-            print(f"[DEBUG] Headers antes da substituição: {headers}")
-            print(f"[DEBUG] Auth tokens disponíveis: {auth_tokens}")
-            print(f"[DEBUG] Quantidade de tokens: {len(auth_tokens)}")
-            
-            # SEMPRE executar substituição para debug
-            headers = self._replace_auth_variables(headers, auth_tokens)
-            print(f"[DEBUG] Headers após substituição: {headers}")
-            print(f"[DEBUG] ===============================================")
-            
-            # Prepara query params
-            params = query_data if query_data else (json.loads(row['query_params']) if row['query_params'] else {})
-            
-            # Prepara body
-            data = None
-            if row['method'] in ['POST', 'PUT', 'PATCH']:
-                if body_data:
-                    data = body_data
-                elif row['body_template']:
-                    data = json.loads(row['body_template'])
-            
-            # Executa request
-            import time
-            start_time = time.time()
-            
-            response = requests.request(
-                method=row['method'],
-                url=url,
-                headers=headers,
-                params=params,
-                json=data if row['content_type'] == 'application/json' else None,
-                data=data if row['content_type'] != 'application/json' else None,
-                timeout=30
-            )
+            prepared = template.prepare(body_data, query_data, headers_data, path_variables)
+            response, timing = self._send_prepared_request(prepared)
             
-            elapsed_time = round(time.time() - start_time, 3)
+            elapsed_time = round(timing['total'], 3)
             
             # Tentar parsear resposta como JSON
             response_body = None
@@ -900,7 +840,8 @@ class APICatalogService:
                 'response_headers': dict(response.headers),
                 'response_body': response_body,
                 'elapsed_time': elapsed_time,
-                'url': url
+                'timing': timing,
+                'url': prepared['url']
             }
             
         except requests.exceptions.RequestException as e:
@@ -914,6 +855,88 @@ class APICatalogService:
                 'message': f'Erro ao testar request: {str(e)}'
             }
     
+    def _get_template(self, request_id):
+        """
+        Obtém a request compilada (RequestTemplate) do cache, carregando do banco se necessário
+        
+        Returns:
+            RequestTemplate: Template ou None se a request não existir
+        """
+        return self.templates.get(request_id, self._load_request_row)
+    
+    def _load_request_row(self, request_id):
+        """
+        Busca a request com endpoint, API e autenticações
+        """
+        conn = self.db._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT r.*, e.path, a.base_url, a.default_headers, a.auth_id as api_auth_id,
+                   auth.auth_type, auth.auth_config, auth.token_field,
+                   req_auth.auth_type as req_auth_type, req_auth.auth_config as req_auth_config, 
+                   req_auth.token_field as req_token_field
+            FROM api_requests r
+            JOIN api_endpoints e ON r.endpoint_id = e.id
+            JOIN apis a ON e.api_id = a.id
+            LEFT JOIN api_authentications auth ON a.auth_id = auth.id
+            LEFT JOIN api_authentications req_auth ON r.auth_id = req_auth.id
+            WHERE r.id = ?
+        ''', (request_id,))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        return row
+    
+    def _send_prepared_request(self, prepared, http=None, timeout=30):
+        """
+        Envia uma request preparada, aplicando os tokens OAuth2 (do cache) nos headers
+        
+        Args:
+            prepared (dict): Resultado de RequestTemplate.prepare
+            http (HTTPClientPool): Pool HTTP a usar (padrão: pool compartilhado)
+            timeout (int): Timeout em segundos
+        
+        Returns:
+            tuple: (requests.Response, dict de timing)
+        """
+        http = http or self.http
+        auth_id = prepared['auth_id']
+        auth_config = prepared['auth_config']
+        
+        # Obter tokens OAuth2 (do cache quando ainda válidos)
+        auth_tokens = self._get_oauth2_tokens(auth_id, auth_config) if auth_config else {}
+        
+        # Repete uma vez com token novo se o token em cache for recusado
+        attempts = 2 if auth_config else 1
+        for attempt in range(attempts):
+            # Substituir variáveis ${campo} pelos valores da autenticação
+            headers = self._replace_auth_variables(prepared['headers'], auth_tokens, prepared.get('auth_header_keys'))
+            
+            logger.debug('%s %s (tokens disponíveis: %s)', prepared['method'], prepared['url'], list(auth_tokens.keys()))
+            
+            # Conexões reaproveitadas por base URL
+            response, timing = http.request(
+                method=prepared['method'],
+                url=prepared['url'],
+                headers=headers,
+                params=prepared['params'],
+                json=prepared['json'],
+                data=prepared['data'],
+                timeout=timeout
+            )
+            
+            if response.status_code != 401 or attempt == attempts - 1:
+                break
+            
+            # Token recusado: descarta do cache e busca um novo
+            logger.debug('401 recebido, descartando token OAuth2 da autenticação %s', auth_id)
+            self.token_cache.invalidate(auth_id, auth_tokens)
+            auth_tokens = self._get_oauth2_tokens(auth_id, auth_config)
+        
+        return response, timing
+    
     def get_test_parameters(self, request_id):
         """
         Obtém os últimos parâmetros de teste salvos
@@ -0,0 +1,381 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from src.database.db_manager import DatabaseManager
+from src.service.api_catalog_service import APICatalogService
+from src.service.http_client_pool import HTTPClientPool
+
+# Variáveis da coleção: {{nome}}
+_VARIABLE_PATTERN = re.compile(r'\{\{\s*([A-Za-z0-9_.-]+)\s*\}\}')
+
+
+class APICollectionService:
+    """
+    Service layer para coleções de requests do catálogo (fluxos login → create → fetch → delete)
+
+    Cada passo da coleção é um dicionário:
+        id: Identificador do passo (padrão: step_<posição>)
+        request_id: ID da request salva no catálogo
+        depends_on: Lista de passos que precisam terminar antes (opcional)
+        body_data, query_data, headers_data, path_variables: Aceitam {{variavel}}
+        extract: {"variavel": "body.data.id"} - caminhos em body, headers ou status_code
+        expected_status: Lista de status aceitos (padrão: qualquer status < 400)
+
+    Se nenhum passo declarar depends_on a coleção roda em ordem; caso contrário
+    é tratada como DAG e passos independentes rodam em paralelo.
+    """
+
+    MAX_PARALLEL = 16
+
+    def __init__(self, catalog_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.db = DatabaseManager()
+        self.catalog = catalog_service or APICatalogService()
+
+    # ==================== COLEÇÕES ====================
+
+    def save_collection(self, name, steps, description=None, max_parallel=4):
+        """
+        Salva uma coleção após validar os passos
+        """
+        if not name or name.strip() == '':
+            return {
+                'success': False,
+                'message': 'Nome da coleção é obrigatório'
+            }
+
+        validation = self._normalize_steps(steps)
+        if not validation['valid']:
+            return {
+                'success': False,
+                'message': validation['message']
+            }
+
+        return self.db.save_collection(name.strip(), steps, description, self._parallelism(max_parallel))
+
+    def get_collections(self):
+        """
+        Lista as coleções salvas
+        """
+        return self.db.get_collections()
+
+    def get_collection(self, collection_id):
+        """
+        Obtém uma coleção salva
+        """
+        return self.db.get_collection(collection_id)
+
+    def delete_collection(self, collection_id):
+        """
+        Deleta uma coleção
+        """
+        return self.db.delete_collection(collection_id)
+
+    # ==================== EXECUÇÃO ====================
+
+    def run_collection(self, collection_id, variables=None):
+        """
+        Executa uma coleção salva
+
+        Args:
+            collection_id (int): ID da coleção
+            variables (dict): Variáveis iniciais (opcional)
+
+        Returns:
+            dict: Resultado por passo e tempo total
+        """
+        result = self.db.get_collection(collection_id)
+        if not result['success']:
+            return result
+
+        collection = result['collection']
+        return self.run_steps(collection['steps'], variables, collection['max_parallel'])
+
+    def run_steps(self, steps, variables=None, max_parallel=4):
+        """
+        Executa uma lista de passos (coleção ad-hoc)
+
+        Args:
+            steps (list): Passos da coleção
+            variables (dict): Variáveis iniciais (opcional)
+            max_parallel (int): Passos executados em paralelo
+
+        Returns:
+            dict: Resultado por passo e tempo total
+        """
+        try:
+            validation = self._normalize_steps(steps)
+            if not validation['valid']:
+                return {
+                    'success': False,
+                    'message': validation['message']
+                }
+
+            steps = validation['steps']
+
+            # Carrega todas as requests antes de começar (compiladas uma vez por request distinta)
+            templates = {}
+            for step in steps:
+                request_id = step['request_id']
+                if request_id not in templates:
+                    templates[request_id] = self.catalog._get_template(request_id)
+                    if not templates[request_id]:
+                        return {
+                            'success': False,
+                            'message': f'Request {request_id} do passo "{step["id"]}" não encontrada'
+                        }
+
+            return self._execute(steps, templates, dict(variables or {}), self._parallelism(max_parallel))
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao executar coleção: {str(e)}'
+            }
+
+    def _execute(self, steps, templates, variables, max_parallel):
+        """
+        Agenda os passos respeitando as dependências e executa os prontos em paralelo
+        """
+        by_id = {step['id']: step for step in steps}
+        results = {}
+        pending = list(by_id)
+        running = {}
+        lock = threading.Lock()
+
+        # Um único pool HTTP para todos os passos da execução
+        http = HTTPClientPool(pool_maxsize=max_parallel)
+        started = time.perf_counter()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                while pending or running:
+                    for step_id in list(pending):
+                        deps = by_id[step_id]['depends_on']
+
+                        if any(dep in results and results[dep]['status'] != 'success' for dep in deps):
+                            pending.remove(step_id)
+                            results[step_id] = self._skipped_result(by_id[step_id], deps, results)
+                            continue
+
+                        if all(dep in results for dep in deps):
+                            pending.remove(step_id)
+                            with lock:
+                                snapshot = dict(variables)
+                            future = executor.submit(
+                                self._run_step, by_id[step_id], templates[by_id[step_id]['request_id']],
+                                snapshot, http, started
+                            )
+                            running[future] = step_id
+
+                    if not running:
+                        continue
+
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step_id = running.pop(future)
+                        result = future.result()
+                        results[step_id] = result
+
+                        with lock:
+                            variables.update(result.get('extracted', {}))
+        finally:
+            http.close()
+
+        total_wall_time = round(time.perf_counter() - started, 4)
+        ordered = [results[step['id']] for step in steps]
+        failed = [result['id'] for result in ordered if result['status'] != 'success']
+
+        return {
+            'success': True,
+            'passed': not failed,
+            'steps': ordered,
+            'failed_steps': failed,
+            'variables': variables,
+            'total_wall_time': total_wall_time,
+            'sum_step_time': round(sum(result.get('wall_time', 0) for result in ordered), 4)
+        }
+
+    def _run_step(self, step, template, variables, http, run_started):
+        """
+        Executa um passo: substitui variáveis, envia a request e extrai valores da resposta
+        """
+        started = time.perf_counter()
+        result = {
+            'id': step['id'],
+            'request_id': step['request_id'],
+            'name': template.name,
+            'method': template.method,
+            'started_at_offset': round(started - run_started, 4)
+        }
+
+        try:
+            prepared = template.prepare(
+                body_data=self._substitute(step.get('body_data'), variables),
+                query_data=self._substitute(step.get('query_data'), variables),
+                headers_data=self._substitute(step.get('headers_data'), variables),
+                path_variables=self._substitute(step.get('path_variables'), variables)
+            )
+
+            response, timing = self.catalog._send_prepared_request(prepared, http=http)
+
+            try:
+                response_body = response.json()
+            except:
+                response_body = response.text
+
+            response_data = {
+                'status_code': response.status_code,
+                'headers': dict(response.headers),
+                'body': response_body
+            }
+
+            extracted = {}
+            missing = []
+            for name, path in (step.get('extract') or {}).items():
+                value = self.catalog._get_nested_value(response_data, path)
+                if value is None:
+                    missing.append(path)
+                else:
+                    extracted[name] = value
+
+            expected = step.get('expected_status')
+            ok = response.status_code in expected if expected else response.status_code < 400
+
+            result.update({
+                'status': 'success' if ok and not missing else 'failed',
+                'status_code': response.status_code,
+                'url': prepared['url'],
+                'response_body': response_body,
+                'extracted': extracted,
+                'timing': timing
+            })
+
+            if not ok:
+                result['error'] = f'Status {response.status_code} inesperado'
+            elif missing:
+                result['error'] = f'Campos não encontrados na resposta: {", ".join(missing)}'
+
+        except Exception as e:
+            result.update({
+                'status': 'failed',
+                'error': str(e),
+                'extracted': {}
+            })
+
+        result['wall_time'] = round(time.perf_counter() - started, 4)
+        return result
+
+    def _skipped_result(self, step, deps, results):
+        """
+        Resultado de um passo não executado porque uma dependência falhou
+        """
+        failed = [dep for dep in deps if results[dep]['status'] != 'success']
+        return {
+            'id': step['id'],
+            'request_id': step['request_id'],
+            'status': 'skipped',
+            'error': f'Dependência não concluída: {", ".join(failed)}',
+            'extracted': {},
+            'wall_time': 0.0
+        }
+
+    def _substitute(self, value, variables):
+        """
+        Substitui {{variavel}} recursivamente em strings, listas e dicionários
+        Um valor que é só "{{variavel}}" mantém o tipo original da variável
+        """
+        if isinstance(value, str):
+            full = _VARIABLE_PATTERN.fullmatch(value.strip())
+            if full and full.group(1) in variables:
+                return variables[full.group(1)]
+
+            return _VARIABLE_PATTERN.sub(
+                lambda match: str(variables.get(match.group(1), match.group(0))),
+                value
+            )
+
+        if isinstance(value, dict):
+            return {key: self._substitute(item, variables) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [self._substitute(item, variables) for item in value]
+
+        return value
+
+    def _normalize_steps(self, steps):
+        """
+        Valida os passos e resolve as dependências (ordem sequencial ou DAG)
+        """
+        if not isinstance(steps, list) or not steps:
+            return {
+                'valid': False,
+                'message': 'A coleção precisa de pelo menos um passo'
+            }
+
+        normalized = []
+        ids = set()
+        is_dag = any(isinstance(step, dict) and step.get('depends_on') is not None for step in steps)
+
+        for position, step in enumerate(steps):
+            if not isinstance(step, dict) or not step.get('request_id'):
+                return {
+                    'valid': False,
+                    'message': f'Passo {position + 1} sem request_id'
+                }
+
+            step = dict(step)
+            step['id'] = str(step.get('id') or f'step_{position + 1}')
+
+            if step['id'] in ids:
+                return {
+                    'valid': False,
+                    'message': f'Passo "{step["id"]}" duplicado'
+                }
+
+            if is_dag:
+                step['depends_on'] = [str(dep) for dep in (step.get('depends_on') or [])]
+            else:
+                step['depends_on'] = [normalized[-1]['id']] if normalized else []
+
+            ids.add(step['id'])
+            normalized.append(step)
+
+        for step in normalized:
+            unknown = [dep for dep in step['depends_on'] if dep not in ids]
+            if unknown:
+                return {
+                    'valid': False,
+                    'message': f'Passo "{step["id"]}" depende de passos inexistentes: {", ".join(unknown)}'
+                }
+
+        # Detecta ciclos (ordenação topológica)
+        remaining = {step['id']: set(step['depends_on']) for step in normalized}
+        while remaining:
+            ready = [step_id for step_id, deps in remaining.items() if not deps]
+            if not ready:
+                return {
+                    'valid': False,
+                    'message': f'Dependência circular entre os passos: {", ".join(sorted(remaining))}'
+                }
+            for step_id in ready:
+                remaining.pop(step_id)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return {
+            'valid': True,
+            'steps': normalized
+        }
+
+    def _parallelism(self, max_parallel):
+        """
+        Normaliza o número de passos simultâneos
+        """
+        try:
+            return min(max(int(max_parallel), 1), self.MAX_PARALLEL)
+        except (TypeError, ValueError):
+            return 4
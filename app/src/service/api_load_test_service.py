@@ -0,0 +1,410 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.database.db_manager import DatabaseManager
+from src.service.api_catalog_service import APICatalogService
+from src.service.http_client_pool import HTTPClientPool
+
+
+class LatencyHistogram:
+    """
+    Histograma de latência no estilo HDR (buckets log-lineares em microssegundos)
+
+    Cada potência de 2 é dividida em 2^sub_bucket_bits sub-buckets, o que mantém
+    o erro relativo abaixo de 1% (com 7 bits) usando memória constante.
+    """
+
+    def __init__(self, sub_bucket_bits=7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+
+    def record(self, seconds):
+        """
+        Registra uma latência
+
+        Args:
+            seconds (float): Latência em segundos
+        """
+        value = max(int(seconds * 1_000_000), 1)
+        bucket = self._bucket_of(value)
+
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+
+    def percentile(self, percent):
+        """
+        Retorna a latência (ms) do percentil informado
+
+        Args:
+            percent (float): Percentil entre 0 e 100
+        """
+        if not self.count:
+            return None
+
+        target = max(int(round(self.count * percent / 100.0)), 1)
+        seen = 0
+
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return round(min(self._bucket_value(bucket), self.max_us) / 1000.0, 3)
+
+        return round(self.max_us / 1000.0, 3)
+
+    def summary(self):
+        """
+        Retorna estatísticas e percentis em milissegundos
+        """
+        if not self.count:
+            return {}
+
+        return {
+            'count': self.count,
+            'min_ms': round(self.min_us / 1000.0, 3),
+            'mean_ms': round(self.total_us / self.count / 1000.0, 3),
+            'p50_ms': self.percentile(50),
+            'p75_ms': self.percentile(75),
+            'p90_ms': self.percentile(90),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'p999_ms': self.percentile(99.9),
+            'max_ms': round(self.max_us / 1000.0, 3)
+        }
+
+    def buckets(self):
+        """
+        Retorna os buckets não vazios como [[latência_ms, quantidade], ...]
+        """
+        return [
+            [round(self._bucket_value(bucket) / 1000.0, 3), self.counts[bucket]]
+            for bucket in sorted(self.counts)
+        ]
+
+    def _bucket_of(self, value):
+        exponent = value.bit_length() - 1
+        if exponent < self.sub_bucket_bits:
+            return value  # Valores pequenos ficam exatos
+
+        shift = exponent - self.sub_bucket_bits
+        return (value >> shift) << shift
+
+    def _bucket_value(self, bucket):
+        # Ponto médio do bucket
+        exponent = bucket.bit_length() - 1
+        if exponent < self.sub_bucket_bits:
+            return bucket
+
+        width = 1 << (exponent - self.sub_bucket_bits)
+        return bucket + width // 2
+
+
+class APILoadTestService:
+    """
+    Service layer para testes de carga das requests do catálogo de APIs
+    """
+
+    MAX_CONCURRENCY = 200
+    MAX_DURATION_SECONDS = 600
+    MAX_TOTAL_REQUESTS = 100000
+
+    def __init__(self, catalog_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.db = DatabaseManager()
+        self.catalog = catalog_service or APICatalogService()
+        self._active_runs = {}
+        self._lock = threading.Lock()
+
+    def start_load_test(self, request_id, concurrency=10, target_rps=None, duration_seconds=None,
+                        total_requests=None, body_data=None, query_data=None, headers_data=None,
+                        path_variables=None):
+        """
+        Inicia um teste de carga em background
+
+        Args:
+            request_id (int): ID da request salva
+            concurrency (int): Workers simultâneos
+            target_rps (float): Requests por segundo alvo (sem limite se None)
+            duration_seconds (float): Duração máxima do teste
+            total_requests (int): Quantidade de requests a enviar
+            body_data, query_data, headers_data, path_variables: Mesmo formato do test_request
+
+        Returns:
+            dict: ID da execução
+        """
+        try:
+            validation = self._validate_options(concurrency, target_rps, duration_seconds, total_requests)
+            if not validation['valid']:
+                return {
+                    'success': False,
+                    'message': validation['message']
+                }
+
+            concurrency = int(concurrency)
+            target_rps = float(target_rps) if target_rps else None
+            duration_seconds = float(duration_seconds) if duration_seconds else None
+            total_requests = int(total_requests) if total_requests else None
+
+            template = self.catalog._get_template(request_id)
+            if not template:
+                return {
+                    'success': False,
+                    'message': 'Request não encontrada'
+                }
+
+            prepared = template.prepare(body_data, query_data, headers_data, path_variables)
+
+            created = self.db.create_load_test_run(request_id, concurrency, target_rps, duration_seconds, total_requests)
+            if not created['success']:
+                return created
+
+            run_id = created['id']
+            state = {
+                'run_id': run_id,
+                'request_id': request_id,
+                'concurrency': concurrency,
+                'target_rps': target_rps,
+                'duration_seconds': duration_seconds,
+                'total_requests': total_requests,
+                'histogram': LatencyHistogram(),
+                'status_codes': {},
+                'errors': {},
+                'sent': 0,
+                'completed': 0,
+                'error_count': 0,
+                'next_slot': None,
+                'started': None,
+                'cancelled': False,
+                'lock': threading.Lock()
+            }
+
+            with self._lock:
+                self._active_runs[run_id] = state
+
+            threading.Thread(target=self._run, args=(state, prepared), daemon=True).start()
+
+            return {
+                'success': True,
+                'message': 'Teste de carga iniciado',
+                'run_id': run_id
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro ao iniciar teste de carga: {str(e)}'
+            }
+
+    def get_run(self, run_id):
+        """
+        Obtém uma execução (progresso ao vivo se ainda estiver rodando)
+        """
+        with self._lock:
+            state = self._active_runs.get(run_id)
+
+        result = self.db.get_load_test_run(run_id)
+
+        if result['success'] and state:
+            result['run'].update(self._summarize(state))
+            result['run']['status'] = 'running'
+
+        return result
+
+    def list_runs(self, request_id=None):
+        """
+        Lista execuções anteriores para comparação
+        """
+        return self.db.get_load_test_runs(request_id)
+
+    def cancel_run(self, run_id):
+        """
+        Interrompe uma execução em andamento
+        """
+        with self._lock:
+            state = self._active_runs.get(run_id)
+
+        if not state:
+            return {
+                'success': False,
+                'message': 'Teste de carga não está em execução'
+            }
+
+        state['cancelled'] = True
+
+        return {
+            'success': True,
+            'message': 'Cancelamento solicitado'
+        }
+
+    def _run(self, state, prepared):
+        """
+        Executa o teste: N workers disputam slots controlados por RPS, duração e quantidade
+        """
+        # Pool dedicado, dimensionado para a concorrência do teste
+        http = HTTPClientPool(pool_connections=1, pool_maxsize=state['concurrency'], max_retries=0)
+        status = 'completed'
+        message = None
+
+        try:
+            state['started'] = time.perf_counter()
+            state['next_slot'] = state['started']
+
+            with ThreadPoolExecutor(max_workers=state['concurrency']) as executor:
+                workers = [
+                    executor.submit(self._worker, state, prepared, http)
+                    for _ in range(state['concurrency'])
+                ]
+                for worker in workers:
+                    worker.result()
+
+            if state['cancelled']:
+                status = 'cancelled'
+
+        except Exception as e:
+            status = 'failed'
+            message = str(e)
+        finally:
+            http.close()
+            summary = self._summarize(state)
+            summary['histogram'] = state['histogram'].buckets()
+            self.db.finish_load_test_run(state['run_id'], status, summary, message)
+
+            with self._lock:
+                self._active_runs.pop(state['run_id'], None)
+
+    def _worker(self, state, prepared, http):
+        """
+        Loop de um worker: reserva um slot, envia a request e registra o resultado
+        """
+        while True:
+            slot = self._claim_slot(state)
+            if slot is None:
+                return
+
+            delay = slot - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            started = time.perf_counter()
+            status_code = None
+            error = None
+
+            try:
+                response, timing = self.catalog._send_prepared_request(prepared, http=http)
+                status_code = response.status_code
+            except Exception as e:
+                error = type(e).__name__
+
+            elapsed = time.perf_counter() - started
+
+            with state['lock']:
+                state['completed'] += 1
+                if error:
+                    state['error_count'] += 1
+                    state['errors'][error] = state['errors'].get(error, 0) + 1
+                else:
+                    key = str(status_code)
+                    state['status_codes'][key] = state['status_codes'].get(key, 0) + 1
+                    state['histogram'].record(elapsed)
+
+    def _claim_slot(self, state):
+        """
+        Reserva o horário de envio da próxima request (None quando o teste acabou)
+        """
+        with state['lock']:
+            now = time.perf_counter()
+
+            if state['cancelled']:
+                return None
+            if state['total_requests'] and state['sent'] >= state['total_requests']:
+                return None
+            if state['duration_seconds'] and now - state['started'] >= state['duration_seconds']:
+                return None
+
+            state['sent'] += 1
+
+            if not state['target_rps']:
+                return now
+
+            # Espaça os envios em 1/RPS segundos, sem acumular atraso de períodos ociosos
+            slot = max(state['next_slot'], now - 1.0 / state['target_rps'])
+            state['next_slot'] = slot + 1.0 / state['target_rps']
+
+            if state['duration_seconds'] and slot - state['started'] >= state['duration_seconds']:
+                state['sent'] -= 1
+                return None
+
+            return slot
+
+    def _summarize(self, state):
+        """
+        Calcula o resumo atual de uma execução
+        """
+        with state['lock']:
+            elapsed = time.perf_counter() - state['started'] if state['started'] else 0.0
+            completed = state['completed']
+
+            return {
+                'completed_requests': completed,
+                'error_count': state['error_count'],
+                'elapsed_seconds': round(elapsed, 3),
+                'throughput_rps': round(completed / elapsed, 2) if elapsed > 0 else 0.0,
+                'latency': state['histogram'].summary(),
+                'status_codes': dict(state['status_codes']),
+                'errors': dict(state['errors'])
+            }
+
+    def _validate_options(self, concurrency, target_rps, duration_seconds, total_requests):
+        """
+        Valida os parâmetros do teste de carga
+        """
+        try:
+            concurrency = int(concurrency)
+            target_rps = float(target_rps) if target_rps else None
+            duration_seconds = float(duration_seconds) if duration_seconds else None
+            total_requests = int(total_requests) if total_requests else None
+        except (TypeError, ValueError):
+            return {
+                'valid': False,
+                'message': 'Parâmetros numéricos inválidos'
+            }
+
+        if concurrency < 1 or concurrency > self.MAX_CONCURRENCY:
+            return {
+                'valid': False,
+                'message': f'Concorrência deve estar entre 1 e {self.MAX_CONCURRENCY}'
+            }
+
+        if not duration_seconds and not total_requests:
+            return {
+                'valid': False,
+                'message': 'Informe a duração (segundos) ou a quantidade de requests'
+            }
+
+        if duration_seconds and (duration_seconds <= 0 or duration_seconds > self.MAX_DURATION_SECONDS):
+            return {
+                'valid': False,
+                'message': f'Duração deve estar entre 1 e {self.MAX_DURATION_SECONDS} segundos'
+            }
+
+        if total_requests and (total_requests < 1 or total_requests > self.MAX_TOTAL_REQUESTS):
+            return {
+                'valid': False,
+                'message': f'Quantidade de requests deve estar entre 1 e {self.MAX_TOTAL_REQUESTS}'
+            }
+
+        if target_rps is not None and target_rps <= 0:
+            return {
+                'valid': False,
+                'message': 'RPS alvo deve ser maior que zero'
+            }
+
+        return {'valid': True}
@@ -0,0 +1,316 @@
+import logging
+import os
+import re
+import threading
+import time
+from boto3 import Session
+from botocore.config import Config
+from dotenv import load_dotenv
+from src.service.aws_single_flight import get_aws_single_flight
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Códigos de erro que indicam limite de taxa da API
+THROTTLE_ERROR_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'TransactionInProgressException',
+    'RequestLimitExceeded',
+    'BandwidthLimitExceeded',
+    'LimitExceededException',
+    'RequestThrottled',
+    'SlowDown',
+    'PriorRequestNotComplete',
+    'EC2ThrottledException'
+}
+
+# Tentativa atual no header amz-sdk-request
+ATTEMPT_PATTERN = re.compile(r'attempt=(\d+)')
+
+
+class TokenBucket:
+    """
+    Token bucket de uma API (serviço + operação)
+
+    - Cada tentativa de chamada consome um token; sem token, a thread espera
+    - Throttling da AWS corta a taxa pela metade; sucessos devolvem aos poucos
+      (2% da taxa configurada por chamada) até o valor configurado
+    """
+
+    MIN_RATE = 0.5
+
+    def __init__(self, rate, burst=None):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Consome tokens, esperando se necessário
+
+        Pedidos maiores que o burst esperam o balde encher e deixam o saldo
+        negativo: a dívida é paga pelas próximas chamadas
+
+        Args:
+            tokens (float): Tokens consumidos (ex: unidades de capacidade)
+
+        Returns:
+            float: Segundos de espera
+        """
+        waited = 0.0
+        needed = min(tokens, self.burst)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= needed:
+                    self.tokens -= tokens
+                    return waited
+
+                delay = (needed - self.tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def throttled(self):
+        with self._lock:
+            # O piso não passa da taxa configurada (ex.: 0.1/s segue em 0.1/s)
+            self.rate = max(min(self.MIN_RATE, self.max_rate), self.rate / 2)
+
+    def succeeded(self):
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.02)
+
+
+class AWSRateLimiter:
+    """
+    Camada de limitação de taxa compartilhada por todos os clientes boto3 da aplicação
+
+    Um token bucket por (serviço, API), com taxa padrão AWS_RATE_LIMIT_DEFAULT
+    chamadas/s e exceções em AWS_RATE_LIMITS (ex: "ssm:PutParameter=3,ecs:*=20").
+    Registra tentativas, retries, throttlings e tempo de espera por API.
+    """
+
+    def __init__(self, default_rate=None, overrides=None):
+        self.default_rate = float(default_rate or os.getenv('AWS_RATE_LIMIT_DEFAULT', 50))
+        self.overrides = overrides if overrides is not None else self._parse_overrides(os.getenv('AWS_RATE_LIMITS', ''))
+
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _parse_overrides(self, value):
+        """
+        Converte "servico:Operacao=taxa,servico:*=taxa" em dict
+        """
+        overrides = {}
+
+        for entry in value.split(','):
+            key, _, rate = entry.strip().partition('=')
+            if not key or not rate:
+                continue
+            try:
+                overrides[key.strip()] = float(rate)
+            except ValueError:
+                logger.warning('AWS_RATE_LIMITS: taxa inválida para "%s"', key)
+
+        return overrides
+
+    def _entry(self, service, operation):
+        """
+        Bucket e contadores de uma API (criados na primeira chamada)
+        """
+        key = (service, operation)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = self.overrides.get(
+                    f'{service}:{operation}',
+                    self.overrides.get(f'{service}:*', self.default_rate)
+                )
+                bucket = self._buckets[key] = TokenBucket(rate)
+                self._stats[key] = {'attempts': 0, 'retries': 0, 'throttles': 0, 'wait_seconds': 0.0}
+
+            return bucket, self._stats[key]
+
+    def before_send(self, service, operation, attempt):
+        """
+        Chamado antes de cada tentativa (inclusive retries)
+        """
+        bucket, stats = self._entry(service, operation)
+        waited = bucket.acquire()
+
+        with self._lock:
+            stats['attempts'] += 1
+            stats['wait_seconds'] += waited
+            if attempt > 1:
+                stats['retries'] += 1
+
+    def after_attempt(self, service, operation, error_code):
+        """
+        Chamado após cada tentativa com o código de erro (ou None)
+        """
+        bucket, stats = self._entry(service, operation)
+
+        if error_code in THROTTLE_ERROR_CODES:
+            bucket.throttled()
+            with self._lock:
+                stats['throttles'] += 1
+        elif error_code is None:
+            bucket.succeeded()
+
+    def get_stats(self):
+        """
+        Contadores por API e totais
+
+        Returns:
+            dict: Lista por (serviço, API) e soma geral
+        """
+        with self._lock:
+            apis = []
+            for (service, operation), stats in sorted(self._stats.items()):
+                bucket = self._buckets[(service, operation)]
+                apis.append({
+                    'service': service,
+                    'operation': operation,
+                    'attempts': stats['attempts'],
+                    'retries': stats['retries'],
+                    'throttles': stats['throttles'],
+                    'wait_seconds': round(stats['wait_seconds'], 3),
+                    'rate_limit': bucket.max_rate,
+                    'current_rate': round(bucket.rate, 2)
+                })
+
+        totals = {
+            counter: sum(api[counter] for api in apis)
+            for counter in ('attempts', 'retries', 'throttles')
+        }
+        totals['wait_seconds'] = round(sum(api['wait_seconds'] for api in apis), 3)
+
+        return {
+            'success': True,
+            'apis': apis,
+            'totals': totals
+        }
+
+    def reset_stats(self):
+        """
+        Zera os contadores (os buckets e taxas atuais são mantidos)
+        """
+        with self._lock:
+            for stats in self._stats.values():
+                stats.update({'attempts': 0, 'retries': 0, 'throttles': 0, 'wait_seconds': 0.0})
+
+    def register(self, client):
+        """
+        Conecta o limitador aos eventos de um cliente boto3
+
+        Args:
+            client: Cliente boto3 (ex: session.client('ssm'))
+
+        Returns:
+            O próprio cliente
+        """
+        service = client.meta.service_model.service_name
+
+        def before_send(request, event_name, **kwargs):
+            # Os modos standard/adaptive enviam o header "amz-sdk-request: attempt=N; max=M"
+            header = request.headers.get('amz-sdk-request') or ''
+            if isinstance(header, bytes):
+                header = header.decode()
+            match = ATTEMPT_PATTERN.search(header)
+            self.before_send(service, event_name.rsplit('.', 1)[-1], int(match.group(1)) if match else 1)
+
+        def needs_retry(response, operation, caught_exception, **kwargs):
+            error_code = None
+            if caught_exception is not None:
+                error_code = type(caught_exception).__name__
+            elif response is not None:
+                error_code = response[1].get('Error', {}).get('Code')
+            self.after_attempt(service, operation.name, error_code)
+
+        client.meta.events.register('before-send', before_send)
+        client.meta.events.register('needs-retry', needs_retry)
+
+        return client
+
+
+def retry_config():
+    """
+    Configuração de retry do botocore: modo adaptive (backoff exponencial com
+    jitter + limitador do próprio cliente) com AWS_MAX_ATTEMPTS tentativas
+    """
+    return Config(retries={
+        'mode': os.getenv('AWS_RETRY_MODE', 'adaptive'),
+        'max_attempts': int(os.getenv('AWS_MAX_ATTEMPTS', 8))
+    })
+
+
+def create_client(service_name, region_name=None, session=None, **kwargs):
+    """
+    Cria um cliente boto3 com retry adaptativo, o limitador de taxa compartilhado
+    e coalescência de leituras idênticas simultâneas
+
+    Args:
+        service_name (str): Nome do serviço (ex: 'ssm', 'ecs')
+        region_name (str): Região (padrão da sessão se None)
+        session (Session): Sessão boto3 (nova sessão se None)
+        **kwargs: Demais argumentos de session.client
+
+    Returns:
+        Cliente boto3
+    """
+    config = retry_config()
+    if kwargs.get('config'):
+        config = config.merge(kwargs.pop('config'))
+
+    client = (session or Session()).client(service_name, region_name=region_name, config=config, **kwargs)
+    get_aws_single_flight().register(client)
+    return get_aws_rate_limiter().register(client)
+
+
+def create_resource(service_name, region_name=None, session=None, **kwargs):
+    """
+    Cria um resource boto3 (ex: dynamodb) com a mesma configuração de create_client
+    """
+    config = retry_config()
+    if kwargs.get('config'):
+        config = config.merge(kwargs.pop('config'))
+
+    resource = (session or Session()).resource(service_name, region_name=region_name, config=config, **kwargs)
+    get_aws_single_flight().register(resource.meta.client)
+    get_aws_rate_limiter().register(resource.meta.client)
+    return resource
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_aws_rate_limiter():
+    """
+    Retorna o limitador compartilhado pela aplicação
+
+    Returns:
+        AWSRateLimiter: Instância única do limitador
+    """
+    global _default_limiter
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = AWSRateLimiter()
+        return _default_limiter
@@ -0,0 +1,191 @@
+import copy
+import os
+import threading
+from concurrent.futures import Future
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Só operações de leitura são compartilhadas
+READ_OPERATION_PREFIXES = ('Describe', 'List', 'Get', 'BatchGet')
+
+
+class SingleFlight:
+    """
+    Coalescência de chamadas AWS idênticas em andamento (single-flight)
+
+    Quando várias requisições Flask disparam a mesma leitura no mesmo cliente
+    boto3 (mesma operação e parâmetros) ao mesmo tempo, só a primeira vai à
+    AWS; as demais aguardam e recebem uma cópia da mesma resposta.
+    Complementa os caches: evita a avalanche de chamadas quando um cache expira.
+    """
+
+    def __init__(self, enabled=None, wait_timeout=None):
+        self.enabled = enabled if enabled is not None else os.getenv('AWS_SINGLE_FLIGHT', 'True') == 'True'
+        self.wait_timeout = float(wait_timeout or os.getenv('AWS_SINGLE_FLIGHT_TIMEOUT', 60))
+
+        self._in_flight = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _count(self, service, operation, counter):
+        """
+        Incrementa um contador (chamado com o lock adquirido)
+        """
+        stats = self._stats.setdefault((service, operation), {'upstream': 0, 'coalesced': 0})
+        stats[counter] += 1
+
+    def _key(self, client, operation, request_dict):
+        """
+        Identifica a chamada: cliente, operação e requisição serializada
+        """
+        body = request_dict.get('body')
+        if isinstance(body, dict):
+            body = tuple(sorted(body.items()))
+
+        return (
+            id(client),
+            operation,
+            request_dict.get('url'),
+            repr(request_dict.get('query_string')),
+            body if isinstance(body, (bytes, str, tuple)) else repr(body)
+        )
+
+    def before_call(self, client, service, model, params, context):
+        """
+        Retorna a resposta de uma chamada idêntica em andamento ou marca esta como líder
+        """
+        if not self.enabled or not model.name.startswith(READ_OPERATION_PREFIXES):
+            return None
+
+        key = self._key(client, model.name, params)
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                self._in_flight[key] = Future()
+                context['single_flight_key'] = key
+                self._count(service, model.name, 'upstream')
+                return None
+
+        try:
+            http_response, parsed = future.result(timeout=self.wait_timeout)
+        except Exception:
+            # A chamada líder falhou (ex: erro de conexão) ou demorou demais: esta segue sozinha
+            return None
+
+        with self._lock:
+            self._count(service, model.name, 'coalesced')
+
+        return http_response, copy.deepcopy(parsed)
+
+    def after_call(self, http_response, parsed, context):
+        """
+        Entrega a resposta da chamada líder a quem estiver aguardando
+        """
+        key = context.pop('single_flight_key', None)
+        if key is None:
+            return
+
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+
+        if future is not None:
+            future.set_result((http_response, copy.deepcopy(parsed)))
+
+    def after_call_error(self, exception, context):
+        """
+        Libera quem estiver aguardando quando a chamada líder levanta exceção
+        """
+        key = context.pop('single_flight_key', None)
+        if key is None:
+            return
+
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+
+        if future is not None:
+            future.set_exception(exception)
+
+    def register(self, client):
+        """
+        Conecta a coalescência aos eventos de um cliente boto3
+
+        Returns:
+            O próprio cliente
+        """
+        service = client.meta.service_model.service_name
+
+        def before_call(model, params, context, **kwargs):
+            return self.before_call(client, service, model, params, context)
+
+        def after_call(http_response, parsed, context, **kwargs):
+            self.after_call(http_response, parsed, context)
+
+        def after_call_error(exception, context, **kwargs):
+            self.after_call_error(exception, context)
+
+        client.meta.events.register('before-call', before_call)
+        client.meta.events.register('after-call', after_call)
+        client.meta.events.register('after-call-error', after_call_error)
+
+        return client
+
+    def get_stats(self):
+        """
+        Chamadas enviadas à AWS e chamadas atendidas por coalescência, por API
+
+        Returns:
+            dict: Lista por (serviço, API) e soma geral
+        """
+        with self._lock:
+            apis = [
+                {
+                    'service': service,
+                    'operation': operation,
+                    'upstream': stats['upstream'],
+                    'coalesced': stats['coalesced']
+                }
+                for (service, operation), stats in sorted(self._stats.items())
+            ]
+            in_flight = len(self._in_flight)
+
+        upstream = sum(api['upstream'] for api in apis)
+        coalesced = sum(api['coalesced'] for api in apis)
+
+        return {
+            'enabled': self.enabled,
+            'in_flight': in_flight,
+            'apis': apis,
+            'totals': {
+                'upstream': upstream,
+                'coalesced': coalesced,
+                'hit_rate': round(coalesced / (upstream + coalesced), 4) if upstream + coalesced else 0.0
+            }
+        }
+
+    def reset_stats(self):
+        """
+        Zera os contadores
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+_default_single_flight = None
+_default_single_flight_lock = threading.Lock()
+
+
+def get_aws_single_flight():
+    """
+    Retorna a camada de coalescência compartilhada pela aplicação
+
+    Returns:
+        SingleFlight: Instância única
+    """
+    global _default_single_flight
+
+    with _default_single_flight_lock:
+        if _default_single_flight is None:
+            _default_single_flight = SingleFlight()
+        return _default_single_flight
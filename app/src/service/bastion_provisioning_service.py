@@ -0,0 +1,281 @@
+import os
+import threading
+import time
+from botocore.exceptions import ClientError, WaiterError
+from dotenv import load_dotenv
+from src.service.ec2_service import EC2Service
+
+load_dotenv()
+
+
+class BastionProvisioner:
+    """
+    Cria Bastion Hosts em background e acompanha até o SSM Agent registrar
+
+    - Etapas: AMI (parâmetro público do SSM, em cache) -> instance profile
+      (verificação memoizada) -> run_instances -> instância running (waiter
+      instance_running) -> SSM Agent online (describe_instance_information)
+    - A requisição HTTP só inicia o job; o progresso é consultado ou
+      transmitido via SSE
+    - A instância só é considerada pronta quando o Session Manager consegue
+      conectar (PingStatus Online)
+    """
+
+    PHASES = ('ami', 'iam', 'launch', 'running', 'ssm')
+
+    def __init__(self, ec2_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.service = ec2_service or EC2Service()
+        self.poll_interval = float(os.getenv('EC2_BASTION_POLL_INTERVAL', 5))
+        self.ssm_timeout = float(os.getenv('EC2_BASTION_SSM_TIMEOUT', 600))
+        self.retention = float(os.getenv('EC2_BASTION_RETENTION', 3600))
+
+        self._jobs = {}
+        self._next_job_id = 1
+        self._lock = threading.Lock()
+
+    # ==================== JOBS ====================
+
+    def start(self, name, instance_type='t3.micro', key_name=None, subnet_id=None, security_group_ids=None):
+        """
+        Inicia a criação do Bastion Host em background
+
+        Args:
+            name (str): Nome da instância
+            instance_type (str): Tipo da instância
+            key_name (str): Nome do key pair (opcional)
+            subnet_id (str): ID da subnet (opcional)
+            security_group_ids (list): IDs dos security groups (opcional)
+
+        Returns:
+            dict: ID do job
+        """
+        self._cleanup()
+
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+
+            job = self._jobs[job_id] = {
+                'id': job_id,
+                'name': name,
+                'instance_type': instance_type,
+                'params': {
+                    'key_name': key_name,
+                    'subnet_id': subnet_id,
+                    'security_group_ids': security_group_ids
+                },
+                'status': 'running',
+                'phase': 'ami',
+                'steps': [],
+                'ami_id': None,
+                'instance_profile': None,
+                'instance_id': None,
+                'instance_state': None,
+                'ping_status': None,
+                'message': None,
+                'started': time.perf_counter(),
+                'phase_started': time.perf_counter(),
+                'elapsed': None,
+                'finished': False,
+                'lock': threading.Lock()
+            }
+
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': f'Criação do Bastion Host {name} iniciada',
+            'job_id': job_id
+        }
+
+    def get_job(self, job_id):
+        """
+        Retorna o progresso/resultado de uma criação
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Job {job_id} não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(job)
+        }
+
+    def iter_progress(self, job_id, interval=1):
+        """
+        Gera o progresso da criação até ela terminar (para streaming)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            yield {'type': 'finished', 'success': False, 'message': f'Job {job_id} não encontrado'}
+            return
+
+        while True:
+            finished = job['finished']
+            snapshot = self._snapshot(job)
+
+            if finished:
+                yield {'type': 'finished', 'success': snapshot['status'] == 'completed', 'job': snapshot}
+                return
+
+            yield {'type': 'progress', 'job': snapshot}
+            time.sleep(interval)
+
+    def _cleanup(self):
+        """
+        Descarta jobs terminados há mais de EC2_BASTION_RETENTION segundos
+        """
+        now = time.perf_counter()
+
+        with self._lock:
+            for job in [job for job in self._jobs.values() if job['finished']]:
+                if now - job['started'] - job['elapsed'] > self.retention:
+                    self._jobs.pop(job['id'])
+
+    # ==================== CRIAÇÃO ====================
+
+    def _run(self, job):
+        """
+        Executa as etapas da criação
+        """
+        status, message = 'failed', None
+
+        try:
+            result = self.service.create_bastion_instance(
+                name=job['name'],
+                instance_type=job['instance_type'],
+                progress=lambda step, details: self._complete_step(job, step, details),
+                **job['params']
+            )
+
+            if not result['success']:
+                message = result['message']
+            else:
+                self._wait_running(job)
+                status, message = self._wait_ssm(job)
+
+        except WaiterError as e:
+            message = f'Instância não ficou running: {e.last_response.get("Error", {}).get("Message", str(e))}'
+        except ClientError as e:
+            message = e.response['Error']['Message']
+        except Exception as e:
+            message = str(e)
+
+        # O novo bastion aparece na próxima consulta de status do SSM
+        self.service.invalidate_bastion_ssm_status()
+
+        with job['lock']:
+            job['status'] = status
+            job['message'] = message
+            job['phase'] = 'done'
+            job['elapsed'] = time.perf_counter() - job['started']
+            job['finished'] = True
+
+    def _wait_running(self, job):
+        """
+        Aguarda a instância ficar running com o waiter do EC2
+        """
+        self.service.ec2_client.get_waiter('instance_running').wait(
+            InstanceIds=[job['instance_id']],
+            WaiterConfig={'Delay': self.poll_interval, 'MaxAttempts': max(1, int(self.ssm_timeout / self.poll_interval))}
+        )
+        self._complete_step(job, 'running', {'instance_state': 'running'})
+
+    def _wait_ssm(self, job):
+        """
+        Consulta o SSM até o agent da instância ficar Online
+
+        Returns:
+            tuple: (status, mensagem)
+        """
+        deadline = time.monotonic() + self.ssm_timeout
+
+        while True:
+            response = self.service.ssm_client.describe_instance_information(
+                Filters=[{'Key': 'InstanceIds', 'Values': [job['instance_id']]}]
+            )
+            information = response.get('InstanceInformationList', [])
+            ping_status = information[0].get('PingStatus') if information else None
+
+            with job['lock']:
+                job['ping_status'] = ping_status
+
+            if ping_status == 'Online':
+                self._complete_step(job, 'ssm', {'ping_status': ping_status})
+                return 'completed', f'Bastion Host {job["name"]} pronto para conexão via SSM'
+
+            if not job['instance_profile']:
+                # Sem a role o agent nunca registra: não adianta esperar
+                return 'completed', 'Instância criada sem IAM Role: anexe o instance profile para usar o SSM'
+
+            if time.monotonic() > deadline:
+                return 'failed', f'SSM Agent não registrou em {self.ssm_timeout:g}s'
+
+            time.sleep(self.poll_interval)
+
+    def _complete_step(self, job, step, details):
+        """
+        Registra a conclusão de uma etapa e avança para a próxima
+        """
+        now = time.perf_counter()
+
+        with job['lock']:
+            job['steps'].append({
+                'phase': step,
+                'seconds': round(now - job['phase_started'], 3),
+                'details': details
+            })
+            job.update({name: value for name, value in details.items() if name in job})
+
+            next_index = self.PHASES.index(step) + 1
+            job['phase'] = self.PHASES[next_index] if next_index < len(self.PHASES) else 'done'
+            job['phase_started'] = now
+
+    def _snapshot(self, job):
+        """
+        Estado do job para a API (sem os campos internos)
+        """
+        with job['lock']:
+            elapsed = job['elapsed'] if job['elapsed'] is not None else time.perf_counter() - job['started']
+
+            return {
+                'id': job['id'],
+                'name': job['name'],
+                'instance_type': job['instance_type'],
+                'status': job['status'],
+                'phase': job['phase'],
+                'steps': list(job['steps']),
+                'ami_id': job['ami_id'],
+                'instance_profile': job['instance_profile'],
+                'instance_id': job['instance_id'],
+                'instance_state': job['instance_state'],
+                'ping_status': job['ping_status'],
+                'message': job['message'],
+                'elapsed_seconds': round(elapsed, 3),
+                'finished': job['finished']
+            }
+
+
+_default_provisioner = None
+_default_provisioner_lock = threading.Lock()
+
+
+def get_bastion_provisioner():
+    """
+    Retorna o serviço de criação de bastions compartilhado pela aplicação
+
+    Returns:
+        BastionProvisioner: Instância única
+    """
+    global _default_provisioner
+
+    with _default_provisioner_lock:
+        if _default_provisioner is None:
+            _default_provisioner = BastionProvisioner()
+        return _default_provisioner
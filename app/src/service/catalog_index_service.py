@@ -0,0 +1,399 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.database.db_manager import DatabaseManager
+from src.service.parameter_store_service import ParameterStoreService
+from src.service.secrets_service import SecretsManagerService
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+class CatalogIndexService:
+    """
+    Índice local (SQLite + FTS5) dos metadados do Parameter Store e do Secrets Manager
+
+    - Nunca armazena valores: só nome, tipo, descrição, tags e datas
+    - Sincroniza em background a cada CATALOG_SYNC_INTERVAL segundos
+    - Incremental: só grava itens com LastModifiedDate/LastChangedDate diferente
+      e só busca tags de parâmetros novos ou alterados
+    """
+
+    PARAMETER = 'parameter'
+    SECRET = 'secret'
+    SOURCES = (PARAMETER, SECRET)
+
+    def __init__(self, parameter_service=None, secrets_service=None):
+        """
+        Inicializa o serviço (a sincronização começa em ensure_background_sync)
+        """
+        self.db = DatabaseManager()
+        self.ssm_client = (parameter_service or ParameterStoreService()).ssm_client
+        self.secrets_client = (secrets_service or SecretsManagerService()).secrets_client
+
+        self.interval = float(os.getenv('CATALOG_SYNC_INTERVAL', 300))
+        self.sync_parameter_tags = os.getenv('CATALOG_SYNC_PARAMETER_TAGS', 'True') == 'True'
+        self.max_workers = int(os.getenv('SSM_MAX_CONCURRENCY', 8))
+
+        self._sync_locks = {source: threading.Lock() for source in self.SOURCES}
+        self._background = None
+        self._lock = threading.Lock()
+
+    # ==================== SINCRONIZAÇÃO ====================
+
+    def ensure_background_sync(self):
+        """
+        Inicia a thread de sincronização periódica (uma única vez)
+        """
+        with self._lock:
+            if self._background and self._background.is_alive():
+                return
+
+            self._background = threading.Thread(target=self._sync_loop, daemon=True)
+            self._background.start()
+
+    def trigger_sync(self, source, full=False):
+        """
+        Dispara uma sincronização em background
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            full (bool): Rebusca as tags de todos os parâmetros
+
+        Returns:
+            dict: Resultado da operação
+        """
+        if source not in self.SOURCES:
+            return {
+                'success': False,
+                'message': f'Origem inválida: {source}'
+            }
+
+        if self._sync_locks[source].locked():
+            return {
+                'success': True,
+                'message': 'Sincronização já está em andamento'
+            }
+
+        threading.Thread(target=self.sync, args=(source, full), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Sincronização iniciada'
+        }
+
+    def sync(self, source, full=False):
+        """
+        Sincroniza o índice de uma origem com a AWS
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            full (bool): Rebusca as tags de todos os parâmetros
+
+        Returns:
+            dict: Quantidade de itens, alterados e removidos
+        """
+        lock = self._sync_locks[source]
+        if not lock.acquire(blocking=False):
+            return {
+                'success': False,
+                'message': 'Sincronização já está em andamento'
+            }
+
+        started = time.perf_counter()
+
+        try:
+            self.db.save_catalog_sync_state(source, 'running')
+
+            current = self._list_parameters() if source == self.PARAMETER else self._list_secrets()
+            indexed = self.db.get_catalog_index_state(source)
+
+            changed = []
+            for name, item in current.items():
+                previous = indexed.get(name)
+                if full or not previous or previous[0] != item['last_modified'] or not previous[1]:
+                    changed.append(item)
+                elif source == self.SECRET and json.loads(previous[2] or '[]') != item['tags']:
+                    # ListSecrets já traz as tags: detecta alteração só de tags sem custo extra
+                    changed.append(item)
+
+            if source == self.PARAMETER:
+                self._load_parameter_tags(changed, indexed)
+
+            deleted = [name for name in indexed if name not in current]
+
+            result = self.db.save_catalog_items(source, changed, deleted)
+            if not result['success']:
+                raise Exception(result['message'])
+
+            duration = round(time.perf_counter() - started, 3)
+            self.db.save_catalog_sync_state(source, 'completed', len(current), len(changed), len(deleted), duration)
+
+            return {
+                'success': True,
+                'item_count': len(current),
+                'changed_count': len(changed),
+                'deleted_count': len(deleted),
+                'duration_seconds': duration
+            }
+
+        except ClientError as e:
+            message = e.response['Error']['Message']
+            self.db.save_catalog_sync_state(source, 'failed', message=message)
+            return {
+                'success': False,
+                'message': f'Erro ao sincronizar índice: {message}'
+            }
+        except Exception as e:
+            self.db.save_catalog_sync_state(source, 'failed', message=str(e))
+            return {
+                'success': False,
+                'message': f'Erro ao sincronizar índice: {str(e)}'
+            }
+        finally:
+            lock.release()
+
+    def refresh_item(self, source, name):
+        """
+        Atualiza um único item no índice (após criar ou alterar pela aplicação)
+        """
+        try:
+            if source == self.PARAMETER:
+                response = self.ssm_client.describe_parameters(
+                    ParameterFilters=[{'Key': 'Name', 'Option': 'Equals', 'Values': [name]}]
+                )
+                items = [self._parameter_item(param) for param in response.get('Parameters', [])]
+                self._load_parameter_tags(items, {})
+            else:
+                items = [self._secret_item(self.secrets_client.describe_secret(SecretId=name))]
+
+            if items:
+                self.db.save_catalog_items(source, items)
+            else:
+                self.db.save_catalog_items(source, [], [name])
+
+        except Exception as e:
+            logger.warning('Falha ao atualizar %s "%s" no índice: %s', source, name, e)
+
+    def remove_item(self, source, name):
+        """
+        Remove um item do índice (após deletar pela aplicação)
+        """
+        self.db.save_catalog_items(source, [], [name])
+
+    def _sync_loop(self):
+        """
+        Loop da sincronização periódica
+        """
+        while True:
+            for source in self.SOURCES:
+                result = self.sync(source)
+                if not result['success']:
+                    logger.warning('Sincronização do índice (%s): %s', source, result['message'])
+
+            time.sleep(self.interval)
+
+    # ==================== CONSULTA ====================
+
+    def is_ready(self, source):
+        """
+        Indica se o índice já foi sincronizado ao menos uma vez
+        """
+        state = self.db.get_catalog_sync_state(source)
+        return bool(state and state['last_sync_at'])
+
+    def get_status(self, source):
+        """
+        Retorna o estado da última sincronização
+        """
+        return {
+            'success': True,
+            'source': source,
+            'state': self.db.get_catalog_sync_state(source)
+        }
+
+    def search(self, source, query=None, prefix=None, tag=None, limit=None):
+        """
+        Busca no índice
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            query (str): Trecho do nome, descrição ou tags
+            prefix (str): Prefixo do nome
+            tag (str): "chave" ou "chave=valor"
+            limit (int): Quantidade máxima de itens
+
+        Returns:
+            dict: Itens no mesmo formato da listagem
+        """
+        tag_key = tag_value = None
+        if tag:
+            tag_key, _, tag_value = tag.partition('=')
+            tag_value = tag_value if _ else None
+
+        started = time.perf_counter()
+        result = self.db.search_catalog_items(source, query, prefix, tag_key, tag_value, limit)
+
+        if result['success']:
+            result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            result['synced_at'] = (self.db.get_catalog_sync_state(source) or {}).get('last_sync_at')
+
+        return result
+
+    def get_tree_level(self, source, path='/', limit=None):
+        """
+        Retorna um nível da árvore de pastas (subpastas com contagem e itens diretos)
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            path (str): Pasta ('/' para a raiz)
+            limit (int): Quantidade máxima de itens diretos
+
+        Returns:
+            dict: Pastas e itens do nível
+        """
+        started = time.perf_counter()
+        result = self.db.get_catalog_tree_level(source, path, limit)
+
+        if result['success']:
+            result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            result['synced_at'] = (self.db.get_catalog_sync_state(source) or {}).get('last_sync_at')
+
+        return result
+
+    # ==================== AWS ====================
+
+    def _list_parameters(self):
+        """
+        Lista os metadados de todos os parâmetros (DescribeParameters, 50 por página)
+        """
+        items = {}
+        paginator = self.ssm_client.get_paginator('describe_parameters')
+
+        for page in paginator.paginate(PaginationConfig={'PageSize': 50}):
+            for param in page.get('Parameters', []):
+                item = self._parameter_item(param)
+                items[item['name']] = item
+
+        return items
+
+    def _list_secrets(self):
+        """
+        Lista os metadados de todos os segredos (ListSecrets já traz as tags)
+        """
+        items = {}
+        paginator = self.secrets_client.get_paginator('list_secrets')
+
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            for secret in page.get('SecretList', []):
+                item = self._secret_item(secret)
+                items[item['name']] = item
+
+        return items
+
+    def _load_parameter_tags(self, items, indexed):
+        """
+        Busca as tags dos parâmetros alterados em paralelo
+        Em caso de falha mantém as tags anteriores e tenta de novo na próxima sincronização
+        """
+        if not items:
+            return
+
+        if not self.sync_parameter_tags:
+            for item in items:
+                item['tags_synced'] = True
+            return
+
+        def fetch(item):
+            try:
+                response = self.ssm_client.list_tags_for_resource(ResourceType='Parameter', ResourceId=item['name'])
+                return response.get('TagList', []), True
+            except Exception:
+                previous = indexed.get(item['name'])
+                return (json.loads(previous[2]) if previous and previous[2] else []), False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for item, (tags, synced) in zip(items, executor.map(fetch, items)):
+                item['tags'] = tags
+                item['tags_synced'] = synced
+                item['data']['tags'] = tags
+
+    def _parameter_item(self, param):
+        """
+        Converte um parâmetro do DescribeParameters para o formato do índice
+        """
+        last_modified = _isoformat(param.get('LastModifiedDate'))
+
+        return {
+            'name': param.get('Name'),
+            'item_type': param.get('Type'),
+            'description': param.get('Description'),
+            'tags': [],
+            'tags_synced': False,
+            'last_modified': last_modified,
+            'data': {
+                'name': param.get('Name'),
+                'type': param.get('Type'),
+                'description': param.get('Description', 'Sem descrição'),
+                'last_modified_date': last_modified,
+                'version': param.get('Version', 1),
+                'tier': param.get('Tier', 'Standard'),
+                'data_type': param.get('DataType', 'text'),
+                'tags': []
+            }
+        }
+
+    def _secret_item(self, secret):
+        """
+        Converte um segredo do ListSecrets/DescribeSecret para o formato do índice
+        """
+        last_changed = _isoformat(secret.get('LastChangedDate'))
+
+        return {
+            'name': secret.get('Name'),
+            'item_type': 'secret',
+            'description': secret.get('Description'),
+            'tags': secret.get('Tags', []),
+            'tags_synced': True,
+            'last_modified': last_changed,
+            'data': {
+                'name': secret.get('Name'),
+                'arn': secret.get('ARN'),
+                'description': secret.get('Description', 'Sem descrição'),
+                'created_date': _isoformat(secret.get('CreatedDate')) or 'N/A',
+                'last_changed_date': last_changed or 'N/A',
+                'last_accessed_date': _isoformat(secret.get('LastAccessedDate')) or 'Nunca',
+                'tags': secret.get('Tags', []),
+                'rotation_enabled': secret.get('RotationEnabled', False),
+                'deleted_date': _isoformat(secret.get('DeletedDate'))
+            }
+        }
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_catalog_index_service():
+    """
+    Retorna o índice compartilhado pela aplicação
+
+    Returns:
+        CatalogIndexService: Instância única do serviço
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = CatalogIndexService()
+        return _default_service
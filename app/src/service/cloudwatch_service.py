@@ -1,10 +1,10 @@
-import boto3
 from boto3 import Session
 from botocore.exceptions import ClientError
 import os
 import time
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client
 
 load_dotenv()
 
@@ -23,9 +23,10 @@ class CloudWatchLogsService:
         session = Session()
         
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.logs_client = session.client(
+        self.logs_client = create_client(
             'logs',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
     
     def list_log_groups(self, prefix=None):
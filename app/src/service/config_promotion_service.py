@@ -0,0 +1,649 @@
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.aws_client_factory import THROTTLE_ERROR_CODES
+from src.service.catalog_index_service import get_catalog_index_service
+from src.service.parameter_store_service import ParameterStoreService
+from src.service.secrets_service import SecretsManagerService
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """
+    Limita as escritas simultâneas e se adapta ao throttling da AWS
+
+    - Começa com o limite máximo de workers
+    - Cada throttling corta o limite pela metade (mínimo 1)
+    - Cada sucesso devolve aos poucos (+1/limite), até o máximo
+    """
+
+    def __init__(self, max_limit):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.active = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Aguarda uma vaga dentro do limite atual
+        """
+        with self._condition:
+            while self.active >= max(1, int(self.limit)):
+                self._condition.wait()
+            self.active += 1
+
+    def release(self, throttled=False):
+        """
+        Libera a vaga e ajusta o limite conforme o resultado
+        """
+        with self._condition:
+            self.active -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit / 2)
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+            self._condition.notify_all()
+
+    @property
+    def current(self):
+        return max(1, int(self.limit))
+
+
+class ConfigPromotionService:
+    """
+    Diff e cópia em massa de parâmetros/segredos entre caminhos (ex: /app/staging/ -> /app/prod/)
+
+    - Lê as duas árvores em lote e calcula inclusões, alterações e remoções em uma passada
+    - Escritas em pool de workers com limite adaptativo e backoff exponencial com jitter
+      quando a AWS responde com throttling
+    - Valores nunca são devolvidos no diff, só os nomes e o tipo de diferença
+    """
+
+    PARAMETER = 'parameter'
+    SECRET = 'secret'
+
+    MAX_ATTEMPTS = 8
+    BACKOFF_BASE = 0.2
+    BACKOFF_MAX = 10.0
+    DELETE_PARAMETERS_BATCH_SIZE = 10
+    MAX_JOBS = 20
+    MAX_ERRORS = 50
+
+    def __init__(self, parameter_service=None, secrets_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.parameters = parameter_service or ParameterStoreService()
+        self.secrets = secrets_service or SecretsManagerService()
+        self.max_workers = int(os.getenv('PROMOTION_MAX_CONCURRENCY', 8))
+
+        self._jobs = {}
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # ==================== CAMINHOS ====================
+
+    def validate_paths(self, source, source_path, target_path, validate_name):
+        """
+        Valida e normaliza os caminhos de origem e destino (sempre terminados em /)
+
+        Parâmetros são hierárquicos e sempre começam com /; nomes de segredos
+        são livres, então o caminho é mantido como digitado (/app/dev/ e
+        app/dev/ são prefixos diferentes).
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+            validate_name (callable): Validação de nome da camada de negócio
+
+        Returns:
+            dict: Resultado da validação com os caminhos normalizados
+        """
+        paths = []
+        for path in (source_path, target_path):
+            if not path or not path.strip().strip('/'):
+                return {
+                    'success': False,
+                    'message': 'Caminhos de origem e destino são obrigatórios'
+                }
+
+            if source == self.PARAMETER:
+                path = '/' + path.strip().strip('/') + '/'
+                validation = validate_name(path.rstrip('/'))
+            else:
+                path = path.strip()
+                path = path if path.endswith('/') else path + '/'
+                validation = validate_name(path)
+
+            if not validation['valid']:
+                return {
+                    'success': False,
+                    'message': validation['message']
+                }
+
+            paths.append(path)
+
+        if paths[0].startswith(paths[1]) or paths[1].startswith(paths[0]):
+            return {
+                'success': False,
+                'message': 'Origem e destino não podem ser o mesmo caminho nem estar um dentro do outro'
+            }
+
+        return {
+            'success': True,
+            'source_path': paths[0],
+            'target_path': paths[1]
+        }
+
+    def diff_paths(self, source, source_path, target_path, validate_name):
+        """
+        Valida os caminhos e compara (ver validate_paths e diff)
+        """
+        validation = self.validate_paths(source, source_path, target_path, validate_name)
+        if not validation['success']:
+            return validation
+
+        return self.diff(source, validation['source_path'], validation['target_path'])
+
+    def start_path_copy(self, source, source_path, target_path, validate_name, delete_missing=False, max_concurrency=None):
+        """
+        Valida os caminhos e a concorrência e inicia a cópia (ver validate_paths e start_copy)
+        """
+        validation = self.validate_paths(source, source_path, target_path, validate_name)
+        if not validation['success']:
+            return validation
+
+        try:
+            max_concurrency = int(max_concurrency) if max_concurrency else None
+        except (TypeError, ValueError):
+            return {
+                'success': False,
+                'message': 'Concorrência inválida'
+            }
+
+        return self.start_copy(
+            source,
+            validation['source_path'],
+            validation['target_path'],
+            bool(delete_missing),
+            max_concurrency
+        )
+
+    # ==================== DIFF ====================
+
+    def diff(self, source, source_path, target_path):
+        """
+        Compara dois caminhos
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            source_path (str): Caminho de origem (ex: /app/staging/)
+            target_path (str): Caminho de destino (ex: /app/prod/)
+
+        Returns:
+            dict: Itens a incluir, alterar e remover no destino
+        """
+        started = time.perf_counter()
+
+        plan = self._build_plan(source, source_path, target_path)
+        if not plan['success']:
+            return plan
+
+        return {
+            'success': True,
+            'source': source,
+            'source_path': source_path,
+            'target_path': target_path,
+            'added': [self._public_entry(entry) for entry in plan['added']],
+            'changed': [self._public_entry(entry) for entry in plan['changed']],
+            'deleted': [self._public_entry(entry) for entry in plan['deleted']],
+            'unchanged_count': plan['unchanged_count'],
+            'elapsed_seconds': round(time.perf_counter() - started, 3)
+        }
+
+    def _build_plan(self, source, source_path, target_path):
+        """
+        Lê as duas árvores e separa inclusões, alterações e remoções
+        """
+        source_items = self._read_tree(source, source_path)
+        if not source_items['success']:
+            return source_items
+
+        target_items = self._read_tree(source, target_path)
+        if not target_items['success']:
+            return target_items
+
+        added, changed, deleted = [], [], []
+        unchanged = 0
+
+        for key, item in source_items['items'].items():
+            current = target_items['items'].get(key)
+            entry = dict(item, key=key, target_name=target_path + key)
+
+            if current is None:
+                added.append(entry)
+            elif current['value'] != item['value'] or current['type'] != item['type']:
+                entry['type_changed'] = current['type'] != item['type']
+                changed.append(entry)
+            else:
+                unchanged += 1
+
+        for key, item in target_items['items'].items():
+            if key not in source_items['items']:
+                deleted.append(dict(item, key=key, target_name=item['name']))
+
+        return {
+            'success': True,
+            'added': sorted(added, key=lambda entry: entry['key']),
+            'changed': sorted(changed, key=lambda entry: entry['key']),
+            'deleted': sorted(deleted, key=lambda entry: entry['key']),
+            'unchanged_count': unchanged
+        }
+
+    def _read_tree(self, source, path):
+        """
+        Lê todos os itens abaixo de um caminho, indexados pelo nome relativo
+        """
+        if source == self.PARAMETER:
+            result = self.parameters.get_parameters_by_path(path)
+            if not result['success']:
+                return result
+
+            return {
+                'success': True,
+                'items': {
+                    param['Name'][len(path):]: {
+                        'name': param['Name'],
+                        'type': param.get('Type'),
+                        'value': param.get('Value')
+                    }
+                    for param in result['parameters']
+                    if param['Name'].startswith(path)
+                }
+            }
+
+        try:
+            names = []
+            paginator = self.secrets.secrets_client.get_paginator('list_secrets')
+
+            # O filtro "name" do ListSecrets casa por prefixo
+            for page in paginator.paginate(Filters=[{'Key': 'name', 'Values': [path]}]):
+                names.extend(
+                    secret['Name'] for secret in page.get('SecretList', [])
+                    if secret['Name'].startswith(path)
+                )
+
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao listar segredos: {e.response["Error"]["Message"]}'
+            }
+
+        if not names:
+            return {
+                'success': True,
+                'items': {}
+            }
+
+        result = self.secrets.get_secret_values(names)
+        if not result['success']:
+            return result
+
+        items = {}
+        for name, value in result['values'].items():
+            if not value['success']:
+                return {
+                    'success': False,
+                    'message': f'Erro ao ler segredo "{name}": {value["message"]}'
+                }
+
+            binary = value.get('is_binary', False)
+            items[name[len(path):]] = {
+                'name': name,
+                'type': 'binary' if binary else 'string',
+                'value': value['secret_binary'] if binary else value['secret_string']
+            }
+
+        return {
+            'success': True,
+            'items': items
+        }
+
+    def _public_entry(self, entry):
+        """
+        Remove o valor de um item do diff
+        """
+        return {key: value for key, value in entry.items() if key != 'value'}
+
+    # ==================== CÓPIA ====================
+
+    def start_copy(self, source, source_path, target_path, delete_missing=False, max_concurrency=None):
+        """
+        Inicia a cópia em background (diff + escritas)
+
+        Args:
+            source (str): 'parameter' ou 'secret'
+            source_path (str): Caminho de origem
+            target_path (str): Caminho de destino
+            delete_missing (bool): Remove do destino o que não existe na origem
+            max_concurrency (int): Escritas simultâneas (padrão PROMOTION_MAX_CONCURRENCY)
+
+        Returns:
+            dict: ID do job
+        """
+        with self._lock:
+            job_id = next(self._job_ids)
+            job = {
+                'id': job_id,
+                'source': source,
+                'source_path': source_path,
+                'target_path': target_path,
+                'delete_missing': delete_missing,
+                'status': 'diffing',
+                'message': None,
+                'added_count': 0,
+                'changed_count': 0,
+                'deleted_count': 0,
+                'unchanged_count': 0,
+                'total': 0,
+                'done': 0,
+                'failed': 0,
+                'throttled': 0,
+                'retries': 0,
+                'backoff_seconds': 0.0,
+                'concurrency': 0,
+                'errors': [],
+                'started': time.perf_counter(),
+                'finished': None,
+                'cancelled': False,
+                'lock': threading.Lock()
+            }
+            self._jobs[job_id] = job
+
+            # Mantém só os jobs mais recentes em memória
+            for old_id in sorted(self._jobs)[:-self.MAX_JOBS]:
+                if self._jobs[old_id]['finished']:
+                    self._jobs.pop(old_id)
+
+        max_concurrency = max(1, min(int(max_concurrency or self.max_workers), 64))
+        threading.Thread(target=self._run_copy, args=(job, max_concurrency), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Cópia iniciada',
+            'job_id': job_id
+        }
+
+    def get_job(self, job_id, source=None):
+        """
+        Retorna o progresso de um job
+
+        Args:
+            job_id (int): ID do job
+            source (str): Se informado, só encontra jobs desse tipo ('parameter' ou 'secret')
+        """
+        job = self._find_job(job_id, source)
+
+        if not job:
+            return {
+                'success': False,
+                'message': 'Job não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(job)
+        }
+
+    def cancel_job(self, job_id, source=None):
+        """
+        Interrompe um job em andamento (escritas já enviadas não são desfeitas)
+        """
+        job = self._find_job(job_id, source)
+
+        if not job or job['finished']:
+            return {
+                'success': False,
+                'message': 'Job não está em execução'
+            }
+
+        job['cancelled'] = True
+
+        return {
+            'success': True,
+            'message': 'Cancelamento solicitado'
+        }
+
+    def iter_progress(self, job_id, interval=0.5, source=None):
+        """
+        Gera o progresso do job periodicamente até ele terminar (para streaming)
+        """
+        while True:
+            result = self.get_job(job_id, source)
+            yield result
+
+            if not result['success'] or result['job']['finished']:
+                return
+
+            time.sleep(interval)
+
+    def _find_job(self, job_id, source=None):
+        """
+        Procura um job (opcionalmente só do tipo informado)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+        if job and source and job['source'] != source:
+            return None
+        return job
+
+    def _run_copy(self, job, max_concurrency):
+        """
+        Executa o diff e aplica as escritas no destino
+        """
+        try:
+            plan = self._build_plan(job['source'], job['source_path'], job['target_path'])
+            if not plan['success']:
+                raise Exception(plan['message'])
+
+            operations = self._build_operations(job, plan)
+
+            with job['lock']:
+                job['added_count'] = len(plan['added'])
+                job['changed_count'] = len(plan['changed'])
+                job['deleted_count'] = len(plan['deleted']) if job['delete_missing'] else 0
+                job['unchanged_count'] = plan['unchanged_count']
+                job['total'] = sum(len(names) for names, _ in operations)
+                job['status'] = 'running'
+                job['started'] = time.perf_counter()
+
+            limiter = AdaptiveLimiter(max_concurrency)
+            job['limiter'] = limiter
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                for future in [executor.submit(self._execute, job, limiter, names, call) for names, call in operations]:
+                    future.result()
+
+            status = 'cancelled' if job['cancelled'] else 'completed'
+            message = None
+
+        except Exception as e:
+            status = 'failed'
+            message = str(e)
+
+        with job['lock']:
+            job['status'] = status
+            job['message'] = message
+            job['finished'] = time.perf_counter()
+
+        if job['done']:
+            get_catalog_index_service().trigger_sync(job['source'])
+
+    def _build_operations(self, job, plan):
+        """
+        Monta a lista de escritas: (nomes afetados, função que executa a chamada)
+        """
+        operations = []
+
+        if job['source'] == self.PARAMETER:
+            client = self.parameters.ssm_client
+
+            for entry in plan['added'] + plan['changed']:
+                operations.append(([entry['target_name']], lambda entry=entry: client.put_parameter(
+                    Name=entry['target_name'],
+                    Value=entry['value'],
+                    Type=entry['type'],
+                    Overwrite=True
+                )))
+
+            if job['delete_missing']:
+                names = [entry['target_name'] for entry in plan['deleted']]
+                for index in range(0, len(names), self.DELETE_PARAMETERS_BATCH_SIZE):
+                    chunk = names[index:index + self.DELETE_PARAMETERS_BATCH_SIZE]
+                    operations.append((chunk, lambda chunk=chunk: client.delete_parameters(Names=chunk)))
+
+            return operations
+
+        client = self.secrets.secrets_client
+
+        def value_args(entry):
+            return {'SecretBinary': entry['value']} if entry['type'] == 'binary' else {'SecretString': entry['value']}
+
+        for entry in plan['added']:
+            operations.append(([entry['target_name']], lambda entry=entry: client.create_secret(
+                Name=entry['target_name'], **value_args(entry)
+            )))
+
+        for entry in plan['changed']:
+            operations.append(([entry['target_name']], lambda entry=entry: client.put_secret_value(
+                SecretId=entry['target_name'], **value_args(entry)
+            )))
+
+        if job['delete_missing']:
+            # Sempre com janela de recuperação: a remoção pode ser desfeita com restore
+            for entry in plan['deleted']:
+                operations.append(([entry['target_name']], lambda entry=entry: client.delete_secret(
+                    SecretId=entry['target_name'], RecoveryWindowInDays=30
+                )))
+
+        return operations
+
+    def _execute(self, job, limiter, names, call):
+        """
+        Executa uma escrita com backoff exponencial (full jitter) em caso de throttling
+        """
+        error = None
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            if job['cancelled']:
+                return
+
+            limiter.acquire()
+            try:
+                call()
+            except ClientError as e:
+                code = e.response['Error']['Code']
+
+                if code in THROTTLE_ERROR_CODES:
+                    limiter.release(throttled=True)
+                    wait = random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+
+                    with job['lock']:
+                        job['throttled'] += 1
+                        job['retries'] += 1
+                        job['backoff_seconds'] += wait
+
+                    time.sleep(wait)
+                    error = e.response['Error']['Message']
+                    continue
+
+                limiter.release()
+                error = e.response['Error']['Message']
+                break
+            except Exception as e:
+                limiter.release()
+                error = str(e)
+                break
+
+            limiter.release()
+
+            if job['source'] == self.SECRET:
+                for name in names:
+                    self.secrets.cache.invalidate(name)
+
+            with job['lock']:
+                job['done'] += len(names)
+            return
+
+        logger.warning('Falha ao copiar %s: %s', ', '.join(names), error)
+
+        with job['lock']:
+            job['failed'] += len(names)
+            for name in names:
+                if len(job['errors']) < self.MAX_ERRORS:
+                    job['errors'].append({'name': name, 'message': error})
+
+    def _snapshot(self, job):
+        """
+        Cópia serializável do estado de um job
+        """
+        with job['lock']:
+            end = job['finished'] or time.perf_counter()
+            elapsed = end - job['started']
+            processed = job['done'] + job['failed']
+            limiter = job.get('limiter')
+
+            return {
+                'id': job['id'],
+                'source': job['source'],
+                'source_path': job['source_path'],
+                'target_path': job['target_path'],
+                'delete_missing': job['delete_missing'],
+                'status': job['status'],
+                'message': job['message'],
+                'added_count': job['added_count'],
+                'changed_count': job['changed_count'],
+                'deleted_count': job['deleted_count'],
+                'unchanged_count': job['unchanged_count'],
+                'total': job['total'],
+                'done': job['done'],
+                'failed': job['failed'],
+                'throttled': job['throttled'],
+                'retries': job['retries'],
+                'backoff_seconds': round(job['backoff_seconds'], 3),
+                'concurrency': limiter.current if limiter else 0,
+                'elapsed_seconds': round(elapsed, 3),
+                'items_per_second': round(processed / elapsed, 2) if elapsed > 0 and job['status'] != 'diffing' else 0.0,
+                'errors': list(job['errors']),
+                'finished': job['finished'] is not None
+            }
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_config_promotion_service():
+    """
+    Retorna o serviço de promoção compartilhado pela aplicação
+
+    Returns:
+        ConfigPromotionService: Instância única do serviço
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = ConfigPromotionService()
+        return _default_service
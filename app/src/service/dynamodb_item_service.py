@@ -0,0 +1,488 @@
+import base64
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from boto3.dynamodb.types import Binary, TypeDeserializer
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.aws_client_factory import TokenBucket
+from src.service.dynamodb_service import DynamoDBService
+
+load_dotenv()
+
+# Operadores aceitos na condição da sort key
+SORT_KEY_OPERATORS = ('=', '<', '<=', '>', '>=', 'between', 'begins_with')
+
+
+def to_json(value):
+    """
+    Converte um valor desserializado do DynamoDB em algo serializável em JSON
+    (Decimal -> int/float, set -> lista ordenada, Binary -> base64)
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_json(item) for item in value)
+    if isinstance(value, Binary):
+        return base64.b64encode(value.value).decode()
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode()
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    return value
+
+
+# Tipos do DynamoDB JSON ({"S": "x"}, {"N": "1.50"}, {"SS": [...]}, ...)
+DYNAMODB_TYPES = ('S', 'N', 'B', 'BOOL', 'NULL', 'M', 'L', 'SS', 'NS', 'BS')
+
+
+def to_dynamodb_json(value):
+    """
+    Converte um valor tipado (como vem da API) em DynamoDB JSON serializável:
+    preserva o tipo e a precisão dos números, separa sets de listas e
+    binários (base64) de strings
+    """
+    (kind, data), = value.items()
+
+    if kind == 'B':
+        data = base64.b64encode(data).decode()
+    elif kind == 'BS':
+        data = [base64.b64encode(item).decode() for item in data]
+    elif kind == 'M':
+        data = {key: to_dynamodb_json(item) for key, item in data.items()}
+    elif kind == 'L':
+        data = [to_dynamodb_json(item) for item in data]
+
+    return {kind: data}
+
+
+def from_dynamodb_json(value):
+    """
+    Operação inversa de to_dynamodb_json (binários em base64 voltam a bytes)
+    """
+    (kind, data), = value.items()
+
+    if kind == 'B':
+        data = base64.b64decode(data, validate=True)
+    elif kind == 'BS':
+        data = [base64.b64decode(item, validate=True) for item in data]
+    elif kind == 'M':
+        data = {key: from_dynamodb_json(item) for key, item in data.items()}
+    elif kind == 'L':
+        data = [from_dynamodb_json(item) for item in data]
+
+    return {kind: data}
+
+
+def is_dynamodb_json(item):
+    """
+    Se todos os atributos do item estão em DynamoDB JSON ({"tipo": valor})
+    """
+    return bool(item) and all(
+        isinstance(value, dict) and len(value) == 1 and next(iter(value)) in DYNAMODB_TYPES
+        for value in item.values()
+    )
+
+
+class DynamoDBItemService:
+    """
+    Navegação nos itens de tabelas DynamoDB
+
+    - Query por key condition com paginação por token (LastEvaluatedKey opaco)
+    - Scan paralelo com TotalSegments: um worker por segmento, páginas
+      entregues conforme chegam por uma fila limitada (memória constante)
+    - ProjectionExpression para trazer só os atributos pedidos
+    - Orçamento de capacidade: o scan para ao atingir as RCUs consumidas
+      (ReturnConsumedCapacity) ou a quantidade máxima de itens
+    """
+
+    def __init__(self, dynamodb_service=None):
+        """
+        Inicializa o serviço
+        """
+        dynamodb_service = dynamodb_service or DynamoDBService()
+        self.dynamodb_client = dynamodb_service.dynamodb_client
+        self.region = dynamodb_service.aws_region
+        self.table_cache = dynamodb_service.table_cache
+        self.max_segments = dynamodb_service.max_workers
+        self.page_size = int(os.getenv('DYNAMODB_PAGE_SIZE', 100))
+
+        self._deserializer = TypeDeserializer()
+
+    # ==================== QUERY ====================
+
+    def query(self, table_name, partition_value, sort_condition=None, index_name=None,
+              projection=None, limit=None, next_token=None, scan_forward=True, consistent_read=False):
+        """
+        Query por partition key (e condição opcional na sort key), uma página por chamada
+
+        Args:
+            table_name (str): Nome da tabela
+            partition_value (str): Valor da partition key
+            sort_condition (dict): {'operator', 'value', 'value2'} (value2 só para between)
+            index_name (str): GSI/LSI consultado (None = tabela)
+            projection (list): Atributos retornados (None = todos)
+            limit (int): Itens por página
+            next_token (str): Token da página anterior
+            scan_forward (bool): Ordem crescente da sort key
+            consistent_read (bool): Leitura fortemente consistente (não vale para GSI)
+
+        Returns:
+            dict: Itens da página, token da próxima página e capacidade consumida
+        """
+        try:
+            schema = self.key_schema(table_name, index_name)
+            names = {'#pk': schema['partition'][0]}
+            values = {':pk': self._typed(partition_value, schema['partition'][1])}
+            condition = '#pk = :pk'
+
+            if sort_condition:
+                if not schema['sort']:
+                    return {
+                        'success': False,
+                        'message': 'A tabela/índice não tem sort key'
+                    }
+                names['#sk'] = schema['sort'][0]
+                condition += ' AND ' + self._sort_expression(sort_condition, schema['sort'][1], values)
+
+            params = {
+                'TableName': table_name,
+                'KeyConditionExpression': condition,
+                'ExpressionAttributeNames': names,
+                'ExpressionAttributeValues': values,
+                'Limit': limit or self.page_size,
+                'ScanIndexForward': scan_forward,
+                'ReturnConsumedCapacity': 'TOTAL'
+            }
+            if index_name:
+                params['IndexName'] = index_name
+            if consistent_read:
+                params['ConsistentRead'] = True
+            if next_token:
+                params['ExclusiveStartKey'] = self._decode_token(next_token)
+            self._apply_projection(params, projection)
+
+            started = time.perf_counter()
+            response = self.dynamodb_client.query(**params)
+
+            return {
+                'success': True,
+                'items': [self._item(item) for item in response.get('Items', [])],
+                'count': response.get('Count', 0),
+                'scanned_count': response.get('ScannedCount', 0),
+                'next_token': self._encode_token(response.get('LastEvaluatedKey')),
+                'consumed_capacity': response.get('ConsumedCapacity', {}).get('CapacityUnits', 0),
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+            }
+
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro: {str(e)}'
+            }
+
+    def _sort_expression(self, sort_condition, attribute_type, values):
+        """
+        Monta a condição da sort key
+        """
+        operator = sort_condition['operator']
+        values[':sk'] = self._typed(sort_condition['value'], attribute_type)
+
+        if operator == 'between':
+            values[':sk2'] = self._typed(sort_condition['value2'], attribute_type)
+            return '#sk BETWEEN :sk AND :sk2'
+        if operator == 'begins_with':
+            return 'begins_with(#sk, :sk)'
+        return f'#sk {operator} :sk'
+
+    # ==================== SCAN ====================
+
+    def iter_scan(self, table_name, segments=4, projection=None, max_items=1000,
+                  max_capacity=None, index_name=None, capacity_rate=None, raw=False):
+        """
+        Scan paralelo entregando os itens conforme chegam (para streaming)
+
+        Args:
+            table_name (str): Nome da tabela
+            segments (int): TotalSegments (workers em paralelo)
+            projection (list): Atributos retornados (None = todos)
+            max_items (int): Itens máximos no total (None = sem limite)
+            max_capacity (float): RCUs máximas consumidas (None = sem limite)
+            index_name (str): Índice percorrido (None = tabela)
+            capacity_rate (float): RCUs/s consumidas no máximo (None = sem limite)
+            raw (bool): Itens tipados como vêm da API, sem converter para JSON simples
+
+        Yields:
+            dict: Blocos 'items' por página e um 'finished' com os totais
+        """
+        segments = max(1, min(segments, self.max_segments))
+        pages = queue.Queue(maxsize=segments * 2)
+        state = {
+            'items': 0,
+            'scanned': 0,
+            'capacity': 0.0,
+            'pages': 0,
+            'stop_reason': None,
+            'stopped': False,
+            'segments': [{'segment': segment, 'items': 0, 'pages': 0, 'done': False} for segment in range(segments)],
+            'lock': threading.Lock()
+        }
+        # A capacidade de cada página só é conhecida na resposta: ela é
+        # descontada do balde depois, atrasando a próxima página do segmento
+        bucket = TokenBucket(capacity_rate, burst=capacity_rate) if capacity_rate else None
+        started = time.perf_counter()
+
+        executor = ThreadPoolExecutor(max_workers=segments)
+        futures = [
+            executor.submit(self._scan_segment, table_name, segment, segments, projection,
+                            max_items, max_capacity, index_name, state, pages, bucket, raw)
+            for segment in range(segments)
+        ]
+
+        try:
+            finished = 0
+            while finished < segments:
+                page = pages.get()
+                if page is None:
+                    finished += 1
+                    continue
+                yield dict(page, type='items', stats=self._scan_stats(state, started))
+
+            error = next((future.exception() for future in futures if future.exception()), None)
+            if error:
+                message = error.response['Error']['Message'] if isinstance(error, ClientError) else str(error)
+                yield {'type': 'finished', 'success': False, 'message': message, 'stats': self._scan_stats(state, started)}
+                return
+
+            yield {'type': 'finished', 'success': True, 'stats': self._scan_stats(state, started)}
+
+        finally:
+            # Cliente desconectou ou o scan terminou: libera os workers
+            state['stopped'] = True
+            while True:
+                try:
+                    pages.get_nowait()
+                except queue.Empty:
+                    break
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def scan_page(self, table_name, projection=None, limit=None, next_token=None, index_name=None):
+        """
+        Uma página de Scan (navegação simples, sem paralelismo)
+        """
+        try:
+            params = {
+                'TableName': table_name,
+                'Limit': limit or self.page_size,
+                'ReturnConsumedCapacity': 'TOTAL'
+            }
+            if index_name:
+                params['IndexName'] = index_name
+            if next_token:
+                params['ExclusiveStartKey'] = self._decode_token(next_token)
+            self._apply_projection(params, projection)
+
+            response = self.dynamodb_client.scan(**params)
+
+            return {
+                'success': True,
+                'items': [self._item(item) for item in response.get('Items', [])],
+                'count': response.get('Count', 0),
+                'scanned_count': response.get('ScannedCount', 0),
+                'next_token': self._encode_token(response.get('LastEvaluatedKey')),
+                'consumed_capacity': response.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+            }
+
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro: {str(e)}'
+            }
+
+    def _scan_segment(self, table_name, segment, total_segments, projection, max_items,
+                      max_capacity, index_name, state, pages, bucket=None, raw=False):
+        """
+        Worker de um segmento: pagina até o fim do segmento ou até o orçamento acabar
+        """
+        params = {
+            'TableName': table_name,
+            'Segment': segment,
+            'TotalSegments': total_segments,
+            'Limit': self.page_size,
+            'ReturnConsumedCapacity': 'TOTAL'
+        }
+        if index_name:
+            params['IndexName'] = index_name
+        self._apply_projection(params, projection)
+
+        try:
+            while not state['stopped'] and not state['stop_reason']:
+                response = self.dynamodb_client.scan(**params)
+                items = response.get('Items', [])
+                capacity = response.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+
+                with state['lock']:
+                    # Corta o excedente da última página para respeitar max_items
+                    if max_items is not None:
+                        items = items[:max(0, max_items - state['items'])]
+                    state['items'] += len(items)
+                    state['scanned'] += response.get('ScannedCount', 0)
+                    state['capacity'] += capacity
+                    state['pages'] += 1
+                    state['segments'][segment]['items'] += len(items)
+                    state['segments'][segment]['pages'] += 1
+
+                    if max_items is not None and state['items'] >= max_items:
+                        state['stop_reason'] = state['stop_reason'] or 'max_items'
+                    elif max_capacity and state['capacity'] >= max_capacity:
+                        state['stop_reason'] = state['stop_reason'] or 'capacity'
+
+                if items:
+                    if not raw:
+                        items = [self._item(item) for item in items]
+                    self._put(pages, {'segment': segment, 'items': items}, state)
+
+                if 'LastEvaluatedKey' not in response:
+                    with state['lock']:
+                        state['segments'][segment]['done'] = True
+                    break
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+                if bucket and capacity:
+                    bucket.acquire(capacity)
+        finally:
+            self._put(pages, None, state)
+
+    def _put(self, pages, page, state):
+        """
+        Entrega uma página ao consumidor (bloqueia enquanto a fila estiver cheia)
+        """
+        while not state['stopped']:
+            try:
+                pages.put(page, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _scan_stats(self, state, started):
+        """
+        Totais do scan até o momento
+        """
+        with state['lock']:
+            elapsed = time.perf_counter() - started
+            return {
+                'items': state['items'],
+                'scanned': state['scanned'],
+                'pages': state['pages'],
+                'consumed_capacity': round(state['capacity'], 2),
+                'stop_reason': state['stop_reason'],
+                'elapsed_seconds': round(elapsed, 3),
+                'items_per_second': round(state['items'] / elapsed, 1) if elapsed else 0,
+                'segments': [dict(segment) for segment in state['segments']]
+            }
+
+    # ==================== AUXILIARES ====================
+
+    def key_schema(self, table_name, index_name=None):
+        """
+        Nome e tipo da partition/sort key da tabela ou do índice (describe_table
+        em cache, invalidado junto com o inventário ao criar/deletar a tabela)
+        """
+        table = self.table_cache.get_key_schema(self.region, table_name)
+
+        if table is None:
+            description = self.dynamodb_client.describe_table(TableName=table_name)['Table']
+            types = {
+                attribute['AttributeName']: attribute['AttributeType']
+                for attribute in description.get('AttributeDefinitions', [])
+            }
+
+            def keys(key_schema):
+                schema = {'partition': None, 'sort': None}
+                for key in key_schema:
+                    role = 'partition' if key['KeyType'] == 'HASH' else 'sort'
+                    schema[role] = (key['AttributeName'], types[key['AttributeName']])
+                return schema
+
+            table = {None: keys(description['KeySchema'])}
+            for index in description.get('GlobalSecondaryIndexes', []) + description.get('LocalSecondaryIndexes', []):
+                table[index['IndexName']] = keys(index['KeySchema'])
+
+            self.table_cache.store_key_schema(self.region, table_name, table)
+
+        if index_name not in table:
+            raise ValueError(f'Índice {index_name} não encontrado na tabela {table_name}')
+
+        return table[index_name]
+
+    def _typed(self, value, attribute_type):
+        """
+        Valor no formato do DynamoDB conforme o tipo do atributo de chave
+        """
+        if attribute_type == 'N':
+            Decimal(str(value))  # Valida o número
+            return {'N': str(value)}
+        if attribute_type == 'B':
+            return {'B': base64.b64decode(value)}
+        return {'S': str(value)}
+
+    def _apply_projection(self, params, projection):
+        """
+        ProjectionExpression com placeholders (evita conflito com palavras reservadas)
+        """
+        if not projection:
+            return
+
+        names = params.setdefault('ExpressionAttributeNames', {})
+        placeholders = []
+        for index, attribute in enumerate(projection):
+            names[f'#p{index}'] = attribute
+            placeholders.append(f'#p{index}')
+
+        params['ProjectionExpression'] = ', '.join(placeholders)
+
+    def _item(self, item):
+        return {key: to_json(self._deserializer.deserialize(value)) for key, value in item.items()}
+
+    def _encode_token(self, key):
+        """
+        LastEvaluatedKey -> token opaco (base64 de JSON; binários em base64)
+        """
+        if not key:
+            return None
+
+        encoded = {
+            name: {'B': base64.b64encode(value['B']).decode()} if 'B' in value else value
+            for name, value in key.items()
+        }
+        return base64.urlsafe_b64encode(json.dumps(encoded).encode()).decode()
+
+    def _decode_token(self, token):
+        """
+        Token -> ExclusiveStartKey
+        """
+        try:
+            key = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except ValueError:
+            raise ValueError('Token de paginação inválido')
+
+        return {
+            name: {'B': base64.b64decode(value['B'])} if 'B' in value else value
+            for name, value in key.items()
+        }
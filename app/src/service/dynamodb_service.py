@@ -1,8 +1,13 @@
 import boto3
 from boto3 import Session
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client, create_resource
+from src.service.dynamodb_table_cache import get_dynamodb_table_cache
 
 load_dotenv()
 
@@ -36,45 +41,100 @@ class DynamoDBService:
         # Cria uma nova sessão boto3 para garantir credenciais atualizadas
         # Isso é crucial para o AWS Toolkit funcionar corretamente
         session = Session()
-        self.dynamodb_client = session.client(
-                'dynamodb',
-            region_name=self.aws_region
+        # Uma conexão HTTP por worker nas leituras/escritas paralelas
+        self.max_workers = int(os.getenv('DYNAMODB_MAX_CONCURRENCY', 16))
+        self.dynamodb_client = create_client(
+            'dynamodb',
+            region_name=self.aws_region,
+            session=session,
+            config=Config(max_pool_connections=self.max_workers)
         )
             
-        self.dynamodb_resource = session.resource(
+        self.dynamodb_resource = create_resource(
             'dynamodb',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
+        
+        # Resumos de describe_table do inventário (atualizados em background)
+        self.table_cache = get_dynamodb_table_cache()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=self.max_workers)
     
-    def create_table(self, table_name, primary_key, primary_key_type='S'):
+    def create_table(self, table_name, primary_key, primary_key_type='S', sort_key=None, sort_key_type='S',
+                     billing_mode='PAY_PER_REQUEST', read_capacity=None, write_capacity=None,
+                     global_indexes=None, local_indexes=None, stream_view_type=None):
         """
         Cria uma nova tabela no DynamoDB
         
+        Uma tabela com o mesmo nome é detectada pelo ResourceInUseException da
+        própria criação (sem listar as tabelas antes)
+        
         Args:
             table_name (str): Nome da tabela a ser criada
-            primary_key (str): Nome da chave primária
-            primary_key_type (str): Tipo da chave primária ('S' para String, 'N' para Number, 'B' para Binary)
+            primary_key (str): Nome da partition key
+            primary_key_type (str): Tipo da partition key ('S' para String, 'N' para Number, 'B' para Binary)
+            sort_key (str): Nome da sort key (opcional)
+            sort_key_type (str): Tipo da sort key
+            billing_mode (str): 'PAY_PER_REQUEST' (on-demand) ou 'PROVISIONED'
+            read_capacity (int): RCUs (modo provisionado)
+            write_capacity (int): WCUs (modo provisionado)
+            global_indexes (list): GSIs ({'name', 'partition_key', 'partition_key_type', 'sort_key',
+                'sort_key_type', 'projection', 'non_key_attributes', 'read_capacity', 'write_capacity'})
+            local_indexes (list): LSIs ({'name', 'sort_key', 'sort_key_type', 'projection', 'non_key_attributes'})
+            stream_view_type (str): Liga o DynamoDB Streams com esse tipo de imagem (opcional)
         
         Returns:
             dict: Resposta da criação da tabela ou erro
         """
         try:
-            response = self.dynamodb_client.create_table(
-                TableName=table_name,
-                KeySchema=[
-                    {
-                        'AttributeName': primary_key,
-                        'KeyType': 'HASH'  # Partition key
-                    }
-                ],
-                AttributeDefinitions=[
-                    {
-                        'AttributeName': primary_key,
-                        'AttributeType': primary_key_type
-                    }
-                ],
-                BillingMode='PAY_PER_REQUEST'  # On-demand billing
-            )
+            attributes = {primary_key: primary_key_type}
+            key_schema = [{'AttributeName': primary_key, 'KeyType': 'HASH'}]  # Partition key
+            if sort_key:
+                attributes[sort_key] = sort_key_type
+                key_schema.append({'AttributeName': sort_key, 'KeyType': 'RANGE'})
+            
+            params = {
+                'TableName': table_name,
+                'KeySchema': key_schema,
+                'BillingMode': billing_mode
+            }
+            if billing_mode == 'PROVISIONED':
+                params['ProvisionedThroughput'] = {
+                    'ReadCapacityUnits': read_capacity,
+                    'WriteCapacityUnits': write_capacity
+                }
+            
+            if global_indexes:
+                params['GlobalSecondaryIndexes'] = []
+                for index in global_indexes:
+                    attributes[index['partition_key']] = index['partition_key_type']
+                    if index.get('sort_key'):
+                        attributes[index['sort_key']] = index['sort_key_type']
+                    definition = self._index_definition(index, index['partition_key'])
+                    if billing_mode == 'PROVISIONED':
+                        definition['ProvisionedThroughput'] = {
+                            'ReadCapacityUnits': index['read_capacity'],
+                            'WriteCapacityUnits': index['write_capacity']
+                        }
+                    params['GlobalSecondaryIndexes'].append(definition)
+            
+            if local_indexes:
+                params['LocalSecondaryIndexes'] = []
+                for index in local_indexes:
+                    attributes[index['sort_key']] = index['sort_key_type']
+                    params['LocalSecondaryIndexes'].append(self._index_definition(index, primary_key))
+            
+            if stream_view_type:
+                params['StreamSpecification'] = {'StreamEnabled': True, 'StreamViewType': stream_view_type}
+            
+            params['AttributeDefinitions'] = [
+                {'AttributeName': name, 'AttributeType': attribute_type}
+                for name, attribute_type in attributes.items()
+            ]
+            
+            response = self.dynamodb_client.create_table(**params)
+            
+            self.table_cache.invalidate(self.aws_region, table_name)
             
             return {
                 'success': True,
@@ -86,6 +146,14 @@ class DynamoDBService:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
             
+            if error_code == 'ResourceInUseException':
+                return {
+                    'success': False,
+                    'message': f'A tabela "{table_name}" já existe',
+                    'errors': ['Tabela já existe'],
+                    'error_code': error_code
+                }
+            
             return {
                 'success': False,
                 'message': f'Erro ao criar tabela: {error_message}',
@@ -97,6 +165,24 @@ class DynamoDBService:
                 'message': f'Erro inesperado: {str(e)}'
             }
     
+    def _index_definition(self, index, partition_key):
+        """
+        Definição de um GSI/LSI no formato do create_table
+        """
+        key_schema = [{'AttributeName': partition_key, 'KeyType': 'HASH'}]
+        if index.get('sort_key'):
+            key_schema.append({'AttributeName': index['sort_key'], 'KeyType': 'RANGE'})
+        
+        projection = {'ProjectionType': index.get('projection') or 'ALL'}
+        if projection['ProjectionType'] == 'INCLUDE':
+            projection['NonKeyAttributes'] = index['non_key_attributes']
+        
+        return {
+            'IndexName': index['name'],
+            'KeySchema': key_schema,
+            'Projection': projection
+        }
+    
     def list_tables(self):
         """
         Lista todas as tabelas DynamoDB
@@ -105,11 +191,14 @@ class DynamoDBService:
             dict: Lista de tabelas ou erro
         """
         try:
-            response = self.dynamodb_client.list_tables()
+            # list_tables retorna no máximo 100 nomes por chamada
+            tables = []
+            for page in self.dynamodb_client.get_paginator('list_tables').paginate():
+                tables.extend(page.get('TableNames', []))
             
             return {
                 'success': True,
-                'tables': response.get('TableNames', [])
+                'tables': tables
             }
             
         except ClientError as e:
@@ -154,6 +243,7 @@ class DynamoDBService:
         """
         try:
             response = self.dynamodb_client.delete_table(TableName=table_name)
+            self.table_cache.invalidate(self.aws_region, table_name)
             
             return {
                 'success': True,
@@ -166,3 +256,155 @@ class DynamoDBService:
                 'success': False,
                 'message': f'Erro ao deletar tabela: {e.response["Error"]["Message"]}'
             }
+    
+    def get_inventory(self, refresh=False):
+        """
+        Inventário de todas as tabelas com métricas de capacidade e tamanho
+        
+        - Nomes de todas as páginas do list_tables
+        - describe_table em paralelo (até DYNAMODB_MAX_CONCURRENCY) só para as
+          tabelas fora do cache
+        - Tabelas com o resumo vencido voltam do cache e são atualizadas em
+          background para a próxima consulta
+        
+        Args:
+            refresh (bool): Ignora o cache e descreve todas as tabelas agora
+        
+        Returns:
+            dict: Resumo por tabela, totais e estatísticas da consulta
+        """
+        try:
+            started = time.perf_counter()
+            listing = self.list_tables()
+            if not listing['success']:
+                return listing
+            table_names = listing['tables']
+            
+            self.table_cache.retain(self.aws_region, table_names)
+            if refresh:
+                summaries, missing, stale = {}, list(table_names), []
+            else:
+                summaries, missing, stale = self.table_cache.get_many(self.aws_region, table_names)
+            
+            errors = []
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                    futures = [(table_name, executor.submit(self._describe_summary, table_name)) for table_name in missing]
+                    for table_name, future in futures:
+                        # Falha em uma tabela (ex: sem permissão) não derruba o inventário
+                        error = future.exception()
+                        if error:
+                            message = error.response['Error']['Message'] if isinstance(error, ClientError) else str(error)
+                            errors.append({'table': table_name, 'message': message})
+                        elif future.result() is not None:
+                            summaries[table_name] = future.result()
+            
+            for table_name in stale:
+                if self.table_cache.claim_refresh(self.aws_region, table_name):
+                    self._refresh_executor.submit(self._refresh_summary, table_name)
+            
+            tables = [summaries[table_name] for table_name in table_names if table_name in summaries]
+            
+            return {
+                'success': True,
+                'tables': tables,
+                'count': len(tables),
+                'totals': {
+                    'item_count': sum(table['item_count'] for table in tables),
+                    'size_bytes': sum(table['size_bytes'] for table in tables),
+                    'gsi_count': sum(len(table['gsis']) for table in tables)
+                },
+                'errors': errors,
+                'described': len(missing),
+                'refreshing': len(stale),
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 2),
+                'cache': self.table_cache.get_stats()
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao montar inventário: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro inesperado: {str(e)}'
+            }
+    
+    def _describe_summary(self, table_name):
+        """
+        describe_table resumido e armazenado no cache (None se a tabela sumiu)
+        """
+        try:
+            table = self.dynamodb_client.describe_table(TableName=table_name)['Table']
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                # Deletada entre o list_tables e o describe_table
+                self.table_cache.invalidate(self.aws_region, table_name)
+                return None
+            raise
+        
+        summary = self._summarize_table(table)
+        self.table_cache.store(self.aws_region, table_name, summary)
+        return summary
+    
+    def _refresh_summary(self, table_name):
+        """
+        Atualização em background de um resumo vencido
+        """
+        try:
+            self._describe_summary(table_name)
+        except Exception:
+            # Mantém o resumo antigo; a próxima consulta tenta de novo
+            pass
+        finally:
+            self.table_cache.release_refresh(self.aws_region, table_name)
+    
+    def _summarize_table(self, table):
+        """
+        Campos do describe_table usados no inventário
+        """
+        key_types = {
+            attribute['AttributeName']: attribute['AttributeType']
+            for attribute in table.get('AttributeDefinitions', [])
+        }
+        
+        def keys(key_schema):
+            return [
+                {'name': key['AttributeName'], 'type': key_types.get(key['AttributeName']), 'role': key['KeyType']}
+                for key in key_schema
+            ]
+        
+        billing_mode = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
+        throughput = table.get('ProvisionedThroughput', {})
+        stream = table.get('StreamSpecification', {})
+        created = table.get('CreationDateTime')
+        
+        return {
+            'name': table['TableName'],
+            'status': table.get('TableStatus'),
+            'item_count': table.get('ItemCount', 0),
+            'size_bytes': table.get('TableSizeBytes', 0),
+            'billing_mode': billing_mode,
+            'read_capacity': throughput.get('ReadCapacityUnits') if billing_mode == 'PROVISIONED' else None,
+            'write_capacity': throughput.get('WriteCapacityUnits') if billing_mode == 'PROVISIONED' else None,
+            'table_class': table.get('TableClassSummary', {}).get('TableClass', 'STANDARD'),
+            'key_schema': keys(table.get('KeySchema', [])),
+            'gsis': [
+                {
+                    'name': index['IndexName'],
+                    'status': index.get('IndexStatus'),
+                    'key_schema': keys(index.get('KeySchema', [])),
+                    'projection': index.get('Projection', {}).get('ProjectionType'),
+                    'item_count': index.get('ItemCount', 0),
+                    'size_bytes': index.get('IndexSizeBytes', 0)
+                }
+                for index in table.get('GlobalSecondaryIndexes', [])
+            ],
+            'lsi_count': len(table.get('LocalSecondaryIndexes', [])),
+            'stream_enabled': stream.get('StreamEnabled', False),
+            'stream_view_type': stream.get('StreamViewType'),
+            'deletion_protection': table.get('DeletionProtectionEnabled', False),
+            'created_at': created.isoformat() if created else None
+        }
@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class DynamoDBTableCache:
+    """
+    Cache em memória dos resumos de describe_table usados no inventário
+
+    - Indexado por (região, tabela)
+    - A validade depende do status da tabela: ACTIVE vale
+      DYNAMODB_INVENTORY_TTL segundos (ItemCount/TableSizeBytes só são
+      atualizados pela AWS a cada ~6 horas); CREATING/UPDATING/DELETING e
+      afins valem DYNAMODB_INVENTORY_TRANSITION_TTL segundos
+    - Entradas vencidas continuam sendo servidas enquanto o serviço as
+      atualiza em background (no máximo uma atualização por tabela)
+    - Também guarda os key schemas (tabela e índices) usados na navegação
+      nos itens, com a validade de tabelas ACTIVE; criar, deletar ou
+      recriar a tabela pelo serviço invalida os dois
+    """
+
+    STABLE_STATUSES = ('ACTIVE',)
+
+    def __init__(self, ttl=None, transition_ttl=None):
+        """
+        Inicializa o cache
+
+        Args:
+            ttl (float): Validade (segundos) de tabelas ACTIVE
+            transition_ttl (float): Validade (segundos) de tabelas em transição
+        """
+        self.ttl = ttl if ttl is not None else float(os.getenv('DYNAMODB_INVENTORY_TTL', 300))
+        self.transition_ttl = transition_ttl if transition_ttl is not None else float(os.getenv('DYNAMODB_INVENTORY_TRANSITION_TTL', 5))
+
+        self._entries = {}
+        self._key_schemas = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale': 0, 'misses': 0, 'refreshes': 0}
+
+    def get_many(self, region, table_names):
+        """
+        Procura os resumos de várias tabelas
+
+        Args:
+            region (str): Região AWS
+            table_names (list): Nomes das tabelas
+
+        Returns:
+            tuple: (resumos encontrados por nome, nomes ausentes, nomes vencidos)
+        """
+        found = {}
+        missing = []
+        stale = []
+        now = time.time()
+
+        with self._lock:
+            for table_name in table_names:
+                entry = self._entries.get((region, table_name))
+                if entry is None:
+                    missing.append(table_name)
+                    self._stats['misses'] += 1
+                    continue
+
+                found[table_name] = entry['summary']
+                if now >= entry['expires_at']:
+                    stale.append(table_name)
+                    self._stats['stale'] += 1
+                else:
+                    self._stats['hits'] += 1
+
+        return found, missing, stale
+
+    def store(self, region, table_name, summary):
+        """
+        Armazena o resumo de uma tabela (a validade vem do status)
+        """
+        ttl = self.ttl if summary.get('status') in self.STABLE_STATUSES else self.transition_ttl
+
+        with self._lock:
+            self._entries[(region, table_name)] = {
+                'summary': summary,
+                'expires_at': time.time() + ttl
+            }
+
+    def get_key_schema(self, region, table_name):
+        """
+        Key schemas da tabela e dos índices (None se ausente ou vencido)
+        """
+        with self._lock:
+            entry = self._key_schemas.get((region, table_name))
+
+        if entry is None or time.time() >= entry['expires_at']:
+            return None
+        return entry['schema']
+
+    def store_key_schema(self, region, table_name, schema):
+        """
+        Armazena os key schemas da tabela e dos índices
+        """
+        with self._lock:
+            self._key_schemas[(region, table_name)] = {
+                'schema': schema,
+                'expires_at': time.time() + self.ttl
+            }
+
+    def claim_refresh(self, region, table_name):
+        """
+        Reserva a atualização em background de uma tabela
+
+        Returns:
+            bool: False se a tabela já está sendo atualizada
+        """
+        with self._lock:
+            if (region, table_name) in self._refreshing:
+                return False
+            self._refreshing.add((region, table_name))
+            self._stats['refreshes'] += 1
+            return True
+
+    def release_refresh(self, region, table_name):
+        with self._lock:
+            self._refreshing.discard((region, table_name))
+
+    def invalidate(self, region, table_name):
+        """
+        Remove uma tabela do cache (ex: após criar ou deletar)
+        """
+        with self._lock:
+            self._entries.pop((region, table_name), None)
+            self._key_schemas.pop((region, table_name), None)
+
+    def retain(self, region, table_names):
+        """
+        Descarta as tabelas da região que não existem mais
+        """
+        table_names = set(table_names)
+
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == region and key[1] not in table_names]:
+                self._entries.pop(key)
+            for key in [key for key in self._key_schemas if key[0] == region and key[1] not in table_names]:
+                self._key_schemas.pop(key)
+
+    def clear(self):
+        """
+        Remove todos os resumos (e key schemas) do cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._key_schemas.clear()
+
+    def get_stats(self):
+        """
+        Retorna contadores de uso do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_tables'] = len(self._entries)
+            stats['cached_key_schemas'] = len(self._key_schemas)
+            stats['refreshing'] = len(self._refreshing)
+        return stats
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_dynamodb_table_cache():
+    """
+    Retorna o cache compartilhado pela aplicação
+
+    Returns:
+        DynamoDBTableCache: Instância única do cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DynamoDBTableCache()
+        return _default_cache
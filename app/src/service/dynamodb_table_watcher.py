@@ -0,0 +1,249 @@
+import logging
+import os
+import threading
+import time
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.dynamodb_service import DynamoDBService
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class DynamoDBTableWatcher:
+    """
+    Acompanha uma tabela recém-criada até ela ficar pronta para uso
+
+    - Um único poller (describe_table) por tabela a cada DYNAMODB_WATCH_INTERVAL
+      segundos; diferente do waiter table_exists (20 s entre consultas e
+      só avisa no fim), expõe cada mudança de status
+    - Pronta = tabela ACTIVE e todos os GSIs ACTIVE (o waiter do boto3 só
+      olha o status da tabela)
+    - O TTL só pode ser ligado com a tabela ACTIVE: é aplicado pelo próprio
+      poller antes de encerrar
+    - Para sozinho ao ficar pronta, falhar ou estourar DYNAMODB_WATCH_TIMEOUT
+    """
+
+    MAX_ERRORS = 3
+
+    def __init__(self, dynamodb_service=None):
+        """
+        Inicializa o watcher
+        """
+        self.service = dynamodb_service or DynamoDBService()
+        self.dynamodb_client = self.service.dynamodb_client
+        self.interval = float(os.getenv('DYNAMODB_WATCH_INTERVAL', 2))
+        self.max_duration = float(os.getenv('DYNAMODB_WATCH_TIMEOUT', 600))
+
+        self._watches = {}
+        self._lock = threading.Lock()
+
+    def watch(self, table_name, ttl_attribute=None):
+        """
+        Garante um poller ativo para a tabela
+
+        Args:
+            table_name (str): Nome da tabela
+            ttl_attribute (str): Atributo de TTL a ligar quando a tabela ficar ACTIVE
+
+        Returns:
+            dict: Estado do acompanhamento
+        """
+        with self._lock:
+            watch = self._watches.get(table_name)
+
+            if watch is None or watch['finished']:
+                watch = self._watches[table_name] = {
+                    'table_name': table_name,
+                    'ttl_attribute': ttl_attribute,
+                    'ttl_status': 'PENDING' if ttl_attribute else None,
+                    'table_status': None,
+                    'indexes': {},
+                    'started': time.perf_counter(),
+                    'elapsed': None,
+                    'polls': 0,
+                    'version': 0,
+                    'finished': False,
+                    'reason': None,
+                    'message': None,
+                    'lock': threading.Lock()
+                }
+                threading.Thread(target=self._poll_loop, args=(watch,), daemon=True).start()
+
+        return {
+            'success': True,
+            'watch': self._snapshot(watch)
+        }
+
+    def get_watch(self, table_name):
+        """
+        Estado atual do acompanhamento de uma tabela
+        """
+        watch = self._watches.get(table_name)
+        if not watch:
+            return {
+                'success': False,
+                'message': f'Tabela {table_name} não está sendo acompanhada'
+            }
+
+        return {
+            'success': True,
+            'watch': self._snapshot(watch)
+        }
+
+    def iter_updates(self, table_name, interval=0.5, heartbeat=15):
+        """
+        Gera o estado da tabela a cada mudança até ela ficar pronta (para streaming)
+        """
+        watch = self._watches.get(table_name)
+        if not watch:
+            yield {'type': 'finished', 'success': False, 'message': f'Tabela {table_name} não está sendo acompanhada'}
+            return
+
+        version = None
+        last_sent = time.monotonic()
+
+        while True:
+            finished = watch['finished']
+
+            if finished:
+                snapshot = self._snapshot(watch)
+                yield {'type': 'finished', 'success': snapshot['reason'] == 'ready', 'watch': snapshot}
+                return
+
+            if watch['version'] != version:
+                snapshot = self._snapshot(watch)
+                version = snapshot['version']
+                last_sent = time.monotonic()
+                yield {'type': 'status', 'watch': snapshot}
+            elif time.monotonic() - last_sent >= heartbeat:
+                last_sent = time.monotonic()
+                yield {'type': 'heartbeat'}
+
+            time.sleep(interval)
+
+    # ==================== POLLING ====================
+
+    def _poll_loop(self, watch):
+        """
+        Consulta a tabela até ela e os índices ficarem ACTIVE
+        """
+        deadline = time.monotonic() + self.max_duration
+        errors = 0
+
+        while True:
+            try:
+                table = self.dynamodb_client.describe_table(TableName=watch['table_name'])['Table']
+                errors = 0
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                    self._finish(watch, 'not_found', 'Tabela não encontrada')
+                    return
+                errors += 1
+                logger.warning('Watcher DynamoDB %s: %s', watch['table_name'], e)
+                if errors >= self.MAX_ERRORS:
+                    self._finish(watch, 'error', e.response['Error']['Message'])
+                    return
+                time.sleep(self.interval)
+                continue
+            except Exception as e:
+                self._finish(watch, 'error', str(e))
+                return
+
+            indexes = {
+                index['IndexName']: index.get('IndexStatus')
+                for index in table.get('GlobalSecondaryIndexes', [])
+            }
+            with watch['lock']:
+                watch['polls'] += 1
+            self._update(watch, table_status=table.get('TableStatus'), indexes=indexes)
+
+            if table.get('TableStatus') == 'ACTIVE' and all(status == 'ACTIVE' for status in indexes.values()):
+                self._enable_ttl(watch)
+                # O inventário passa a mostrar a tabela como ACTIVE
+                self.service.table_cache.invalidate(self.service.aws_region, watch['table_name'])
+                self._finish(watch, 'ready', 'Tabela pronta para uso')
+                return
+
+            if time.monotonic() > deadline:
+                self._finish(watch, 'timeout', f'Tabela não ficou ACTIVE em {self.max_duration:g}s')
+                return
+
+            time.sleep(self.interval)
+
+    def _enable_ttl(self, watch):
+        """
+        Liga o TTL (o erro não invalida a tabela: fica registrado no status)
+        """
+        if not watch['ttl_attribute']:
+            return
+
+        try:
+            self.dynamodb_client.update_time_to_live(
+                TableName=watch['table_name'],
+                TimeToLiveSpecification={'Enabled': True, 'AttributeName': watch['ttl_attribute']}
+            )
+            self._update(watch, ttl_status='ENABLED')
+        except ClientError as e:
+            self._update(watch, ttl_status='FAILED', message=f"Falha ao ligar o TTL: {e.response['Error']['Message']}")
+
+    def _update(self, watch, **fields):
+        """
+        Aplica mudanças no estado (só incrementa a versão se algo mudou)
+        """
+        with watch['lock']:
+            changed = any(watch[name] != value for name, value in fields.items())
+            watch.update(fields)
+            if changed:
+                watch['version'] += 1
+
+    def _finish(self, watch, reason, message):
+        with watch['lock']:
+            watch['reason'] = reason
+            # Pronta com falha no TTL: mantém o aviso do TTL
+            if not (reason == 'ready' and watch['message']):
+                watch['message'] = message
+            watch['elapsed'] = time.perf_counter() - watch['started']
+            watch['version'] += 1
+            watch['finished'] = True
+
+    def _snapshot(self, watch):
+        """
+        Estado do acompanhamento para a API
+        """
+        with watch['lock']:
+            elapsed = watch['elapsed'] if watch['elapsed'] is not None else time.perf_counter() - watch['started']
+
+            return {
+                'table_name': watch['table_name'],
+                'table_status': watch['table_status'],
+                'indexes': dict(watch['indexes']),
+                'ttl_attribute': watch['ttl_attribute'],
+                'ttl_status': watch['ttl_status'],
+                'polls': watch['polls'],
+                'version': watch['version'],
+                'elapsed_seconds': round(elapsed, 3),
+                'reason': watch['reason'],
+                'message': watch['message'],
+                'finished': watch['finished']
+            }
+
+
+_default_watcher = None
+_default_watcher_lock = threading.Lock()
+
+
+def get_dynamodb_table_watcher():
+    """
+    Retorna o watcher compartilhado pela aplicação
+
+    Returns:
+        DynamoDBTableWatcher: Instância única
+    """
+    global _default_watcher
+
+    with _default_watcher_lock:
+        if _default_watcher is None:
+            _default_watcher = DynamoDBTableWatcher()
+        return _default_watcher
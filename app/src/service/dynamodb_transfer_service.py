@@ -0,0 +1,742 @@
+import csv
+import json
+import math
+import os
+import queue
+import random
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.aws_client_factory import THROTTLE_ERROR_CODES, TokenBucket
+from src.service.dynamodb_item_service import DynamoDBItemService, from_dynamodb_json, is_dynamodb_json, to_dynamodb_json
+from src.service.dynamodb_service import DynamoDBService
+
+load_dotenv()
+
+
+class DynamoDBTransferService:
+    """
+    Importação e exportação em massa de tabelas DynamoDB
+
+    - Importação: NDJSON (um item JSON por linha, simples ou em DynamoDB JSON)
+      ou CSV (cabeçalho = atributos) lido em streaming, em lotes de 25 para o
+      BatchWriteItem, com vários escritores em paralelo e retry com backoff
+      exponencial dos UnprocessedItems
+    - Exportação: Scan paralelo (TotalSegments) gravado em NDJSON (DynamoDB
+      JSON, importável de volta sem perder tipos) ou Parquet
+    - Memória constante: o arquivo enviado vai para disco e é lido linha a linha;
+      leitor/escritores e scan/gravação se comunicam por filas limitadas
+    - Limite de taxa opcional em WCU/RCU por segundo (token bucket)
+    """
+
+    IMPORT = 'import'
+    EXPORT = 'export'
+    IMPORT_FORMATS = ('ndjson', 'csv')
+    EXPORT_FORMATS = ('ndjson', 'parquet')
+    BATCH_SIZE = 25
+
+    def __init__(self, dynamodb_service=None):
+        """
+        Inicializa o serviço
+        """
+        dynamodb_service = dynamodb_service or DynamoDBService()
+        self.dynamodb_client = dynamodb_service.dynamodb_client
+        self.items = DynamoDBItemService(dynamodb_service)
+        self.max_writers = dynamodb_service.max_workers
+        self.max_retries = int(os.getenv('DYNAMODB_IMPORT_MAX_RETRIES', 8))
+        self.retention = float(os.getenv('DYNAMODB_TRANSFER_RETENTION', 3600))
+
+        self._serializer = TypeSerializer()
+        self._deserializer = TypeDeserializer()
+        self._jobs = {}
+        self._next_job_id = 1
+        self._lock = threading.Lock()
+
+    # ==================== JOBS ====================
+
+    def start_import(self, table_name, stream, file_format, writers=None, max_wcu=None):
+        """
+        Grava o arquivo recebido em disco e inicia a importação em background
+
+        Args:
+            table_name (str): Tabela de destino
+            stream: Arquivo (NDJSON ou CSV) lido em blocos
+            file_format (str): 'ndjson' ou 'csv'
+            writers (int): Escritores simultâneos
+            max_wcu (float): WCUs/s consumidas no máximo (None = sem limite)
+
+        Returns:
+            dict: ID do job
+        """
+        self._cleanup()
+
+        try:
+            # Valida a tabela antes de receber o arquivo
+            key_schema = self.items.key_schema(table_name)
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+
+        spool = tempfile.NamedTemporaryFile(suffix=f'.{file_format}', prefix='dynamodb-import-', delete=False)
+        with spool:
+            shutil.copyfileobj(stream, spool, 1024 * 1024)
+
+        job = self._create_job(self.IMPORT, table_name, file_format, spool.name, {
+            'writers': min(writers or self.max_writers, self.max_writers),
+            'max_wcu': max_wcu,
+            'key_schema': key_schema,
+            'file_bytes': os.path.getsize(spool.name)
+        })
+        threading.Thread(target=self._run_import, args=(job,), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Importação iniciada',
+            'job_id': job['id']
+        }
+
+    def start_export(self, table_name, file_format, segments=4, max_rcu=None, projection=None):
+        """
+        Inicia a exportação da tabela em background
+
+        Args:
+            table_name (str): Tabela exportada
+            file_format (str): 'ndjson' ou 'parquet'
+            segments (int): Segmentos do scan paralelo
+            max_rcu (float): RCUs/s consumidas no máximo (None = sem limite)
+            projection (list): Atributos exportados (None = todos)
+
+        Returns:
+            dict: ID do job
+        """
+        self._cleanup()
+
+        if file_format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                return {
+                    'success': False,
+                    'message': 'Exportação em Parquet requer o pacote pyarrow (pip install pyarrow)'
+                }
+
+        output = tempfile.NamedTemporaryFile(suffix=f'.{file_format}', prefix='dynamodb-export-', delete=False)
+        output.close()
+
+        job = self._create_job(self.EXPORT, table_name, file_format, output.name, {
+            'segments': segments,
+            'max_rcu': max_rcu,
+            'projection': projection
+        })
+        threading.Thread(target=self._run_export, args=(job,), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Exportação iniciada',
+            'job_id': job['id']
+        }
+
+    def get_job(self, job_id):
+        """
+        Retorna o progresso de um job
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Job {job_id} não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(job)
+        }
+
+    def cancel_job(self, job_id):
+        """
+        Interrompe o job (os lotes já gravados permanecem)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Job {job_id} não encontrado'
+            }
+
+        job['cancelled'] = True
+
+        return {
+            'success': True,
+            'message': 'Cancelamento solicitado'
+        }
+
+    def iter_progress(self, job_id, interval=0.5):
+        """
+        Gera o progresso do job até ele terminar (para streaming)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            yield {'type': 'finished', 'success': False, 'message': f'Job {job_id} não encontrado'}
+            return
+
+        while True:
+            finished = job['finished']
+            snapshot = self._snapshot(job)
+
+            if finished:
+                yield {'type': 'finished', 'success': snapshot['status'] == 'completed', 'job': snapshot}
+                return
+
+            yield {'type': 'progress', 'job': snapshot}
+            time.sleep(interval)
+
+    def get_export_file(self, job_id):
+        """
+        Caminho e nome para download do arquivo de uma exportação terminada
+
+        Returns:
+            tuple: (caminho, nome do arquivo) ou (None, None)
+        """
+        job = self._jobs.get(job_id)
+        if not job or job['kind'] != self.EXPORT or not job['finished'] or job['status'] == 'failed':
+            return None, None
+
+        return job['path'], f"{job['table_name']}-{job['id']}.{job['format']}"
+
+    def _create_job(self, kind, table_name, file_format, path, options):
+        """
+        Registra um job novo
+        """
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+
+            job = self._jobs[job_id] = dict(options, **{
+                'id': job_id,
+                'kind': kind,
+                'table_name': table_name,
+                'format': file_format,
+                'path': path,
+                'status': 'running',
+                'message': None,
+                'errors': [],
+                'read': 0,
+                'invalid': 0,
+                'written': 0,
+                'failed': 0,
+                'batches': 0,
+                'retries': 0,
+                'throttled': 0,
+                'capacity': 0.0,
+                'bytes': 0,
+                'started': time.perf_counter(),
+                'elapsed': None,
+                'cancelled': False,
+                'finished': False,
+                'lock': threading.Lock()
+            })
+
+        return job
+
+    def _finish(self, job, status, message):
+        with job['lock']:
+            job['status'] = status
+            job['message'] = message
+            job['elapsed'] = time.perf_counter() - job['started']
+            job['finished'] = True
+
+    def _error(self, job, message):
+        """
+        Guarda uma amostra dos erros (chamado com o lock adquirido)
+        """
+        if len(job['errors']) < 20:
+            job['errors'].append(message)
+
+    def _cleanup(self):
+        """
+        Descarta jobs terminados há mais de DYNAMODB_TRANSFER_RETENTION segundos (e seus arquivos)
+        """
+        now = time.perf_counter()
+
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job['finished'] and now - job['started'] - job['elapsed'] > self.retention
+            ]
+            for job in expired:
+                self._jobs.pop(job['id'])
+
+        for job in expired:
+            try:
+                os.remove(job['path'])
+            except OSError:
+                pass
+
+    # ==================== IMPORTAÇÃO ====================
+
+    def _run_import(self, job):
+        """
+        Lê o arquivo em lotes de 25 itens e distribui entre os escritores
+        """
+        batches = queue.Queue(maxsize=job['writers'] * 2)
+        bucket = TokenBucket(job['max_wcu'], burst=job['max_wcu']) if job['max_wcu'] else None
+        writers = [
+            threading.Thread(target=self._write_loop, args=(job, batches, bucket), daemon=True)
+            for _ in range(job['writers'])
+        ]
+        for writer in writers:
+            writer.start()
+
+        try:
+            for batch in self._read_batches(job):
+                if job['cancelled']:
+                    break
+                batches.put(batch)
+            status = 'cancelled' if job['cancelled'] else 'completed'
+            message = None
+        except Exception as e:
+            status, message = 'failed', f'Erro ao ler o arquivo: {str(e)}'
+        finally:
+            for _ in writers:
+                batches.put(None)
+            for writer in writers:
+                writer.join()
+            try:
+                os.remove(job['path'])
+            except OSError:
+                pass
+
+        if status == 'completed' and job['failed']:
+            message = f"{job['failed']} itens não foram gravados"
+
+        self._finish(job, status, message)
+
+    def _read_batches(self, job):
+        """
+        Itens do arquivo já serializados, em lotes de até 25
+
+        Um lote não pode repetir a mesma chave (o BatchWriteItem recusa):
+        ao encontrar uma chave repetida o lote atual é fechado antes
+        """
+        keys = [key[0] for key in (job['key_schema']['partition'], job['key_schema']['sort']) if key]
+        batch, batch_keys = [], set()
+
+        for line_number, item, error in self._read_items(job):
+            try:
+                if error:
+                    raise ValueError(error)
+                missing = [key for key in keys if item.get(key) in (None, '')]
+                if missing:
+                    raise ValueError(f'chave ausente: {", ".join(missing)}')
+                serialized = {name: self._serializer.serialize(value) for name, value in item.items()}
+            except (TypeError, ValueError) as e:
+                with job['lock']:
+                    job['invalid'] += 1
+                    self._error(job, f'Linha {line_number}: {str(e)}')
+                continue
+
+            key = tuple(json.dumps(serialized[name], sort_keys=True, default=str) for name in keys)
+            if key in batch_keys or len(batch) == self.BATCH_SIZE:
+                yield batch
+                batch, batch_keys = [], set()
+
+            batch.append(serialized)
+            batch_keys.add(key)
+            with job['lock']:
+                job['read'] += 1
+
+        if batch:
+            yield batch
+
+    def _read_items(self, job):
+        """
+        Itens do arquivo como dicts Python (números como Decimal)
+
+        Linhas em DynamoDB JSON (como as da exportação) mantêm os tipos:
+        sets, binários (base64) e números exatos
+
+        Yields:
+            tuple: (número da linha, item, erro)
+        """
+        key_types = dict(key for key in (job['key_schema']['partition'], job['key_schema']['sort']) if key)
+
+        with open(job['path'], encoding='utf-8-sig', newline='') as source:
+            lines = self._count_bytes(job, source)
+
+            if job['format'] == 'csv':
+                for line_number, row in enumerate(csv.DictReader(lines), start=2):
+                    # Células vazias não viram atributos; chaves numéricas viram Decimal
+                    item = {name: value for name, value in row.items() if name and value not in (None, '')}
+                    try:
+                        for name, attribute_type in key_types.items():
+                            if name in item and attribute_type == 'N':
+                                item[name] = Decimal(item[name])
+                    except ArithmeticError:
+                        yield line_number, None, f'valor numérico inválido na chave {name}'
+                        continue
+                    yield line_number, item, None
+                return
+
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line, parse_float=Decimal)
+                except ValueError:
+                    item = None
+                if not isinstance(item, dict):
+                    yield line_number, None, 'JSON inválido (esperado um objeto por linha)'
+                    continue
+                if is_dynamodb_json(item):
+                    try:
+                        item = {
+                            name: self._deserializer.deserialize(from_dynamodb_json(value))
+                            for name, value in item.items()
+                        }
+                    except (TypeError, ValueError, ArithmeticError):
+                        yield line_number, None, 'DynamoDB JSON inválido'
+                        continue
+                yield line_number, item, None
+
+    def _count_bytes(self, job, source):
+        """
+        Linhas do arquivo, contando os bytes lidos para o progresso
+        """
+        for line in source:
+            job['bytes'] += len(line.encode('utf-8'))
+            yield line
+
+    def _write_loop(self, job, batches, bucket):
+        """
+        Um escritor: grava os lotes da fila até receber o sinal de fim
+        """
+        while True:
+            batch = batches.get()
+            if batch is None:
+                return
+            if job['cancelled']:
+                continue
+
+            try:
+                self._write_batch(job, batch, bucket)
+            except Exception as e:
+                with job['lock']:
+                    job['failed'] += len(batch)
+                    self._error(job, str(e))
+
+    def _write_batch(self, job, requests, bucket):
+        """
+        BatchWriteItem com retry (backoff exponencial com jitter) dos UnprocessedItems e throttlings
+        """
+        requests = [{'PutRequest': {'Item': item}} for item in requests]
+        attempt = 0
+
+        while requests and not job['cancelled']:
+            if bucket:
+                bucket.acquire(sum(self._write_units(request['PutRequest']['Item']) for request in requests))
+
+            try:
+                response = self.dynamodb_client.batch_write_item(
+                    RequestItems={job['table_name']: requests},
+                    ReturnConsumedCapacity='TOTAL'
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] not in THROTTLE_ERROR_CODES:
+                    raise
+                unprocessed = requests
+                with job['lock']:
+                    job['throttled'] += 1
+            else:
+                unprocessed = response.get('UnprocessedItems', {}).get(job['table_name'], [])
+                capacity = sum(item.get('CapacityUnits', 0) for item in response.get('ConsumedCapacity', []))
+                with job['lock']:
+                    job['batches'] += 1
+                    job['written'] += len(requests) - len(unprocessed)
+                    job['capacity'] += capacity
+
+            requests = unprocessed
+            if not requests:
+                return
+
+            attempt += 1
+            if attempt > self.max_retries:
+                with job['lock']:
+                    job['failed'] += len(requests)
+                    self._error(job, f'{len(requests)} itens não processados após {self.max_retries} tentativas')
+                return
+
+            with job['lock']:
+                job['retries'] += 1
+            # Full jitter: espera aleatória até 50 ms * 2^tentativa (máx. 10 s)
+            time.sleep(random.uniform(0, min(10.0, 0.05 * 2 ** attempt)))
+
+    def _write_units(self, item):
+        """
+        WCUs estimadas de um item (1 por KB, arredondado para cima)
+        """
+        size = sum(len(name) + len(json.dumps(value, default=str)) for name, value in item.items())
+        return max(1, math.ceil(size / 1024))
+
+    # ==================== EXPORTAÇÃO ====================
+
+    def _run_export(self, job):
+        """
+        Scan paralelo gravando cada página no arquivo conforme chega
+        """
+        writer = _ParquetWriter(job['path']) if job['format'] == 'parquet' else None
+        status, message = 'completed', None
+
+        try:
+            with open(job['path'], 'w', encoding='utf-8') if not writer else nullcontext() as output:
+                events = self.items.iter_scan(
+                    job['table_name'],
+                    job['segments'],
+                    job['projection'],
+                    max_items=None,
+                    capacity_rate=job['max_rcu'],
+                    raw=True
+                )
+                try:
+                    for event in events:
+                        if job['cancelled']:
+                            status = 'cancelled'
+                            break
+
+                        if event['type'] == 'items':
+                            if writer:
+                                writer.write(event['items'])
+                            else:
+                                output.write(''.join(
+                                    json.dumps(
+                                        {name: to_dynamodb_json(value) for name, value in item.items()},
+                                        ensure_ascii=False
+                                    ) + '\n'
+                                    for item in event['items']
+                                ))
+                            with job['lock']:
+                                job['read'] += len(event['items'])
+                                job['written'] += len(event['items'])
+                                job['capacity'] = event['stats']['consumed_capacity']
+                                job['batches'] = event['stats']['pages']
+                        elif not event['success']:
+                            status, message = 'failed', event['message']
+                finally:
+                    # Encerra os workers do scan se o job foi cancelado
+                    events.close()
+
+        except ClientError as e:
+            status, message = 'failed', e.response['Error']['Message']
+        except Exception as e:
+            status, message = 'failed', str(e)
+        finally:
+            if writer:
+                writer.close()
+
+        with job['lock']:
+            job['bytes'] = os.path.getsize(job['path'])
+
+        self._finish(job, status, message)
+
+    # ==================== AUXILIARES ====================
+
+    def _snapshot(self, job):
+        """
+        Estado do job para a API (sem os campos internos)
+        """
+        with job['lock']:
+            elapsed = job['elapsed'] if job['elapsed'] is not None else time.perf_counter() - job['started']
+
+            snapshot = {
+                'id': job['id'],
+                'kind': job['kind'],
+                'table_name': job['table_name'],
+                'format': job['format'],
+                'status': job['status'],
+                'message': job['message'],
+                'errors': list(job['errors']),
+                'read': job['read'],
+                'invalid': job['invalid'],
+                'written': job['written'],
+                'failed': job['failed'],
+                'batches': job['batches'],
+                'retries': job['retries'],
+                'throttled': job['throttled'],
+                'consumed_capacity': round(job['capacity'], 2),
+                'bytes': job['bytes'],
+                'elapsed_seconds': round(elapsed, 3),
+                'items_per_second': round(job['written'] / elapsed, 1) if elapsed else 0,
+                'finished': job['finished']
+            }
+
+            if job['kind'] == self.IMPORT:
+                snapshot.update(writers=job['writers'], max_wcu=job['max_wcu'], file_bytes=job['file_bytes'])
+            else:
+                snapshot.update(segments=job['segments'], max_rcu=job['max_rcu'])
+
+            return snapshot
+
+
+class _ParquetWriter:
+    """
+    Grava itens tipados (como vêm da API) em Parquet em grupos de linhas, sem
+    manter a tabela em memória
+
+    O schema vem do primeiro grupo e segue o tipo do DynamoDB: BOOL -> bool,
+    S -> string, B -> binary, N -> int64 (inteiros) ou decimal128 (escala
+    exata). Sets, listas, mapas e colunas com tipos misturados viram strings
+    em DynamoDB JSON (metadado dynamodb_json na coluna). Atributos que
+    aparecem depois, NULL ou valores que não cabem na coluna vão para a coluna
+    _extra (DynamoDB JSON) em vez de serem perdidos.
+    """
+
+    ROW_GROUP_SIZE = 10000
+    DECIMAL_PRECISION = 38
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = []
+        self.schema = None
+        self.writer = None
+
+    def write(self, items):
+        self.rows.extend(items)
+        if len(self.rows) >= self.ROW_GROUP_SIZE:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        if self.writer:
+            self.writer.close()
+        elif self.schema is None:
+            # Tabela vazia: arquivo válido só com a coluna _extra
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            pq.write_table(pa.table({'_extra': pa.array([], pa.string())}), self.path)
+
+    def _flush(self):
+        if not self.rows:
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.schema is None:
+            self.schema = pa.schema(
+                [self._field(name) for name in self._names()] + [('_extra', pa.string())]
+            )
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+
+        columns = {field.name: [] for field in self.schema}
+        for item in self.rows:
+            extra = {}
+            for field in self.schema:
+                if field.name == '_extra':
+                    continue
+                value = item.get(field.name)
+                converted = self._convert(value, field)
+                if value is not None and converted is None:
+                    extra[field.name] = to_dynamodb_json(value)
+                columns[field.name].append(converted)
+            extra.update({name: to_dynamodb_json(value) for name, value in item.items() if name not in columns})
+            columns['_extra'].append(json.dumps(extra, ensure_ascii=False) if extra else None)
+
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+        self.rows = []
+
+    def _names(self):
+        names = {}
+        for item in self.rows:
+            for name in item:
+                names.setdefault(name, None)
+        return [name for name in names if name != '_extra']
+
+    def _field(self, name):
+        """
+        Coluna de um atributo conforme os tipos do DynamoDB vistos no primeiro grupo
+        """
+        import pyarrow as pa
+
+        values = [item[name] for item in self.rows if name in item]
+        kinds = {next(iter(value)) for value in values}
+
+        if kinds == {'BOOL'}:
+            return pa.field(name, pa.bool_())
+        if kinds == {'S'}:
+            return pa.field(name, pa.string())
+        if kinds == {'B'}:
+            return pa.field(name, pa.binary())
+        if kinds == {'N'}:
+            numbers = [Decimal(value['N']) for value in values]
+            if all(number == number.to_integral_value() and -2 ** 63 <= number < 2 ** 63 for number in numbers):
+                return pa.field(name, pa.int64())
+
+            scale = max(max(0, -number.as_tuple().exponent) for number in numbers)
+            if all(self._integer_digits(number) + scale <= self.DECIMAL_PRECISION for number in numbers):
+                return pa.field(name, pa.decimal128(self.DECIMAL_PRECISION, scale))
+
+        return pa.field(name, pa.string(), metadata={'dynamodb_json': 'true'})
+
+    def _integer_digits(self, number):
+        sign, digits, exponent = number.as_tuple()
+        return max(len(digits) + exponent, 0)
+
+    def _convert(self, value, field):
+        """
+        Valor no tipo da coluna (None se não couber)
+        """
+        import pyarrow as pa
+
+        if value is None:
+            return None
+        if field.metadata:
+            return json.dumps(to_dynamodb_json(value), ensure_ascii=False)
+
+        (kind, data), = value.items()
+
+        if field.type == pa.bool_():
+            return data if kind == 'BOOL' else None
+        if field.type == pa.string():
+            return data if kind == 'S' else None
+        if field.type == pa.binary():
+            return bytes(data) if kind == 'B' else None
+        if kind != 'N':
+            return None
+
+        number = Decimal(data)
+        if field.type == pa.int64():
+            integral = number == number.to_integral_value() and -2 ** 63 <= number < 2 ** 63
+            return int(number) if integral else None
+
+        # decimal128: só se couber sem arredondar
+        if -number.as_tuple().exponent > field.type.scale:
+            return None
+        if self._integer_digits(number) + field.type.scale > field.type.precision:
+            return None
+        return number
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_dynamodb_transfer_service():
+    """
+    Retorna o serviço compartilhado pela aplicação (os jobs ficam em memória)
+
+    Returns:
+        DynamoDBTransferService: Instância única do serviço
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = DynamoDBTransferService()
+        return _default_service
@@ -1,12 +1,38 @@
-import boto3
 from boto3 import Session
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, WaiterError
 import os
 import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client, create_resource
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Parâmetros públicos do SSM com a AMI mais recente do Amazon Linux 2 (SSM Agent pré-instalado)
+BASTION_AMI_PARAMETERS = {
+    'x86_64': '/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-x86_64-gp2',
+    'arm64': '/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-arm64-gp2'
+}
+
+SSM_ROLE_NAME = 'EC2-SSM-Role'
+SSM_INSTANCE_PROFILE_NAME = 'EC2-SSM-InstanceProfile'
+
+# Compartilhados por todas as instâncias do service (o controller de EC2 e o
+# de consultas criam instâncias próprias)
+_ami_cache = {}
+_ssm_profile_checked = False
+_bastion_status_cache = {}
+_cache_lock = threading.Lock()
+
+# Máximo de IDs aceitos pelo filtro InstanceIds do describe_instance_information
+SSM_INSTANCE_ID_CHUNK = 50
+
 
 class EC2Service:
     """
@@ -22,14 +48,26 @@ class EC2Service:
         session = Session()
         
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.ec2_client = session.client(
+        self.ec2_client = create_client(
             'ec2',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
-        self.ec2_resource = session.resource(
+        self.ec2_resource = create_resource(
             'ec2',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
+        )
+        self.ssm_client = create_client(
+            'ssm',
+            region_name=self.aws_region,
+            session=session
         )
+        self.iam_client = create_client('iam', session=session)
+
+        self.ami_cache_ttl = float(os.getenv('EC2_AMI_CACHE_TTL', 3600))
+        self.iam_propagation_timeout = float(os.getenv('EC2_IAM_PROPAGATION_TIMEOUT', 60))
+        self.ssm_status_ttl = float(os.getenv('EC2_SSM_STATUS_TTL', 30))
     
     def list_instances(self):
         """
@@ -99,8 +137,147 @@ class EC2Service:
                 'message': f'Erro inesperado: {str(e)}'
             }
     
+    def get_bastion_ssm_status(self, refresh=False):
+        """
+        Visão em lote dos Bastion Hosts com o status do SSM Agent
+
+        Junta describe_instances (filtrado pela tag Type=Bastion, paginado)
+        com describe_instance_information (paginado, em lotes de até 50 IDs).
+        O resultado fica em cache por EC2_SSM_STATUS_TTL segundos: o SSM
+        Agent envia ping a cada ~5 minutos, então consultas mais frequentes
+        não trazem informação nova.
+
+        Args:
+            refresh (bool): Ignora o cache
+
+        Returns:
+            dict: Bastions com status do SSM ou erro
+        """
+        now = time.monotonic()
+
+        with _cache_lock:
+            entry = _bastion_status_cache.get(self.aws_region)
+            if entry and not refresh and now < entry['expires_at']:
+                return self._with_ping_age(entry['result'], cached=True, age_seconds=round(now - entry['fetched_at'], 1))
+
+        try:
+            started = time.perf_counter()
+
+            instances = []
+            paginator = self.ec2_client.get_paginator('describe_instances')
+            for page in paginator.paginate(Filters=[
+                {'Name': 'tag:Type', 'Values': ['Bastion']},
+                {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
+            ]):
+                for reservation in page.get('Reservations', []):
+                    instances.extend(reservation.get('Instances', []))
+
+            # Só instâncias ligadas podem ter o agent online
+            running_ids = [instance['InstanceId'] for instance in instances if instance['State']['Name'] == 'running']
+            information = {}
+            api_calls = 0
+
+            paginator = self.ssm_client.get_paginator('describe_instance_information')
+            for i in range(0, len(running_ids), SSM_INSTANCE_ID_CHUNK):
+                chunk = running_ids[i:i + SSM_INSTANCE_ID_CHUNK]
+                for page in paginator.paginate(
+                    Filters=[{'Key': 'InstanceIds', 'Values': chunk}],
+                    PaginationConfig={'PageSize': SSM_INSTANCE_ID_CHUNK}
+                ):
+                    api_calls += 1
+                    for item in page.get('InstanceInformationList', []):
+                        information[item['InstanceId']] = item
+
+            bastions = [self._bastion_status(instance, information.get(instance['InstanceId'])) for instance in instances]
+            # Saudáveis primeiro; entre eles, o ping mais recente
+            bastions.sort(key=lambda bastion: (not bastion['healthy'], bastion['last_ping_seconds'] is None,
+                                               bastion['last_ping_seconds'] or 0))
+
+            result = {
+                'success': True,
+                'bastions': bastions,
+                'count': len(bastions),
+                'online': sum(1 for bastion in bastions if bastion['healthy']),
+                'ssm_api_calls': api_calls,
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+            }
+
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao consultar status do SSM: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro inesperado: {str(e)}'
+            }
+
+        with _cache_lock:
+            _bastion_status_cache[self.aws_region] = {
+                'result': result,
+                'fetched_at': now,
+                'expires_at': now + self.ssm_status_ttl
+            }
+
+        return self._with_ping_age(result, cached=False, age_seconds=0)
+
+    @staticmethod
+    def _with_ping_age(result, **extra):
+        """
+        Cópia do resultado com last_ping_seconds calculado agora (o cache
+        guarda o horário do ping, não a idade)
+        """
+        now = time.time()
+        bastions = [
+            dict(bastion, last_ping_seconds=(
+                round(now - datetime.fromisoformat(bastion['last_ping']).timestamp()) if bastion['last_ping'] else None
+            ))
+            for bastion in result['bastions']
+        ]
+
+        return dict(result, bastions=bastions, **extra)
+
+    def invalidate_bastion_ssm_status(self):
+        """
+        Descarta o status em cache (ex: após iniciar, parar ou terminar instâncias)
+        """
+        with _cache_lock:
+            _bastion_status_cache.pop(self.aws_region, None)
+
+    @staticmethod
+    def _bastion_status(instance, information):
+        """
+        Combina a instância com o registro do SSM Agent
+        """
+        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
+        state = instance['State']['Name']
+        ping_status = information.get('PingStatus') if information else None
+        last_ping = information.get('LastPingDateTime') if information else None
+
+        if ping_status == 'Online':
+            ssm_status = 'online'
+        elif information:
+            ssm_status = 'offline'
+        else:
+            ssm_status = 'unregistered'
+
+        return {
+            'instance_id': instance['InstanceId'],
+            'name': tags.get('Name', 'N/A'),
+            'state': state,
+            'private_ip': instance.get('PrivateIpAddress', 'N/A'),
+            'instance_type': instance.get('InstanceType'),
+            'ssm_status': ssm_status,
+            'ping_status': ping_status,
+            'last_ping': last_ping.isoformat() if last_ping else None,
+            'last_ping_seconds': round(time.time() - last_ping.timestamp()) if last_ping else None,
+            'agent_version': information.get('AgentVersion') if information else None,
+            'healthy': state == 'running' and ping_status == 'Online'
+        }
+
     def create_bastion_instance(self, name, instance_type='t3.micro', key_name=None, 
-                               subnet_id=None, security_group_ids=None):
+                               subnet_id=None, security_group_ids=None, progress=None):
         """
         Cria uma instância EC2 configurada como Bastion Host com SSM
         
@@ -110,32 +287,18 @@ class EC2Service:
             key_name (str): Nome do key pair (opcional)
             subnet_id (str): ID da subnet (opcional)
             security_group_ids (list): IDs dos security groups (opcional)
+            progress (callable): Recebe (etapa, detalhes) ao concluir cada etapa (opcional)
         
         Returns:
             dict: Resultado da operação
         """
+        progress = progress or (lambda step, details: None)
+
         try:
-            # AMI do Amazon Linux 2 (com SSM Agent pré-instalado)
-            # Busca a AMI mais recente do Amazon Linux 2
-            ami_response = self.ec2_client.describe_images(
-                Owners=['amazon'],
-                Filters=[
-                    {'Name': 'name', 'Values': ['amzn2-ami-hvm-*-x86_64-gp2']},
-                    {'Name': 'state', 'Values': ['available']}
-                ]
-            )
-            
-            if not ami_response['Images']:
-                return {
-                    'success': False,
-                    'message': 'Nenhuma AMI do Amazon Linux 2 encontrada'
-                }
-            
-            # Ordena por data de criação e pega a mais recente
-            latest_ami = sorted(ami_response['Images'], 
-                              key=lambda x: x['CreationDate'], 
-                              reverse=True)[0]
-            ami_id = latest_ami['ImageId']
+            # AMI do Amazon Linux 2 na arquitetura do tipo de instância
+            architecture = self.instance_architecture(instance_type)
+            ami_id, cached = self.get_latest_bastion_ami(architecture)
+            progress('ami', {'ami_id': ami_id, 'architecture': architecture, 'cached': cached})
             
             # User data para configurar o bastion
             user_data = """#!/bin/bash
@@ -155,6 +318,7 @@ hostnamectl set-hostname bastion-host
             
             # Cria ou obtém IAM Role para SSM
             iam_instance_profile = self._get_or_create_ssm_role()
+            progress('iam', {'instance_profile': iam_instance_profile})
             
             # Parâmetros da instância
             params = {
@@ -182,10 +346,9 @@ hostnamectl set-hostname bastion-host
             # Adiciona IAM Instance Profile se foi criado
             if iam_instance_profile:
                 params['IamInstanceProfile'] = {'Name': iam_instance_profile}
-                print(f"✅ Usando Instance Profile: {iam_instance_profile}")
             else:
-                print(f"⚠️  Instância será criada SEM IAM Role")
-                print(f"💡 Você precisará anexar manualmente o Instance Profile 'EC2-SSM-InstanceProfile' depois")
+                logger.warning("Bastion %s será criado SEM IAM Role: anexe o Instance Profile '%s' depois",
+                               name, SSM_INSTANCE_PROFILE_NAME)
             
             # Adiciona key pair se fornecido
             if key_name:
@@ -199,14 +362,17 @@ hostnamectl set-hostname bastion-host
             if security_group_ids:
                 params['SecurityGroupIds'] = security_group_ids
             
-            response = self.ec2_client.run_instances(**params)
+            response = self._run_instances_with_profile(params)
             instance = response['Instances'][0]
+            progress('launch', {'instance_id': instance['InstanceId']})
             
             return {
                 'success': True,
                 'message': f'Bastion Host {name} criado com sucesso',
                 'instance': instance,
-                'instance_id': instance['InstanceId']
+                'instance_id': instance['InstanceId'],
+                'ami_id': ami_id,
+                'instance_profile': iam_instance_profile
             }
             
         except ClientError as e:
@@ -219,6 +385,73 @@ hostnamectl set-hostname bastion-host
                 'success': False,
                 'message': f'Erro inesperado: {str(e)}'
             }
+
+    @staticmethod
+    def instance_architecture(instance_type):
+        """
+        Arquitetura do tipo de instância (famílias Graviton têm "g" após a geração: t4g, m6gd, c7gn)
+        """
+        family = instance_type.split('.')[0]
+        return 'arm64' if re.match(r'^[a-z]+\d+[a-z]*g', family) else 'x86_64'
+
+    def get_latest_bastion_ami(self, architecture='x86_64'):
+        """
+        Resolve a AMI mais recente do Amazon Linux 2 pelo parâmetro público do SSM
+
+        Uma única chamada GetParameter substitui o describe_images com todas as
+        AMIs do Amazon Linux 2; o ID fica em cache por EC2_AMI_CACHE_TTL segundos.
+
+        Args:
+            architecture (str): x86_64 ou arm64
+
+        Returns:
+            tuple: (ID da AMI, se veio do cache)
+        """
+        key = (self.aws_region, architecture)
+
+        with _cache_lock:
+            entry = _ami_cache.get(key)
+            if entry and time.monotonic() < entry['expires_at']:
+                return entry['ami_id'], True
+
+        response = self.ssm_client.get_parameter(Name=BASTION_AMI_PARAMETERS[architecture])
+        ami_id = response['Parameter']['Value']
+
+        with _cache_lock:
+            _ami_cache[key] = {'ami_id': ami_id, 'expires_at': time.monotonic() + self.ami_cache_ttl}
+
+        return ami_id, False
+
+    def _run_instances_with_profile(self, params):
+        """
+        Executa run_instances repetindo enquanto o instance profile não propagou para o EC2
+
+        Um profile recém-criado pode levar alguns segundos para ser aceito
+        (InvalidParameterValue); em vez de uma espera fixa, repete com backoff
+        até EC2_IAM_PROPAGATION_TIMEOUT segundos.
+        """
+        global _ssm_profile_checked
+
+        deadline = time.monotonic() + self.iam_propagation_timeout
+        delay = 1
+
+        while True:
+            try:
+                return self.ec2_client.run_instances(**params)
+            except ClientError as e:
+                error = e.response['Error']
+                if 'IamInstanceProfile' not in params or error['Code'] != 'InvalidParameterValue' \
+                        or 'iam' not in error['Message'].lower():
+                    raise
+                if time.monotonic() + delay > deadline:
+                    # O profile pode ter sido removido: a próxima criação verifica de novo
+                    with _cache_lock:
+                        _ssm_profile_checked = False
+                    raise
+
+            logger.info('Instance profile ainda propagando, nova tentativa em %ss', delay)
+            time.sleep(delay)
+            delay = min(delay * 2, 8)
     
     def create_instance(self, name, ami_id, instance_type, key_name=None, 
                        subnet_id=None, security_group_ids=None, user_data=None):
@@ -296,6 +529,7 @@ hostnamectl set-hostname bastion-host
         """
         try:
             response = self.ec2_client.start_instances(InstanceIds=[instance_id])
+            self.invalidate_bastion_ssm_status()
             
             return {
                 'success': True,
@@ -326,6 +560,7 @@ hostnamectl set-hostname bastion-host
         """
         try:
             response = self.ec2_client.stop_instances(InstanceIds=[instance_id])
+            self.invalidate_bastion_ssm_status()
             
             return {
                 'success': True,
@@ -356,6 +591,7 @@ hostnamectl set-hostname bastion-host
         """
         try:
             response = self.ec2_client.terminate_instances(InstanceIds=[instance_id])
+            self.invalidate_bastion_ssm_status()
             
             return {
                 'success': True,
@@ -400,29 +636,37 @@ hostnamectl set-hostname bastion-host
         """
         Obtém ou cria uma IAM Role para SSM
         
+        A verificação é memoizada: depois que o instance profile existe com a
+        role anexada, as próximas criações não consultam o IAM. As esperas
+        usam os waiters do IAM em vez de pausas fixas.
+        
         Returns:
             str: Nome do instance profile ou None
         """
-        import time
-        
+        global _ssm_profile_checked
+
+        with _cache_lock:
+            if _ssm_profile_checked:
+                return SSM_INSTANCE_PROFILE_NAME
+
+        waiter_config = {'Delay': 1, 'MaxAttempts': 30}
+
         try:
-            iam_client = boto3.client('iam')
-            
-            role_name = 'EC2-SSM-Role'
-            instance_profile_name = 'EC2-SSM-InstanceProfile'
-            
             # Tenta obter o instance profile existente
             try:
-                response = iam_client.get_instance_profile(InstanceProfileName=instance_profile_name)
+                response = self.iam_client.get_instance_profile(InstanceProfileName=SSM_INSTANCE_PROFILE_NAME)
                 # Verifica se tem a role anexada
                 if response['InstanceProfile'].get('Roles'):
-                    print(f"✅ Instance Profile '{instance_profile_name}' já existe")
-                    return instance_profile_name
+                    with _cache_lock:
+                        _ssm_profile_checked = True
+                    return SSM_INSTANCE_PROFILE_NAME
+                profile_exists = True
             except ClientError as e:
                 if e.response['Error']['Code'] != 'NoSuchEntity':
                     raise
+                profile_exists = False
             
-            print(f"🔧 Criando IAM Role e Instance Profile para SSM...")
+            logger.info('Criando IAM Role e Instance Profile para SSM')
             
             # Cria a role se não existir
             trust_policy = {
@@ -435,70 +679,50 @@ hostnamectl set-hostname bastion-host
             }
             
             try:
-                iam_client.create_role(
-                    RoleName=role_name,
+                self.iam_client.create_role(
+                    RoleName=SSM_ROLE_NAME,
                     AssumeRolePolicyDocument=json.dumps(trust_policy),
                     Description='Role for EC2 instances to use SSM Session Manager'
                 )
-                print(f"✅ Role '{role_name}' criada")
-                
-                # Aguarda a role ser criada
-                time.sleep(2)
-                
-                # Anexa a policy gerenciada do SSM
-                iam_client.attach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn='arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore'
-                )
-                print(f"✅ Policy SSM anexada à role")
-                
+                self.iam_client.get_waiter('role_exists').wait(RoleName=SSM_ROLE_NAME, WaiterConfig=waiter_config)
             except ClientError as e:
-                if e.response['Error']['Code'] == 'EntityAlreadyExists':
-                    print(f"ℹ️  Role '{role_name}' já existe")
-                else:
+                if e.response['Error']['Code'] != 'EntityAlreadyExists':
                     raise
+
+            # Anexa a policy gerenciada do SSM (idempotente)
+            self.iam_client.attach_role_policy(
+                RoleName=SSM_ROLE_NAME,
+                PolicyArn='arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore'
+            )
             
             # Cria o instance profile
+            if not profile_exists:
+                try:
+                    self.iam_client.create_instance_profile(InstanceProfileName=SSM_INSTANCE_PROFILE_NAME)
+                    self.iam_client.get_waiter('instance_profile_exists').wait(
+                        InstanceProfileName=SSM_INSTANCE_PROFILE_NAME, WaiterConfig=waiter_config
+                    )
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'EntityAlreadyExists':
+                        raise
+            
+            # Adiciona a role ao instance profile (a propagação para o EC2 é
+            # tratada com retry em _run_instances_with_profile)
             try:
-                iam_client.create_instance_profile(
-                    InstanceProfileName=instance_profile_name
-                )
-                print(f"✅ Instance Profile '{instance_profile_name}' criado")
-                
-                # Aguarda o instance profile ser criado
-                time.sleep(2)
-                
-                # Adiciona a role ao instance profile
-                iam_client.add_role_to_instance_profile(
-                    InstanceProfileName=instance_profile_name,
-                    RoleName=role_name
+                self.iam_client.add_role_to_instance_profile(
+                    InstanceProfileName=SSM_INSTANCE_PROFILE_NAME,
+                    RoleName=SSM_ROLE_NAME
                 )
-                print(f"✅ Role adicionada ao Instance Profile")
-                
-                # Aguarda propagação (importante!)
-                print(f"⏳ Aguardando propagação do IAM (10 segundos)...")
-                time.sleep(10)
-                
             except ClientError as e:
-                if e.response['Error']['Code'] == 'EntityAlreadyExists':
-                    print(f"ℹ️  Instance Profile '{instance_profile_name}' já existe")
-                    # Tenta adicionar a role se não estiver
-                    try:
-                        iam_client.add_role_to_instance_profile(
-                            InstanceProfileName=instance_profile_name,
-                            RoleName=role_name
-                        )
-                        time.sleep(5)
-                    except:
-                        pass
-                else:
+                if e.response['Error']['Code'] != 'LimitExceeded':
                     raise
+
+            with _cache_lock:
+                _ssm_profile_checked = True
+            return SSM_INSTANCE_PROFILE_NAME
             
-            return instance_profile_name
-            
-        except Exception as e:
-            print(f"⚠️  Aviso: Não foi possível criar IAM Role: {str(e)}")
-            print(f"💡 Dica: Crie manualmente ou verifique permissões IAM")
+        except (ClientError, WaiterError) as e:
+            logger.warning('Não foi possível criar IAM Role para SSM (crie manualmente ou verifique permissões IAM): %s', e)
             return None
     
     def list_available_amis(self, owner='amazon', name_filter='amzn2-ami-hvm*'):
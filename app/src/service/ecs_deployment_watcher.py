@@ -0,0 +1,380 @@
+import logging
+import os
+import queue
+import threading
+import time
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.ecs_service import ECSService
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+def _isoformat(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+class ECSDeploymentWatcher:
+    """
+    Acompanha deployments de serviços ECS e envia só as mudanças aos inscritos
+
+    - Um único poller (describe_services) por serviço, compartilhado por todos
+      os inscritos daquele serviço
+    - Intervalo adaptativo: volta ao mínimo quando algo muda e cresce 1.5x a
+      cada consulta sem mudança, até o máximo
+    - Para sozinho quando o rollout atinge steady state, falha, estoura o
+      tempo máximo ou fica sem inscritos
+    """
+
+    MAX_ERRORS = 3
+
+    def __init__(self, ecs_service=None):
+        """
+        Inicializa o watcher
+        """
+        self.ecs_client = (ecs_service or ECSService()).ecs_client
+
+        self.min_interval = float(os.getenv('ECS_WATCH_MIN_INTERVAL', 2))
+        self.max_interval = float(os.getenv('ECS_WATCH_MAX_INTERVAL', 15))
+        self.max_duration = float(os.getenv('ECS_WATCH_TIMEOUT', 1800))
+
+        self._watches = {}
+        self._lock = threading.Lock()
+
+    # ==================== INSCRIÇÃO ====================
+
+    def watch(self, cluster_name, service_name):
+        """
+        Garante um poller ativo para o serviço (sem inscrever ninguém)
+
+        Returns:
+            dict: Estado do acompanhamento
+        """
+        watch = self._ensure_watch(cluster_name, service_name)
+        return {
+            'success': True,
+            'watch': self._watch_info(watch)
+        }
+
+    def subscribe(self, cluster_name, service_name):
+        """
+        Inscreve um consumidor; recebe primeiro o estado atual completo e depois só as mudanças
+
+        Returns:
+            tuple: (watch, fila de mensagens)
+        """
+        subscriber = queue.Queue()
+
+        with self._lock:
+            watch = self._ensure_watch(cluster_name, service_name, locked=True)
+            watch['subscribers'].add(subscriber)
+            watch['idle_since'] = None
+
+            if watch['service'] is not None:
+                subscriber.put(self._message(watch, 'snapshot', service=watch['service']))
+            if watch['finished']:
+                subscriber.put(self._message(watch, 'finished', reason=watch['reason']))
+
+        return watch, subscriber
+
+    def unsubscribe(self, watch, subscriber):
+        """
+        Remove um consumidor
+        """
+        with self._lock:
+            watch['subscribers'].discard(subscriber)
+            watch['idle_since'] = time.monotonic() if not watch['subscribers'] else None
+
+    def iter_updates(self, cluster_name, service_name, heartbeat=15):
+        """
+        Gera as mensagens do serviço até o acompanhamento terminar (para streaming)
+        """
+        watch, subscriber = self.subscribe(cluster_name, service_name)
+
+        try:
+            while True:
+                try:
+                    message = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield {'type': 'heartbeat'}
+                    continue
+
+                yield message
+
+                if message['type'] == 'finished':
+                    return
+        finally:
+            self.unsubscribe(watch, subscriber)
+
+    def list_watches(self):
+        """
+        Acompanhamentos ativos
+        """
+        with self._lock:
+            watches = [self._watch_info(watch) for watch in self._watches.values()]
+
+        return {
+            'success': True,
+            'watches': watches,
+            'count': len(watches)
+        }
+
+    def _ensure_watch(self, cluster_name, service_name, locked=False):
+        """
+        Retorna o poller do serviço, criando um novo se não houver um ativo
+        """
+        if not locked:
+            with self._lock:
+                return self._ensure_watch(cluster_name, service_name, locked=True)
+
+        key = (cluster_name, service_name)
+        watch = self._watches.get(key)
+
+        if watch is None or watch['finished']:
+            watch = self._watches[key] = {
+                'cluster': cluster_name,
+                'service_name': service_name,
+                'service': None,
+                'deployments': {},
+                'event_ids': set(),
+                'subscribers': set(),
+                'started_at': time.time(),
+                'idle_since': time.monotonic(),
+                'polls': 0,
+                'changes': 0,
+                'interval': self.min_interval,
+                'finished': False,
+                'reason': None
+            }
+            threading.Thread(target=self._poll_loop, args=(watch,), daemon=True).start()
+
+        return watch
+
+    # ==================== POLLING ====================
+
+    def _poll_loop(self, watch):
+        """
+        Consulta o serviço até o rollout terminar
+        """
+        deadline = time.monotonic() + self.max_duration
+        errors = 0
+
+        while True:
+            try:
+                response = self.ecs_client.describe_services(
+                    cluster=watch['cluster'],
+                    services=[watch['service_name']]
+                )
+                errors = 0
+            except ClientError as e:
+                errors += 1
+                logger.warning('Watcher ECS %s/%s: %s', watch['cluster'], watch['service_name'], e)
+                if errors >= self.MAX_ERRORS:
+                    self._finish(watch, 'error', e.response['Error']['Message'])
+                    return
+                time.sleep(watch['interval'])
+                continue
+            except Exception as e:
+                self._finish(watch, 'error', str(e))
+                return
+
+            services = response.get('services', [])
+            if not services:
+                self._finish(watch, 'not_found', 'Serviço não encontrado')
+                return
+
+            watch['polls'] += 1
+            self._apply(watch, services[0])
+
+            state = self._rollout_state(services[0])
+            if state == 'COMPLETED':
+                self._finish(watch, 'completed', 'Serviço em steady state')
+                return
+            if state == 'FAILED':
+                self._finish(watch, 'failed', 'Deployment falhou')
+                return
+            if time.monotonic() > deadline:
+                self._finish(watch, 'timeout', f'Sem steady state em {self.max_duration:g}s')
+                return
+
+            with self._lock:
+                idle_since = watch['idle_since']
+            if idle_since is not None and time.monotonic() - idle_since > self.max_interval * 2:
+                self._finish(watch, 'no_subscribers', 'Sem inscritos')
+                return
+
+            time.sleep(watch['interval'])
+
+    def _apply(self, watch, service):
+        """
+        Compara com a consulta anterior e publica só o que mudou
+        """
+        summary = self._service_summary(service)
+        deployments = {deployment['id']: deployment for deployment in summary.pop('deployments')}
+        first = watch['service'] is None
+
+        changed_deployments = [
+            deployment for deployment_id, deployment in deployments.items()
+            if watch['deployments'].get(deployment_id) != deployment
+        ]
+        removed_deployments = [deployment_id for deployment_id in watch['deployments'] if deployment_id not in deployments]
+
+        # describe_services traz os eventos mais recentes primeiro
+        new_events = [
+            {
+                'id': event.get('id'),
+                'created_at': _isoformat(event.get('createdAt')),
+                'message': event.get('message')
+            }
+            for event in service.get('events', [])
+            if event.get('id') not in watch['event_ids']
+        ]
+        new_events.reverse()
+
+        previous = {key: value for key, value in (watch['service'] or {}).items() if key not in ('deployments', 'events')}
+        changed_fields = {key: value for key, value in summary.items() if previous.get(key) != value}
+
+        with self._lock:
+            watch['deployments'] = deployments
+            watch['event_ids'].update(event['id'] for event in new_events)
+            events = ([] if first else watch['service']['events']) + new_events
+            watch['service'] = dict(summary, deployments=list(deployments.values()), events=events[-20:])
+
+            if first:
+                message = self._message(watch, 'snapshot', service=watch['service'])
+                watch['interval'] = self.min_interval
+            elif changed_deployments or removed_deployments or new_events or changed_fields:
+                watch['changes'] += 1
+                watch['interval'] = self.min_interval
+                message = self._message(
+                    watch,
+                    'update',
+                    fields=changed_fields,
+                    deployments=changed_deployments,
+                    removed_deployments=removed_deployments,
+                    events=new_events
+                )
+            else:
+                watch['interval'] = min(self.max_interval, watch['interval'] * 1.5)
+                message = None
+
+            if message:
+                self._publish(watch, message)
+
+    def _finish(self, watch, reason, detail):
+        """
+        Encerra o acompanhamento e avisa os inscritos
+        """
+        with self._lock:
+            watch['finished'] = True
+            watch['reason'] = reason
+            self._publish(watch, self._message(watch, 'finished', reason=reason, detail=detail))
+
+            if self._watches.get((watch['cluster'], watch['service_name'])) is watch:
+                self._watches.pop((watch['cluster'], watch['service_name']))
+
+    def _publish(self, watch, message):
+        """
+        Envia uma mensagem a todos os inscritos (chamado com o lock adquirido)
+        """
+        for subscriber in watch['subscribers']:
+            subscriber.put(message)
+
+    def _message(self, watch, message_type, **data):
+        """
+        Monta uma mensagem com os metadados do acompanhamento
+        """
+        return dict(data, type=message_type, cluster=watch['cluster'], service_name=watch['service_name'],
+                    polls=watch['polls'], interval=round(watch['interval'], 2))
+
+    def _rollout_state(self, service):
+        """
+        COMPLETED quando só resta o deployment PRIMARY e ele convergiu; FAILED se o rollout falhou
+        """
+        deployments = service.get('deployments', [])
+        primary = next((deployment for deployment in deployments if deployment.get('status') == 'PRIMARY'), None)
+
+        if primary is None:
+            return 'IN_PROGRESS'
+        if primary.get('rolloutState') == 'FAILED':
+            return 'FAILED'
+        if len(deployments) > 1:
+            return 'IN_PROGRESS'
+
+        # rolloutState COMPLETED pode chegar antes das contagens convergirem:
+        # exige também todas as tasks desejadas em execução e nenhuma pendente
+        converged = primary.get('runningCount') == primary.get('desiredCount') and not primary.get('pendingCount')
+
+        if primary.get('rolloutState'):
+            return 'COMPLETED' if primary['rolloutState'] == 'COMPLETED' and converged else 'IN_PROGRESS'
+
+        # Deployment controller sem rolloutState (ex: EXTERNAL): só as contagens
+        return 'COMPLETED' if converged else 'IN_PROGRESS'
+
+    def _service_summary(self, service):
+        """
+        Campos acompanhados do serviço
+        """
+        return {
+            'status': service.get('status'),
+            'desired_count': service.get('desiredCount', 0),
+            'running_count': service.get('runningCount', 0),
+            'pending_count': service.get('pendingCount', 0),
+            'task_definition': service.get('taskDefinition'),
+            'rollout_state': self._rollout_state(service),
+            'deployments': [
+                {
+                    'id': deployment.get('id'),
+                    'status': deployment.get('status'),
+                    'rollout_state': deployment.get('rolloutState'),
+                    'rollout_state_reason': deployment.get('rolloutStateReason'),
+                    'task_definition': deployment.get('taskDefinition'),
+                    'desired_count': deployment.get('desiredCount', 0),
+                    'running_count': deployment.get('runningCount', 0),
+                    'pending_count': deployment.get('pendingCount', 0),
+                    'failed_tasks': deployment.get('failedTasks', 0),
+                    'capacity_provider': ','.join(
+                        strategy.get('capacityProvider', '') for strategy in deployment.get('capacityProviderStrategy', [])
+                    ) or deployment.get('launchType'),
+                    'updated_at': _isoformat(deployment.get('updatedAt'))
+                }
+                for deployment in service.get('deployments', [])
+            ]
+        }
+
+    def _watch_info(self, watch):
+        """
+        Resumo de um acompanhamento
+        """
+        return {
+            'cluster': watch['cluster'],
+            'service_name': watch['service_name'],
+            'subscribers': len(watch['subscribers']),
+            'polls': watch['polls'],
+            'changes': watch['changes'],
+            'interval': round(watch['interval'], 2),
+            'finished': watch['finished'],
+            'reason': watch['reason'],
+            'stream_url': f"/ecs/clusters/{watch['cluster']}/services/{watch['service_name']}/deployment/stream"
+        }
+
+
+_default_watcher = None
+_default_watcher_lock = threading.Lock()
+
+
+def get_ecs_deployment_watcher():
+    """
+    Retorna o watcher compartilhado pela aplicação
+
+    Returns:
+        ECSDeploymentWatcher: Instância única do watcher
+    """
+    global _default_watcher
+
+    with _default_watcher_lock:
+        if _default_watcher is None:
+            _default_watcher = ECSDeploymentWatcher()
+        return _default_watcher
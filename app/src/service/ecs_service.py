@@ -1,8 +1,11 @@
-import boto3
 from boto3 import Session
 from botocore.exceptions import ClientError
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client
+from src.service.task_definition_cache import get_task_definition_cache
 
 load_dotenv()
 
@@ -24,10 +27,14 @@ class ECSService:
         # Se as credenciais estiverem definidas no .env, usa elas
         # Caso contrário, deixa o boto3 usar a cadeia de credenciais padrão
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.ecs_client = session.client(
-           'ecs',
-            region_name=self.aws_region
+        self.ecs_client = create_client(
+            'ecs',
+            region_name=self.aws_region,
+            session=session
         )
+        
+        self.task_definitions = get_task_definition_cache()
+        self.max_workers = int(os.getenv('ECS_MAX_CONCURRENCY', 8))
     
     def list_clusters(self):
         """
@@ -151,6 +158,110 @@ class ECSService:
                 'message': f'Erro inesperado: {str(e)}'
             }
     
+    def get_tasks_deep_view(self, cluster_name, service_name=None, desired_status='RUNNING'):
+        """
+        Busca tasks e suas task definitions em uma única passada
+        
+        - list_tasks paginado (100 ARNs por página)
+        - describe_tasks em lotes de 100 (limite da API), lotes em paralelo
+        - task definitions deduplicadas; só as ausentes do cache LRU são
+          buscadas (describe_task_definition em paralelo, a API não tem versão em lote)
+        
+        Args:
+            cluster_name (str): Nome ou ARN do cluster
+            service_name (str, optional): Nome do serviço para filtrar tasks
+            desired_status (str): RUNNING, PENDING ou STOPPED
+        
+        Returns:
+            dict: Tasks, task definitions por ARN e tempo de cada fase
+        """
+        try:
+            timing = {}
+            api_calls = {}
+            
+            # Fase 1: ARNs das tasks
+            started = time.perf_counter()
+            params = {'cluster': cluster_name, 'desiredStatus': desired_status}
+            if service_name:
+                params['serviceName'] = service_name
+            
+            task_arns = []
+            api_calls['list_tasks'] = 0
+            for page in self.ecs_client.get_paginator('list_tasks').paginate(**params, PaginationConfig={'PageSize': 100}):
+                task_arns.extend(page.get('taskArns', []))
+                api_calls['list_tasks'] += 1
+            timing['list_tasks_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            
+            # Fase 2: detalhes das tasks em lotes de 100
+            started = time.perf_counter()
+            chunks = [task_arns[i:i + 100] for i in range(0, len(task_arns), 100)]
+            tasks = []
+            failures = []
+            
+            if chunks:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                    responses = executor.map(
+                        lambda chunk: self.ecs_client.describe_tasks(cluster=cluster_name, tasks=chunk),
+                        chunks
+                    )
+                    for response in responses:
+                        tasks.extend(response.get('tasks', []))
+                        failures.extend(response.get('failures', []))
+            api_calls['describe_tasks'] = len(chunks)
+            timing['describe_tasks_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            
+            # Fase 3: task definitions distintas (cache LRU + busca das ausentes)
+            started = time.perf_counter()
+            arns = list(dict.fromkeys(task['taskDefinitionArn'] for task in tasks if task.get('taskDefinitionArn')))
+            task_definitions, missing = self.task_definitions.get_many(arns)
+            
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                    for arn, task_definition in zip(missing, executor.map(self._describe_task_definition, missing)):
+                        if task_definition is not None:
+                            self.task_definitions.store(arn, task_definition)
+                            task_definitions[arn] = task_definition
+            api_calls['describe_task_definition'] = len(missing)
+            timing['describe_task_definitions_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            
+            return {
+                'success': True,
+                'tasks': tasks,
+                'failures': failures,
+                'task_definitions': task_definitions,
+                'timing': timing,
+                'api_calls': api_calls,
+                'task_definition_stats': {
+                    'unique': len(arns),
+                    'cached': len(arns) - len(missing),
+                    'fetched': len(missing)
+                },
+                'cache': self.task_definitions.get_stats()
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao listar tasks: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro inesperado: {str(e)}'
+            }
+    
+    def _describe_task_definition(self, task_definition_arn):
+        """
+        Busca uma task definition (None se não existir mais)
+        """
+        try:
+            response = self.ecs_client.describe_task_definition(taskDefinition=task_definition_arn)
+            return response.get('taskDefinition')
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('ClientException', 'InvalidParameterException'):
+                return None
+            raise
+    
     def get_cluster_details(self, cluster_name):
         """
         Obtém detalhes de um cluster específico
@@ -0,0 +1,266 @@
+import os
+import socket
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Timing da request em andamento na thread atual (preenchido pelas conexões)
+_timing_context = threading.local()
+
+
+def _current_timing():
+    """
+    Retorna o dicionário de timing da request em andamento na thread atual
+    """
+    return getattr(_timing_context, 'timing', None)
+
+
+class _TimedConnectionMixin:
+    """
+    Mede a resolução DNS e a conexão TCP de cada nova conexão do pool
+    """
+
+    def _new_conn(self):
+        timing = _current_timing()
+        if timing is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        started = time.perf_counter()
+
+        # Resolve o host separadamente para medir o DNS sem resolver duas vezes
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            addresses = []  # Deixa o urllib3 gerar o erro de resolução
+
+        resolved = time.perf_counter()
+
+        if addresses:
+            self._dns_host = addresses[0][4][0]
+
+        try:
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+
+        timing['dns'] += resolved - started
+        timing['connect'] += time.perf_counter() - resolved
+        timing['new_connections'] += 1
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+
+    def connect(self):
+        timing = _current_timing()
+        if timing is None:
+            return super().connect()
+
+        # connect() = _new_conn() (DNS + TCP) + handshake TLS
+        before = timing['dns'] + timing['connect']
+        started = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - started
+
+        timing['tls'] += max(elapsed - (timing['dns'] + timing['connect'] - before), 0.0)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter que usa conexões instrumentadas para medir cada fase
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+
+class HTTPClientPool:
+    """
+    Pool de sessões HTTP reutilizáveis (keep-alive) agrupadas por base URL
+
+    Cada base URL (scheme://host:porta) ganha sua própria requests.Session com
+    pool de conexões e retries configuráveis via variáveis de ambiente:
+
+    - HTTP_POOL_CONNECTIONS: hosts mantidos em cache por sessão (padrão 10)
+    - HTTP_POOL_MAXSIZE: conexões simultâneas por host (padrão 20)
+    - HTTP_MAX_RETRIES: retries em falhas de conexão e 502/503/504 (padrão 2)
+    - HTTP_RETRY_BACKOFF: fator de backoff exponencial em segundos (padrão 0.3)
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, max_retries=None, backoff_factor=None):
+        """
+        Inicializa o pool (as sessões são criadas sob demanda)
+        """
+        self.pool_connections = pool_connections or int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+        self.pool_maxsize = pool_maxsize or int(os.getenv('HTTP_POOL_MAXSIZE', 20))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('HTTP_MAX_RETRIES', 2))
+        self.backoff_factor = backoff_factor if backoff_factor is not None else float(os.getenv('HTTP_RETRY_BACKOFF', 0.3))
+
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, url):
+        """
+        Obtém (ou cria) a sessão responsável pela base URL informada
+
+        Args:
+            url (str): URL completa ou base URL
+
+        Returns:
+            requests.Session: Sessão compartilhada da base URL
+        """
+        key = self._pool_key(url)
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[key] = session
+            return session
+
+    def request(self, method, url, timeout=30, **kwargs):
+        """
+        Executa uma request reutilizando as conexões da base URL
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL completa
+            timeout (int): Timeout em segundos
+            **kwargs: Argumentos repassados ao requests (headers, params, json, data...)
+
+        Returns:
+            tuple: (requests.Response, dict com timing em segundos por fase)
+        """
+        session = self.get_session(url)
+
+        timing = {
+            'dns': 0.0,
+            'connect': 0.0,
+            'tls': 0.0,
+            'ttfb': 0.0,
+            'transfer': 0.0,
+            'total': 0.0,
+            'new_connections': 0
+        }
+
+        _timing_context.timing = timing
+        started = time.perf_counter()
+
+        try:
+            # stream=True devolve o controle ao receber os headers (TTFB)
+            response = session.request(method=method, url=url, timeout=timeout, stream=True, **kwargs)
+            headers_received = time.perf_counter()
+
+            try:
+                response.content  # Lê o body (transferência)
+            except Exception:
+                response.close()
+                raise
+        finally:
+            _timing_context.timing = None
+
+        finished = time.perf_counter()
+
+        setup = timing['dns'] + timing['connect'] + timing['tls']
+        timing['ttfb'] = max(headers_received - started - setup, 0.0)
+        timing['transfer'] = finished - headers_received
+        timing['total'] = finished - started
+
+        for phase in ('dns', 'connect', 'tls', 'ttfb', 'transfer', 'total'):
+            timing[phase] = round(timing[phase], 4)
+
+        timing['reused_connection'] = timing['new_connections'] == 0
+
+        return response, timing
+
+    def close(self):
+        """
+        Fecha todas as sessões e conexões abertas
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _create_session(self):
+        """
+        Cria uma sessão com pool de conexões e política de retries
+        """
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,  # Não repete POST/PATCH
+            raise_on_status=False
+        )
+
+        adapter = _TimedHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # Cada teste é independente: não guarda cookies entre requests
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        return session
+
+    def _pool_key(self, url):
+        """
+        Normaliza a URL para scheme://host:porta
+        """
+        parts = urlsplit(url or '')
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_http_client_pool():
+    """
+    Retorna o pool HTTP compartilhado pela aplicação
+
+    Returns:
+        HTTPClientPool: Instância única do pool
+    """
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPClientPool()
+        return _default_pool
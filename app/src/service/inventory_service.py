@@ -0,0 +1,452 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from boto3 import Session
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client
+
+load_dotenv()
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _tag(tags, key):
+    for tag in tags or []:
+        if tag.get('Key') == key:
+            return tag.get('Value')
+    return None
+
+
+class InventoryService:
+    """
+    Inventário concorrente de recursos AWS em várias regiões e contas (perfis)
+
+    - Uma tarefa por (perfil, região, recurso), todas em paralelo
+    - Timeout por região contado a partir do início de cada tarefa: o que
+      não terminar no prazo volta como 'timeout' sem atrasar as demais
+      regiões, e tarefas que esperaram na fila não perdem tempo de prazo
+    - Prazo total por coleta (um timeout de região por "onda" do pool): o
+      que ainda estiver na fila depois dele é cancelado
+    - Um único pool de threads limitado (INVENTORY_MAX_CONCURRENCY) para
+      todas as coletas
+    - Clientes com timeouts de conexão/leitura e poucas tentativas derivados
+      do timeout de região, para uma região inacessível não prender workers
+    - Clientes boto3 em cache por (conta, região, serviço)
+    """
+
+    # Recurso -> serviço boto3
+    RESOURCES = {
+        'ecs': 'ecs',
+        'ec2': 'ec2',
+        'rds': 'rds',
+        'sqs': 'sqs',
+        'sns': 'sns',
+        'logs': 'logs',
+        'secrets': 'secretsmanager',
+        'parameters': 'ssm'
+    }
+
+    def __init__(self):
+        """
+        Inicializa o serviço
+        """
+        self.default_region = os.getenv('AWS_REGION', 'sa-east-1')
+        self.max_workers = int(os.getenv('INVENTORY_MAX_CONCURRENCY', 32))
+        self.max_items = int(os.getenv('INVENTORY_MAX_ITEMS', 1000))
+        self.region_timeout = float(os.getenv('INVENTORY_REGION_TIMEOUT', 20))
+
+        # Com 2 tentativas, uma chamada travada não passa do prazo da região
+        self.client_config = Config(
+            connect_timeout=max(1, self.region_timeout / 4),
+            read_timeout=max(1, self.region_timeout / 2),
+            retries={'mode': os.getenv('AWS_RETRY_MODE', 'adaptive'), 'max_attempts': 2}
+        )
+
+        self._sessions = {}
+        self._accounts = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='inventory')
+
+    # ==================== CLIENTES ====================
+
+    def get_available_options(self):
+        """
+        Regiões e perfis disponíveis para o inventário
+
+        Returns:
+            dict: Regiões, perfis e recursos suportados
+        """
+        session = Session()
+
+        return {
+            'success': True,
+            'regions': sorted(session.get_available_regions('ec2')),
+            'profiles': sorted(session.available_profiles),
+            'resources': sorted(self.RESOURCES),
+            'default_region': self.default_region
+        }
+
+    def _session(self, profile):
+        """
+        Sessão boto3 por perfil (None = cadeia de credenciais padrão)
+        """
+        with self._lock:
+            session = self._sessions.get(profile)
+            if session is None:
+                session = self._sessions[profile] = Session(profile_name=profile) if profile else Session()
+            return session
+
+    def _account(self, profile):
+        """
+        ID da conta do perfil (STS GetCallerIdentity, uma vez por perfil)
+        """
+        with self._lock:
+            account = self._accounts.get(profile)
+        if account:
+            return account
+
+        sts = create_client('sts', region_name=self.default_region, session=self._session(profile),
+                            config=self.client_config)
+        account = sts.get_caller_identity()['Account']
+
+        with self._lock:
+            self._accounts[profile] = account
+        return account
+
+    def _client(self, profile, region, service):
+        """
+        Cliente boto3 em cache por (conta, região, serviço)
+        """
+        key = (self._account(profile), region, service)
+
+        with self._lock:
+            client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        client = create_client(service, region_name=region, session=self._session(profile),
+                               config=self.client_config)
+
+        with self._lock:
+            return self._clients.setdefault(key, client)
+
+    # ==================== INVENTÁRIO ====================
+
+    def collect(self, resources, regions, profiles=None, timeout=None):
+        """
+        Coleta os recursos em todas as combinações de perfil e região
+
+        Args:
+            resources (list): Recursos (ecs, ec2, rds, sqs, sns, logs, secrets, parameters)
+            regions (list): Regiões (ex: ['sa-east-1', 'us-east-1'])
+            profiles (list): Perfis do ~/.aws (None = credenciais padrão)
+            timeout (float): Segundos máximos por região
+
+        Returns:
+            dict: Itens de todas as regiões em uma única lista e o status de cada região
+        """
+        profiles = profiles or [None]
+        timeout = float(timeout or os.getenv('INVENTORY_REGION_TIMEOUT', 20))
+        started = time.perf_counter()
+
+        tasks = [
+            (profile, region, resource)
+            for profile in profiles
+            for region in regions
+            for resource in resources
+        ]
+
+        task_started = {}
+        futures = {
+            self._executor.submit(self._run_task, task_started, index, task): index
+            for index, task in enumerate(tasks)
+        }
+        timed_out = self._wait_tasks(futures, task_started, timeout)
+
+        items = []
+        regions_status = []
+
+        for future, index in futures.items():
+            profile, region, resource = tasks[index]
+
+            if index not in timed_out:
+                status = future.result()
+                items.extend(status.pop('items'))
+            else:
+                status = {
+                    'profile': profile,
+                    'account': self._accounts.get(profile),
+                    'region': region,
+                    'resource': resource,
+                    'status': 'timeout',
+                    'count': 0,
+                    'truncated': False,
+                    'elapsed_seconds': timed_out[index][0],
+                    'message': timed_out[index][1]
+                }
+            regions_status.append(status)
+
+        counts = {}
+        for item in items:
+            counts[item['resource']] = counts.get(item['resource'], 0) + 1
+
+        return {
+            'success': True,
+            'items': items,
+            'count': len(items),
+            'counts': counts,
+            'regions': regions_status,
+            'elapsed_seconds': round(time.perf_counter() - started, 3),
+            'sequential_seconds': round(sum(status['elapsed_seconds'] for status in regions_status), 3)
+        }
+
+    def _run_task(self, task_started, index, task):
+        """
+        Registra o início da tarefa (o prazo conta a partir daqui) e coleta
+        """
+        task_started[index] = time.monotonic()
+        return self._collect_one(*task)
+
+    def _wait_tasks(self, futures, task_started, timeout, poll_interval=0.2):
+        """
+        Aguarda as tarefas, cada uma com o seu prazo a partir do próprio início
+
+        Tarefas que estouram o prazo são abandonadas (a thread termina a
+        chamada em andamento e o resultado é descartado). A coleta inteira
+        tem ainda um prazo total de um timeout por "onda" do pool: o que
+        continuar na fila depois dele é cancelado
+
+        Returns:
+            dict: Índice -> (segundos, mensagem) das tarefas que estouraram o prazo
+        """
+        requested = time.monotonic()
+        deadline = requested + timeout * math.ceil(len(futures) / self.max_workers)
+        pending = set(futures)
+        timed_out = {}
+
+        while pending:
+            pending = {future for future in pending if not future.done()}
+            now = time.monotonic()
+            next_deadline = min(now + poll_interval, deadline)
+
+            for future in list(pending):
+                index = futures[future]
+                started = task_started.get(index)
+
+                if started is None:
+                    # Ainda na fila: só o prazo total vale
+                    if now >= deadline:
+                        future.cancel()
+                        pending.discard(future)
+                        timed_out[index] = (round(now - requested, 3), f'Não iniciada em {now - requested:.0f}s (fila cheia)')
+                elif now - started >= timeout or now >= deadline:
+                    pending.discard(future)
+                    timed_out[index] = (round(now - started, 3), f'Sem resposta em {now - started:.0f}s')
+                else:
+                    next_deadline = min(next_deadline, started + timeout)
+
+            if pending:
+                wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+
+        return timed_out
+
+    def _collect_one(self, profile, region, resource):
+        """
+        Coleta um recurso em uma região e conta
+        """
+        started = time.perf_counter()
+        status = {
+            'profile': profile,
+            'account': None,
+            'region': region,
+            'resource': resource,
+            'status': 'ok',
+            'count': 0,
+            'truncated': False,
+            'message': None,
+            'items': []
+        }
+
+        try:
+            status['account'] = self._account(profile)
+            client = self._client(profile, region, self.RESOURCES[resource])
+
+            items, truncated = getattr(self, f'_list_{resource}')(client)
+
+            for item in items:
+                item.update({
+                    'resource': resource,
+                    'profile': profile,
+                    'account': status['account'],
+                    'region': region
+                })
+
+            status['items'] = items
+            status['count'] = len(items)
+            status['truncated'] = truncated
+
+        except ClientError as e:
+            status['status'] = 'error'
+            status['message'] = e.response['Error']['Message']
+        except Exception as e:
+            status['status'] = 'error'
+            status['message'] = str(e)
+
+        status['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        return status
+
+    def _paginate(self, client, operation, key, **kwargs):
+        """
+        Percorre um paginator até max_items
+
+        Returns:
+            tuple: (lista de itens, se foi truncado)
+        """
+        items = []
+
+        for page in client.get_paginator(operation).paginate(**kwargs):
+            items.extend(page.get(key, []))
+            if len(items) >= self.max_items:
+                return items[:self.max_items], True
+
+        return items, False
+
+    # ==================== RECURSOS ====================
+
+    def _list_ecs(self, client):
+        arns, truncated = self._paginate(client, 'list_clusters', 'clusterArns')
+        items = []
+
+        for index in range(0, len(arns), 100):
+            response = client.describe_clusters(clusters=arns[index:index + 100])
+            for cluster in response.get('clusters', []):
+                items.append({
+                    'name': cluster.get('clusterName'),
+                    'id': cluster.get('clusterArn'),
+                    'status': cluster.get('status'),
+                    'details': {
+                        'running_tasks': cluster.get('runningTasksCount', 0),
+                        'pending_tasks': cluster.get('pendingTasksCount', 0),
+                        'active_services': cluster.get('activeServicesCount', 0)
+                    }
+                })
+
+        return items, truncated
+
+    def _list_ec2(self, client):
+        reservations, truncated = self._paginate(client, 'describe_instances', 'Reservations')
+        items = []
+
+        for reservation in reservations:
+            for instance in reservation.get('Instances', []):
+                items.append({
+                    'name': _tag(instance.get('Tags'), 'Name') or instance.get('InstanceId'),
+                    'id': instance.get('InstanceId'),
+                    'status': instance.get('State', {}).get('Name'),
+                    'details': {
+                        'instance_type': instance.get('InstanceType'),
+                        'private_ip': instance.get('PrivateIpAddress'),
+                        'launch_time': _isoformat(instance.get('LaunchTime'))
+                    }
+                })
+
+        return items, truncated
+
+    def _list_rds(self, client):
+        instances, truncated = self._paginate(client, 'describe_db_instances', 'DBInstances')
+
+        return [
+            {
+                'name': instance.get('DBInstanceIdentifier'),
+                'id': instance.get('DBInstanceArn'),
+                'status': instance.get('DBInstanceStatus'),
+                'details': {
+                    'engine': instance.get('Engine'),
+                    'instance_class': instance.get('DBInstanceClass'),
+                    'endpoint': instance.get('Endpoint', {}).get('Address')
+                }
+            }
+            for instance in instances
+        ], truncated
+
+    def _list_sqs(self, client):
+        urls, truncated = self._paginate(client, 'list_queues', 'QueueUrls')
+
+        return [
+            {
+                'name': url.rsplit('/', 1)[-1],
+                'id': url,
+                'status': None,
+                'details': {}
+            }
+            for url in urls
+        ], truncated
+
+    def _list_sns(self, client):
+        topics, truncated = self._paginate(client, 'list_topics', 'Topics')
+
+        return [
+            {
+                'name': topic['TopicArn'].rsplit(':', 1)[-1],
+                'id': topic['TopicArn'],
+                'status': None,
+                'details': {}
+            }
+            for topic in topics
+        ], truncated
+
+    def _list_logs(self, client):
+        groups, truncated = self._paginate(client, 'describe_log_groups', 'logGroups')
+
+        return [
+            {
+                'name': group.get('logGroupName'),
+                'id': group.get('arn'),
+                'status': None,
+                'details': {
+                    'stored_bytes': group.get('storedBytes', 0),
+                    'retention_days': group.get('retentionInDays')
+                }
+            }
+            for group in groups
+        ], truncated
+
+    def _list_secrets(self, client):
+        secrets, truncated = self._paginate(client, 'list_secrets', 'SecretList')
+
+        return [
+            {
+                'name': secret.get('Name'),
+                'id': secret.get('ARN'),
+                'status': 'deleted' if secret.get('DeletedDate') else None,
+                'details': {
+                    'last_changed_date': _isoformat(secret.get('LastChangedDate'))
+                }
+            }
+            for secret in secrets
+        ], truncated
+
+    def _list_parameters(self, client):
+        parameters, truncated = self._paginate(
+            client, 'describe_parameters', 'Parameters', PaginationConfig={'PageSize': 50}
+        )
+
+        return [
+            {
+                'name': parameter.get('Name'),
+                'id': parameter.get('Name'),
+                'status': None,
+                'details': {
+                    'type': parameter.get('Type'),
+                    'last_modified_date': _isoformat(parameter.get('LastModifiedDate'))
+                }
+            }
+            for parameter in parameters
+        ], truncated
@@ -1,10 +1,19 @@
 """
 Service para gerenciar SQS e SNS
 """
-import boto3
 import os
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from src.service.aws_client_factory import THROTTLE_ERROR_CODES, create_client
+
+# Limites do SendMessageBatch
+SQS_BATCH_SIZE = 10
+SQS_BATCH_MAX_BYTES = 262144
 
 class MessagingService:
     def __init__(self):
@@ -12,8 +21,19 @@ class MessagingService:
         Inicializa conexão com SQS e SNS
         """
         self.aws_region = os.getenv('AWS_REGION', 'sa-east-1')
-        self.sqs_client = boto3.client('sqs', region_name=self.aws_region)
-        self.sns_client = boto3.client('sns', region_name=self.aws_region)
+        self.max_workers = int(os.getenv('SQS_MAX_CONCURRENCY', 16))
+        # Uma conexão HTTP por chamada simultânea nos envios em lote
+        self.sqs_client = create_client(
+            'sqs',
+            region_name=self.aws_region,
+            config=Config(max_pool_connections=self.max_workers)
+        )
+        self.sns_client = create_client(
+            'sns',
+            region_name=self.aws_region,
+            config=Config(max_pool_connections=self.max_workers)
+        )
+        self.batch_max_attempts = int(os.getenv('SQS_BATCH_MAX_ATTEMPTS', 5))
     
     # ==================== SQS ====================
     
@@ -164,6 +184,193 @@ class MessagingService:
                 'message': f'Erro: {str(e)}'
             }
     
+    def send_message_batch(self, queue_url, entries, max_concurrency=None):
+        """
+        Envia muitas mensagens com SendMessageBatch (até 10 por chamada, chamadas em paralelo)
+        
+        - entries pode ser um gerador: só max_concurrency * 2 lotes ficam em memória
+        - Lotes também respeitam o limite de 256 KiB por chamada
+        - Entradas que falham por erro da AWS (SenderFault = false) são reenviadas
+          com backoff; erros da própria mensagem não são repetidos
+        
+        Args:
+            queue_url (str): URL da fila
+            entries (iterable): Dicts com body e, opcionalmente, delay_seconds,
+                group_id, deduplication_id e attributes
+            max_concurrency (int): Chamadas simultâneas
+        
+        Returns:
+            dict: Enviadas, falhas, retries e mensagens/segundo
+        """
+        def send(batch):
+            return self.sqs_client.send_message_batch(
+                QueueUrl=queue_url,
+                Entries=[self._batch_entry(str(index), entry) for index, entry in batch]
+            )
+        
+        return self._run_batches(send, entries, max_concurrency, 'enviada(s)')
+    
+    def _run_batches(self, call, entries, max_concurrency, verb):
+        """
+        Executa uma API em lote (SendMessageBatch / PublishBatch) sobre todas as entradas
+        
+        Args:
+            call (callable): Recebe uma lista de (índice, entrada) e retorna a resposta
+                da AWS com Successful/Failed
+            entries (iterable): Entradas (pode ser um gerador)
+            max_concurrency (int): Chamadas simultâneas
+            verb (str): Verbo da mensagem de resultado (ex: 'enviada(s)')
+        
+        Returns:
+            dict: Enviadas, falhas, retries e mensagens/segundo
+        """
+        max_concurrency = max_concurrency or self.max_workers
+        stats = {'sent': 0, 'failed': 0, 'retried': 0, 'api_calls': 0}
+        errors = []
+        lock = threading.Lock()
+        started = time.perf_counter()
+        
+        def send(batch):
+            pending = batch
+            
+            for attempt in range(1, self.batch_max_attempts + 1):
+                try:
+                    failed = call(pending).get('Failed', [])
+                except ClientError as e:
+                    # Falha da chamada inteira: repete o lote se for throttling
+                    if e.response['Error']['Code'] not in THROTTLE_ERROR_CODES or attempt == self.batch_max_attempts:
+                        raise
+                    failed = [
+                        {'Id': str(index), 'SenderFault': False, 'Code': e.response['Error']['Code']}
+                        for index, _ in pending
+                    ]
+                
+                retry_ids = {item['Id'] for item in failed if not item.get('SenderFault')}
+                permanent = [item for item in failed if item.get('SenderFault')]
+                
+                with lock:
+                    stats['api_calls'] += 1
+                    stats['sent'] += len(pending) - len(failed)
+                    stats['failed'] += len(permanent)
+                    errors.extend(permanent[:max(0, 20 - len(errors))])
+                
+                pending = [(index, entry) for index, entry in pending if str(index) in retry_ids]
+                if not pending:
+                    return
+                
+                with lock:
+                    stats['retried'] += len(pending)
+                time.sleep(random.uniform(0, min(5, 0.1 * 2 ** attempt)))
+            
+            with lock:
+                stats['failed'] += len(pending)
+                if len(errors) < 20:
+                    errors.append({'Id': pending[0][0], 'Code': 'MaxAttempts', 'Message': 'Tentativas esgotadas'})
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                in_flight = set()
+                
+                for batch in self._iter_batches(entries):
+                    if len(in_flight) >= max_concurrency * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    in_flight.add(executor.submit(send, batch))
+                
+                for future in in_flight:
+                    future.result()
+            
+            elapsed = time.perf_counter() - started
+            
+            return {
+                'success': stats['failed'] == 0,
+                'message': f"{stats['sent']} mensagem(ns) {verb}" + (f", {stats['failed']} com falha" if stats['failed'] else ''),
+                'sent': stats['sent'],
+                'failed': stats['failed'],
+                'retried': stats['retried'],
+                'api_calls': stats['api_calls'],
+                'errors': [
+                    {'index': int(error['Id']), 'code': error.get('Code'), 'message': error.get('Message')}
+                    for error in errors
+                ],
+                'elapsed_seconds': round(elapsed, 3),
+                'messages_per_second': round(stats['sent'] / elapsed, 1) if elapsed else 0
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}',
+                'sent': stats['sent']
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro: {str(e)}',
+                'sent': stats['sent']
+            }
+    
+    def _iter_batches(self, entries):
+        """
+        Agrupa as entradas em lotes de até 10 mensagens e 256 KiB
+        
+        Yields:
+            list: Tuplas (índice da entrada, entrada)
+        """
+        batch = []
+        batch_bytes = 0
+        
+        for index, entry in enumerate(entries):
+            size = self._entry_size(entry)
+            
+            if batch and (len(batch) == SQS_BATCH_SIZE or batch_bytes + size > SQS_BATCH_MAX_BYTES):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            
+            batch.append((index, entry))
+            batch_bytes += size
+        
+        if batch:
+            yield batch
+    
+    def _entry_size(self, entry):
+        """
+        Tamanho da mensagem como a AWS conta no limite de 256 KiB: corpo e,
+        para cada atributo, nome + tipo + valor (BinaryValue em bytes)
+        """
+        size = len(entry['body'].encode('utf-8'))
+        
+        for name, value in (entry.get('attributes') or {}).items():
+            data = value.get('BinaryValue', value.get('StringValue', ''))
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            
+            size += len(name.encode('utf-8')) + len(value.get('DataType', '').encode('utf-8')) + len(data)
+        
+        return size
+    
+    def _batch_entry(self, entry_id, entry):
+        """
+        Converte uma entrada para o formato do SendMessageBatch
+        """
+        item = {
+            'Id': entry_id,
+            'MessageBody': entry['body']
+        }
+        
+        if entry.get('delay_seconds'):
+            item['DelaySeconds'] = entry['delay_seconds']
+        if entry.get('attributes'):
+            item['MessageAttributes'] = entry['attributes']
+        if entry.get('group_id'):
+            item['MessageGroupId'] = entry['group_id']
+        if entry.get('deduplication_id'):
+            item['MessageDeduplicationId'] = entry['deduplication_id']
+        
+        return item
+    
     def receive_messages(self, queue_url, max_messages=10, wait_time=0):
         """
         Recebe mensagens da fila SQS
@@ -222,6 +429,57 @@ class MessagingService:
                 'message': f'Erro: {str(e)}'
             }
     
+    def delete_message_batch(self, queue_url, receipt_handles):
+        """
+        Deleta várias mensagens com DeleteMessageBatch (10 por chamada, chamadas em paralelo)
+        
+        Args:
+            queue_url (str): URL da fila
+            receipt_handles (list): Receipt handles das mensagens
+        
+        Returns:
+            dict: Quantidade deletada e falhas
+        """
+        try:
+            chunks = [receipt_handles[i:i + SQS_BATCH_SIZE] for i in range(0, len(receipt_handles), SQS_BATCH_SIZE)]
+            
+            def delete(chunk):
+                return self.sqs_client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[{'Id': str(index), 'ReceiptHandle': handle} for index, handle in enumerate(chunk)]
+                )
+            
+            deleted = 0
+            errors = []
+            
+            if chunks:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                    for response in executor.map(delete, chunks):
+                        deleted += len(response.get('Successful', []))
+                        errors.extend(
+                            {'code': item.get('Code'), 'message': item.get('Message')}
+                            for item in response.get('Failed', [])
+                        )
+            
+            return {
+                'success': not errors,
+                'message': f'{deleted} mensagem(ns) deletada(s)' + (f', {len(errors)} com falha' if errors else ''),
+                'deleted': deleted,
+                'failed': len(errors),
+                'errors': errors[:20]
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro: {str(e)}'
+            }
+    
     def purge_queue(self, queue_url):
         """
         Limpa todas as mensagens da fila
@@ -386,6 +644,50 @@ class MessagingService:
                 'message': f'Erro: {str(e)}'
             }
     
+    def publish_batch(self, topic_arn, entries, max_concurrency=None):
+        """
+        Publica muitas mensagens com PublishBatch (até 10 por chamada, chamadas em paralelo)
+        
+        Mesmo comportamento do send_message_batch: entradas lidas sob demanda,
+        lotes de até 256 KiB e reenvio com backoff das falhas transitórias
+        
+        Args:
+            topic_arn (str): ARN do tópico
+            entries (iterable): Dicts com body e, opcionalmente, subject,
+                group_id, deduplication_id e attributes
+            max_concurrency (int): Chamadas simultâneas
+        
+        Returns:
+            dict: Publicadas, falhas, retries e mensagens/segundo
+        """
+        def publish(batch):
+            return self.sns_client.publish_batch(
+                TopicArn=topic_arn,
+                PublishBatchRequestEntries=[self._publish_entry(str(index), entry) for index, entry in batch]
+            )
+        
+        return self._run_batches(publish, entries, max_concurrency, 'publicada(s)')
+    
+    def _publish_entry(self, entry_id, entry):
+        """
+        Converte uma entrada para o formato do PublishBatch
+        """
+        item = {
+            'Id': entry_id,
+            'Message': entry['body']
+        }
+        
+        if entry.get('subject'):
+            item['Subject'] = entry['subject']
+        if entry.get('attributes'):
+            item['MessageAttributes'] = entry['attributes']
+        if entry.get('group_id'):
+            item['MessageGroupId'] = entry['group_id']
+        if entry.get('deduplication_id'):
+            item['MessageDeduplicationId'] = entry['deduplication_id']
+        
+        return item
+    
     def list_subscriptions(self, topic_arn=None):
         """
         Lista inscrições SNS
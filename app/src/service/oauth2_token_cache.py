@@ -0,0 +1,189 @@
+import logging
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class OAuth2TokenCache:
+    """
+    Cache em memória dos tokens OAuth2, indexado pelo id da autenticação (api_authentications.id)
+
+    - Respeita o expires_in devolvido pelo provedor (ou OAUTH2_DEFAULT_TTL)
+    - Renova em background antes de expirar (OAUTH2_REFRESH_MARGIN segundos)
+    - Single-flight: requests concorrentes compartilham uma única busca de token
+    """
+
+    def __init__(self, refresh_margin=None, default_ttl=None):
+        """
+        Inicializa o cache
+
+        Args:
+            refresh_margin (float): Segundos antes da expiração para renovar o token
+            default_ttl (int): Validade usada quando o provedor não informa expires_in
+        """
+        self.refresh_margin = refresh_margin if refresh_margin is not None else float(os.getenv('OAUTH2_REFRESH_MARGIN', 60))
+        self.default_ttl = default_ttl if default_ttl is not None else int(os.getenv('OAUTH2_DEFAULT_TTL', 300))
+
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+
+    def get_tokens(self, auth_id, config_key, fetch):
+        """
+        Obtém os tokens de uma autenticação, buscando no provedor só quando necessário
+
+        Args:
+            auth_id (int): ID da autenticação
+            config_key (str): auth_config serializado (mudou a config, o token é descartado)
+            fetch (callable): Função sem argumentos que retorna (tokens, expires_in)
+
+        Returns:
+            dict: Tokens extraídos da resposta do provedor
+        """
+        entry = self._valid_entry(auth_id, config_key)
+
+        if entry:
+            self._count('hits')
+            if time.time() >= entry['refresh_at']:
+                self._refresh_in_background(auth_id, config_key, fetch)
+            return entry['tokens']
+
+        # Single-flight: só uma thread busca o token, as demais aguardam o resultado
+        with self._key_lock(auth_id):
+            entry = self._valid_entry(auth_id, config_key)
+            if entry:
+                self._count('hits')
+                return entry['tokens']
+
+            self._count('misses')
+            return self._fetch_and_store(auth_id, config_key, fetch)['tokens']
+
+    def invalidate(self, auth_id, tokens=None):
+        """
+        Remove o token de uma autenticação (ex: após receber 401 ou deletar a autenticação)
+
+        Args:
+            auth_id (int): ID da autenticação
+            tokens (dict): Tokens recusados; se informado, só remove se ainda forem os
+                do cache (outra request pode já ter buscado um token novo)
+        """
+        with self._lock:
+            entry = self._entries.get(auth_id)
+            if entry is None or (tokens is not None and entry['tokens'] is not tokens):
+                return
+            self._entries.pop(auth_id)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """
+        Remove todos os tokens do cache
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Retorna contadores de uso do cache
+
+        Returns:
+            dict: hits, misses, refreshes, evictions e tokens em cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_tokens'] = len(self._entries)
+        return stats
+
+    def _valid_entry(self, auth_id, config_key):
+        """
+        Retorna a entrada do cache se ainda não expirou
+        """
+        with self._lock:
+            entry = self._entries.get(auth_id)
+
+        if entry and entry['config_key'] == config_key and time.time() < entry['expires_at']:
+            return entry
+        return None
+
+    def _fetch_and_store(self, auth_id, config_key, fetch):
+        """
+        Busca um novo token no provedor e armazena no cache
+        """
+        tokens, expires_in = fetch()
+
+        try:
+            ttl = float(expires_in) if expires_in else self.default_ttl
+        except (TypeError, ValueError):
+            ttl = self.default_ttl
+
+        now = time.time()
+        entry = {
+            'tokens': tokens,
+            'config_key': config_key,
+            'expires_at': now + ttl,
+            # Para tokens curtos renova com 80% da validade em vez da margem fixa
+            'refresh_at': now + max(ttl - self.refresh_margin, ttl * 0.8)
+        }
+
+        with self._lock:
+            self._entries[auth_id] = entry
+
+        return entry
+
+    def _refresh_in_background(self, auth_id, config_key, fetch):
+        """
+        Renova o token em uma thread separada se nenhuma renovação estiver em andamento
+        """
+        lock = self._key_lock(auth_id)
+        if not lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self._fetch_and_store(auth_id, config_key, fetch)
+                self._count('refreshes')
+            except Exception as e:
+                logger.warning('Falha ao renovar token OAuth2 da autenticação %s: %s', auth_id, e)
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _key_lock(self, auth_id):
+        """
+        Retorna o lock exclusivo de uma autenticação
+        """
+        with self._lock:
+            lock = self._locks.get(auth_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[auth_id] = lock
+            return lock
+
+    def _count(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_oauth2_token_cache():
+    """
+    Retorna o cache de tokens OAuth2 compartilhado pela aplicação
+
+    Returns:
+        OAuth2TokenCache: Instância única do cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = OAuth2TokenCache()
+        return _default_cache
@@ -1,8 +1,10 @@
-import boto3
 from boto3 import Session
 from botocore.exceptions import ClientError
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client
 
 load_dotenv()
 
@@ -12,6 +14,13 @@ class ParameterStoreService:
     Service layer para gerenciar operações com AWS Systems Manager Parameter Store usando boto3
     """
     
+    # Limite da API GetParameters
+    GET_PARAMETERS_BATCH_SIZE = 10
+    
+    # Nomes sendo buscados no momento, compartilhados entre requisições simultâneas
+    _in_flight = {}
+    _in_flight_lock = threading.Lock()
+    
     def __init__(self):
         """
         Inicializa a conexão com SSM Parameter Store usando boto3
@@ -21,10 +30,13 @@ class ParameterStoreService:
         session = Session()
         
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.ssm_client = session.client(
+        self.ssm_client = create_client(
             'ssm',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
+        
+        self.max_workers = int(os.getenv('SSM_MAX_CONCURRENCY', 8))
     
     def list_parameters(self, max_results=50):
         """
@@ -257,6 +269,127 @@ class ParameterStoreService:
                 'message': f'Erro inesperado: {str(e)}'
             }
     
+    def get_parameters(self, names, with_decryption=True):
+        """
+        Obtém vários parâmetros de uma vez (hidratação em lote)
+        
+        Os nomes são buscados com GetParameters em lotes de 10, em paralelo.
+        Nomes que já estão sendo buscados por outra requisição não são pedidos
+        de novo: a requisição aguarda o resultado em andamento.
+        
+        Args:
+            names (list): Nomes dos parâmetros
+            with_decryption (bool): Descriptografar valores SecureString
+        
+        Returns:
+            dict: Parâmetros encontrados (na ordem pedida) e nomes inválidos
+        """
+        try:
+            names = list(dict.fromkeys(names))
+            futures, owned = self._claim_names(names, with_decryption)
+            
+            try:
+                if owned:
+                    self._fetch_parameters(owned, with_decryption, futures)
+            finally:
+                self._release_names(owned, with_decryption, futures)
+            
+            parameters = []
+            invalid = []
+            
+            for name in names:
+                parameter = futures[name].result()
+                if parameter is None:
+                    invalid.append(name)
+                else:
+                    parameters.append(parameter)
+            
+            return {
+                'success': True,
+                'parameters': parameters,
+                'invalid_parameters': invalid,
+                'count': len(parameters)
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao obter parâmetros: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro inesperado: {str(e)}'
+            }
+    
+    def _claim_names(self, names, with_decryption):
+        """
+        Registra os nomes que esta requisição vai buscar e reaproveita os que já estão em andamento
+        
+        Returns:
+            tuple: (future por nome, nomes que esta requisição deve buscar)
+        """
+        futures = {}
+        owned = []
+        
+        with self._in_flight_lock:
+            for name in names:
+                key = (name, with_decryption)
+                future = self._in_flight.get(key)
+                
+                if future is None:
+                    future = Future()
+                    self._in_flight[key] = future
+                    owned.append(name)
+                
+                futures[name] = future
+        
+        return futures, owned
+    
+    def _release_names(self, owned, with_decryption, futures):
+        """
+        Remove os nomes do registro de buscas em andamento
+        """
+        with self._in_flight_lock:
+            for name in owned:
+                self._in_flight.pop((name, with_decryption), None)
+        
+        # Garante que quem está aguardando não fique bloqueado se a busca falhou
+        for name in owned:
+            if not futures[name].done():
+                futures[name].set_exception(Exception(f'Falha ao obter o parâmetro {name}'))
+    
+    def _fetch_parameters(self, names, with_decryption, futures):
+        """
+        Executa GetParameters em lotes de 10 em paralelo e resolve os futures
+        """
+        size = self.GET_PARAMETERS_BATCH_SIZE
+        chunks = [names[i:i + size] for i in range(0, len(names), size)]
+        
+        def fetch(chunk):
+            response = self.ssm_client.get_parameters(Names=chunk, WithDecryption=with_decryption)
+            found = {}
+            
+            for param in response.get('Parameters', []):
+                # Nomes com seletor de versão/label (/app/db:3) voltam com o nome
+                # base e o seletor no campo Selector; a mesma requisição pode
+                # pedir /app/db e /app/db:3, então a chave inclui o seletor
+                selector = param.get('Selector') or ''
+                if selector and not selector.startswith(':'):
+                    selector = ':' + selector
+                
+                # Nomes pedidos por ARN casam pelo ARN (ou pelo Name, quando a AWS devolve o ARN nele)
+                for base in (param.get('Name'), param.get('ARN')):
+                    if base:
+                        found[base + selector] = param
+            
+            return found
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            for chunk, found in zip(chunks, executor.map(fetch, chunks)):
+                for name in chunk:
+                    futures[name].set_result(found.get(name))
+    
     def get_parameters_by_path(self, path, recursive=True, with_decryption=True):
         """
         Obtém parâmetros por caminho
@@ -271,26 +404,16 @@ class ParameterStoreService:
         """
         try:
             parameters = []
-            next_token = None
+            paginator = self.ssm_client.get_paginator('get_parameters_by_path')
             
-            while True:
-                params = {
-                    'Path': path,
-                    'Recursive': recursive,
-                    'WithDecryption': with_decryption,
-                    'MaxResults': 10
-                }
-                
-                if next_token:
-                    params['NextToken'] = next_token
-                
-                response = self.ssm_client.get_parameters_by_path(**params)
-                
-                parameters.extend(response.get('Parameters', []))
-                
-                next_token = response.get('NextToken')
-                if not next_token:
-                    break
+            # GetParametersByPath já traz os valores (até 10 por página)
+            for page in paginator.paginate(
+                Path=path,
+                Recursive=recursive,
+                WithDecryption=with_decryption,
+                PaginationConfig={'PageSize': 10}
+            ):
+                parameters.extend(page.get('Parameters', []))
             
             return {
                 'success': True,
@@ -1,8 +1,8 @@
-import boto3
 from boto3 import Session
 from botocore.exceptions import ClientError
 import os
 from dotenv import load_dotenv
+from src.service.aws_client_factory import create_client
 
 load_dotenv()
 
@@ -21,9 +21,10 @@ class RDSService:
         session = Session()
         
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.rds_client = session.client(
+        self.rds_client = create_client(
             'rds',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
     
     def list_db_instances(self):
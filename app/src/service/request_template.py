@@ -0,0 +1,226 @@
+import json
+import os
+import re
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Variáveis de autenticação nos headers: ${campo}
+AUTH_VARIABLE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Path variables no path do endpoint: /pessoas/{id}
+_PATH_VARIABLE_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+
+def _load_json(value, default=None):
+    """
+    Faz o parse de uma coluna JSON, ignorando valores inválidos
+    """
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class RequestTemplate:
+    """
+    Request do catálogo compilada a partir das linhas de api_requests, api_endpoints,
+    apis e api_authentications
+
+    Tudo que não depende dos dados do teste é resolvido uma única vez: URL com as
+    path variables já separadas, headers mesclados (API + request + Content-Type),
+    query params e body padrão, autenticação efetiva e os headers com ${campo}.
+    """
+
+    BODY_METHODS = ('POST', 'PUT', 'PATCH')
+
+    def __init__(self, row):
+        """
+        Compila a linha retornada por APICatalogService._load_request_row
+        """
+        self.request_id = row['id']
+        self.name = row['name']
+        self.method = row['method']
+        self.content_type = row['content_type']
+        self.is_json = self.content_type == 'application/json'
+        self.compiled_at = time.time()
+
+        # URL: partes literais nas posições pares, nomes das variáveis nas ímpares
+        self.url_parts = _PATH_VARIABLE_PATTERN.split(f"{row['base_url'] or ''}{row['path']}")
+        self.static_url = self.url_parts[0] if len(self.url_parts) == 1 else None
+
+        # Headers padrão da API < headers da request < Content-Type
+        headers = {}
+        headers.update(_load_json(row['default_headers'], {}) or {})
+        headers.update(_load_json(row['headers'], {}) or {})
+        headers['Content-Type'] = self.content_type
+        self.headers = headers
+        self.auth_header_keys = self._auth_header_keys(headers)
+
+        self.query_params = _load_json(row['query_params'], {}) or {}
+        self.body = _load_json(row['body_template']) if self.method in self.BODY_METHODS else None
+
+        # Autenticação efetiva (a da request sobrescreve a da API)
+        auth_type = row['req_auth_type'] if row['req_auth_type'] else row['auth_type']
+        auth_config = row['req_auth_config'] if row['req_auth_config'] else row['auth_config']
+        self.auth_type = auth_type
+        self.auth_id = row['auth_id'] if row['req_auth_type'] else row['api_auth_id']
+        self.auth_config = auth_config if auth_type == 'oauth2' and auth_config else None
+
+    def prepare(self, body_data=None, query_data=None, headers_data=None, path_variables=None):
+        """
+        Monta a request com os dados do teste
+
+        Returns:
+            dict: Request pronta para APICatalogService._send_prepared_request
+        """
+        url = self.static_url if self.static_url is not None else self._render_url(path_variables or {})
+
+        if headers_data:
+            headers = dict(self.headers)
+            headers.update(headers_data)
+            auth_header_keys = self._auth_header_keys(headers)
+        else:
+            headers = self.headers
+            auth_header_keys = self.auth_header_keys
+
+        params = query_data if query_data else self.query_params
+
+        data = None
+        if self.method in self.BODY_METHODS:
+            data = body_data if body_data else self.body
+
+        return {
+            'method': self.method,
+            'url': url,
+            'headers': headers,
+            'auth_header_keys': auth_header_keys,
+            'params': params,
+            'json': data if self.is_json else None,
+            'data': data if not self.is_json else None,
+            'auth_id': self.auth_id,
+            'auth_config': self.auth_config
+        }
+
+    def _render_url(self, path_variables):
+        """
+        Substitui as path variables (as não informadas ficam como {nome})
+        """
+        parts = list(self.url_parts)
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            parts[index] = str(path_variables[name]) if name in path_variables else f'{{{name}}}'
+        return ''.join(parts)
+
+    def _auth_header_keys(self, headers):
+        """
+        Headers que contêm ${campo} e precisam dos tokens da autenticação
+        """
+        return tuple(
+            key for key, value in headers.items()
+            if isinstance(value, str) and '${' in value
+        )
+
+
+class RequestTemplateCache:
+    """
+    Cache em memória das requests compiladas, indexado pelo id da request
+
+    O APICatalogService invalida as entradas ao alterar ou remover requests,
+    endpoints, APIs e autenticações. REQUEST_TEMPLATE_TTL (segundos) limita a
+    idade de cada entrada para refletir alterações feitas fora da aplicação.
+    """
+
+    def __init__(self, ttl=None):
+        """
+        Inicializa o cache
+
+        Args:
+            ttl (float): Validade de cada template em segundos
+        """
+        self.ttl = ttl if ttl is not None else float(os.getenv('REQUEST_TEMPLATE_TTL', 300))
+
+        self._templates = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, request_id, load_row):
+        """
+        Obtém o template de uma request, compilando só quando necessário
+
+        Args:
+            request_id (int): ID da request
+            load_row (callable): Função que recebe o request_id e retorna a linha (ou None)
+
+        Returns:
+            RequestTemplate: Template compilado ou None se a request não existir
+        """
+        with self._lock:
+            template = self._templates.get(request_id)
+
+        if template and time.time() - template.compiled_at < self.ttl:
+            self._count('hits')
+            return template
+
+        row = load_row(request_id)
+        self._count('misses')
+
+        if not row:
+            return None
+
+        template = RequestTemplate(row)
+        with self._lock:
+            self._templates[request_id] = template
+        return template
+
+    def invalidate(self, request_id):
+        """
+        Remove o template de uma request
+        """
+        with self._lock:
+            if self._templates.pop(request_id, None) is not None:
+                self._stats['invalidations'] += 1
+
+    def clear(self):
+        """
+        Remove todos os templates (alterações em endpoints, APIs ou autenticações)
+        """
+        with self._lock:
+            self._stats['invalidations'] += len(self._templates)
+            self._templates.clear()
+
+    def get_stats(self):
+        """
+        Retorna contadores de uso do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_templates'] = len(self._templates)
+        return stats
+
+    def _count(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_request_template_cache():
+    """
+    Retorna o cache de templates compartilhado pela aplicação
+
+    Returns:
+        RequestTemplateCache: Instância única do cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = RequestTemplateCache()
+        return _default_cache
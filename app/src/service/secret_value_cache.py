@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class SecretValueCache:
+    """
+    Cache em memória (nunca persistido) dos valores do Secrets Manager
+
+    - Valores indexados por (ARN, VersionId): uma versão de segredo é imutável
+    - Cada nome/ARN consultado aponta para a versão em cache; ao descartar uma
+      versão, os nomes/ARNs que apontavam para ela também são removidos
+    - Dentro de SECRETS_CACHE_REVALIDATE segundos o valor é usado direto; depois
+      disso o serviço revalida com describe_secret antes de baixar de novo
+    """
+
+    def __init__(self, revalidate_after=None, max_entries=None):
+        """
+        Inicializa o cache
+
+        Args:
+            revalidate_after (float): Segundos em que o valor é usado sem revalidar
+            max_entries (int): Quantidade máxima de versões em memória
+        """
+        self.revalidate_after = revalidate_after if revalidate_after is not None else float(os.getenv('SECRETS_CACHE_REVALIDATE', 30))
+        self.max_entries = max_entries or int(os.getenv('SECRETS_CACHE_MAX_ENTRIES', 500))
+
+        self._values = {}
+        self._refs = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'evictions': 0}
+
+    def lookup(self, secret_id):
+        """
+        Procura o valor de um segredo
+
+        Args:
+            secret_id (str): Nome ou ARN do segredo
+
+        Returns:
+            tuple: (valor ou None, referência ou None, precisa revalidar)
+        """
+        with self._lock:
+            ref = self._refs.get(secret_id)
+            if not ref:
+                return None, None, False
+
+            value = self._values.get((ref['arn'], ref['version_id']))
+            if value is None:
+                self._refs.pop(secret_id, None)
+                return None, None, False
+
+            stale = time.time() - ref['validated_at'] >= self.revalidate_after
+            return value, dict(ref), stale
+
+    def store(self, secret_id, arn, version_id, value):
+        """
+        Armazena o valor de uma versão e associa o nome/ARN consultado a ela
+        """
+        if not arn or not version_id:
+            return
+
+        with self._lock:
+            if (arn, version_id) not in self._values and len(self._values) >= self.max_entries:
+                # Remove a versão mais antiga (dicts mantêm a ordem de inserção)
+                oldest = next(iter(self._values))
+                self._values.pop(oldest)
+                self._drop_refs(*oldest)
+                self._stats['evictions'] += 1
+
+            self._values[(arn, version_id)] = value
+
+            ref = {
+                'arn': arn,
+                'version_id': version_id,
+                'validated_at': time.time()
+            }
+            self._refs[secret_id] = ref
+            self._refs[arn] = dict(ref)
+
+    def mark_valid(self, secret_id):
+        """
+        Confirma que a versão em cache continua atual (após describe_secret)
+        """
+        with self._lock:
+            for key in self._keys_for(secret_id):
+                self._refs[key]['validated_at'] = time.time()
+
+    def invalidate(self, secret_id):
+        """
+        Remove um segredo do cache (ex: após update ou delete)
+        """
+        with self._lock:
+            for key in self._keys_for(secret_id):
+                ref = self._refs.pop(key)
+                self._values.pop((ref['arn'], ref['version_id']), None)
+
+    def clear(self):
+        """
+        Remove todos os valores do cache
+        """
+        with self._lock:
+            self._values.clear()
+            self._refs.clear()
+
+    def count(self, counter, amount=1):
+        """
+        Incrementa um contador de uso
+        """
+        with self._lock:
+            self._stats[counter] += amount
+
+    def get_stats(self):
+        """
+        Retorna contadores de uso do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_versions'] = len(self._values)
+            stats['cached_names'] = len(self._refs)
+        return stats
+
+    def _drop_refs(self, arn, version_id):
+        """
+        Remove os nomes/ARNs que apontam para uma versão (chamado com o lock adquirido)
+        """
+        for key in [key for key, ref in self._refs.items() if ref['arn'] == arn and ref['version_id'] == version_id]:
+            self._refs.pop(key)
+
+    def _keys_for(self, secret_id):
+        """
+        Nomes/ARNs que apontam para o mesmo segredo (chamado com o lock adquirido)
+        """
+        ref = self._refs.get(secret_id)
+        if not ref:
+            return []
+        return [key for key, other in self._refs.items() if other['arn'] == ref['arn']]
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_secret_value_cache():
+    """
+    Retorna o cache de valores de segredos compartilhado pela aplicação
+
+    Returns:
+        SecretValueCache: Instância única do cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SecretValueCache()
+        return _default_cache
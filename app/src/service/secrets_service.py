@@ -1,9 +1,11 @@
-import boto3
 from boto3 import Session
 from botocore.exceptions import ClientError
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from src.service.secret_value_cache import get_secret_value_cache
+from src.service.aws_client_factory import create_client
 
 load_dotenv()
 
@@ -22,10 +24,15 @@ class SecretsManagerService:
         session = Session()
         
         # Usa a cadeia de credenciais padrão (AWS Toolkit, CLI, etc.)
-        self.secrets_client = session.client(
+        self.secrets_client = create_client(
             'secretsmanager',
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            session=session
         )
+        
+        self.cache = get_secret_value_cache()
+        self.max_workers = int(os.getenv('SECRETS_MAX_CONCURRENCY', 8))
+        self._batch_supported = True
     
     def list_secrets(self):
         """
@@ -61,7 +68,7 @@ class SecretsManagerService:
     
     def get_secret_value(self, secret_name):
         """
-        Obtém o valor de um segredo específico
+        Obtém o valor de um segredo específico (usando o cache em memória)
         
         Args:
             secret_name (str): Nome ou ARN do segredo
@@ -69,75 +76,264 @@ class SecretsManagerService:
         Returns:
             dict: Valor do segredo ou erro
         """
+        cached = self._get_cached_values([secret_name])
+        if secret_name in cached:
+            return cached[secret_name]
+        
+        return self._fetch_secret_value(secret_name)
+    
+    def _fetch_secret_value(self, secret_name):
+        """
+        Busca o valor de um segredo no Secrets Manager e guarda no cache
+        """
         try:
             response = self.secrets_client.get_secret_value(SecretId=secret_name)
             
-            # Extrai o valor do segredo
-            if 'SecretString' in response:
-                secret_value = response['SecretString']
-                
-                # Tenta parsear como JSON
+            return self._store_value(secret_name, response)
+            
+        except ClientError as e:
+            return self._secret_error(secret_name, e.response['Error']['Code'], e.response['Error']['Message'])
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro inesperado: {str(e)}'
+            }
+    
+    def get_secret_values(self, secret_names):
+        """
+        Obtém o valor de vários segredos de uma vez
+        
+        Usa BatchGetSecretValue (até 20 segredos por chamada, chamadas em paralelo)
+        e cai para get_secret_value concorrente se a API não estiver disponível.
+        Valores em cache só são baixados de novo se o segredo mudou.
+        
+        Args:
+            secret_names (list): Nomes ou ARNs dos segredos
+        
+        Returns:
+            dict: Valores por nome (cada um no formato de get_secret_value)
+        """
+        try:
+            secret_names = list(dict.fromkeys(secret_names))
+            
+            values = self._get_cached_values(secret_names)
+            missing = [name for name in secret_names if name not in values]
+            
+            if missing and self._batch_supported:
                 try:
-                    secret_json = json.loads(secret_value)
-                    is_json = True
-                except json.JSONDecodeError:
-                    secret_json = None
-                    is_json = False
+                    values.update(self._batch_fetch(missing))
+                except ClientError as e:
+                    if e.response['Error']['Code'] not in ('AccessDeniedException', 'UnknownOperationException'):
+                        raise
+                    # Sem permissão para secretsmanager:BatchGetSecretValue: usa chamadas individuais
+                    self._batch_supported = False
                 
-                return {
-                    'success': True,
-                    'secret_name': secret_name,
-                    'secret_string': secret_value,
-                    'secret_json': secret_json,
-                    'is_json': is_json,
-                    'version_id': response.get('VersionId'),
-                    'created_date': response.get('CreatedDate').isoformat() if response.get('CreatedDate') else None
-                }
-            elif 'SecretBinary' in response:
-                # Segredo binário
-                return {
-                    'success': True,
-                    'secret_name': secret_name,
-                    'secret_binary': response['SecretBinary'],
-                    'is_binary': True,
-                    'version_id': response.get('VersionId'),
-                    'created_date': response.get('CreatedDate').isoformat() if response.get('CreatedDate') else None
-                }
-            else:
-                return {
-                    'success': False,
-                    'message': 'Segredo não contém valor'
-                }
+                missing = [name for name in secret_names if name not in values]
             
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                    for name, result in zip(missing, executor.map(self._fetch_secret_value, missing)):
+                        values[name] = result
             
-            if error_code == 'ResourceNotFoundException':
-                return {
-                    'success': False,
-                    'message': f'Segredo "{secret_name}" não encontrado'
-                }
-            elif error_code == 'InvalidRequestException':
-                return {
-                    'success': False,
-                    'message': 'Requisição inválida. Verifique o nome do segredo.'
-                }
-            elif error_code == 'InvalidParameterException':
-                return {
-                    'success': False,
-                    'message': 'Parâmetro inválido'
-                }
-            else:
-                return {
-                    'success': False,
-                    'message': f'Erro ao obter segredo: {e.response["Error"]["Message"]}'
-                }
+            return {
+                'success': True,
+                'values': values,
+                'count': len(values),
+                'errors': sum(1 for result in values.values() if not result['success']),
+                'cache': self.cache.get_stats()
+            }
+            
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro ao obter segredos: {e.response["Error"]["Message"]}'
+            }
         except Exception as e:
             return {
                 'success': False,
                 'message': f'Erro inesperado: {str(e)}'
             }
     
+    def _batch_fetch(self, secret_names):
+        """
+        Busca os valores com BatchGetSecretValue em lotes de 20, em paralelo
+        """
+        chunks = [secret_names[i:i + 20] for i in range(0, len(secret_names), 20)]
+        values = {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            for chunk, (responses, errors) in zip(chunks, executor.map(self._batch_fetch_chunk, chunks)):
+                for secret_id, response in responses.items():
+                    values[secret_id] = self._store_value(secret_id, response)
+                
+                for error in errors:
+                    if error.get('SecretId') in chunk:
+                        values[error['SecretId']] = self._secret_error(
+                            error['SecretId'], error.get('ErrorCode'), error.get('Message')
+                        )
+        
+        return values
+    
+    def _batch_fetch_chunk(self, secret_names):
+        """
+        Executa BatchGetSecretValue para até 20 segredos (seguindo o NextToken)
+        
+        Returns:
+            tuple: (respostas por nome consultado, lista de erros)
+        """
+        params = {'SecretIdList': secret_names}
+        responses = {}
+        errors = []
+        
+        while True:
+            response = self.secrets_client.batch_get_secret_value(**params)
+            
+            for secret in response.get('SecretValues', []):
+                # A resposta traz nome e ARN; associa ao identificador consultado
+                for secret_id in (secret.get('Name'), secret.get('ARN')):
+                    if secret_id in secret_names:
+                        responses[secret_id] = secret
+            
+            errors.extend(response.get('Errors', []))
+            
+            if not response.get('NextToken'):
+                break
+            params['NextToken'] = response['NextToken']
+        
+        return responses, errors
+    
+    def _get_cached_values(self, secret_names):
+        """
+        Retorna os valores em cache ainda válidos, revalidando com describe_secret
+        (em paralelo) os que passaram do intervalo de revalidação
+        """
+        values = {}
+        stale = {}
+        
+        for name in secret_names:
+            value, ref, needs_validation = self.cache.lookup(name)
+            if value is None:
+                continue
+            if needs_validation:
+                stale[name] = (value, ref)
+            else:
+                values[name] = value
+        
+        self.cache.count('hits', len(values))
+        
+        if stale:
+            names = list(stale)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+                for name, valid in zip(names, executor.map(lambda n: self._revalidate(n, stale[n][1]), names)):
+                    if valid:
+                        values[name] = stale[name][0]
+        
+        self.cache.count('misses', len(secret_names) - len(values))
+        return values
+    
+    def _revalidate(self, secret_name, ref):
+        """
+        Verifica com describe_secret se a versão em cache ainda é a atual
+        
+        Returns:
+            bool: True se o valor em cache pode ser usado
+        """
+        try:
+            response = self.secrets_client.describe_secret(SecretId=secret_name)
+        except Exception:
+            self.cache.invalidate(secret_name)
+            return False
+        
+        # LastChangedDate também muda com tags/descrição: o que importa é a versão
+        # em cache continuar sendo a AWSCURRENT (sem VersionIdsToStages, baixa de novo)
+        stages = response.get('VersionIdsToStages') or {}
+        unchanged = 'AWSCURRENT' in stages.get(ref['version_id'], [])
+        
+        if unchanged:
+            self.cache.mark_valid(secret_name)
+            self.cache.count('revalidated')
+            return True
+        
+        self.cache.invalidate(secret_name)
+        return False
+    
+    def _store_value(self, secret_name, response):
+        """
+        Formata a resposta do Secrets Manager e guarda no cache
+        """
+        result = self._format_secret_value(secret_name, response)
+        
+        if result['success']:
+            self.cache.store(secret_name, response.get('ARN'), response.get('VersionId'), result)
+        
+        return result
+    
+    def _format_secret_value(self, secret_name, response):
+        """
+        Formata a resposta de GetSecretValue/BatchGetSecretValue
+        """
+        # Extrai o valor do segredo
+        if 'SecretString' in response:
+            secret_value = response['SecretString']
+            
+            # Tenta parsear como JSON
+            try:
+                secret_json = json.loads(secret_value)
+                is_json = True
+            except json.JSONDecodeError:
+                secret_json = None
+                is_json = False
+            
+            return {
+                'success': True,
+                'secret_name': secret_name,
+                'secret_string': secret_value,
+                'secret_json': secret_json,
+                'is_json': is_json,
+                'version_id': response.get('VersionId'),
+                'created_date': response.get('CreatedDate').isoformat() if response.get('CreatedDate') else None
+            }
+        elif 'SecretBinary' in response:
+            # Segredo binário
+            return {
+                'success': True,
+                'secret_name': secret_name,
+                'secret_binary': response['SecretBinary'],
+                'is_binary': True,
+                'version_id': response.get('VersionId'),
+                'created_date': response.get('CreatedDate').isoformat() if response.get('CreatedDate') else None
+            }
+        else:
+            return {
+                'success': False,
+                'message': 'Segredo não contém valor'
+            }
+    
+    def _secret_error(self, secret_name, error_code, message):
+        """
+        Monta a mensagem de erro ao obter o valor de um segredo
+        """
+        if error_code == 'ResourceNotFoundException':
+            return {
+                'success': False,
+                'message': f'Segredo "{secret_name}" não encontrado'
+            }
+        elif error_code == 'InvalidRequestException':
+            return {
+                'success': False,
+                'message': 'Requisição inválida. Verifique o nome do segredo.'
+            }
+        elif error_code == 'InvalidParameterException':
+            return {
+                'success': False,
+                'message': 'Parâmetro inválido'
+            }
+        else:
+            return {
+                'success': False,
+                'message': f'Erro ao obter segredo: {message}'
+            }
+    
     def describe_secret(self, secret_name):
         """
         Obtém detalhes de um segredo (sem revelar o valor)
@@ -243,6 +439,8 @@ class SecretsManagerService:
                 SecretString=secret_value
             )
             
+            self.cache.invalidate(secret_name)
+            
             return {
                 'success': True,
                 'message': f'Segredo "{secret_name}" atualizado com sucesso',
@@ -284,6 +482,8 @@ class SecretsManagerService:
             
             response = self.secrets_client.delete_secret(**params)
             
+            self.cache.invalidate(secret_name)
+            
             deletion_date = response.get('DeletionDate')
             
             if force_delete:
@@ -0,0 +1,387 @@
+import json
+import os
+import threading
+import time
+import uuid
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.api_load_test_service import LatencyHistogram
+from src.service.messaging_service import MessagingService
+
+load_dotenv()
+
+
+class SNSFanoutTester:
+    """
+    Teste ponta a ponta de fan-out SNS -> SQS (vazão, latência de entrega e perda)
+
+    - Cria uma fila SQS temporária, libera o tópico na policy da fila e a
+      inscreve com RawMessageDelivery
+    - Os receptores começam antes da publicação: a latência é medida do
+      momento em que a mensagem foi montada até o recebimento (mesmo relógio)
+    - Publica N mensagens com PublishBatch e espera as entregas até todas
+      chegarem ou ficar settle_timeout segundos sem receber nada
+    - Perdidas = publicadas - recebidas (sem contar duplicadas)
+    - A inscrição e a fila são removidas ao final, mesmo em caso de erro
+    """
+
+    QUEUE_PREFIX = 'dev-manager-fanout-'
+
+    def __init__(self, messaging_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.service = messaging_service or MessagingService()
+        self.receivers = int(os.getenv('SNS_FANOUT_RECEIVERS', 8))
+        self.retention = float(os.getenv('SNS_FANOUT_RETENTION', 3600))
+
+        self._jobs = {}
+        self._next_job_id = 1
+        self._lock = threading.Lock()
+
+    # ==================== JOBS ====================
+
+    def start(self, topic_arn, count, concurrency=None, settle_timeout=10):
+        """
+        Inicia o teste em background
+
+        Args:
+            topic_arn (str): ARN do tópico
+            count (int): Mensagens publicadas
+            concurrency (int): Chamadas PublishBatch simultâneas
+            settle_timeout (float): Segundos sem entregas até considerar o restante perdido
+
+        Returns:
+            dict: ID do teste
+        """
+        self._cleanup()
+
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+
+            job = self._jobs[job_id] = {
+                'id': job_id,
+                'run_id': uuid.uuid4().hex[:12],
+                'topic_arn': topic_arn,
+                'count': count,
+                'concurrency': concurrency,
+                'settle_timeout': settle_timeout,
+                'fifo': topic_arn.endswith('.fifo'),
+                'status': 'running',
+                'phase': 'setup',
+                'message': None,
+                'queue_url': None,
+                'subscription_arn': None,
+                'publish': None,
+                'published': 0,
+                'received': 0,
+                'duplicates': 0,
+                'seen': bytearray(count),
+                'histogram': LatencyHistogram(),
+                'last_received': time.perf_counter(),
+                'publishing': True,
+                'receive_error': None,
+                'started': time.perf_counter(),
+                'elapsed': None,
+                'finished': False,
+                'lock': threading.Lock()
+            }
+
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Teste de fan-out iniciado',
+            'job_id': job_id
+        }
+
+    def get_job(self, job_id):
+        """
+        Retorna o progresso/resultado de um teste
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Teste {job_id} não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(job)
+        }
+
+    def iter_progress(self, job_id, interval=0.5):
+        """
+        Gera o progresso do teste até ele terminar (para streaming)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            yield {'type': 'finished', 'success': False, 'message': f'Teste {job_id} não encontrado'}
+            return
+
+        while True:
+            finished = job['finished']
+            snapshot = self._snapshot(job)
+
+            if finished:
+                yield {'type': 'finished', 'success': snapshot['status'] == 'completed', 'job': snapshot}
+                return
+
+            yield {'type': 'progress', 'job': snapshot}
+            time.sleep(interval)
+
+    def _cleanup(self):
+        """
+        Descarta testes terminados há mais de SNS_FANOUT_RETENTION segundos
+        """
+        now = time.perf_counter()
+
+        with self._lock:
+            for job in [job for job in self._jobs.values() if job['finished']]:
+                if now - job['started'] - job['elapsed'] > self.retention:
+                    self._jobs.pop(job['id'])
+
+    # ==================== TESTE ====================
+
+    def _run(self, job):
+        """
+        Prepara a fila, publica, aguarda as entregas e remove os recursos temporários
+        """
+        receivers = []
+
+        try:
+            self._setup(job)
+
+            job['phase'] = 'publishing'
+            receivers = [
+                threading.Thread(target=self._receive_loop, args=(job,), daemon=True)
+                for _ in range(self.receivers)
+            ]
+            for receiver in receivers:
+                receiver.start()
+
+            job['publish'] = self.service.publish_batch(job['topic_arn'], self._entries(job), job['concurrency'])
+            with job['lock']:
+                job['published'] = job['publish'].get('sent', 0)
+                # O prazo sem entregas conta a partir do fim da publicação
+                job['last_received'] = time.perf_counter()
+                job['publishing'] = False
+                job['phase'] = 'receiving'
+
+            for receiver in receivers:
+                receiver.join()
+
+            status, message = 'completed', None
+            if not job['publish']['success']:
+                status, message = 'failed', job['publish']['message']
+            elif job['receive_error']:
+                status, message = 'failed', job['receive_error']
+
+        except ClientError as e:
+            status, message = 'failed', e.response['Error']['Message']
+        except Exception as e:
+            status, message = 'failed', str(e)
+        finally:
+            job['publishing'] = False
+            for receiver in receivers:
+                receiver.join()
+
+        job['phase'] = 'cleanup'
+        cleanup_error = self._teardown(job)
+
+        with job['lock']:
+            job['status'] = status
+            job['message'] = message or cleanup_error
+            job['phase'] = 'done'
+            job['elapsed'] = time.perf_counter() - job['started']
+            job['finished'] = True
+
+    def _setup(self, job):
+        """
+        Fila temporária com policy liberando o tópico e inscrição com RawMessageDelivery
+        """
+        sqs = self.service.sqs_client
+        name = f"{self.QUEUE_PREFIX}{job['run_id']}" + ('.fifo' if job['fifo'] else '')
+        attributes = {'MessageRetentionPeriod': '3600'}
+        if job['fifo']:
+            attributes['FifoQueue'] = 'true'
+
+        job['queue_url'] = sqs.create_queue(QueueName=name, Attributes=attributes)['QueueUrl']
+        queue_arn = sqs.get_queue_attributes(
+            QueueUrl=job['queue_url'],
+            AttributeNames=['QueueArn']
+        )['Attributes']['QueueArn']
+
+        sqs.set_queue_attributes(QueueUrl=job['queue_url'], Attributes={'Policy': json.dumps({
+            'Version': '2012-10-17',
+            'Statement': [{
+                'Effect': 'Allow',
+                'Principal': {'Service': 'sns.amazonaws.com'},
+                'Action': 'sqs:SendMessage',
+                'Resource': queue_arn,
+                'Condition': {'ArnEquals': {'aws:SourceArn': job['topic_arn']}}
+            }]
+        })})
+
+        job['subscription_arn'] = self.service.sns_client.subscribe(
+            TopicArn=job['topic_arn'],
+            Protocol='sqs',
+            Endpoint=queue_arn,
+            Attributes={'RawMessageDelivery': 'true'},
+            ReturnSubscriptionArn=True
+        )['SubscriptionArn']
+
+    def _teardown(self, job):
+        """
+        Remove a inscrição e a fila temporária
+
+        Returns:
+            str: Erro da limpeza (None se tudo foi removido)
+        """
+        errors = []
+
+        if job['subscription_arn']:
+            try:
+                self.service.sns_client.unsubscribe(SubscriptionArn=job['subscription_arn'])
+            except ClientError as e:
+                errors.append(f"inscrição: {e.response['Error']['Message']}")
+
+        if job['queue_url']:
+            try:
+                self.service.sqs_client.delete_queue(QueueUrl=job['queue_url'])
+            except ClientError as e:
+                errors.append(f"fila {job['queue_url']}: {e.response['Error']['Message']}")
+
+        return f"Falha ao remover recursos temporários ({'; '.join(errors)})" if errors else None
+
+    def _entries(self, job):
+        """
+        Mensagens do teste: o corpo leva o número de sequência e o instante de envio
+        """
+        for seq in range(job['count']):
+            yield {
+                'body': json.dumps({'fanout_test': job['run_id'], 'seq': seq, 'sent_at': time.time()}),
+                'group_id': f'fanout-{seq % 10}' if job['fifo'] else None,
+                'deduplication_id': f"{job['run_id']}-{seq}" if job['fifo'] else None
+            }
+
+    def _receive_loop(self, job):
+        """
+        Um receptor: recebe, registra a latência e apaga, até todas chegarem ou as entregas pararem
+        """
+        try:
+            self._receive_batches(job)
+        except ClientError as e:
+            job['receive_error'] = e.response['Error']['Message']
+        except Exception as e:
+            job['receive_error'] = str(e)
+
+    def _receive_batches(self, job):
+        """
+        Recebe em lotes de 10 com long polling curto
+        """
+        while not job['receive_error']:
+            with job['lock']:
+                done = not job['publishing'] and (
+                    job['received'] >= job['published']
+                    or time.perf_counter() - job['last_received'] > job['settle_timeout']
+                )
+            if done:
+                return
+
+            response = self.service.sqs_client.receive_message(
+                QueueUrl=job['queue_url'],
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=1
+            )
+            messages = response.get('Messages', [])
+            if not messages:
+                continue
+
+            now = time.time()
+            with job['lock']:
+                job['last_received'] = time.perf_counter()
+                for message in messages:
+                    self._record(job, message, now)
+
+            self.service.sqs_client.delete_message_batch(
+                QueueUrl=job['queue_url'],
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']}
+                    for index, message in enumerate(messages)
+                ]
+            )
+
+    def _record(self, job, message, now):
+        """
+        Registra uma entrega (chamado com o lock adquirido)
+        """
+        body = json.loads(message['Body'])
+        if 'fanout_test' not in body and 'Message' in body:
+            # Inscrição sem RawMessageDelivery: o corpo é o envelope do SNS
+            body = json.loads(body['Message'])
+
+        if body.get('fanout_test') != job['run_id']:
+            return
+
+        seq = body['seq']
+        if job['seen'][seq]:
+            job['duplicates'] += 1
+            return
+
+        job['seen'][seq] = 1
+        job['received'] += 1
+        job['histogram'].record(max(0.0, now - body['sent_at']))
+
+    def _snapshot(self, job):
+        """
+        Estado do teste para a API (sem os campos internos)
+        """
+        with job['lock']:
+            elapsed = job['elapsed'] if job['elapsed'] is not None else time.perf_counter() - job['started']
+            publish = job['publish'] or {}
+
+            return {
+                'id': job['id'],
+                'topic_arn': job['topic_arn'],
+                'queue_url': job['queue_url'],
+                'status': job['status'],
+                'phase': job['phase'],
+                'message': job['message'],
+                'count': job['count'],
+                'published': job['published'],
+                'publish_failed': publish.get('failed', 0),
+                'publish_api_calls': publish.get('api_calls', 0),
+                'publish_seconds': publish.get('elapsed_seconds'),
+                'publish_per_second': publish.get('messages_per_second'),
+                'received': job['received'],
+                'duplicates': job['duplicates'],
+                'lost': job['published'] - job['received'] if job['finished'] else None,
+                'loss_rate': round((job['published'] - job['received']) / job['published'], 4)
+                if job['finished'] and job['published'] else None,
+                'latency': job['histogram'].summary(),
+                'latency_buckets': job['histogram'].buckets() if job['finished'] else None,
+                'elapsed_seconds': round(elapsed, 3),
+                'finished': job['finished']
+            }
+
+
+_default_tester = None
+_default_tester_lock = threading.Lock()
+
+
+def get_sns_fanout_tester():
+    """
+    Retorna o testador compartilhado pela aplicação (os testes ficam em memória)
+
+    Returns:
+        SNSFanoutTester: Instância única
+    """
+    global _default_tester
+
+    with _default_tester_lock:
+        if _default_tester is None:
+            _default_tester = SNSFanoutTester()
+        return _default_tester
@@ -0,0 +1,521 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.service.messaging_service import MessagingService
+
+load_dotenv()
+
+
+class SQSDrainService:
+    """
+    Leitura em massa de filas SQS (peek ou drain)
+
+    - Vários receptores em paralelo com long polling, 10 mensagens por chamada
+    - As mensagens vão para um arquivo NDJSON temporário: o stream para o
+      navegador e a exportação leem desse arquivo, sem acumular em memória
+    - drain: cada lote recebido é apagado com DeleteMessageBatch
+    - peek: ao final (inclusive em erro ou cancelamento) as mensagens voltam
+      a ficar visíveis (ChangeMessageVisibilityBatch com timeout 0); durante
+      leituras mais longas que o visibility timeout a invisibilidade das
+      mensagens já lidas é renovada perto de expirar, dobrando o prazo a cada
+      renovação (poucas chamadas por mensagem mesmo em leituras grandes), e
+      reentregas são descartadas pelo MessageId
+    - Para ao atingir o limite de mensagens/bytes ou quando um long polling
+      volta vazio (fila vazia ou restante invisível)
+    """
+
+    PEEK = 'peek'
+    DRAIN = 'drain'
+    MODES = (PEEK, DRAIN)
+
+    # Limite da AWS para a invisibilidade de uma mensagem desde o recebimento
+    MAX_VISIBILITY = 43200
+
+    def __init__(self, messaging_service=None):
+        """
+        Inicializa o serviço
+        """
+        self.sqs_client = (messaging_service or MessagingService()).sqs_client
+        self.max_receivers = int(os.getenv('SQS_DRAIN_MAX_RECEIVERS', 10))
+        self.retention = float(os.getenv('SQS_DRAIN_RETENTION', 3600))
+
+        self._jobs = {}
+        self._next_job_id = 1
+        self._lock = threading.Lock()
+
+    # ==================== JOBS ====================
+
+    def start(self, queue_url, mode, max_messages, max_bytes=None, receivers=None,
+              wait_time=5, visibility_timeout=120):
+        """
+        Inicia a leitura da fila em background
+
+        Args:
+            queue_url (str): URL da fila
+            mode (str): 'peek' ou 'drain'
+            max_messages (int): Quantidade máxima de mensagens
+            max_bytes (int): Soma máxima do tamanho dos corpos (None = sem limite)
+            receivers (int): Receptores simultâneos
+            wait_time (int): WaitTimeSeconds do long polling (1 a 20)
+            visibility_timeout (int): Segundos que as mensagens ficam invisíveis durante a leitura
+
+        Returns:
+            dict: ID do job
+        """
+        self._cleanup()
+        spool = tempfile.NamedTemporaryFile(mode='w', suffix='.ndjson', prefix='sqs-drain-', delete=False, encoding='utf-8')
+
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+
+            self._jobs[job_id] = {
+                'id': job_id,
+                'queue_url': queue_url,
+                'mode': mode,
+                'max_messages': max_messages,
+                'max_bytes': max_bytes,
+                'receivers': min(receivers or self.max_receivers, self.max_receivers),
+                'wait_time': wait_time,
+                'visibility_timeout': visibility_timeout,
+                'status': 'running',
+                'stop_reason': None,
+                'message': None,
+                'received': 0,
+                'bytes': 0,
+                'deleted': 0,
+                'released': 0,
+                'duplicates': 0,
+                'api_calls': 0,
+                'empty_polls': 0,
+                'spool': spool,
+                'spool_path': spool.name,
+                'receipt_handles': {},
+                'leases': {},
+                'started': time.perf_counter(),
+                'elapsed': None,
+                'cancelled': False,
+                'finished': False,
+                'lock': threading.Lock()
+            }
+
+        threading.Thread(target=self._run, args=(self._jobs[job_id],), daemon=True).start()
+
+        return {
+            'success': True,
+            'message': 'Leitura iniciada',
+            'job_id': job_id
+        }
+
+    def get_job(self, job_id):
+        """
+        Retorna o progresso de um job
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Job {job_id} não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(job)
+        }
+
+    def cancel_job(self, job_id):
+        """
+        Interrompe a leitura (o que já foi recebido continua disponível para exportação)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return {
+                'success': False,
+                'message': f'Job {job_id} não encontrado'
+            }
+
+        job['cancelled'] = True
+
+        return {
+            'success': True,
+            'message': 'Cancelamento solicitado'
+        }
+
+    def iter_messages(self, job_id, chunk_size=100, interval=0.5):
+        """
+        Gera as mensagens do job conforme chegam, em blocos (para streaming)
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            yield {'type': 'finished', 'success': False, 'message': f'Job {job_id} não encontrado'}
+            return
+
+        with open(job['spool_path'], encoding='utf-8') as spool:
+            while True:
+                finished = job['finished']
+                messages = []
+                position = spool.tell()
+
+                for line in iter(spool.readline, ''):
+                    if not line.endswith('\n'):
+                        # Linha ainda sendo escrita: relê na próxima volta
+                        spool.seek(position)
+                        break
+                    position = spool.tell()
+                    messages.append(json.loads(line))
+
+                    if len(messages) == chunk_size:
+                        yield {'type': 'messages', 'messages': messages, 'job': self._snapshot(job)}
+                        messages = []
+
+                if messages:
+                    yield {'type': 'messages', 'messages': messages, 'job': self._snapshot(job)}
+
+                if finished:
+                    yield {'type': 'finished', 'success': True, 'job': self._snapshot(job)}
+                    return
+
+                yield {'type': 'progress', 'job': self._snapshot(job)}
+                time.sleep(interval)
+
+    def get_export_path(self, job_id):
+        """
+        Caminho do arquivo NDJSON com as mensagens recebidas pelo job
+        """
+        job = self._jobs.get(job_id)
+        return job['spool_path'] if job else None
+
+    def _cleanup(self):
+        """
+        Descarta jobs terminados há mais de SQS_DRAIN_RETENTION segundos (e seus arquivos)
+        """
+        now = time.perf_counter()
+
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job['finished'] and now - job['started'] - job['elapsed'] > self.retention
+            ]
+            for job in expired:
+                self._jobs.pop(job['id'])
+
+        for job in expired:
+            try:
+                os.remove(job['spool_path'])
+            except OSError:
+                pass
+
+    # ==================== LEITURA ====================
+
+    def _run(self, job):
+        """
+        Executa os receptores e, no modo peek, devolve a visibilidade das mensagens
+        """
+        status, message = 'failed', None
+        stop_heartbeat = threading.Event()
+
+        if job['mode'] == self.PEEK:
+            threading.Thread(target=self._keep_invisible, args=(job, stop_heartbeat), daemon=True).start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=job['receivers']) as executor:
+                for future in [executor.submit(self._receive_loop, job) for _ in range(job['receivers'])]:
+                    future.result()
+
+            status = 'cancelled' if job['cancelled'] else 'completed'
+
+        except ClientError as e:
+            message = e.response['Error']['Message']
+        except Exception as e:
+            message = str(e)
+
+        finally:
+            stop_heartbeat.set()
+
+            if job['mode'] == self.PEEK:
+                # Mesmo após erro ou cancelamento, nada pode ficar invisível na fila
+                try:
+                    with job['lock']:
+                        receipt_handles = list(job['receipt_handles'].values())
+                    self._release(job, receipt_handles)
+                except ClientError as e:
+                    status, message = 'failed', message or e.response['Error']['Message']
+                except Exception as e:
+                    status, message = 'failed', message or str(e)
+
+        job['spool'].close()
+
+        with job['lock']:
+            job['status'] = status
+            job['message'] = message
+            job['stop_reason'] = job['stop_reason'] or status
+            job['elapsed'] = time.perf_counter() - job['started']
+            job['receipt_handles'] = {}
+            job['leases'] = {}
+            job['finished'] = True
+
+    def _receive_loop(self, job):
+        """
+        Um receptor: long polling até a fila esvaziar, o limite ser atingido ou o job ser cancelado
+        """
+        try:
+            self._receive_batches(job)
+        except Exception:
+            # Interrompe os demais receptores
+            job['stop_reason'] = 'error'
+            raise
+
+    def _receive_batches(self, job):
+        """
+        Recebe, grava e (no modo drain) apaga lotes de até 10 mensagens
+        """
+        while not job['cancelled'] and not job['stop_reason']:
+            response = self.sqs_client.receive_message(
+                QueueUrl=job['queue_url'],
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=job['wait_time'],
+                VisibilityTimeout=job['visibility_timeout'],
+                AttributeNames=['All'],
+                MessageAttributeNames=['All']
+            )
+            messages = response.get('Messages', [])
+
+            with job['lock']:
+                job['api_calls'] += 1
+                if not messages:
+                    job['empty_polls'] += 1
+                    # Long polling vazio: a fila está vazia (ou o resto está invisível)
+                    job['stop_reason'] = job['stop_reason'] or 'empty'
+                    return
+
+                if job['mode'] == self.PEEK:
+                    messages = self._skip_redelivered(job, messages)
+                    if job['duplicates'] >= job['max_messages']:
+                        # Só acontece se a renovação da invisibilidade falhar: limita as voltas na fila
+                        job['stop_reason'] = job['stop_reason'] or 'budget'
+                        return
+
+                accepted, excess = self._claim(job, messages)
+
+                for message in accepted:
+                    job['spool'].write(json.dumps(self._format_message(message), ensure_ascii=False) + '\n')
+                job['spool'].flush()
+
+                if job['mode'] == self.PEEK:
+                    now = time.monotonic()
+                    for message in accepted:
+                        job['receipt_handles'][message['MessageId']] = message['ReceiptHandle']
+                        job['leases'][message['MessageId']] = self._new_lease(job, now)
+
+            if job['mode'] == self.DRAIN and accepted:
+                self._delete(job, accepted)
+
+            # Mensagens além do limite não entram no resultado: voltam para a fila
+            self._release(job, [message['ReceiptHandle'] for message in excess])
+
+    def _skip_redelivered(self, job, messages):
+        """
+        Peek: descarta mensagens já lidas que voltaram a ficar visíveis,
+        guardando o receipt handle mais recente (chamado com o lock adquirido)
+        """
+        fresh = []
+
+        for message in messages:
+            if message['MessageId'] in job['receipt_handles']:
+                job['receipt_handles'][message['MessageId']] = message['ReceiptHandle']
+                job['leases'][message['MessageId']] = self._new_lease(job, time.monotonic())
+                job['duplicates'] += 1
+            else:
+                fresh.append(message)
+
+        return fresh
+
+    def _claim(self, job, messages):
+        """
+        Separa as mensagens que cabem no limite de quantidade/bytes (chamado com o lock adquirido)
+        """
+        accepted = []
+
+        for message in messages:
+            size = len(message.get('Body', '').encode('utf-8'))
+            over_count = job['received'] >= job['max_messages']
+            over_bytes = job['max_bytes'] is not None and job['bytes'] + size > job['max_bytes']
+
+            if over_count or over_bytes:
+                job['stop_reason'] = job['stop_reason'] or 'budget'
+                break
+
+            job['received'] += 1
+            job['bytes'] += size
+            accepted.append(message)
+
+        if job['received'] >= job['max_messages']:
+            job['stop_reason'] = job['stop_reason'] or 'budget'
+
+        return accepted, messages[len(accepted):]
+
+    def _delete(self, job, messages):
+        """
+        Apaga um lote recebido (até 10 mensagens) com DeleteMessageBatch
+        """
+        response = self.sqs_client.delete_message_batch(
+            QueueUrl=job['queue_url'],
+            Entries=[
+                {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']}
+                for index, message in enumerate(messages)
+            ]
+        )
+
+        with job['lock']:
+            job['api_calls'] += 1
+            job['deleted'] += len(response.get('Successful', []))
+
+    def _release(self, job, receipt_handles):
+        """
+        Torna mensagens visíveis de novo
+        """
+        released = self._change_visibility(job, receipt_handles, 0)
+
+        with job['lock']:
+            job['released'] += released
+
+    def _new_lease(self, job, now):
+        """
+        Prazo de invisibilidade de uma mensagem recém-recebida: [recebida em, expira em, duração]
+        """
+        return [now, now + job['visibility_timeout'], job['visibility_timeout']]
+
+    def _keep_invisible(self, job, stop):
+        """
+        Peek: renova a invisibilidade das mensagens já lidas antes que expire,
+        para que não sejam entregues de novo durante a leitura
+
+        Só entram na renovação as mensagens a menos de meio visibility timeout
+        de expirar, e cada renovação dobra o prazo da mensagem (até o limite de
+        12h da AWS): uma leitura de duração T custa ~log2(T / visibility
+        timeout) renovações por mensagem, em vez de uma a cada meio timeout
+        para todas as mensagens lidas. O peek devolve tudo com timeout 0 ao
+        final, então prazos longos não seguram a fila além da leitura
+        """
+        interval = max(min(job['visibility_timeout'] / 4, 5), 0.25)
+        margin = max(job['visibility_timeout'] / 2, interval * 2)
+
+        while not stop.wait(interval):
+            now = time.monotonic()
+            renewals = {}
+
+            with job['lock']:
+                for message_id, lease in job['leases'].items():
+                    received, expires, duration = lease
+                    if expires - now > margin:
+                        continue
+
+                    duration = min(duration * 2, self.MAX_VISIBILITY - int(now - received))
+                    if duration > 0:
+                        lease[1:] = [now + duration, duration]
+                        renewals.setdefault(duration, []).append(job['receipt_handles'][message_id])
+
+            try:
+                for duration, receipt_handles in renewals.items():
+                    self._change_visibility(job, receipt_handles, duration)
+            except Exception:
+                # Reentregas que escaparem são descartadas pelo MessageId
+                pass
+
+    def _change_visibility(self, job, receipt_handles, visibility_timeout):
+        """
+        ChangeMessageVisibilityBatch (10 por chamada, em paralelo)
+
+        Returns:
+            int: Mensagens alteradas
+        """
+        chunks = [receipt_handles[i:i + 10] for i in range(0, len(receipt_handles), 10)]
+        if not chunks:
+            return 0
+
+        def change(chunk):
+            response = self.sqs_client.change_message_visibility_batch(
+                QueueUrl=job['queue_url'],
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': handle, 'VisibilityTimeout': visibility_timeout}
+                    for index, handle in enumerate(chunk)
+                ]
+            )
+            return len(response.get('Successful', []))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_receivers, len(chunks))) as executor:
+            changed = sum(executor.map(change, chunks))
+
+        with job['lock']:
+            job['api_calls'] += len(chunks)
+
+        return changed
+
+    def _format_message(self, message):
+        """
+        Mensagem no formato exportado (uma linha do NDJSON)
+        """
+        attributes = message.get('Attributes', {})
+
+        return {
+            'message_id': message.get('MessageId'),
+            'body': message.get('Body'),
+            'receipt_handle': message.get('ReceiptHandle'),
+            'sent_timestamp': attributes.get('SentTimestamp'),
+            'receive_count': attributes.get('ApproximateReceiveCount'),
+            'group_id': attributes.get('MessageGroupId'),
+            'attributes': attributes,
+            'message_attributes': message.get('MessageAttributes', {})
+        }
+
+    def _snapshot(self, job):
+        """
+        Estado do job para a API (sem os campos internos)
+        """
+        with job['lock']:
+            elapsed = job['elapsed'] if job['elapsed'] is not None else time.perf_counter() - job['started']
+
+            return {
+                'id': job['id'],
+                'queue_url': job['queue_url'],
+                'mode': job['mode'],
+                'status': job['status'],
+                'stop_reason': job['stop_reason'],
+                'message': job['message'],
+                'received': job['received'],
+                'bytes': job['bytes'],
+                'deleted': job['deleted'],
+                'released': job['released'],
+                'duplicates': job['duplicates'],
+                'api_calls': job['api_calls'],
+                'receivers': job['receivers'],
+                'max_messages': job['max_messages'],
+                'max_bytes': job['max_bytes'],
+                'elapsed_seconds': round(elapsed, 3),
+                'messages_per_second': round(job['received'] / elapsed, 1) if elapsed else 0,
+                'finished': job['finished']
+            }
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_sqs_drain_service():
+    """
+    Retorna o serviço compartilhado pela aplicação (os jobs ficam em memória)
+
+    Returns:
+        SQSDrainService: Instância única do serviço
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = SQSDrainService()
+        return _default_service
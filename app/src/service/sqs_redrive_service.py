@@ -0,0 +1,625 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+from src.database.db_manager import DatabaseManager
+from src.service.aws_client_factory import THROTTLE_ERROR_CODES, TokenBucket
+from src.service.messaging_service import MessagingService
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Limite do StartMessageMoveTask (MaxNumberOfMessagesPerSecond)
+NATIVE_MAX_RATE = 500
+
+
+class SQSRedriveService:
+    """
+    Redrive de DLQs SQS com controle de vazão e estado persistido no SQLite
+
+    - native: StartMessageMoveTask (a AWS move as mensagens); o progresso vem
+      de ListMessageMoveTasks
+    - pipeline: usado quando o redrive nativo não se aplica (limite de
+      mensagens, taxa acima de 500/s ou fracionária, filas FIFO ou API
+      indisponível).
+      Receptores com long polling -> SendMessageBatch no destino ->
+      DeleteMessageBatch na DLQ só do que foi enviado (entrega at-least-once),
+      com token bucket limitando mensagens/segundo
+    - Contadores gravados no SQLite a cada SQS_REDRIVE_FLUSH_INTERVAL segundos:
+      redrives interrompidos (cancelamento ou reinício da aplicação) podem ser
+      retomados de onde pararam
+    """
+
+    NATIVE = 'native'
+    PIPELINE = 'pipeline'
+    STRATEGIES = ('auto', NATIVE, PIPELINE)
+
+    # Estados do ListMessageMoveTasks -> estados do redrive
+    NATIVE_STATUS = {
+        'RUNNING': 'running',
+        'CANCELLING': 'running',
+        'COMPLETED': 'completed',
+        'CANCELLED': 'paused',
+        'FAILED': 'failed'
+    }
+
+    RESUMABLE = ('paused', 'interrupted', 'failed')
+
+    def __init__(self, messaging_service=None, db=None):
+        """
+        Inicializa o serviço e retoma o acompanhamento dos redrives nativos em andamento
+        """
+        self.sqs_client = (messaging_service or MessagingService()).sqs_client
+        self.db = db or DatabaseManager()
+
+        self.receivers = int(os.getenv('SQS_REDRIVE_RECEIVERS', 4))
+        self.poll_interval = float(os.getenv('SQS_REDRIVE_POLL_INTERVAL', 5))
+        self.flush_interval = float(os.getenv('SQS_REDRIVE_FLUSH_INTERVAL', 1))
+        self.visibility_timeout = int(os.getenv('SQS_REDRIVE_VISIBILITY_TIMEOUT', 60))
+
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+        # Pipelines que rodavam quando a aplicação parou não têm mais receptores
+        self.db.interrupt_running_redrive_jobs()
+        for row in self.db.get_redrive_jobs(limit=1000):
+            if row['status'] == 'running' and row['strategy'] == self.NATIVE:
+                self._start_thread(self._runtime(row), self._monitor_native)
+
+    # ==================== REDRIVES ====================
+
+    def start(self, source_queue_url, destination_queue_url=None, max_per_second=None,
+              max_messages=None, strategy='auto'):
+        """
+        Inicia o redrive em background
+
+        Args:
+            source_queue_url (str): URL da DLQ
+            destination_queue_url (str): URL do destino (None = fila de origem das mensagens)
+            max_per_second (float): Limite de mensagens por segundo (None = sem limite)
+            max_messages (int): Quantidade máxima de mensagens (None = até esvaziar a DLQ)
+            strategy (str): 'auto', 'native' ou 'pipeline'
+
+        Returns:
+            dict: ID do redrive e estratégia usada
+        """
+        try:
+            if strategy == 'auto':
+                strategy = self._choose_strategy(source_queue_url, destination_queue_url, max_per_second, max_messages)
+
+            if strategy == self.PIPELINE and not destination_queue_url:
+                destination_queue_url = self._source_queue(source_queue_url)
+
+            created = self.db.create_redrive_job(
+                source_queue_url, destination_queue_url, strategy, max_per_second, max_messages
+            )
+            if not created['success']:
+                return created
+
+            job = self._runtime(self.db.get_redrive_job(created['id']))
+            return self._launch(job)
+
+        except ClientError as e:
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Erro: {str(e)}'
+            }
+
+    def resume(self, job_id):
+        """
+        Retoma um redrive pausado, interrompido ou com falha, mantendo os contadores
+        """
+        row = self.db.get_redrive_job(job_id)
+        if not row:
+            return {
+                'success': False,
+                'message': f'Redrive {job_id} não encontrado'
+            }
+
+        if row['status'] not in self.RESUMABLE:
+            return {
+                'success': False,
+                'message': f'Redrive {job_id} está {row["status"]} e não pode ser retomado'
+            }
+
+        self.db.update_redrive_job(job_id, status='running', message=None)
+        row.update(status='running', message=None)
+
+        try:
+            return self._launch(self._runtime(row))
+        except ClientError as e:
+            self.db.update_redrive_job(job_id, status='failed', message=e.response['Error']['Message'])
+            return {
+                'success': False,
+                'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+            }
+
+    def cancel(self, job_id):
+        """
+        Pausa o redrive (pode ser retomado depois)
+        """
+        job = self._jobs.get(job_id)
+        if not job or job['finished']:
+            return {
+                'success': False,
+                'message': f'Redrive {job_id} não está em andamento'
+            }
+
+        job['cancelled'] = True
+
+        if job['strategy'] == self.NATIVE and job['task_handle']:
+            try:
+                self.sqs_client.cancel_message_move_task(TaskHandle=job['task_handle'])
+            except ClientError as e:
+                return {
+                    'success': False,
+                    'message': f'Erro AWS: {e.response["Error"]["Message"]}'
+                }
+
+        return {
+            'success': True,
+            'message': 'Cancelamento solicitado'
+        }
+
+    def get_job(self, job_id):
+        """
+        Estado de um redrive (SQLite + contadores em memória do que está rodando)
+        """
+        row = self.db.get_redrive_job(job_id)
+        if not row:
+            return {
+                'success': False,
+                'message': f'Redrive {job_id} não encontrado'
+            }
+
+        return {
+            'success': True,
+            'job': self._snapshot(row)
+        }
+
+    def list_jobs(self, source_queue_url=None, limit=50):
+        """
+        Redrives registrados, mais recentes primeiro
+        """
+        jobs = [self._snapshot(row) for row in self.db.get_redrive_jobs(source_queue_url, limit)]
+
+        return {
+            'success': True,
+            'jobs': jobs,
+            'count': len(jobs)
+        }
+
+    def iter_progress(self, job_id, interval=1):
+        """
+        Gera o estado do redrive até ele parar (para streaming)
+        """
+        while True:
+            result = self.get_job(job_id)
+            if not result['success']:
+                yield {'type': 'finished', 'success': False, 'message': result['message']}
+                return
+
+            job = result['job']
+            if job['status'] != 'running':
+                yield {'type': 'finished', 'success': job['status'] != 'failed', 'job': job}
+                return
+
+            yield {'type': 'progress', 'job': job}
+            time.sleep(interval)
+
+    def _choose_strategy(self, source_queue_url, destination_queue_url, max_per_second, max_messages):
+        """
+        Redrive nativo sempre que ele consegue respeitar os parâmetros pedidos
+        (MaxNumberOfMessagesPerSecond só aceita inteiros de 1 a 500)
+        """
+        fifo = source_queue_url.endswith('.fifo') or (destination_queue_url or '').endswith('.fifo')
+        native_rate = not max_per_second or (max_per_second <= NATIVE_MAX_RATE and float(max_per_second).is_integer())
+
+        if max_messages or fifo or not native_rate:
+            return self.PIPELINE
+        return self.NATIVE
+
+    def _source_queue(self, dlq_url):
+        """
+        Fila que usa a DLQ no RedrivePolicy (destino padrão do pipeline)
+        """
+        response = self.sqs_client.list_dead_letter_source_queues(QueueUrl=dlq_url, MaxResults=2)
+        urls = response.get('queueUrls', [])
+
+        if len(urls) != 1:
+            raise ValueError(
+                'Informe a fila de destino: a DLQ não é usada por nenhuma fila' if not urls
+                else 'Informe a fila de destino: a DLQ é usada por mais de uma fila'
+            )
+
+        return urls[0]
+
+    def _queue_arn(self, queue_url):
+        response = self.sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['QueueArn'])
+        return response['Attributes']['QueueArn']
+
+    def _runtime(self, row):
+        """
+        Estado em memória de um redrive em execução
+        """
+        job = {
+            'id': row['id'],
+            'source_queue_url': row['source_queue_url'],
+            'destination_queue_url': row['destination_queue_url'],
+            'strategy': row['strategy'],
+            'max_per_second': row['max_per_second'],
+            'max_messages': row['max_messages'],
+            'task_handle': row['task_handle'],
+            'moved': row['moved_count'] or 0,
+            'failed': row['failed_count'] or 0,
+            'base_moved': row['base_moved_count'] or 0,
+            'moved_at_start': row['moved_count'] or 0,
+            'to_move': row['to_move_count'],
+            'in_flight': 0,
+            'api_calls': 0,
+            'stop_reason': None,
+            'started': time.perf_counter(),
+            'flushed': time.monotonic(),
+            'cancelled': False,
+            'finished': False,
+            'lock': threading.Lock()
+        }
+
+        with self._lock:
+            self._jobs[job['id']] = job
+
+        return job
+
+    def _launch(self, job):
+        """
+        Inicia o redrive nativo (ou cai para o pipeline se a API não aceitar) e a thread de execução
+        """
+        if job['strategy'] == self.NATIVE:
+            try:
+                self._start_native(job)
+            except ClientError as e:
+                logger.warning('Redrive %s: StartMessageMoveTask indisponível (%s), usando pipeline', job['id'], e)
+                job['strategy'] = self.PIPELINE
+                job['destination_queue_url'] = job['destination_queue_url'] or self._source_queue(job['source_queue_url'])
+                self.db.update_redrive_job(
+                    job['id'],
+                    strategy=self.PIPELINE,
+                    message=f'Redrive nativo indisponível: {e.response["Error"]["Message"]}'
+                )
+
+        if job['strategy'] == self.NATIVE:
+            self._start_thread(job, self._monitor_native)
+        else:
+            self._start_thread(job, self._run_pipeline)
+
+        return {
+            'success': True,
+            'message': 'Redrive iniciado',
+            'job_id': job['id'],
+            'strategy': job['strategy']
+        }
+
+    def _start_thread(self, job, target):
+        threading.Thread(target=target, args=(job,), daemon=True).start()
+
+    # ==================== NATIVO ====================
+
+    def _start_native(self, job):
+        """
+        StartMessageMoveTask da DLQ para o destino (ou para as filas de origem)
+        """
+        params = {'SourceArn': self._queue_arn(job['source_queue_url'])}
+
+        if job['destination_queue_url']:
+            params['DestinationArn'] = self._queue_arn(job['destination_queue_url'])
+        if job['max_per_second']:
+            params['MaxNumberOfMessagesPerSecond'] = int(job['max_per_second'])
+
+        response = self.sqs_client.start_message_move_task(**params)
+
+        # O progresso do novo task soma ao que redrives anteriores já moveram
+        job['task_handle'] = response['TaskHandle']
+        job['source_arn'] = params['SourceArn']
+        job['base_moved'] = job['moved']
+        self.db.update_redrive_job(job['id'], task_handle=job['task_handle'], base_moved_count=job['base_moved'])
+
+    def _monitor_native(self, job):
+        """
+        Acompanha o move task com ListMessageMoveTasks até ele terminar
+        """
+        try:
+            source_arn = job.get('source_arn') or self._queue_arn(job['source_queue_url'])
+
+            while True:
+                response = self.sqs_client.list_message_move_tasks(SourceArn=source_arn, MaxResults=10)
+                task = next(
+                    (item for item in response.get('Results', []) if item.get('TaskHandle') == job['task_handle']),
+                    (response.get('Results') or [None])[0]
+                )
+
+                if task is None:
+                    self._finish(job, 'failed', 'Move task não encontrado')
+                    return
+
+                with job['lock']:
+                    job['api_calls'] += 1
+                    job['moved'] = job['base_moved'] + task.get('ApproximateNumberOfMessagesMoved', 0)
+                    job['to_move'] = task.get('ApproximateNumberOfMessagesToMove')
+
+                status = self.NATIVE_STATUS.get(task.get('Status'), 'running')
+                if status != 'running':
+                    self._finish(job, status, task.get('FailureReason'))
+                    return
+
+                self._flush(job, force=True)
+                time.sleep(self.poll_interval)
+
+        except ClientError as e:
+            self._finish(job, 'failed', e.response['Error']['Message'])
+        except Exception as e:
+            self._finish(job, 'failed', str(e))
+
+    # ==================== PIPELINE ====================
+
+    def _run_pipeline(self, job):
+        """
+        Executa os receptores até a DLQ esvaziar, o limite ser atingido ou o redrive ser pausado
+        """
+        # Rajada de no máximo um lote: a taxa vale desde o primeiro segundo
+        bucket = TokenBucket(job['max_per_second'], burst=min(job['max_per_second'], 10)) if job['max_per_second'] else None
+        receivers = max(1, min(self.receivers, int(job['max_per_second'] or self.receivers)))
+
+        try:
+            with ThreadPoolExecutor(max_workers=receivers) as executor:
+                for future in [executor.submit(self._pipeline_loop, job, bucket) for _ in range(receivers)]:
+                    future.result()
+
+            if job['cancelled']:
+                self._finish(job, 'paused', 'Pausado pelo usuário')
+            else:
+                self._finish(job, 'completed', 'Limite atingido' if job['stop_reason'] == 'budget' else 'DLQ vazia')
+
+        except ClientError as e:
+            self._finish(job, 'failed', e.response['Error']['Message'])
+        except Exception as e:
+            self._finish(job, 'failed', str(e))
+
+    def _pipeline_loop(self, job, bucket):
+        """
+        Um receptor: recebe da DLQ, envia ao destino e apaga da DLQ o que foi enviado
+        """
+        fifo = job['destination_queue_url'].endswith('.fifo')
+
+        # Taxas baixas (inclusive < 1/s): só recebe o que dá para mover dentro do visibility timeout
+        batch_size = 10
+        if job['max_per_second']:
+            batch_size = max(1, min(10, int(job['max_per_second'] * self.visibility_timeout / 2)))
+
+        try:
+            while not job['cancelled'] and not job['stop_reason']:
+                response = self.sqs_client.receive_message(
+                    QueueUrl=job['source_queue_url'],
+                    MaxNumberOfMessages=batch_size,
+                    WaitTimeSeconds=5,
+                    VisibilityTimeout=self.visibility_timeout,
+                    AttributeNames=['MessageGroupId', 'MessageDeduplicationId'],
+                    MessageAttributeNames=['All']
+                )
+                messages = response.get('Messages', [])
+
+                with job['lock']:
+                    job['api_calls'] += 1
+                    if not messages:
+                        # Long polling vazio: DLQ vazia (ou o resto está invisível)
+                        job['stop_reason'] = job['stop_reason'] or 'empty'
+                        return
+                    accepted, excess = self._claim(job, messages)
+
+                # Mensagens além do limite voltam a ficar visíveis na DLQ
+                self._release(job, excess)
+
+                if bucket:
+                    for _ in accepted:
+                        bucket.acquire()
+
+                self._move(job, accepted, fifo, bucket)
+                self._flush(job)
+
+        except Exception:
+            # Interrompe os demais receptores
+            job['stop_reason'] = 'error'
+            raise
+
+    def _claim(self, job, messages):
+        """
+        Reserva as mensagens que cabem no limite (chamado com o lock adquirido)
+        """
+        if not job['max_messages']:
+            job['in_flight'] += len(messages)
+            return messages, []
+
+        available = max(0, job['max_messages'] - job['moved'] - job['failed'] - job['in_flight'])
+        accepted = messages[:available]
+        job['in_flight'] += len(accepted)
+
+        if job['moved'] + job['failed'] + job['in_flight'] >= job['max_messages']:
+            job['stop_reason'] = job['stop_reason'] or 'budget'
+
+        return accepted, messages[len(accepted):]
+
+    def _move(self, job, messages, fifo, bucket):
+        """
+        SendMessageBatch no destino e DeleteMessageBatch na DLQ das entradas enviadas
+        """
+        if not messages:
+            return
+
+        entries = []
+        for index, message in enumerate(messages):
+            entry = {'Id': str(index), 'MessageBody': message['Body']}
+            if message.get('MessageAttributes'):
+                entry['MessageAttributes'] = message['MessageAttributes']
+            if fifo:
+                attributes = message.get('Attributes', {})
+                entry['MessageGroupId'] = attributes.get('MessageGroupId') or 'redrive'
+                entry['MessageDeduplicationId'] = attributes.get('MessageDeduplicationId') or message['MessageId']
+            entries.append(entry)
+
+        try:
+            response = self.sqs_client.send_message_batch(QueueUrl=job['destination_queue_url'], Entries=entries)
+        except ClientError as e:
+            if e.response['Error']['Code'] not in THROTTLE_ERROR_CODES:
+                raise
+            # Throttling no destino: reduz a taxa e devolve o lote à DLQ
+            if bucket:
+                bucket.throttled()
+            self._release(job, messages)
+            with job['lock']:
+                job['api_calls'] += 1
+                job['in_flight'] -= len(messages)
+            return
+
+        if bucket:
+            bucket.succeeded()
+
+        sent = [messages[int(item['Id'])] for item in response.get('Successful', [])]
+        failed = response.get('Failed', [])
+
+        if sent:
+            self.sqs_client.delete_message_batch(
+                QueueUrl=job['source_queue_url'],
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']}
+                    for index, message in enumerate(sent)
+                ]
+            )
+
+        # Falhas ficam na DLQ (voltam a ficar visíveis após o visibility timeout)
+        with job['lock']:
+            job['api_calls'] += 2 if sent else 1
+            job['in_flight'] -= len(messages)
+            job['moved'] += len(sent)
+            job['failed'] += len(failed)
+
+    def _release(self, job, messages):
+        """
+        Torna mensagens visíveis de novo na DLQ (ChangeMessageVisibilityBatch com timeout 0)
+        """
+        if not messages:
+            return
+
+        self.sqs_client.change_message_visibility_batch(
+            QueueUrl=job['source_queue_url'],
+            Entries=[
+                {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle'], 'VisibilityTimeout': 0}
+                for index, message in enumerate(messages)
+            ]
+        )
+
+        with job['lock']:
+            job['api_calls'] += 1
+
+    # ==================== ESTADO ====================
+
+    def _flush(self, job, force=False):
+        """
+        Grava os contadores no SQLite (no máximo a cada flush_interval segundos)
+        """
+        with job['lock']:
+            now = time.monotonic()
+            if not force and now - job['flushed'] < self.flush_interval:
+                return
+            job['flushed'] = now
+            counters = {'moved_count': job['moved'], 'failed_count': job['failed'], 'to_move_count': job['to_move']}
+
+        self.db.update_redrive_job(job['id'], **counters)
+
+    def _finish(self, job, status, message=None):
+        """
+        Grava o estado final do redrive
+        """
+        with job['lock']:
+            job['finished'] = True
+            job['elapsed'] = time.perf_counter() - job['started']
+
+        self.db.update_redrive_job(
+            job['id'],
+            status=status,
+            message=message,
+            moved_count=job['moved'],
+            failed_count=job['failed'],
+            to_move_count=job['to_move']
+        )
+
+    def _snapshot(self, row):
+        """
+        Linha do SQLite com os contadores atuais da execução em memória
+        """
+        job = self._jobs.get(row['id'])
+        snapshot = {
+            'id': row['id'],
+            'source_queue_url': row['source_queue_url'],
+            'destination_queue_url': row['destination_queue_url'],
+            'strategy': row['strategy'],
+            'status': row['status'],
+            'message': row['message'],
+            'max_per_second': row['max_per_second'],
+            'max_messages': row['max_messages'],
+            'moved': row['moved_count'] or 0,
+            'failed': row['failed_count'] or 0,
+            'to_move': row['to_move_count'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'api_calls': None,
+            'elapsed_seconds': None,
+            'messages_per_second': None
+        }
+
+        if job and row['status'] == 'running':
+            with job['lock']:
+                elapsed = time.perf_counter() - job['started']
+                snapshot.update({
+                    'strategy': job['strategy'],
+                    'moved': job['moved'],
+                    'failed': job['failed'],
+                    'to_move': job['to_move'],
+                    'api_calls': job['api_calls'],
+                    'elapsed_seconds': round(elapsed, 3),
+                    'messages_per_second': round((job['moved'] - job['moved_at_start']) / elapsed, 1) if elapsed else 0
+                })
+        elif job and job['finished']:
+            snapshot.update({
+                'api_calls': job['api_calls'],
+                'elapsed_seconds': round(job['elapsed'], 3),
+                'messages_per_second': round((job['moved'] - job['moved_at_start']) / job['elapsed'], 1) if job['elapsed'] else 0
+            })
+
+        return snapshot
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_sqs_redrive_service():
+    """
+    Retorna o serviço compartilhado pela aplicação
+
+    Returns:
+        SQSRedriveService: Instância única do serviço
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = SQSRedriveService()
+        return _default_service
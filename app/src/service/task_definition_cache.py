@@ -0,0 +1,102 @@
+import os
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class TaskDefinitionCache:
+    """
+    Cache LRU em memória das task definitions do ECS
+
+    - Indexado pelo ARN com revisão (family:revision): uma revisão registrada
+      é imutável, então a entrada nunca precisa ser revalidada
+    - Ao atingir ECS_TASK_DEFINITION_CACHE_SIZE descarta a menos usada
+    """
+
+    def __init__(self, max_entries=None):
+        """
+        Inicializa o cache
+
+        Args:
+            max_entries (int): Quantidade máxima de task definitions em memória
+        """
+        self.max_entries = max_entries or int(os.getenv('ECS_TASK_DEFINITION_CACHE_SIZE', 256))
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get_many(self, arns):
+        """
+        Procura várias task definitions
+
+        Args:
+            arns (list): ARNs com revisão
+
+        Returns:
+            tuple: (task definitions encontradas por ARN, ARNs ausentes)
+        """
+        found = {}
+        missing = []
+
+        with self._lock:
+            for arn in arns:
+                task_definition = self._entries.get(arn)
+                if task_definition is None:
+                    missing.append(arn)
+                    self._stats['misses'] += 1
+                else:
+                    self._entries.move_to_end(arn)
+                    found[arn] = task_definition
+                    self._stats['hits'] += 1
+
+        return found, missing
+
+    def store(self, arn, task_definition):
+        """
+        Armazena uma task definition
+        """
+        with self._lock:
+            self._entries[arn] = task_definition
+            self._entries.move_to_end(arn)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        """
+        Remove todas as task definitions do cache
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Retorna contadores de uso do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_task_definitions'] = len(self._entries)
+        return stats
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_task_definition_cache():
+    """
+    Retorna o cache compartilhado pela aplicação
+
+    Returns:
+        TaskDefinitionCache: Instância única do cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TaskDefinitionCache()
+        return _default_cache
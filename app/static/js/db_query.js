@@ -369,12 +369,13 @@ function selectFromTable(tableName) {
 /**
  * Carrega lista de Bastions
  */
-async function loadBastions() {
+async function loadBastions(event) {
     const select = document.getElementById('bastionInstanceId');
     select.innerHTML = '<option value="">Carregando...</option>';
     
     try {
-        const response = await fetch('/db-query/list-bastions');
+        // O botão "Atualizar" ignora o cache do status do SSM
+        const response = await fetch(`/db-query/list-bastions${event ? '?refresh=true' : ''}`);
         const result = await response.json();
         
         if (result.success) {
@@ -385,9 +386,14 @@ async function loadBastions() {
                 result.bastions.forEach(bastion => {
                     const option = document.createElement('option');
                     option.value = bastion.instance_id;
-                    option.textContent = `${bastion.name} (${bastion.instance_id}) - ${bastion.private_ip}`;
+                    option.textContent = `${bastion.healthy ? '🟢' : '🔴'} ${bastion.name} (${bastion.instance_id}) - ${bastion.private_ip} - SSM ${formatSsmStatus(bastion)}`;
                     select.appendChild(option);
                 });
+                
+                // Pré-seleciona o bastion saudável com ping mais recente
+                if (result.recommended) {
+                    select.value = result.recommended;
+                }
             }
         } else {
             select.innerHTML = '<option value="">Erro ao carregar</option>';
@@ -399,6 +405,20 @@ async function loadBastions() {
     }
 }
 
+/**
+ * Descreve o status do SSM Agent de um bastion
+ */
+function formatSsmStatus(bastion) {
+    if (bastion.ssm_status === 'unregistered') {
+        return 'não registrado';
+    }
+    
+    const lastPing = bastion.last_ping_seconds === null ? '' :
+        bastion.last_ping_seconds < 60 ? ` (ping há ${bastion.last_ping_seconds}s)` :
+        ` (ping há ${Math.round(bastion.last_ping_seconds / 60)} min)`;
+    return `${bastion.ping_status}${lastPing}`;
+}
+
 /**
  * Carrega lista de instâncias RDS
  */
@@ -497,6 +517,11 @@ async function createTunnel() {
             bootstrap.Modal.getInstance(document.getElementById('tunnelModal')).hide();
         } else {
             showAlert(result.message, 'danger');
+            
+            // Bastion offline: seleciona o saudável sugerido
+            if (result.recommended) {
+                document.getElementById('bastionInstanceId').value = result.recommended;
+            }
         }
         
     } catch (error) {
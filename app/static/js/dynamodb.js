@@ -18,7 +18,14 @@ createTableForm.addEventListener('submit', async (e) => {
 });
 
 refreshBtn.addEventListener('click', () => {
-    loadTables();
+    loadTables(true);
+});
+
+document.getElementById('billingMode').addEventListener('change', (e) => {
+    const provisioned = e.target.value === 'PROVISIONED';
+    document.querySelectorAll('.provisioned-field').forEach(field => {
+        field.classList.toggle('d-none', !provisioned);
+    });
 });
 
 /**
@@ -58,10 +65,20 @@ function showAlert(message, type = 'info', errors = []) {
  */
 async function createTable() {
     const formData = new FormData(createTableForm);
+    const provisioned = formData.get('billing_mode') === 'PROVISIONED';
     const data = {
         table_name: formData.get('table_name'),
         primary_key: formData.get('primary_key'),
-        primary_key_type: formData.get('primary_key_type')
+        primary_key_type: formData.get('primary_key_type'),
+        sort_key: formData.get('sort_key'),
+        sort_key_type: formData.get('sort_key_type'),
+        billing_mode: formData.get('billing_mode'),
+        read_capacity: provisioned ? formData.get('read_capacity') : null,
+        write_capacity: provisioned ? formData.get('write_capacity') : null,
+        stream_view_type: formData.get('stream_view_type'),
+        ttl_attribute: formData.get('ttl_attribute'),
+        global_indexes: collectIndexes('gsi', provisioned),
+        local_indexes: collectIndexes('lsi', provisioned)
     };
     
     // Desabilita o botão durante a requisição
@@ -82,7 +99,10 @@ async function createTable() {
         if (result.success) {
             showAlert(result.message, 'success');
             createTableForm.reset();
+            document.getElementById('indexRows').innerHTML = '';
+            document.querySelectorAll('.provisioned-field').forEach(field => field.classList.add('d-none'));
             loadTables(); // Recarrega a lista de tabelas
+            followTableStatus(data.table_name, result.watch);
         } else {
             showAlert(result.message, 'danger', result.errors);
         }
@@ -97,9 +117,136 @@ async function createTable() {
 }
 
 /**
- * Carrega a lista de tabelas existentes
+ * Adiciona uma linha de definição de índice (GSI ou LSI) ao formulário
  */
-async function loadTables() {
+function addIndexRow(kind) {
+    const row = document.createElement('div');
+    row.className = 'index-row border rounded p-2 mb-2 small';
+    row.dataset.kind = kind;
+    row.innerHTML = `
+        <div class="d-flex justify-content-between align-items-center mb-1">
+            <span class="badge bg-${kind === 'gsi' ? 'primary' : 'secondary'}">${kind.toUpperCase()}</span>
+            <button type="button" class="btn-close btn-sm" onclick="this.closest('.index-row').remove()"></button>
+        </div>
+        <div class="row g-1">
+            <div class="col-12">
+                <input type="text" class="form-control form-control-sm" data-field="name" placeholder="Nome do índice" required>
+            </div>
+            ${kind === 'gsi' ? `
+                <div class="col-8">
+                    <input type="text" class="form-control form-control-sm" data-field="partition_key" placeholder="Partition key" required>
+                </div>
+                <div class="col-4">${keyTypeSelect('partition_key_type')}</div>
+            ` : ''}
+            <div class="col-8">
+                <input type="text" class="form-control form-control-sm" data-field="sort_key"
+                       placeholder="${kind === 'gsi' ? 'Sort key (opcional)' : 'Sort key'}" ${kind === 'lsi' ? 'required' : ''}>
+            </div>
+            <div class="col-4">${keyTypeSelect('sort_key_type')}</div>
+            <div class="col-4">
+                <select class="form-select form-select-sm" data-field="projection">
+                    <option value="ALL">ALL</option>
+                    <option value="KEYS_ONLY">KEYS_ONLY</option>
+                    <option value="INCLUDE">INCLUDE</option>
+                </select>
+            </div>
+            <div class="col-8">
+                <input type="text" class="form-control form-control-sm" data-field="non_key_attributes" placeholder="Atributos (INCLUDE)">
+            </div>
+            ${kind === 'gsi' ? `
+                <div class="col-6 provisioned-field ${document.getElementById('billingMode').value === 'PROVISIONED' ? '' : 'd-none'}">
+                    <input type="number" class="form-control form-control-sm" data-field="read_capacity" value="5" min="1" placeholder="RCU">
+                </div>
+                <div class="col-6 provisioned-field ${document.getElementById('billingMode').value === 'PROVISIONED' ? '' : 'd-none'}">
+                    <input type="number" class="form-control form-control-sm" data-field="write_capacity" value="5" min="1" placeholder="WCU">
+                </div>
+            ` : ''}
+        </div>
+    `;
+    document.getElementById('indexRows').appendChild(row);
+}
+
+function keyTypeSelect(field) {
+    return `
+        <select class="form-select form-select-sm" data-field="${field}">
+            <option value="S">S</option>
+            <option value="N">N</option>
+            <option value="B">B</option>
+        </select>
+    `;
+}
+
+/**
+ * Lê as definições de índices do formulário
+ */
+function collectIndexes(kind, provisioned) {
+    return Array.from(document.querySelectorAll(`.index-row[data-kind="${kind}"]`)).map(row => {
+        const index = {};
+        row.querySelectorAll('[data-field]').forEach(input => {
+            index[input.dataset.field] = input.value;
+        });
+        if (!provisioned) {
+            delete index.read_capacity;
+            delete index.write_capacity;
+        }
+        return index;
+    });
+}
+
+/**
+ * Acompanha a tabela recém-criada via Server-Sent Events até ela ficar pronta
+ */
+function followTableStatus(tableName, watch) {
+    const container = document.getElementById('tableStatusContainer');
+    displayTableStatus(container, watch);
+
+    const source = new EventSource(`/dynamodb/tables/${encodeURIComponent(tableName)}/status/stream`);
+
+    source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+
+        if (data.watch) {
+            displayTableStatus(container, data.watch);
+        }
+
+        if (data.type === 'finished') {
+            source.close();
+            loadTables();
+        }
+    };
+
+    source.onerror = () => {
+        source.close();
+    };
+}
+
+/**
+ * Exibe o status da tabela, dos GSIs e do TTL
+ */
+function displayTableStatus(container, watch) {
+    const statusColors = { ACTIVE: 'success', ENABLED: 'success', CREATING: 'info', PENDING: 'info', FAILED: 'danger' };
+    const badge = (status) => `<span class="badge bg-${statusColors[status] || 'secondary'}">${status || '...'}</span>`;
+    const reasonColors = { ready: 'success', timeout: 'warning' };
+    const indexes = Object.entries(watch.indexes);
+
+    container.innerHTML = `
+        <div class="alert alert-${watch.finished ? (reasonColors[watch.reason] || 'danger') : 'info'} small mb-0">
+            <div class="d-flex justify-content-between">
+                <strong>${watch.finished ? '' : '<span class="spinner-border spinner-border-sm me-1"></span>'}${watch.table_name}</strong>
+                <span>${watch.elapsed_seconds.toFixed(0)}s</span>
+            </div>
+            <div>Tabela: ${badge(watch.table_status)}</div>
+            ${indexes.length ? `<div>GSIs: ${indexes.map(([name, status]) => `${name} ${badge(status)}`).join(' ')}</div>` : ''}
+            ${watch.ttl_attribute ? `<div>TTL (${watch.ttl_attribute}): ${badge(watch.ttl_status)}</div>` : ''}
+            ${watch.message ? `<div class="mt-1">${watch.message}</div>` : ''}
+        </div>
+    `;
+}
+
+/**
+ * Carrega o inventário das tabelas existentes (refresh = ignora o cache do servidor)
+ */
+async function loadTables(refresh = false) {
     tablesContainer.innerHTML = `
         <div class="text-center">
             <div class="spinner-border text-primary" role="status">
@@ -110,11 +257,11 @@ async function loadTables() {
     `;
     
     try {
-        const response = await fetch('/dynamodb/list');
+        const response = await fetch(`/dynamodb/inventory${refresh ? '?refresh=true' : ''}`);
         const result = await response.json();
         
         if (result.success) {
-            displayTables(result.tables);
+            displayTables(result);
         } else {
             tablesContainer.innerHTML = `
                 <div class="alert alert-warning">
@@ -133,9 +280,25 @@ async function loadTables() {
 }
 
 /**
- * Exibe a lista de tabelas na interface
+ * Formata bytes em B/KB/MB/GB
+ */
+function formatBytes(bytes) {
+    const units = ['B', 'KB', 'MB', 'GB', 'TB'];
+    let value = bytes || 0;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+        value /= 1024;
+        unit++;
+    }
+    return `${value.toFixed(unit ? 1 : 0)} ${units[unit]}`;
+}
+
+/**
+ * Exibe o inventário de tabelas na interface
  */
-function displayTables(tables) {
+function displayTables(inventory) {
+    const tables = inventory.tables;
+    
     if (!tables || tables.length === 0) {
         tablesContainer.innerHTML = `
             <div class="empty-state">
@@ -147,9 +310,32 @@ function displayTables(tables) {
         return;
     }
     
-    let html = '<div class="row">';
+    const statusColors = { ACTIVE: 'success', CREATING: 'info', UPDATING: 'warning', DELETING: 'danger' };
+    
+    let html = `
+        <div class="small text-muted mb-3">
+            <strong>${inventory.count}</strong> tabelas |
+            <strong>${inventory.totals.item_count.toLocaleString('pt-BR')}</strong> itens |
+            <strong>${formatBytes(inventory.totals.size_bytes)}</strong> |
+            ${inventory.totals.gsi_count} GSIs |
+            ${inventory.described} descritas agora, ${inventory.refreshing} atualizando em background
+            (${inventory.elapsed_ms} ms)
+        </div>
+    `;
+    
+    inventory.errors.forEach(error => {
+        html += `<div class="alert alert-warning py-1 small"><i class="bi bi-exclamation-triangle"></i> ${error.table}: ${error.message}</div>`;
+    });
+    
+    html += '<div class="row">';
     
-    tables.forEach(tableName => {
+    tables.forEach(table => {
+        const tableName = table.name;
+        const keys = table.key_schema.map(key => `${key.name} (${key.type})`).join(' + ');
+        const capacity = table.billing_mode === 'PROVISIONED'
+            ? `Provisionado ${table.read_capacity} RCU / ${table.write_capacity} WCU`
+            : 'On-demand';
+        
         html += `
             <div class="col-md-6 mb-3">
                 <div class="table-item">
@@ -159,10 +345,27 @@ function displayTables(tables) {
                                 <i class="bi bi-table"></i> ${tableName}
                             </div>
                             <div class="table-status">
-                                <span class="badge bg-success">Ativa</span>
+                                <span class="badge bg-${statusColors[table.status] || 'secondary'}">${table.status}</span>
+                                <span class="badge bg-light text-dark">${capacity}</span>
+                                ${table.stream_enabled ? `<span class="badge bg-primary">Stream: ${table.stream_view_type}</span>` : ''}
+                                ${table.deletion_protection ? '<span class="badge bg-dark">Proteção contra exclusão</span>' : ''}
+                            </div>
+                            <div class="small text-muted mt-1">
+                                <i class="bi bi-key"></i> ${keys} |
+                                ${table.item_count.toLocaleString('pt-BR')} itens |
+                                ${formatBytes(table.size_bytes)}
+                                ${table.lsi_count ? ` | ${table.lsi_count} LSIs` : ''}
                             </div>
+                            ${table.gsis.length ? `
+                                <div class="small text-muted">
+                                    <i class="bi bi-diagram-3"></i> GSIs:
+                                    ${table.gsis.map(index => `${index.name} (${index.status}, ${index.item_count.toLocaleString('pt-BR')} itens)`).join(', ')}
+                                </div>` : ''}
                         </div>
                         <div class="btn-group btn-group-sm">
+                            <button class="btn btn-outline-primary" onclick="openItems('${tableName}')" title="Ver itens">
+                                <i class="bi bi-grid-3x3"></i>
+                            </button>
                             <button class="btn btn-outline-info" onclick="viewTableInfo('${tableName}')" title="Ver detalhes">
                                 <i class="bi bi-info-circle"></i>
                             </button>
@@ -190,13 +393,18 @@ async function viewTableInfo(tableName) {
         
         if (result.success) {
             const tableData = result.data;
-            const keySchema = tableData.KeySchema[0];
-            const attributeDef = tableData.AttributeDefinitions[0];
+            const attributeTypes = {};
+            tableData.AttributeDefinitions.forEach(attribute => {
+                attributeTypes[attribute.AttributeName] = attribute.AttributeType;
+            });
+            const keys = tableData.KeySchema
+                .map(key => `${key.AttributeName} (${attributeTypes[key.AttributeName]}${key.KeyType === 'RANGE' ? ', sort' : ''})`)
+                .join(' + ');
             
             const info = `
                 <strong>Nome:</strong> ${tableData.TableName}<br>
                 <strong>Status:</strong> ${tableData.TableStatus}<br>
-                <strong>Chave Primária:</strong> ${keySchema.AttributeName} (${attributeDef.AttributeType})<br>
+                <strong>Chave Primária:</strong> ${keys}<br>
                 <strong>Itens:</strong> ${tableData.ItemCount || 0}<br>
                 <strong>Tamanho:</strong> ${(tableData.TableSizeBytes / 1024).toFixed(2)} KB<br>
                 <strong>Criada em:</strong> ${new Date(tableData.CreationDateTime).toLocaleString('pt-BR')}
@@ -243,3 +451,439 @@ async function deleteTable(tableName) {
         showAlert('Erro ao deletar tabela: ' + error.message, 'danger');
     }
 }
+
+// ==================== NAVEGAÇÃO NOS ITENS ====================
+
+// Linhas exibidas no máximo (o scan continua contando além disso)
+const MAX_RENDERED_ITEMS = 1000;
+
+const itemsModalElement = document.getElementById('itemsModal');
+const queryForm = document.getElementById('queryForm');
+const queryNextBtn = document.getElementById('queryNextBtn');
+const scanForm = document.getElementById('scanForm');
+const scanStopBtn = document.getElementById('scanStopBtn');
+const itemsResult = document.getElementById('itemsResult');
+const itemsStats = document.getElementById('itemsStats');
+const importForm = document.getElementById('importForm');
+const exportForm = document.getElementById('exportForm');
+const transferProgress = document.getElementById('transferProgress');
+
+let itemsTable = null;
+let itemsRows = [];
+let queryNextToken = null;
+let scanSource = null;
+let transferSource = null;
+
+queryForm.addEventListener('submit', (e) => {
+    e.preventDefault();
+    queryItems(false);
+});
+
+queryNextBtn.addEventListener('click', () => {
+    queryItems(true);
+});
+
+scanForm.addEventListener('submit', (e) => {
+    e.preventDefault();
+    startScan();
+});
+
+importForm.addEventListener('submit', (e) => {
+    e.preventDefault();
+    startImport();
+});
+
+exportForm.addEventListener('submit', (e) => {
+    e.preventDefault();
+    startExport();
+});
+
+scanStopBtn.addEventListener('click', () => {
+    stopScan('Scan interrompido');
+});
+
+itemsModalElement.addEventListener('hidden.bs.modal', () => {
+    stopScan();
+    stopTransferStream();
+});
+
+/**
+ * Abre o navegador de itens de uma tabela
+ */
+function openItems(tableName) {
+    itemsTable = tableName;
+    itemsRows = [];
+    queryNextToken = null;
+    queryNextBtn.disabled = true;
+    document.getElementById('itemsTableName').textContent = tableName;
+    itemsResult.innerHTML = '<p class="text-muted text-center mb-0">Faça uma consulta ou inicie um scan.</p>';
+    itemsStats.innerHTML = '';
+    transferProgress.innerHTML = '';
+
+    new bootstrap.Modal(itemsModalElement).show();
+}
+
+/**
+ * Query paginada (nextPage = true continua do token da página anterior)
+ */
+async function queryItems(nextPage) {
+    const formData = new FormData(queryForm);
+    const queryBtn = document.getElementById('queryBtn');
+    const data = {
+        partition_value: formData.get('partition_value'),
+        sort_operator: formData.get('sort_operator'),
+        sort_value: formData.get('sort_value'),
+        sort_value2: formData.get('sort_value2'),
+        index_name: formData.get('index_name'),
+        projection: formData.get('projection'),
+        limit: formData.get('limit'),
+        scan_forward: formData.get('scan_forward') === 'on',
+        next_token: nextPage ? queryNextToken : null
+    };
+
+    stopScan();
+    queryBtn.disabled = true;
+    queryNextBtn.disabled = true;
+
+    try {
+        const response = await fetch(`/dynamodb/items/${encodeURIComponent(itemsTable)}/query`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(data)
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            itemsRows = nextPage ? itemsRows.concat(result.items) : result.items;
+            queryNextToken = result.next_token;
+            renderItems();
+            itemsStats.innerHTML = `
+                <span class="me-3"><strong>Itens:</strong> ${itemsRows.length}</span>
+                <span class="me-3"><strong>Página:</strong> ${result.count} (${result.scanned_count} lidos)</span>
+                <span class="me-3"><strong>RCUs:</strong> ${result.consumed_capacity}</span>
+                <span class="me-3"><strong>Latência:</strong> ${result.elapsed_ms} ms</span>
+                ${queryNextToken ? '' : '<span class="badge bg-secondary">Fim dos resultados</span>'}
+            `;
+        } else {
+            itemsResult.innerHTML = `<div class="alert alert-danger mb-0">${escapeHtml(result.message)}</div>`;
+        }
+
+    } catch (error) {
+        itemsResult.innerHTML = `<div class="alert alert-danger mb-0">Erro ao consultar itens: ${escapeHtml(error.message)}</div>`;
+    } finally {
+        queryBtn.disabled = false;
+        queryNextBtn.disabled = !queryNextToken;
+    }
+}
+
+/**
+ * Scan paralelo: os itens chegam por Server-Sent Events conforme cada segmento pagina
+ */
+function startScan() {
+    const formData = new FormData(scanForm);
+    const params = new URLSearchParams();
+    ['segments', 'max_items', 'max_capacity', 'projection'].forEach(field => {
+        if (formData.get(field)) {
+            params.set(field, formData.get(field));
+        }
+    });
+
+    stopScan();
+    itemsRows = [];
+    queryNextBtn.disabled = true;
+    itemsResult.innerHTML = '<div class="text-center"><div class="spinner-border spinner-border-sm text-primary"></div> Percorrendo a tabela...</div>';
+    itemsStats.innerHTML = '';
+    document.getElementById('scanBtn').disabled = true;
+    scanStopBtn.disabled = false;
+
+    scanSource = new EventSource(`/dynamodb/items/${encodeURIComponent(itemsTable)}/scan/stream?${params}`);
+
+    scanSource.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+
+        if (data.type === 'items') {
+            if (itemsRows.length < MAX_RENDERED_ITEMS) {
+                itemsRows = itemsRows.concat(data.items.slice(0, MAX_RENDERED_ITEMS - itemsRows.length));
+                renderItems();
+            }
+            displayScanStats(data.stats, false);
+        } else if (data.type === 'finished') {
+            displayScanStats(data.stats, true);
+            if (!data.success) {
+                itemsResult.insertAdjacentHTML('afterbegin',
+                    `<div class="alert alert-danger">${escapeHtml(data.message)}</div>`);
+            } else if (!itemsRows.length) {
+                itemsResult.innerHTML = '<p class="text-muted text-center mb-0">Nenhum item encontrado.</p>';
+            }
+            stopScan();
+        }
+    };
+
+    scanSource.onerror = () => {
+        // Erros de validação voltam como 400 antes do stream começar
+        if (scanSource && scanSource.readyState === EventSource.CLOSED) {
+            itemsResult.innerHTML = '<div class="alert alert-danger mb-0">Não foi possível iniciar o scan. Verifique os parâmetros.</div>';
+        }
+        stopScan();
+    };
+}
+
+/**
+ * Fecha o stream do scan (o servidor libera os workers ao perceber a desconexão)
+ */
+function stopScan(message) {
+    if (scanSource) {
+        scanSource.close();
+        scanSource = null;
+        if (message) {
+            itemsStats.insertAdjacentHTML('beforeend', `<span class="badge bg-warning text-dark">${message}</span>`);
+        }
+    }
+    document.getElementById('scanBtn').disabled = false;
+    scanStopBtn.disabled = true;
+}
+
+/**
+ * Totais do scan no rodapé do modal
+ */
+function displayScanStats(stats, finished) {
+    const stopReasons = {
+        max_items: 'limite de itens atingido',
+        capacity: 'orçamento de RCUs atingido'
+    };
+    const segmentsDone = stats.segments.filter(segment => segment.done).length;
+
+    itemsStats.innerHTML = `
+        <span class="me-3"><strong>Itens:</strong> ${stats.items} (${stats.scanned} lidos)</span>
+        <span class="me-3"><strong>Páginas:</strong> ${stats.pages}</span>
+        <span class="me-3"><strong>Segmentos concluídos:</strong> ${segmentsDone}/${stats.segments.length}</span>
+        <span class="me-3"><strong>RCUs:</strong> ${stats.consumed_capacity}</span>
+        <span class="me-3"><strong>Vazão:</strong> ${stats.items_per_second} itens/s</span>
+        <span class="me-3"><strong>Tempo:</strong> ${stats.elapsed_seconds}s</span>
+        ${stats.items > MAX_RENDERED_ITEMS ? `<span class="me-3">(exibindo os primeiros ${MAX_RENDERED_ITEMS})</span>` : ''}
+        ${finished ? `<span class="badge bg-${stats.stop_reason ? 'warning text-dark' : 'success'}">
+            ${stats.stop_reason ? 'Parado: ' + stopReasons[stats.stop_reason] : 'Concluído'}</span>` : ''}
+    `;
+}
+
+/**
+ * Renderiza os itens em tabela (colunas = união dos atributos)
+ */
+function renderItems() {
+    if (!itemsRows.length) {
+        itemsResult.innerHTML = '<p class="text-muted text-center mb-0">Nenhum item encontrado.</p>';
+        return;
+    }
+
+    const columns = [];
+    itemsRows.forEach(item => {
+        Object.keys(item).forEach(key => {
+            if (!columns.includes(key)) {
+                columns.push(key);
+            }
+        });
+    });
+
+    const formatValue = (value) => {
+        if (value === undefined) {
+            return '<span class="text-muted">-</span>';
+        }
+        return escapeHtml(typeof value === 'object' ? JSON.stringify(value) : String(value));
+    };
+
+    itemsResult.innerHTML = `
+        <table class="table table-sm table-striped table-hover small mb-0">
+            <thead class="table-light sticky-top">
+                <tr>${columns.map(column => `<th>${escapeHtml(column)}</th>`).join('')}</tr>
+            </thead>
+            <tbody>
+                ${itemsRows.map(item => `
+                    <tr>${columns.map(column => `<td>${formatValue(item[column])}</td>`).join('')}</tr>
+                `).join('')}
+            </tbody>
+        </table>
+    `;
+}
+
+// ==================== IMPORTAÇÃO / EXPORTAÇÃO ====================
+
+/**
+ * Envia o arquivo como corpo da requisição (o servidor grava em disco em streaming)
+ */
+async function startImport() {
+    const formData = new FormData(importForm);
+    const file = formData.get('file');
+    const importBtn = document.getElementById('importBtn');
+    const params = new URLSearchParams({ filename: file.name });
+    ['format', 'writers', 'max_wcu'].forEach(field => {
+        if (formData.get(field)) {
+            params.set(field, formData.get(field));
+        }
+    });
+
+    importBtn.disabled = true;
+    transferProgress.innerHTML = '<div class="text-center"><div class="spinner-border spinner-border-sm text-primary"></div> Enviando arquivo...</div>';
+
+    try {
+        const response = await fetch(`/dynamodb/items/${encodeURIComponent(itemsTable)}/import?${params}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/octet-stream'
+            },
+            body: file
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            followTransfer(result.job_id);
+        } else {
+            transferProgress.innerHTML = `<div class="alert alert-danger mb-0">${escapeHtml(result.message)}</div>`;
+        }
+
+    } catch (error) {
+        transferProgress.innerHTML = `<div class="alert alert-danger mb-0">Erro ao enviar arquivo: ${escapeHtml(error.message)}</div>`;
+    } finally {
+        importBtn.disabled = false;
+    }
+}
+
+/**
+ * Inicia a exportação da tabela
+ */
+async function startExport() {
+    const formData = new FormData(exportForm);
+    const exportBtn = document.getElementById('exportBtn');
+    const data = {
+        format: formData.get('format'),
+        segments: formData.get('segments'),
+        max_rcu: formData.get('max_rcu'),
+        projection: formData.get('projection')
+    };
+
+    exportBtn.disabled = true;
+
+    try {
+        const response = await fetch(`/dynamodb/items/${encodeURIComponent(itemsTable)}/export`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(data)
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            followTransfer(result.job_id);
+        } else {
+            transferProgress.innerHTML = `<div class="alert alert-danger mb-0">${escapeHtml(result.message)}</div>`;
+        }
+
+    } catch (error) {
+        transferProgress.innerHTML = `<div class="alert alert-danger mb-0">Erro ao iniciar exportação: ${escapeHtml(error.message)}</div>`;
+    } finally {
+        exportBtn.disabled = false;
+    }
+}
+
+/**
+ * Acompanha o progresso de uma importação/exportação via Server-Sent Events
+ */
+function followTransfer(jobId) {
+    stopTransferStream();
+    transferSource = new EventSource(`/dynamodb/transfers/${jobId}/stream`);
+
+    transferSource.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+
+        if (!data.job) {
+            transferProgress.innerHTML = `<div class="alert alert-danger mb-0">${escapeHtml(data.message)}</div>`;
+        } else {
+            displayTransferJob(data.job);
+        }
+
+        if (data.type === 'finished') {
+            stopTransferStream();
+        }
+    };
+
+    transferSource.onerror = () => {
+        stopTransferStream();
+    };
+}
+
+function stopTransferStream() {
+    if (transferSource) {
+        transferSource.close();
+        transferSource = null;
+    }
+}
+
+/**
+ * Cancela uma importação/exportação em andamento
+ */
+async function cancelTransfer(jobId) {
+    try {
+        await fetch(`/dynamodb/transfers/${jobId}/cancel`, { method: 'POST' });
+    } catch (error) {
+        showAlert('Erro ao cancelar: ' + error.message, 'danger');
+    }
+}
+
+/**
+ * Exibe o progresso de uma importação/exportação
+ */
+function displayTransferJob(job) {
+    const isImport = job.kind === 'import';
+    const statusColors = { running: 'primary', completed: 'success', cancelled: 'warning', failed: 'danger' };
+    const progress = isImport && job.file_bytes
+        ? Math.min(100, Math.round(job.bytes / job.file_bytes * 100))
+        : null;
+
+    transferProgress.innerHTML = `
+        <div class="border rounded p-2 small">
+            <div class="d-flex justify-content-between align-items-center mb-2">
+                <strong>${isImport ? 'Importação' : 'Exportação'} #${job.id} (${job.format.toUpperCase()})</strong>
+                <span>
+                    <span class="badge bg-${statusColors[job.status] || 'secondary'}">${job.status}</span>
+                    ${!job.finished ? `<button class="btn btn-outline-danger btn-sm ms-2" onclick="cancelTransfer(${job.id})">
+                        <i class="bi bi-stop-fill"></i> Cancelar</button>` : ''}
+                    ${job.finished && !isImport && job.status !== 'failed' ? `<a class="btn btn-success btn-sm ms-2"
+                        href="/dynamodb/transfers/${job.id}/download"><i class="bi bi-download"></i> Baixar</a>` : ''}
+                </span>
+            </div>
+            ${progress !== null ? `
+                <div class="progress mb-2" style="height: 6px;">
+                    <div class="progress-bar" style="width: ${progress}%"></div>
+                </div>` : ''}
+            <span class="me-3"><strong>Gravados:</strong> ${job.written}</span>
+            ${isImport ? `
+                <span class="me-3"><strong>Lidos:</strong> ${job.read}</span>
+                <span class="me-3"><strong>Inválidos:</strong> ${job.invalid}</span>
+                <span class="me-3"><strong>Falhas:</strong> ${job.failed}</span>
+                <span class="me-3"><strong>Retries:</strong> ${job.retries} (${job.throttled} throttlings)</span>
+            ` : `
+                <span class="me-3"><strong>Páginas:</strong> ${job.batches}</span>
+                <span class="me-3"><strong>Arquivo:</strong> ${(job.bytes / 1024).toFixed(1)} KB</span>
+            `}
+            <span class="me-3"><strong>${isImport ? 'WCUs' : 'RCUs'}:</strong> ${job.consumed_capacity}</span>
+            <span class="me-3"><strong>Vazão:</strong> ${job.items_per_second} itens/s</span>
+            <span class="me-3"><strong>Tempo:</strong> ${job.elapsed_seconds}s</span>
+            ${job.message ? `<div class="text-${job.status === 'failed' ? 'danger' : 'muted'} mt-1">${escapeHtml(job.message)}</div>` : ''}
+            ${job.errors.length ? `<ul class="text-danger mb-0 mt-1">${job.errors.map(error => `<li>${escapeHtml(error)}</li>`).join('')}</ul>` : ''}
+        </div>
+    `;
+}
+
+/**
+ * Escapa texto para inserir no HTML
+ */
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
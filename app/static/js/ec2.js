@@ -61,11 +61,20 @@ async function loadInstances() {
     `;
     
     try {
-        const response = await fetch('/ec2/instances');
-        const result = await response.json();
+        // Status do SSM dos bastions em paralelo (em cache no servidor; falha não impede a listagem)
+        const [result, ssmStatus] = await Promise.all([
+            fetch('/ec2/instances').then(response => response.json()),
+            fetch('/ec2/bastions/status').then(response => response.json()).catch(() => null)
+        ]);
         
         if (result.success) {
-            displayInstances(result.instances);
+            const bastionStatus = {};
+            if (ssmStatus && ssmStatus.success) {
+                ssmStatus.bastions.forEach(bastion => {
+                    bastionStatus[bastion.instance_id] = bastion;
+                });
+            }
+            displayInstances(result.instances, bastionStatus);
         } else {
             instancesContainer.innerHTML = `
                 <div class="alert alert-warning">
@@ -86,7 +95,7 @@ async function loadInstances() {
 /**
  * Exibe a lista de instâncias
  */
-function displayInstances(instances) {
+function displayInstances(instances, bastionStatus = {}) {
     if (!instances || instances.length === 0) {
         instancesContainer.innerHTML = `
             <div class="empty-state">
@@ -120,12 +129,15 @@ function displayInstances(instances) {
         const isRunning = instance.state === 'running';
         const isStopped = instance.state === 'stopped';
         const isBastion = instance.type_tag === 'Bastion';
+        const ssm = bastionStatus[instance.instance_id];
+        const ssmColors = { online: 'success', offline: 'danger', unregistered: 'secondary' };
         
         html += `
             <tr>
                 <td>
                     <strong>${instance.name}</strong>
                     ${isBastion ? '<br><span class="badge bg-success">Bastion</span>' : ''}
+                    ${isBastion && ssm && isRunning ? `<span class="badge bg-${ssmColors[ssm.ssm_status]}" title="${ssm.last_ping ? 'Último ping: ' + ssm.last_ping : ''}">SSM ${ssm.ping_status || 'não registrado'}</span>` : ''}
                 </td>
                 <td><code>${instance.instance_id}</code></td>
                 <td>${instance.instance_type}</td>
@@ -215,13 +227,11 @@ async function createBastionHost() {
         const result = await response.json();
         
         if (result.success) {
-            showAlert(result.message + ' - A instância levará alguns minutos para ficar disponível.', 'success');
-            
             const modal = bootstrap.Modal.getInstance(document.getElementById('createBastionModal'));
             modal.hide();
             
             form.reset();
-            setTimeout(() => loadInstances(), 2000);
+            followBastionJob(result.job_id);
         } else {
             showAlert(result.message, 'danger');
         }
@@ -234,6 +244,97 @@ async function createBastionHost() {
     }
 }
 
+/**
+ * Acompanha a criação de um Bastion Host até o SSM Agent registrar
+ */
+function followBastionJob(jobId) {
+    const container = document.createElement('div');
+    container.id = `bastionJob-${jobId}`;
+    document.getElementById('bastionJobsContainer').prepend(container);
+
+    const source = new EventSource(`/ec2/bastion/jobs/${jobId}/stream`);
+
+    source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+
+        if (data.job) {
+            const previousInstance = container.dataset.instanceId;
+            displayBastionJob(container, data.job);
+
+            // Mostra a nova instância na lista assim que ela é lançada
+            if (data.job.instance_id && !previousInstance) {
+                container.dataset.instanceId = data.job.instance_id;
+                loadInstances();
+            }
+        } else if (data.message) {
+            showAlert(data.message, 'danger');
+        }
+
+        if (data.type === 'finished') {
+            source.close();
+            loadInstances();
+        }
+    };
+
+    source.onerror = () => {
+        source.close();
+    };
+}
+
+/**
+ * Exibe as etapas da criação de um Bastion Host
+ */
+function displayBastionJob(container, job) {
+    const phases = {
+        ami: 'AMI',
+        iam: 'Instance profile',
+        launch: 'Lançamento',
+        running: 'Instância running',
+        ssm: 'SSM Agent online'
+    };
+    const steps = Object.fromEntries(job.steps.map(step => [step.phase, step]));
+    const statusColor = job.finished ? (job.status === 'completed' ? 'success' : 'danger') : 'info';
+
+    const items = Object.entries(phases).map(([phase, label]) => {
+        const step = steps[phase];
+        let icon = '<i class="bi bi-circle text-muted"></i>';
+        if (step) {
+            icon = '<i class="bi bi-check-circle-fill text-success"></i>';
+        } else if (phase === job.phase && !job.finished) {
+            icon = '<span class="spinner-border spinner-border-sm text-primary"></span>';
+        }
+
+        let detail = '';
+        if (phase === 'ami' && step) {
+            detail = `${job.ami_id}${step.details.cached ? ' (cache)' : ''}`;
+        } else if (phase === 'iam' && step) {
+            detail = job.instance_profile || 'sem IAM Role';
+        } else if (phase === 'launch' && step) {
+            detail = job.instance_id;
+        } else if (phase === 'ssm' && job.ping_status) {
+            detail = job.ping_status;
+        }
+
+        return `
+            <li class="list-group-item d-flex justify-content-between align-items-center py-1">
+                <span>${icon} ${label} <small class="text-muted">${detail}</small></span>
+                <small class="text-muted">${step ? step.seconds.toFixed(1) + 's' : ''}</small>
+            </li>
+        `;
+    }).join('');
+
+    container.innerHTML = `
+        <div class="alert alert-${statusColor} small">
+            <div class="d-flex justify-content-between mb-2">
+                <strong><i class="bi bi-shield-check"></i> Bastion ${job.name} (${job.instance_type})</strong>
+                <span>${job.elapsed_seconds.toFixed(0)}s</span>
+            </div>
+            <ul class="list-group mb-0">${items}</ul>
+            ${job.message ? `<div class="mt-2">${job.message}</div>` : ''}
+        </div>
+    `;
+}
+
 /**
  * Cria uma instância EC2 genérica
  */
@@ -8,6 +8,10 @@ const alertContainer = document.getElementById('alertContainer');
 const servicesSection = document.getElementById('servicesSection');
 const tasksSection = document.getElementById('tasksSection');
 const selectedClusterNameSpan = document.getElementById('selectedClusterName');
+const deploymentWatchContainer = document.getElementById('deploymentWatchContainer');
+
+// Streams de deployment abertos por serviço
+const deploymentStreams = {};
 
 // Variável global para armazenar o cluster selecionado
 let currentCluster = null;
@@ -319,6 +323,9 @@ function displayServices(services, clusterName) {
                                 <button class="btn btn-outline-warning" onclick="showChangeCapacityModal('${clusterName}', '${service.name}', '${service.launch_type}')" title="Mudar Capacity Provider">
                                     <i class="bi bi-arrow-left-right"></i>
                                 </button>
+                                <button class="btn btn-outline-primary" onclick="loadTasks('${clusterName}', '${service.name}')" title="Ver Tasks">
+                                    <i class="bi bi-list-task"></i>
+                                </button>
                                 <button class="btn btn-outline-info" onclick="viewServiceDetails('${clusterName}', '${service.name}')" title="Ver Detalhes">
                                     <i class="bi bi-info-circle"></i>
                                 </button>
@@ -362,9 +369,9 @@ function displayServices(services, clusterName) {
 }
 
 /**
- * Carrega as tasks de um cluster
+ * Carrega as tasks de um cluster (ou de um serviço) com task definition e containers
  */
-async function loadTasks(clusterName) {
+async function loadTasks(clusterName, serviceName = null) {
     tasksSection.style.display = 'block';
     tasksContainer.innerHTML = `
         <div class="text-center">
@@ -379,11 +386,12 @@ async function loadTasks(clusterName) {
     tasksSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
     
     try {
-        const response = await fetch(`/ecs/clusters/${clusterName}/tasks`);
+        const query = serviceName ? `?service_name=${encodeURIComponent(serviceName)}` : '';
+        const response = await fetch(`/ecs/clusters/${clusterName}/tasks/deep-view${query}`);
         const result = await response.json();
         
         if (result.success) {
-            displayTasks(result.tasks);
+            displayTasks(result.tasks, result);
         } else {
             tasksContainer.innerHTML = `
                 <div class="alert alert-warning">
@@ -404,7 +412,7 @@ async function loadTasks(clusterName) {
 /**
  * Exibe a lista de tasks
  */
-function displayTasks(tasks) {
+function displayTasks(tasks, result = null) {
     if (!tasks || tasks.length === 0) {
         tasksContainer.innerHTML = `
             <div class="empty-state">
@@ -428,6 +436,7 @@ function displayTasks(tasks) {
                 <th>Memory</th>
                 <th>Containers</th>
                 <th>Health</th>
+                <th>IP / AZ</th>
             </tr>
         </thead>
         <tbody>
@@ -446,16 +455,50 @@ function displayTasks(tasks) {
                 <td><small>${task.task_definition}</small></td>
                 <td>${task.cpu}</td>
                 <td>${task.memory}</td>
-                <td>${task.containers}</td>
+                <td>${Array.isArray(task.containers) ? task.containers.map(containerHtml).join('') : task.containers}</td>
                 <td><span class="badge bg-${healthColor}">${task.health_status}</span></td>
+                <td><small>${task.private_ip || '-'}<br>${task.availability_zone || ''}</small></td>
             </tr>
         `;
     });
     
     html += '</tbody></table></div>';
+    
+    if (result && result.timing) {
+        html += `
+            <small class="text-muted">
+                <i class="bi bi-stopwatch"></i>
+                list_tasks: ${result.timing.list_tasks_ms}ms |
+                describe_tasks: ${result.timing.describe_tasks_ms}ms (${result.api_calls.describe_tasks} chamada(s)) |
+                task definitions: ${result.timing.describe_task_definitions_ms}ms
+                (${result.task_definitions.unique} distinta(s), ${result.task_definitions.cached} em cache) |
+                total: ${result.timing.total_ms}ms
+            </small>
+        `;
+    }
+    
     tasksContainer.innerHTML = html;
 }
 
+/**
+ * Exibe um container da task (imagem, status e recursos)
+ */
+function containerHtml(container) {
+    const statusColor = container.status === 'RUNNING' ? 'success' :
+                        container.status === 'STOPPED' ? 'danger' : 'warning';
+    const image = container.image.split('/').pop();
+    
+    return `
+        <div class="mb-1">
+            <span class="badge bg-${statusColor}">${container.status}</span>
+            <strong>${container.name}</strong>
+            <br><small class="text-muted" title="${container.image}">${image}</small>
+            ${container.cpu || container.memory ? `<br><small>CPU ${container.cpu ?? '-'} | Mem ${container.memory ?? container.memory_reservation ?? '-'}</small>` : ''}
+            ${container.exit_code !== null && container.exit_code !== undefined ? `<br><small class="text-danger">exit ${container.exit_code}${container.reason ? `: ${container.reason}` : ''}</small>` : ''}
+        </div>
+    `;
+}
+
 /**
  * Visualiza detalhes de um cluster
  */
@@ -499,8 +542,8 @@ async function stopService(clusterName, serviceName) {
         
         if (result.success) {
             showAlert(result.message, 'success');
-            // Recarrega a lista de serviços
-            setTimeout(() => loadServices(clusterName), 2000);
+            // Acompanha o deployment até o serviço estabilizar
+            watchDeployment(clusterName, serviceName);
         } else {
             showAlert(result.message, 'danger');
         }
@@ -540,8 +583,8 @@ async function startService(clusterName, serviceName, desiredCount) {
         
         if (result.success) {
             showAlert(result.message, 'success');
-            // Recarrega a lista de serviços
-            setTimeout(() => loadServices(clusterName), 2000);
+            // Acompanha o deployment até o serviço estabilizar
+            watchDeployment(clusterName, serviceName);
         } else {
             showAlert(result.message, 'danger');
         }
@@ -635,8 +678,8 @@ async function changeCapacityProvider(clusterName, serviceName, capacityProvider
         
         if (result.success) {
             showAlert(result.message + ' - Aguarde o deployment...', 'success');
-            // Recarrega a lista de serviços
-            setTimeout(() => loadServices(clusterName), 3000);
+            // Acompanha o deployment até o serviço estabilizar
+            watchDeployment(clusterName, serviceName);
         } else {
             showAlert(result.message, 'danger');
         }
@@ -645,3 +688,157 @@ async function changeCapacityProvider(clusterName, serviceName, capacityProvider
         showAlert(`Erro ao alterar capacity provider: ${error.message}`, 'danger');
     }
 }
+
+/**
+ * Acompanha o deployment de um serviço via Server-Sent Events
+ */
+function watchDeployment(clusterName, serviceName) {
+    const key = `${clusterName}/${serviceName}`;
+    const cardId = `deployment-${key.replace(/[^a-zA-Z0-9_-]/g, '-')}`;
+    
+    if (deploymentStreams[key]) {
+        deploymentStreams[key].close();
+    }
+    
+    if (!document.getElementById(cardId)) {
+        deploymentWatchContainer.insertAdjacentHTML('beforeend', `
+            <div class="card shadow-sm mb-3" id="${cardId}">
+                <div class="card-header d-flex justify-content-between align-items-center">
+                    <span><i class="bi bi-arrow-repeat"></i> Deployment: <strong>${serviceName}</strong></span>
+                    <button class="btn btn-sm btn-outline-secondary" onclick="closeDeploymentWatch('${key}', '${cardId}')">
+                        <i class="bi bi-x-lg"></i>
+                    </button>
+                </div>
+                <div class="card-body">
+                    <div class="deployment-summary mb-2 text-muted">Aguardando primeira consulta...</div>
+                    <div class="deployment-list mb-2"></div>
+                    <ul class="deployment-events list-unstyled small mb-0"></ul>
+                </div>
+            </div>
+        `);
+    }
+    
+    const card = document.getElementById(cardId);
+    const deployments = {};
+    const source = new EventSource(`/ecs/clusters/${encodeURIComponent(clusterName)}/services/${encodeURIComponent(serviceName)}/deployment/stream`);
+    deploymentStreams[key] = source;
+    
+    source.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        
+        if (message.type === 'heartbeat') {
+            return;
+        }
+        
+        if (message.type === 'snapshot') {
+            Object.keys(deployments).forEach(id => delete deployments[id]);
+            message.service.deployments.forEach(deployment => deployments[deployment.id] = deployment);
+            card.querySelector('.deployment-events').innerHTML = '';
+            displayDeploymentSummary(card, message.service);
+            addDeploymentEvents(card, message.service.events);
+        } else if (message.type === 'update') {
+            message.deployments.forEach(deployment => deployments[deployment.id] = deployment);
+            message.removed_deployments.forEach(id => delete deployments[id]);
+            if (Object.keys(message.fields).length > 0) {
+                displayDeploymentSummary(card, message.fields);
+            }
+            addDeploymentEvents(card, message.events);
+        } else if (message.type === 'finished') {
+            source.close();
+            delete deploymentStreams[key];
+            
+            const color = message.reason === 'completed' ? 'success' : 'warning';
+            card.querySelector('.deployment-summary').insertAdjacentHTML('beforeend', `
+                <span class="badge bg-${color} ms-2">${message.detail || message.reason}</span>
+            `);
+            
+            if (currentCluster === clusterName) {
+                loadServices(clusterName);
+            }
+        }
+        
+        displayDeploymentList(card, Object.values(deployments));
+    };
+    
+    source.onerror = () => {
+        // O navegador reconecta sozinho; ao reconectar recebe o estado completo de novo
+        card.querySelector('.deployment-summary').classList.add('text-warning');
+    };
+}
+
+/**
+ * Encerra o acompanhamento de um deployment
+ */
+function closeDeploymentWatch(key, cardId) {
+    if (deploymentStreams[key]) {
+        deploymentStreams[key].close();
+        delete deploymentStreams[key];
+    }
+    document.getElementById(cardId).remove();
+}
+
+/**
+ * Atualiza as contagens do serviço (recebe só os campos alterados)
+ */
+function displayDeploymentSummary(card, fields) {
+    const summary = card.querySelector('.deployment-summary');
+    const state = summary.dataset;
+    
+    Object.entries(fields).forEach(([field, value]) => {
+        if (typeof value !== 'object') {
+            state[field] = value;
+        }
+    });
+    
+    summary.classList.remove('text-muted', 'text-warning');
+    summary.innerHTML = `
+        <span class="badge bg-secondary">${state.rollout_state || '-'}</span>
+        Desired: <strong>${state.desired_count ?? '-'}</strong> |
+        Running: <strong>${state.running_count ?? '-'}</strong> |
+        Pending: <strong>${state.pending_count ?? '-'}</strong>
+    `;
+}
+
+/**
+ * Exibe os deployments em andamento
+ */
+function displayDeploymentList(card, deployments) {
+    card.querySelector('.deployment-list').innerHTML = deployments.map(deployment => {
+        const percent = deployment.desired_count ? Math.round(deployment.running_count * 100 / deployment.desired_count) : 100;
+        const color = deployment.rollout_state === 'FAILED' ? 'danger' :
+                      deployment.status === 'PRIMARY' ? 'primary' : 'secondary';
+        
+        return `
+            <div class="mb-2">
+                <small>
+                    <strong>${deployment.status}</strong> ${deployment.rollout_state || ''}
+                    - <code>${(deployment.task_definition || '').split('/').pop()}</code>
+                    ${deployment.capacity_provider ? `(${deployment.capacity_provider})` : ''}
+                    - ${deployment.running_count}/${deployment.desired_count} running
+                    ${deployment.pending_count ? `, ${deployment.pending_count} pending` : ''}
+                    ${deployment.failed_tasks ? `, <span class="text-danger">${deployment.failed_tasks} falha(s)</span>` : ''}
+                </small>
+                <div class="progress" style="height: 6px;">
+                    <div class="progress-bar bg-${color}" style="width: ${percent}%"></div>
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+/**
+ * Adiciona os eventos novos do serviço (mais recentes no topo)
+ */
+function addDeploymentEvents(card, events) {
+    const list = card.querySelector('.deployment-events');
+    
+    events.forEach(event => {
+        list.insertAdjacentHTML('afterbegin', `
+            <li><span class="text-muted">${new Date(event.created_at).toLocaleTimeString()}</span> ${event.message}</li>
+        `);
+    });
+    
+    while (list.children.length > 20) {
+        list.lastElementChild.remove();
+    }
+}
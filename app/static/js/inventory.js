@@ -0,0 +1,246 @@
+// JavaScript para o inventário multi-região/multi-conta
+
+// Elementos do DOM
+const alertContainer = document.getElementById('alertContainer');
+const inventoryContainer = document.getElementById('inventoryContainer');
+const regionStatusContainer = document.getElementById('regionStatusContainer');
+const inventorySummary = document.getElementById('inventorySummary');
+const collectInventoryBtn = document.getElementById('collectInventoryBtn');
+
+// Variáveis globais
+let inventoryItems = [];
+
+// Event Listeners
+document.addEventListener('DOMContentLoaded', () => {
+    loadOptions();
+});
+
+collectInventoryBtn.addEventListener('click', () => {
+    collectInventory();
+});
+
+document.getElementById('inventoryFilter').addEventListener('input', () => {
+    displayInventory();
+});
+
+/**
+ * Exibe um alerta na página
+ */
+function showAlert(message, type = 'info') {
+    const alertDiv = document.createElement('div');
+    alertDiv.className = `alert alert-${type} alert-dismissible fade show`;
+    alertDiv.role = 'alert';
+    
+    alertDiv.innerHTML = `
+        <strong>${type === 'success' ? 'Sucesso!' : type === 'danger' ? 'Erro!' : 'Atenção!'}</strong> ${message}
+        <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+    `;
+    
+    alertContainer.innerHTML = '';
+    alertContainer.appendChild(alertDiv);
+    
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+    
+    setTimeout(() => {
+        alertDiv.remove();
+    }, 8000);
+}
+
+/**
+ * Carrega regiões, perfis e recursos disponíveis
+ */
+async function loadOptions() {
+    try {
+        const response = await fetch('/inventory/options');
+        const result = await response.json();
+        
+        if (!result.success) {
+            showAlert(result.message, 'danger');
+            return;
+        }
+        
+        document.getElementById('inventoryRegions').innerHTML = result.regions.map(region => `
+            <option value="${region}" ${region === result.default_region ? 'selected' : ''}>${region}</option>
+        `).join('');
+        
+        document.getElementById('inventoryProfiles').innerHTML = result.profiles.map(profile => `
+            <option value="${profile}">${profile}</option>
+        `).join('');
+        
+        document.getElementById('inventoryResources').innerHTML = result.resources.map(resource => `
+            <div class="form-check">
+                <input class="form-check-input inventory-resource" type="checkbox" value="${resource}" id="resource-${resource}" checked>
+                <label class="form-check-label" for="resource-${resource}">${resource}</label>
+            </div>
+        `).join('');
+        
+    } catch (error) {
+        showAlert(`Erro ao carregar opções: ${error.message}`, 'danger');
+    }
+}
+
+/**
+ * Valores selecionados de um select múltiplo
+ */
+function selectedValues(id) {
+    return Array.from(document.getElementById(id).selectedOptions).map(option => option.value);
+}
+
+/**
+ * Coleta o inventário nas regiões e perfis selecionados
+ */
+async function collectInventory() {
+    const resources = Array.from(document.querySelectorAll('.inventory-resource:checked')).map(input => input.value);
+    const regions = selectedValues('inventoryRegions');
+    
+    if (resources.length === 0 || regions.length === 0) {
+        showAlert('Selecione ao menos uma região e um recurso', 'warning');
+        return;
+    }
+    
+    collectInventoryBtn.disabled = true;
+    inventorySummary.innerHTML = '';
+    inventoryContainer.innerHTML = `
+        <div class="text-center">
+            <div class="spinner-border text-primary" role="status"></div>
+            <p class="mt-2">Consultando ${regions.length} região(ões)...</p>
+        </div>
+    `;
+    
+    try {
+        const response = await fetch('/inventory/collect', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                resources: resources,
+                regions: regions,
+                profiles: selectedValues('inventoryProfiles'),
+                timeout: document.getElementById('inventoryTimeout').value || null
+            })
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            inventoryContainer.innerHTML = '';
+            showAlert(result.message, 'danger');
+            return;
+        }
+        
+        inventoryItems = result.items;
+        displaySummary(result);
+        displayInventory();
+        displayRegionStatus(result.regions);
+        
+    } catch (error) {
+        inventoryContainer.innerHTML = '';
+        showAlert(`Erro ao coletar inventário: ${error.message}`, 'danger');
+    } finally {
+        collectInventoryBtn.disabled = false;
+    }
+}
+
+/**
+ * Exibe totais e o tempo da consulta paralela comparado à soma das consultas
+ */
+function displaySummary(result) {
+    const counts = Object.entries(result.counts).map(([resource, count]) => `
+        <span class="badge bg-secondary me-1">${resource}: ${count}</span>
+    `).join('');
+    const failed = result.regions.filter(status => status.status !== 'ok').length;
+    
+    inventorySummary.innerHTML = `
+        <div class="alert alert-light border mb-0">
+            <strong>${result.count}</strong> recurso(s) ${counts}
+            <span class="ms-3 text-muted">
+                <i class="bi bi-stopwatch"></i> ${result.elapsed_seconds}s
+                (sequencial seria ~${result.sequential_seconds}s)
+            </span>
+            ${failed ? `<span class="badge bg-warning text-dark ms-2">${failed} consulta(s) com erro/timeout</span>` : ''}
+        </div>
+    `;
+}
+
+/**
+ * Exibe a tabela consolidada de recursos
+ */
+function displayInventory() {
+    const filter = document.getElementById('inventoryFilter').value.toLowerCase();
+    const items = inventoryItems.filter(item =>
+        !filter ||
+        (item.name || '').toLowerCase().includes(filter) ||
+        (item.id || '').toLowerCase().includes(filter) ||
+        item.region.includes(filter)
+    );
+    
+    if (items.length === 0) {
+        inventoryContainer.innerHTML = '<p class="text-muted text-center mb-0">Nenhum recurso encontrado</p>';
+        return;
+    }
+    
+    const rows = items.map(item => `
+        <tr>
+            <td><span class="badge bg-primary">${item.resource}</span></td>
+            <td><strong>${item.name || '-'}</strong><br><small class="text-muted">${item.id || ''}</small></td>
+            <td>${item.status || '-'}</td>
+            <td>${item.region}</td>
+            <td>${item.profile || 'padrão'}<br><small class="text-muted">${item.account || ''}</small></td>
+            <td><small>${Object.entries(item.details).map(([key, value]) => `${key}: ${value ?? '-'}`).join('<br>')}</small></td>
+        </tr>
+    `).join('');
+    
+    inventoryContainer.innerHTML = `
+        <div class="table-responsive">
+            <table class="table table-hover table-sm">
+                <thead>
+                    <tr>
+                        <th>Recurso</th>
+                        <th>Nome</th>
+                        <th>Status</th>
+                        <th>Região</th>
+                        <th>Conta</th>
+                        <th>Detalhes</th>
+                    </tr>
+                </thead>
+                <tbody>${rows}</tbody>
+            </table>
+        </div>
+    `;
+}
+
+/**
+ * Exibe o status de cada consulta (perfil + região + recurso)
+ */
+function displayRegionStatus(statuses) {
+    const badges = { ok: 'bg-success', error: 'bg-danger', timeout: 'bg-warning text-dark' };
+    
+    const rows = statuses.map(status => `
+        <tr>
+            <td>${status.region}</td>
+            <td>${status.profile || 'padrão'}</td>
+            <td>${status.resource}</td>
+            <td><span class="badge ${badges[status.status]}">${status.status}</span></td>
+            <td>${status.count}${status.truncated ? ' <span class="badge bg-info">truncado</span>' : ''}</td>
+            <td>${status.elapsed_seconds}s</td>
+            <td><small class="text-muted">${status.message || ''}</small></td>
+        </tr>
+    `).join('');
+    
+    regionStatusContainer.innerHTML = `
+        <div class="table-responsive">
+            <table class="table table-sm mb-0">
+                <thead>
+                    <tr>
+                        <th>Região</th>
+                        <th>Perfil</th>
+                        <th>Recurso</th>
+                        <th>Status</th>
+                        <th>Itens</th>
+                        <th>Tempo</th>
+                        <th>Mensagem</th>
+                    </tr>
+                </thead>
+                <tbody>${rows}</tbody>
+            </table>
+        </div>
+    `;
+}
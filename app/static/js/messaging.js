@@ -229,6 +229,11 @@ function viewQueueMessages(queueUrl, queueName) {
     // Configura event listeners
     document.getElementById('receiveMessagesBtn').onclick = () => receiveMessages(queueUrl);
     document.getElementById('sendMessageBtn').onclick = () => sendMessage(queueUrl);
+    document.getElementById('sendBatchBtn').onclick = () => sendMessageBatch(queueUrl);
+    document.getElementById('startDrainBtn').onclick = () => startDrain(queueUrl);
+    resetDrain();
+    document.getElementById('startRedriveBtn').onclick = () => startRedrive(queueUrl);
+    resetRedrive(queueUrl);
     document.getElementById('purgeQueueBtn').onclick = () => purgeQueue(queueUrl, queueName);
     
     new bootstrap.Modal(document.getElementById('queueMessagesModal')).show();
@@ -343,6 +348,429 @@ async function sendMessage(queueUrl) {
     }
 }
 
+// Leitura em massa em andamento
+let drainSource = null;
+let drainJobId = null;
+const DRAIN_DISPLAY_LIMIT = 500;
+
+/**
+ * Limpa o estado da leitura em massa ao abrir outra fila
+ */
+function resetDrain() {
+    if (drainSource) {
+        drainSource.close();
+        drainSource = null;
+    }
+    drainJobId = null;
+    document.getElementById('drainProgress').innerHTML = '';
+    document.getElementById('cancelDrainBtn').classList.add('d-none');
+    document.getElementById('exportDrainBtn').classList.add('d-none');
+}
+
+/**
+ * Inicia a leitura em massa e recebe as mensagens via Server-Sent Events
+ */
+async function startDrain(queueUrl) {
+    const mode = document.getElementById('drainMode').value;
+    const maxMessages = parseInt(document.getElementById('drainMaxMessages').value);
+    const maxBytes = document.getElementById('drainMaxBytes').value;
+    const receivers = document.getElementById('drainReceivers').value;
+    
+    if (mode === 'drain' && !confirm(`Apagar até ${maxMessages} mensagem(ns) da fila conforme forem lidas?`)) {
+        return;
+    }
+    
+    resetDrain();
+    
+    try {
+        const response = await fetch('/messaging/sqs/drain', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                queue_url: queueUrl,
+                mode: mode,
+                max_messages: maxMessages,
+                max_bytes: maxBytes ? parseInt(maxBytes) : null,
+                receivers: receivers ? parseInt(receivers) : null
+            })
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            showAlert(result.message, 'danger');
+            return;
+        }
+        
+        drainJobId = result.job_id;
+        const container = document.getElementById('messagesContent');
+        container.innerHTML = `
+            ${mode === 'peek' ? `
+                <button class="btn btn-sm btn-danger mb-2" onclick="deleteSelectedMessages('${queueUrl}')">
+                    <i class="bi bi-trash"></i> Deletar selecionadas
+                </button>
+            ` : ''}
+            <div class="table-responsive" style="max-height: 500px;">
+                <table class="table table-sm table-hover">
+                    <thead>
+                        <tr>
+                            ${mode === 'peek' ? '<th><input type="checkbox" onchange="toggleDrainSelection(this.checked)"></th>' : ''}
+                            <th>ID</th>
+                            <th>Enviada em</th>
+                            <th>Recebimentos</th>
+                            <th>Corpo</th>
+                        </tr>
+                    </thead>
+                    <tbody id="drainMessages"></tbody>
+                </table>
+            </div>
+        `;
+        
+        document.getElementById('cancelDrainBtn').classList.remove('d-none');
+        document.getElementById('cancelDrainBtn').onclick = () => fetch(`/messaging/sqs/drain/${drainJobId}/cancel`, { method: 'POST' });
+        
+        drainSource = new EventSource(`/messaging/sqs/drain/${drainJobId}/stream`);
+        drainSource.onmessage = (event) => {
+            const data = JSON.parse(event.data);
+            
+            if (data.messages) {
+                appendDrainMessages(data.messages, mode);
+            }
+            if (data.job) {
+                displayDrainProgress(data.job);
+            }
+            if (data.type === 'finished') {
+                drainSource.close();
+                drainSource = null;
+                document.getElementById('cancelDrainBtn').classList.add('d-none');
+                
+                const exportBtn = document.getElementById('exportDrainBtn');
+                exportBtn.href = `/messaging/sqs/drain/${drainJobId}/export`;
+                exportBtn.classList.remove('d-none');
+            }
+        };
+        
+    } catch (error) {
+        showAlert(`Erro: ${error.message}`, 'danger');
+    }
+}
+
+/**
+ * Acrescenta mensagens recebidas à tabela (exibe no máximo DRAIN_DISPLAY_LIMIT; o NDJSON tem todas)
+ */
+function appendDrainMessages(messages, mode) {
+    const tbody = document.getElementById('drainMessages');
+    const available = DRAIN_DISPLAY_LIMIT - tbody.children.length;
+    
+    messages.slice(0, Math.max(0, available)).forEach(msg => {
+        const row = document.createElement('tr');
+        const body = document.createElement('code');
+        body.textContent = msg.body.length > 300 ? `${msg.body.substring(0, 300)}...` : msg.body;
+        
+        row.innerHTML = `
+            ${mode === 'peek' ? `<td><input type="checkbox" class="drain-select" data-receipt="${msg.receipt_handle}"></td>` : ''}
+            <td><small>${msg.message_id}</small></td>
+            <td><small>${msg.sent_timestamp ? new Date(parseInt(msg.sent_timestamp)).toLocaleString() : '-'}</small></td>
+            <td>${msg.receive_count || '-'}</td>
+            <td></td>
+        `;
+        row.lastElementChild.appendChild(body);
+        tbody.appendChild(row);
+    });
+}
+
+/**
+ * Exibe o progresso da leitura em massa
+ */
+function displayDrainProgress(job) {
+    const reasons = { budget: 'limite atingido', empty: 'fila vazia', cancelled: 'interrompido', error: 'erro' };
+    
+    document.getElementById('drainProgress').innerHTML = `
+        <strong>${job.received}</strong> mensagem(ns) | ${(job.bytes / 1024).toFixed(1)} KiB |
+        ${job.messages_per_second} msgs/s | ${job.elapsed_seconds}s | ${job.api_calls} chamada(s)
+        ${job.mode === 'drain' ? ` | ${job.deleted} apagada(s)` : ''}
+        ${job.finished ? ` | <span class="badge bg-${job.status === 'failed' ? 'danger' : 'success'}">${job.message || reasons[job.stop_reason] || job.status}</span>` : ''}
+        ${job.received > DRAIN_DISPLAY_LIMIT ? ` | exibindo ${DRAIN_DISPLAY_LIMIT}, exporte o NDJSON para ver todas` : ''}
+    `;
+}
+
+/**
+ * Marca ou desmarca todas as mensagens lidas
+ */
+function toggleDrainSelection(checked) {
+    document.querySelectorAll('.drain-select').forEach(input => input.checked = checked);
+}
+
+/**
+ * Deleta as mensagens selecionadas (DeleteMessageBatch)
+ */
+async function deleteSelectedMessages(queueUrl) {
+    const selected = Array.from(document.querySelectorAll('.drain-select:checked'));
+    
+    if (selected.length === 0 || !confirm(`Deletar ${selected.length} mensagem(ns)?`)) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/messaging/sqs/messages/batch', {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                queue_url: queueUrl,
+                receipt_handles: selected.map(input => input.dataset.receipt)
+            })
+        });
+        const result = await response.json();
+        
+        showAlert(result.message, result.success ? 'success' : 'warning');
+        if (result.deleted) {
+            selected.forEach(input => input.closest('tr').remove());
+        }
+    } catch (error) {
+        showAlert(`Erro: ${error.message}`, 'danger');
+    }
+}
+
+const redriveSources = {};
+
+/**
+ * Carrega as filas de destino e o histórico de redrives da DLQ aberta
+ */
+async function resetRedrive(queueUrl) {
+    Object.values(redriveSources).forEach(source => source.close());
+    Object.keys(redriveSources).forEach(jobId => delete redriveSources[jobId]);
+    
+    const select = document.getElementById('redriveDestination');
+    select.innerHTML = '<option value="">Fila de origem das mensagens</option>';
+    allQueues.filter(queue => queue.url !== queueUrl).forEach(queue => {
+        const option = document.createElement('option');
+        option.value = queue.url;
+        option.textContent = queue.name;
+        select.appendChild(option);
+    });
+    
+    document.getElementById('redriveJobs').innerHTML = '';
+    
+    try {
+        const response = await fetch(`/messaging/sqs/redrive?source_queue_url=${encodeURIComponent(queueUrl)}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            result.jobs.forEach(job => {
+                displayRedriveJob(job);
+                if (job.status === 'running') {
+                    followRedrive(job.id);
+                }
+            });
+        }
+    } catch (error) {
+        showAlert(`Erro: ${error.message}`, 'danger');
+    }
+}
+
+/**
+ * Inicia o redrive da DLQ
+ */
+async function startRedrive(queueUrl) {
+    const rate = document.getElementById('redriveRate').value;
+    const maxMessages = document.getElementById('redriveMaxMessages').value;
+    
+    if (!confirm('Mover as mensagens desta DLQ para a fila de destino?')) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/messaging/sqs/redrive', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                source_queue_url: queueUrl,
+                destination_queue_url: document.getElementById('redriveDestination').value || null,
+                max_per_second: rate ? parseFloat(rate) : null,
+                max_messages: maxMessages ? parseInt(maxMessages) : null,
+                strategy: document.getElementById('redriveStrategy').value
+            })
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            showAlert(result.message, 'danger');
+            return;
+        }
+        
+        showAlert(`Redrive iniciado (${result.strategy === 'native' ? 'nativo' : 'pipeline'})`, 'success');
+        followRedrive(result.job_id);
+    } catch (error) {
+        showAlert(`Erro: ${error.message}`, 'danger');
+    }
+}
+
+/**
+ * Acompanha o progresso do redrive via Server-Sent Events
+ */
+function followRedrive(jobId) {
+    if (redriveSources[jobId]) {
+        return;
+    }
+    
+    const source = new EventSource(`/messaging/sqs/redrive/${jobId}/stream`);
+    redriveSources[jobId] = source;
+    
+    source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        
+        if (data.job) {
+            displayRedriveJob(data.job);
+        }
+        if (data.type === 'finished') {
+            source.close();
+            delete redriveSources[jobId];
+        }
+    };
+}
+
+/**
+ * Exibe (ou atualiza) a linha de um redrive
+ */
+function displayRedriveJob(job) {
+    const colors = { running: 'primary', completed: 'success', paused: 'warning', interrupted: 'warning', failed: 'danger' };
+    const container = document.getElementById('redriveJobs');
+    let row = document.getElementById(`redriveJob${job.id}`);
+    
+    if (!row) {
+        row = document.createElement('div');
+        row.id = `redriveJob${job.id}`;
+        row.className = 'border-top py-1';
+        container.prepend(row);
+    }
+    
+    const progress = job.to_move ? ` de ~${job.to_move}` : '';
+    const destination = job.destination_queue_url ? job.destination_queue_url.split('/').pop() : 'origem';
+    
+    row.innerHTML = `
+        <span class="badge bg-${colors[job.status] || 'secondary'}">${job.status}</span>
+        #${job.id} (${job.strategy === 'native' ? 'nativo' : 'pipeline'}) → ${destination}:
+        <strong>${job.moved}</strong>${progress} movida(s)
+        ${job.failed ? ` | ${job.failed} com falha` : ''}
+        ${job.messages_per_second !== null ? ` | ${job.messages_per_second} msgs/s` : ''}
+        ${job.max_per_second ? ` (limite ${job.max_per_second}/s)` : ''}
+        ${job.message ? ` | <span class="text-muted">${job.message}</span>` : ''}
+        ${job.status === 'running' ? `<button class="btn btn-sm btn-outline-danger ms-2" onclick="redriveAction(${job.id}, 'cancel')"><i class="bi bi-pause-circle"></i> Pausar</button>` : ''}
+        ${['paused', 'interrupted', 'failed'].includes(job.status) ? `<button class="btn btn-sm btn-outline-primary ms-2" onclick="redriveAction(${job.id}, 'resume')"><i class="bi bi-play-circle"></i> Retomar</button>` : ''}
+    `;
+}
+
+/**
+ * Pausa ou retoma um redrive
+ */
+async function redriveAction(jobId, action) {
+    try {
+        const response = await fetch(`/messaging/sqs/redrive/${jobId}/${action}`, { method: 'POST' });
+        const result = await response.json();
+        
+        if (!result.success) {
+            showAlert(result.message, 'danger');
+            return;
+        }
+        
+        followRedrive(jobId);
+    } catch (error) {
+        showAlert(`Erro: ${error.message}`, 'danger');
+    }
+}
+
+/**
+ * Alterna entre os modos template e NDJSON do envio em lote
+ */
+document.querySelectorAll('input[name="batchMode"]').forEach(input => {
+    input.addEventListener('change', () => {
+        const isTemplate = document.getElementById('batchModeTemplate').checked;
+        document.getElementById('batchTemplateGroup').classList.toggle('d-none', !isTemplate);
+        document.getElementById('batchCountGroup').classList.toggle('d-none', !isTemplate);
+        document.getElementById('batchNdjsonGroup').classList.toggle('d-none', isTemplate);
+    });
+});
+
+/**
+ * Envio em lote (SendMessageBatch de 10 em 10, em paralelo)
+ */
+async function sendMessageBatch(queueUrl) {
+    const isTemplate = document.getElementById('batchModeTemplate').checked;
+    const file = document.getElementById('batchNdjsonFile').files[0];
+    const concurrency = document.getElementById('batchConcurrency').value;
+    const delay = document.getElementById('batchDelay').value || 0;
+    const resultContainer = document.getElementById('batchResult');
+    
+    let request;
+    if (isTemplate) {
+        request = fetch('/messaging/sqs/messages/send-batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                queue_url: queueUrl,
+                template: document.getElementById('batchTemplate').value,
+                count: parseInt(document.getElementById('batchCount').value),
+                concurrency: concurrency ? parseInt(concurrency) : null,
+                delay_seconds: parseInt(delay)
+            })
+        });
+    } else if (file) {
+        // Arquivo enviado direto no corpo: o servidor lê linha a linha
+        const params = new URLSearchParams({ queue_url: queueUrl, delay_seconds: delay });
+        if (concurrency) {
+            params.set('concurrency', concurrency);
+        }
+        request = fetch(`/messaging/sqs/messages/send-batch?${params}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/x-ndjson' },
+            body: file
+        });
+    } else {
+        request = fetch('/messaging/sqs/messages/send-batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                queue_url: queueUrl,
+                ndjson: document.getElementById('batchNdjson').value,
+                concurrency: concurrency ? parseInt(concurrency) : null,
+                delay_seconds: parseInt(delay)
+            })
+        });
+    }
+    
+    const btn = document.getElementById('sendBatchBtn');
+    btn.disabled = true;
+    btn.innerHTML = '<span class="spinner-border spinner-border-sm"></span> Enviando...';
+    resultContainer.innerHTML = '';
+    
+    try {
+        const response = await request;
+        const result = await response.json();
+        
+        if (result.sent === undefined) {
+            resultContainer.innerHTML = `<div class="alert alert-danger">${result.message}</div>`;
+            return;
+        }
+        
+        const errors = (result.errors || []).map(error => `
+            <li>Mensagem ${error.index + 1}: ${error.code} ${error.message || ''}</li>
+        `).join('');
+        
+        resultContainer.innerHTML = `
+            <div class="alert alert-${result.success ? 'success' : 'warning'}">
+                <strong>${result.message}</strong><br>
+                ${result.messages_per_second ?? '-'} msgs/s em ${result.elapsed_seconds ?? '-'}s |
+                ${result.api_calls ?? '-'} chamada(s) | ${result.retried ?? 0} reenvio(s)
+                ${errors ? `<ul class="mb-0 mt-2 small">${errors}</ul>` : ''}
+            </div>
+        `;
+    } catch (error) {
+        resultContainer.innerHTML = `<div class="alert alert-danger">Erro: ${error.message}</div>`;
+    } finally {
+        btn.disabled = false;
+        btn.innerHTML = '<i class="bi bi-send"></i> Enviar';
+    }
+}
+
 /**
  * Deleta mensagem
  */
@@ -577,6 +1005,8 @@ function publishToTopic(topicArn, topicName) {
     currentTopicArn = topicArn;
     
     document.getElementById('publishMessageBtn').onclick = () => publishMessage(topicArn);
+    document.getElementById('fanoutTestBtn').onclick = () => startFanoutTest(topicArn);
+    document.getElementById('publishResult').innerHTML = '';
     
     new bootstrap.Modal(document.getElementById('publishMessageModal')).show();
 }
@@ -593,6 +1023,11 @@ async function publishMessage(topicArn) {
         return;
     }
     
+    const count = parseInt(document.getElementById('publishCount').value) || 1;
+    if (count > 1) {
+        return publishBatch(topicArn, message, subject, count);
+    }
+    
     const btn = document.getElementById('publishMessageBtn');
     btn.disabled = true;
     btn.innerHTML = '<span class="spinner-border spinner-border-sm"></span> Publicando...';
@@ -625,3 +1060,113 @@ async function publishMessage(topicArn) {
         btn.innerHTML = '<i class="bi bi-megaphone"></i> Publicar';
     }
 }
+
+/**
+ * Publicação em lote (PublishBatch de 10 em 10, em paralelo)
+ */
+async function publishBatch(topicArn, template, subject, count) {
+    const concurrency = document.getElementById('publishConcurrency').value;
+    const resultContainer = document.getElementById('publishResult');
+    const btn = document.getElementById('publishMessageBtn');
+    btn.disabled = true;
+    btn.innerHTML = '<span class="spinner-border spinner-border-sm"></span> Publicando...';
+    resultContainer.innerHTML = '';
+    
+    try {
+        const response = await fetch('/messaging/sns/publish-batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                topic_arn: topicArn,
+                template: template,
+                count: count,
+                subject: subject || null,
+                concurrency: concurrency ? parseInt(concurrency) : null
+            })
+        });
+        const result = await response.json();
+        
+        if (result.sent === undefined) {
+            resultContainer.innerHTML = `<div class="alert alert-danger">${result.message}</div>`;
+            return;
+        }
+        
+        resultContainer.innerHTML = `
+            <div class="alert alert-${result.success ? 'success' : 'warning'}">
+                <strong>${result.message}</strong><br>
+                ${result.messages_per_second ?? '-'} msgs/s em ${result.elapsed_seconds ?? '-'}s |
+                ${result.api_calls ?? '-'} chamada(s) | ${result.retried ?? 0} reenvio(s)
+            </div>
+        `;
+    } catch (error) {
+        resultContainer.innerHTML = `<div class="alert alert-danger">Erro: ${error.message}</div>`;
+    } finally {
+        btn.disabled = false;
+        btn.innerHTML = '<i class="bi bi-megaphone"></i> Publicar';
+    }
+}
+
+/**
+ * Teste de fan-out: fila SQS temporária inscrita no tópico, progresso via Server-Sent Events
+ */
+async function startFanoutTest(topicArn) {
+    const concurrency = document.getElementById('publishConcurrency').value;
+    const resultContainer = document.getElementById('publishResult');
+    const btn = document.getElementById('fanoutTestBtn');
+    
+    try {
+        const response = await fetch('/messaging/sns/fanout-test', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                topic_arn: topicArn,
+                count: parseInt(document.getElementById('publishCount').value) || 100,
+                concurrency: concurrency ? parseInt(concurrency) : null,
+                settle_timeout: parseFloat(document.getElementById('fanoutSettle').value) || 10
+            })
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            resultContainer.innerHTML = `<div class="alert alert-danger">${result.message}</div>`;
+            return;
+        }
+        
+        btn.disabled = true;
+        const source = new EventSource(`/messaging/sns/fanout-test/${result.job_id}/stream`);
+        source.onmessage = (event) => {
+            const data = JSON.parse(event.data);
+            
+            if (data.job) {
+                displayFanoutResult(data.job);
+            }
+            if (data.type === 'finished') {
+                source.close();
+                btn.disabled = false;
+            }
+        };
+    } catch (error) {
+        resultContainer.innerHTML = `<div class="alert alert-danger">Erro: ${error.message}</div>`;
+    }
+}
+
+/**
+ * Exibe progresso e resultado do teste de fan-out
+ */
+function displayFanoutResult(job) {
+    const phases = { setup: 'preparando fila', publishing: 'publicando', receiving: 'aguardando entregas', cleanup: 'removendo fila', done: 'concluído' };
+    const latency = job.latency || {};
+    const color = job.status === 'failed' ? 'danger' : (job.finished ? (job.lost ? 'warning' : 'success') : 'info');
+    
+    document.getElementById('publishResult').innerHTML = `
+        <div class="alert alert-${color} small">
+            <strong>Fan-out: ${phases[job.phase] || job.phase}</strong> (${job.elapsed_seconds}s)<br>
+            Publicadas: ${job.published}/${job.count}
+            ${job.publish_per_second ? ` (${job.publish_per_second} msgs/s, ${job.publish_api_calls} chamada(s))` : ''}<br>
+            Recebidas: ${job.received} | Duplicadas: ${job.duplicates}
+            ${job.finished ? ` | Perdidas: ${job.lost} (${((job.loss_rate || 0) * 100).toFixed(2)}%)` : ''}<br>
+            ${latency.count ? `Latência: p50 ${latency.p50_ms} ms | p90 ${latency.p90_ms} ms | p99 ${latency.p99_ms} ms | máx ${latency.max_ms} ms` : ''}
+            ${job.message ? `<br><span class="text-danger">${job.message}</span>` : ''}
+        </div>
+    `;
+}
@@ -14,7 +14,11 @@ const favoritesFilter = document.getElementById('favoritesFilter');
 const clearFavoritesFilterBtn = document.getElementById('clearFavoritesFilterBtn');
 
 let allParameters = [];
+let searchTimeout = null;
+let parameterTreeRoot = null;
+let searchSequence = 0;
 let allFavorites = [];
+let favoriteValues = {};
 let currentParameterName = null;
 let currentParameterValue = null;
 
@@ -32,6 +36,8 @@ clearFilterBtn.addEventListener('click', () => {
     filterParameters();
 });
 favoritesFilter.addEventListener('input', filterFavorites);
+document.getElementById('promotionDiffBtn').addEventListener('click', diffPromotion);
+document.getElementById('promotionCopyBtn').addEventListener('click', startPromotion);
 clearFavoritesFilterBtn.addEventListener('click', () => {
     favoritesFilter.value = '';
     filterFavorites();
@@ -79,6 +85,19 @@ async function loadParameters() {
     `;
     
     try {
+        // Hierarquia carregada sob demanda a partir do índice do servidor
+        const treeResponse = await fetch('/parameters/tree?path=/');
+        const treeResult = await treeResponse.json();
+        
+        if (treeResult.success) {
+            parameterTreeRoot = treeResult;
+            allParameters = [];
+            displayParameterTree(treeResult);
+            return;
+        }
+        
+        // Índice ainda não sincronizado: usa a lista completa
+        parameterTreeRoot = null;
         const response = await fetch('/parameters/list');
         const result = await response.json();
         
@@ -115,6 +134,13 @@ function displayParameters(parameters) {
         return;
     }
     
+    parametersContainer.innerHTML = parameterTableHtml(parameters);
+}
+
+/**
+ * Monta a tabela de parâmetros
+ */
+function parameterTableHtml(parameters) {
     let html = '<div class="table-responsive"><table class="table table-hover">';
     html += `
         <thead class="table-dark">
@@ -130,56 +156,195 @@ function displayParameters(parameters) {
     `;
     
     parameters.forEach(param => {
-        const typeColor = param.type === 'SecureString' ? 'danger' : param.type === 'StringList' ? 'info' : 'secondary';
-        
+        html += parameterRowHtml(param);
+    });
+    
+    html += '</tbody></table></div>';
+    return html;
+}
+
+/**
+ * Monta a linha de um parâmetro
+ */
+function parameterRowHtml(param) {
+    const typeColor = param.type === 'SecureString' ? 'danger' : param.type === 'StringList' ? 'info' : 'secondary';
+    
+    return `
+        <tr>
+            <td>
+                <i class="bi bi-sliders text-primary"></i>
+                <strong class="font-monospace">${param.name}</strong>
+            </td>
+            <td><span class="badge bg-${typeColor}">${param.type}</span></td>
+            <td>${param.description}</td>
+            <td><span class="badge bg-secondary">v${param.version}</span></td>
+            <td>
+                <button class="btn btn-sm btn-warning" onclick="toggleFavorite('${param.name}')" title="Adicionar aos favoritos">
+                    <i class="bi bi-star"></i>
+                </button>
+                <button class="btn btn-sm btn-success" onclick="viewParameterValue('${param.name}')" title="Ver Valor">
+                    <i class="bi bi-eye"></i>
+                </button>
+                <button class="btn btn-sm btn-info" onclick="viewHistory('${param.name}')" title="Histórico">
+                    <i class="bi bi-clock-history"></i>
+                </button>
+                <button class="btn btn-sm btn-secondary" onclick="openUpdateModal('${param.name}')" title="Atualizar">
+                    <i class="bi bi-pencil"></i>
+                </button>
+                <button class="btn btn-sm btn-danger" onclick="deleteParameter('${param.name}')" title="Deletar">
+                    <i class="bi bi-trash"></i>
+                </button>
+            </td>
+        </tr>
+    `;
+}
+
+/**
+ * Exibe a raiz da hierarquia de parâmetros
+ */
+function displayParameterTree(level) {
+    if (level.folders.length === 0 && level.parameters.length === 0) {
+        displayParameters([]);
+        return;
+    }
+    
+    parametersContainer.innerHTML = `
+        <p class="text-muted small mb-2">
+            ${level.total_count} parâmetros indexados
+            ${level.synced_at ? `(sincronizado em ${level.synced_at})` : ''}
+        </p>
+        ${parameterTreeLevelHtml(level)}
+    `;
+}
+
+/**
+ * Monta um nível da hierarquia: subpastas (expansíveis) e parâmetros diretos
+ */
+function parameterTreeLevelHtml(level) {
+    let html = '<ul class="list-unstyled mb-0">';
+    
+    level.folders.forEach(folder => {
         html += `
-            <tr>
-                <td>
-                    <i class="bi bi-sliders text-primary"></i>
-                    <strong class="font-monospace">${param.name}</strong>
-                </td>
-                <td><span class="badge bg-${typeColor}">${param.type}</span></td>
-                <td>${param.description}</td>
-                <td><span class="badge bg-secondary">v${param.version}</span></td>
-                <td>
-                    <button class="btn btn-sm btn-warning" onclick="toggleFavorite('${param.name}')" title="Adicionar aos favoritos">
-                        <i class="bi bi-star"></i>
-                    </button>
-                    <button class="btn btn-sm btn-success" onclick="viewParameterValue('${param.name}')" title="Ver Valor">
-                        <i class="bi bi-eye"></i>
-                    </button>
-                    <button class="btn btn-sm btn-info" onclick="viewHistory('${param.name}')" title="Histórico">
-                        <i class="bi bi-clock-history"></i>
-                    </button>
-                    <button class="btn btn-sm btn-secondary" onclick="openUpdateModal('${param.name}')" title="Atualizar">
-                        <i class="bi bi-pencil"></i>
-                    </button>
-                    <button class="btn btn-sm btn-danger" onclick="deleteParameter('${param.name}')" title="Deletar">
-                        <i class="bi bi-trash"></i>
-                    </button>
-                </td>
-            </tr>
+            <li>
+                <button class="btn btn-sm btn-link text-decoration-none px-0" onclick="toggleParameterFolder(this, '${folder.path}')">
+                    <i class="bi bi-folder text-warning"></i>
+                    <span class="font-monospace">${folder.name}/</span>
+                    <span class="badge bg-secondary">${folder.count}</span>
+                </button>
+                <div class="ms-4 d-none" data-loaded="false"></div>
+            </li>
         `;
     });
     
-    html += '</tbody></table></div>';
-    parametersContainer.innerHTML = html;
+    html += '</ul>';
+    
+    if (level.parameters.length > 0) {
+        html += parameterTableHtml(level.parameters);
+    }
+    
+    if (level.truncated) {
+        html += `
+            <p class="text-muted small">
+                Exibindo ${level.parameters.length} de ${level.item_count} parâmetros. Use o filtro para refinar.
+            </p>
+        `;
+    }
+    
+    return html;
+}
+
+/**
+ * Expande/recolhe uma pasta, carregando apenas o nível dela na primeira vez
+ */
+async function toggleParameterFolder(button, path) {
+    const container = button.nextElementSibling;
+    const icon = button.querySelector('i');
+    
+    if (!container.classList.contains('d-none')) {
+        container.classList.add('d-none');
+        icon.className = 'bi bi-folder text-warning';
+        return;
+    }
+    
+    container.classList.remove('d-none');
+    icon.className = 'bi bi-folder2-open text-warning';
+    
+    if (container.dataset.loaded === 'true') {
+        return;
+    }
+    
+    container.innerHTML = '<div class="spinner-border spinner-border-sm text-primary" role="status"></div>';
+    
+    try {
+        const params = new URLSearchParams({ path: path });
+        const response = await fetch(`/parameters/tree?${params}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            container.innerHTML = parameterTreeLevelHtml(result);
+            container.dataset.loaded = 'true';
+        } else {
+            container.innerHTML = `<div class="alert alert-danger py-1">${result.message}</div>`;
+        }
+    } catch (error) {
+        container.innerHTML = `<div class="alert alert-danger py-1">Erro ao carregar pasta: ${error.message}</div>`;
+    }
 }
 
 /**
  * Filtra parâmetros
  */
 function filterParameters() {
-    const filter = parametersFilter.value.toLowerCase();
+    const filter = parametersFilter.value.trim();
+    
+    clearTimeout(searchTimeout);
     
     if (!filter) {
-        displayParameters(allParameters);
+        searchSequence++;
+        if (parameterTreeRoot) {
+            displayParameterTree(parameterTreeRoot);
+        } else {
+            displayParameters(allParameters);
+        }
         return;
     }
     
+    // Busca no índice do servidor (substring, prefixo e tags) com debounce
+    searchTimeout = setTimeout(() => searchParameters(filter), 250);
+}
+
+/**
+ * Busca parâmetros no índice local do servidor
+ * Enquanto o índice não terminou a primeira sincronização, filtra a lista carregada
+ */
+async function searchParameters(filter) {
+    const sequence = ++searchSequence;
+    
+    try {
+        const params = new URLSearchParams({ q: filter });
+        const response = await fetch(`/parameters/search?${params}`);
+        const result = await response.json();
+        
+        if (sequence !== searchSequence) {
+            return;
+        }
+        
+        if (result.success) {
+            displayParameters(result.parameters);
+            return;
+        }
+    } catch (error) {
+        console.error('Erro ao buscar parâmetros:', error);
+        
+        if (sequence !== searchSequence) {
+            return;
+        }
+    }
+    
+    const lowerFilter = filter.toLowerCase();
     const filtered = allParameters.filter(param => 
-        param.name.toLowerCase().includes(filter) ||
-        (param.description && param.description.toLowerCase().includes(filter))
+        param.name.toLowerCase().includes(lowerFilter) ||
+        (param.description && param.description.toLowerCase().includes(lowerFilter))
     );
     
     displayParameters(filtered);
@@ -241,9 +406,13 @@ async function createParameter() {
  */
 async function viewParameterValue(parameterName) {
     try {
-        const encoded = encodeURIComponent(parameterName);
-        const response = await fetch(`/parameters/${encoded}/value`);
-        const result = await response.json();
+        // Favoritos já vêm carregados em lote
+        let result = favoriteValues[parameterName] ? { success: true, parameter: favoriteValues[parameterName] } : null;
+        if (!result) {
+            const encoded = encodeURIComponent(parameterName);
+            const response = await fetch(`/parameters/${encoded}/value`);
+            result = await response.json();
+        }
         
         if (result.success) {
             const param = result.parameter;
@@ -331,6 +500,7 @@ async function updateParameter() {
         const result = await response.json();
         
         if (result.success) {
+            delete favoriteValues[currentParameterName];
             showAlert(result.message, 'success');
             bootstrap.Modal.getInstance(document.getElementById('updateParameterModal')).hide();
             loadParameters();
@@ -444,6 +614,7 @@ async function loadFavorites() {
         if (result.success) {
             allFavorites = result.favorites;
             displayFavorites(allFavorites);
+            loadFavoriteValues();
         } else {
             favoritesContainer.innerHTML = `
                 <div class="alert alert-danger">
@@ -460,6 +631,31 @@ async function loadFavorites() {
     }
 }
 
+/**
+ * Carrega os valores de todos os favoritos em uma única requisição
+ */
+async function loadFavoriteValues() {
+    favoriteValues = {};
+    
+    if (allFavorites.length === 0) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/parameters/favorites/values');
+        const result = await response.json();
+        
+        if (result.success) {
+            result.parameters.forEach(param => {
+                favoriteValues[param.Name] = param;
+            });
+        }
+    } catch (error) {
+        // Sem os valores em lote, cada favorito é buscado ao abrir
+        favoriteValues = {};
+    }
+}
+
 /**
  * Exibe lista de favoritos
  */
@@ -616,3 +812,160 @@ async function removeFavorite(parameterName) {
         showAlert(`Erro: ${error.message}`, 'danger');
     }
 }
+
+/**
+ * Lê os campos do modal de promoção
+ */
+function promotionPayload() {
+    return {
+        source_path: document.getElementById('promotionSourcePath').value.trim(),
+        target_path: document.getElementById('promotionTargetPath').value.trim(),
+        delete_missing: document.getElementById('promotionDeleteMissing').checked
+    };
+}
+
+/**
+ * Compara os caminhos de origem e destino (sem exibir valores)
+ */
+async function diffPromotion() {
+    const container = document.getElementById('promotionResult');
+    container.innerHTML = '<div class="text-center"><div class="spinner-border text-primary" role="status"></div></div>';
+    
+    try {
+        const response = await fetch('/parameters/promotions/diff', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(promotionPayload())
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            container.innerHTML = `<div class="alert alert-danger">${result.message}</div>`;
+            return;
+        }
+        
+        const rows = [
+            ...result.added.map(item => ({ ...item, action: 'Incluir', color: 'success' })),
+            ...result.changed.map(item => ({ ...item, action: item.type_changed ? 'Alterar (tipo)' : 'Alterar', color: 'warning' })),
+            ...result.deleted.map(item => ({ ...item, action: 'Remover', color: 'danger' }))
+        ];
+        
+        let html = `
+            <p>
+                <span class="badge bg-success">${result.added.length} inclusões</span>
+                <span class="badge bg-warning text-dark">${result.changed.length} alterações</span>
+                <span class="badge bg-danger">${result.deleted.length} no destino sem origem</span>
+                <span class="badge bg-secondary">${result.unchanged_count} iguais</span>
+                <small class="text-muted ms-2">${result.elapsed_seconds}s</small>
+            </p>
+        `;
+        
+        if (rows.length > 0) {
+            html += '<div class="table-responsive" style="max-height: 400px;"><table class="table table-sm">';
+            html += '<thead><tr><th>Ação</th><th>Destino</th><th>Tipo</th></tr></thead><tbody>';
+            rows.forEach(row => {
+                html += `
+                    <tr>
+                        <td><span class="badge bg-${row.color}">${row.action}</span></td>
+                        <td class="font-monospace">${row.target_name}</td>
+                        <td>${row.type}</td>
+                    </tr>
+                `;
+            });
+            html += '</tbody></table></div>';
+        }
+        
+        container.innerHTML = html;
+    } catch (error) {
+        container.innerHTML = `<div class="alert alert-danger">Erro ao comparar: ${error.message}</div>`;
+    }
+}
+
+/**
+ * Inicia a cópia e acompanha o progresso via Server-Sent Events
+ */
+async function startPromotion() {
+    const payload = promotionPayload();
+    
+    if (!confirm(`Copiar ${payload.source_path} para ${payload.target_path}?`)) {
+        return;
+    }
+    
+    const container = document.getElementById('promotionResult');
+    
+    try {
+        const response = await fetch('/parameters/promotions', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        const result = await response.json();
+        
+        if (!result.success) {
+            container.innerHTML = `<div class="alert alert-danger">${result.message}</div>`;
+            return;
+        }
+        
+        const source = new EventSource(`/parameters/promotions/${result.job_id}/stream`);
+        
+        source.onmessage = (event) => {
+            const progress = JSON.parse(event.data);
+            
+            if (!progress.success) {
+                container.innerHTML = `<div class="alert alert-danger">${progress.message}</div>`;
+                source.close();
+                return;
+            }
+            
+            displayPromotionProgress(progress.job);
+            
+            if (progress.job.finished) {
+                source.close();
+                loadParameters();
+            }
+        };
+        
+        source.onerror = () => source.close();
+    } catch (error) {
+        container.innerHTML = `<div class="alert alert-danger">Erro ao iniciar cópia: ${error.message}</div>`;
+    }
+}
+
+/**
+ * Exibe o progresso de uma cópia
+ */
+function displayPromotionProgress(job) {
+    const container = document.getElementById('promotionResult');
+    const processed = job.done + job.failed;
+    const percent = job.total > 0 ? Math.round(processed * 100 / job.total) : (job.finished ? 100 : 0);
+    const color = job.status === 'failed' || job.failed > 0 ? 'danger' : job.finished ? 'success' : 'primary';
+    
+    let html = `
+        <div class="progress mb-2" style="height: 24px;">
+            <div class="progress-bar bg-${color} ${job.finished ? '' : 'progress-bar-striped progress-bar-animated'}" style="width: ${percent}%">
+                ${processed} / ${job.total}
+            </div>
+        </div>
+        <p class="small mb-2">
+            <strong>Status:</strong> ${job.status} |
+            <strong>Itens/s:</strong> ${job.items_per_second} |
+            <strong>Concorrência:</strong> ${job.concurrency} |
+            <strong>Throttling:</strong> ${job.throttled} (${job.backoff_seconds}s em backoff) |
+            <strong>Falhas:</strong> ${job.failed}
+        </p>
+    `;
+    
+    if (job.message) {
+        html += `<div class="alert alert-danger">${job.message}</div>`;
+    }
+    
+    if (job.errors.length > 0) {
+        html += '<ul class="small text-danger">';
+        job.errors.forEach(error => {
+            html += `<li><span class="font-monospace">${error.name}</span>: ${error.message}</li>`;
+        });
+        html += '</ul>';
+    }
+    
+    container.innerHTML = html;
+}
@@ -16,7 +16,10 @@ const clearFavoritesFilterBtn = document.getElementById('clearFavoritesFilterBtn
 let currentSecretForUpdate = null;
 let currentSecretValue = null;
 let allSecrets = [];
+let searchTimeout = null;
+let searchSequence = 0;
 let allFavorites = [];
+let favoriteValues = {};
 
 // Event Listeners
 refreshSecretsBtn.addEventListener('click', loadSecrets);
@@ -275,8 +278,12 @@ async function viewSecretValue(secretName) {
     modal.show();
     
     try {
-        const response = await fetch(`/secrets/${encodeURIComponent(secretName)}/value`);
-        const result = await response.json();
+        // Favoritos já vêm carregados em lote
+        let result = favoriteValues[secretName];
+        if (!result || !result.success) {
+            const response = await fetch(`/secrets/${encodeURIComponent(secretName)}/value`);
+            result = await response.json();
+        }
         
         if (result.success) {
             currentSecretValue = result.secret_string;
@@ -360,6 +367,7 @@ async function updateSecret() {
         const result = await response.json();
         
         if (result.success) {
+            delete favoriteValues[currentSecretForUpdate];
             showAlert(result.message, 'success');
             bootstrap.Modal.getInstance(document.getElementById('updateSecretModal')).hide();
             loadSecrets();
@@ -526,16 +534,52 @@ function formatDate(dateString) {
  * Filtra segredos
  */
 function filterSecrets() {
-    const filter = secretsFilter.value.toLowerCase();
+    const filter = secretsFilter.value.trim();
+    
+    clearTimeout(searchTimeout);
     
     if (!filter) {
+        searchSequence++;
         displaySecrets(allSecrets);
         return;
     }
     
+    // Busca no índice do servidor (substring, prefixo e tags) com debounce
+    searchTimeout = setTimeout(() => searchSecrets(filter), 250);
+}
+
+/**
+ * Busca segredos no índice local do servidor
+ * Enquanto o índice não terminou a primeira sincronização, filtra a lista carregada
+ */
+async function searchSecrets(filter) {
+    const sequence = ++searchSequence;
+    
+    try {
+        const params = new URLSearchParams({ q: filter });
+        const response = await fetch(`/secrets/search?${params}`);
+        const result = await response.json();
+        
+        if (sequence !== searchSequence) {
+            return;
+        }
+        
+        if (result.success) {
+            displaySecrets(result.secrets);
+            return;
+        }
+    } catch (error) {
+        console.error('Erro ao buscar segredos:', error);
+        
+        if (sequence !== searchSequence) {
+            return;
+        }
+    }
+    
+    const lowerFilter = filter.toLowerCase();
     const filtered = allSecrets.filter(secret => 
-        secret.name.toLowerCase().includes(filter) ||
-        (secret.description && secret.description.toLowerCase().includes(filter))
+        secret.name.toLowerCase().includes(lowerFilter) ||
+        (secret.description && secret.description.toLowerCase().includes(lowerFilter))
     );
     
     displaySecrets(filtered);
@@ -580,6 +624,7 @@ async function loadFavorites() {
         if (result.success) {
             allFavorites = result.favorites;
             displayFavorites(allFavorites);
+            loadFavoriteValues();
         } else {
             favoritesContainer.innerHTML = `
                 <div class="alert alert-danger">
@@ -596,6 +641,29 @@ async function loadFavorites() {
     }
 }
 
+/**
+ * Carrega os valores de todos os favoritos em uma única requisição
+ */
+async function loadFavoriteValues() {
+    favoriteValues = {};
+    
+    if (allFavorites.length === 0) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/secrets/favorites/values');
+        const result = await response.json();
+        
+        if (result.success) {
+            favoriteValues = result.values;
+        }
+    } catch (error) {
+        // Sem os valores em lote, cada favorito é buscado ao abrir
+        favoriteValues = {};
+    }
+}
+
 /**
  * Exibe lista de favoritos
  */